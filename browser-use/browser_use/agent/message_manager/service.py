@@ -14,12 +14,15 @@ from browser_use.agent.views import (
 	MessageManagerState,
 )
 from browser_use.browser.views import BrowserStateSummary
+from browser_use.dom.diff import diff_dom_states, serialize_dom_diff
+from browser_use.dom.views import SerializedDOMState
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.llm.messages import (
 	BaseMessage,
 	ContentPartImageParam,
 	ContentPartTextParam,
 	SystemMessage,
+	UserMessage,
 )
 from browser_use.observability import observe_debug
 from browser_use.utils import match_url_with_domain_pattern, time_execution_sync
@@ -111,6 +114,9 @@ class MessageManager:
 		include_recent_events: bool = False,
 		sample_images: list[ContentPartTextParam | ContentPartImageParam] | None = None,
 		llm_screenshot_size: tuple[int, int] | None = None,
+		dom_prompt_mode: Literal['full', 'delta'] = 'full',
+		dom_delta_resync_ratio: float = 0.3,
+		max_clickable_elements_length: int = 40000,
 	):
 		self.task = task
 		self.state = state
@@ -124,6 +130,14 @@ class MessageManager:
 		self.include_recent_events = include_recent_events
 		self.sample_images = sample_images
 		self.llm_screenshot_size = llm_screenshot_size
+		# 'delta': keep the last full element list in a cached message and only send changes against it
+		self.dom_prompt_mode = dom_prompt_mode
+		self.dom_delta_resync_ratio = dom_delta_resync_ratio
+		self._dom_base_state: SerializedDOMState | None = None
+		self._dom_base_url: str | None = None
+		# The element list behind a restored base message is not persisted, so deltas could not be computed against it
+		self.state.history.dom_base_message = None
+		self.max_clickable_elements_length = max_clickable_elements_length
 
 		assert max_history_items is None or max_history_items > 5, 'max_history_items must be None or greater than 5'
 
@@ -345,6 +359,10 @@ class MessageManager:
 		# Use vision in the user message if screenshots are included
 		effective_use_vision = len(screenshots) > 0
 
+		interactive_elements_text = None
+		if self.dom_prompt_mode == 'delta':
+			interactive_elements_text = self._get_dom_delta_text(browser_state_summary)
+
 		# Create single state message with all content
 		assert browser_state_summary
 		state_message = AgentMessagePrompt(
@@ -364,6 +382,8 @@ class MessageManager:
 			sample_images=self.sample_images,
 			read_state_images=self.state.read_state_images,
 			llm_screenshot_size=self.llm_screenshot_size,
+			interactive_elements_text=interactive_elements_text,
+			max_clickable_elements_length=self.max_clickable_elements_length,
 		).get_user_message(effective_use_vision)
 
 		# Store state message text for history
@@ -372,6 +392,41 @@ class MessageManager:
 		# Set the state message with caching enabled
 		self._set_message_with_type(state_message, 'state')
 
+	def _get_dom_delta_text(self, browser_state_summary: BrowserStateSummary) -> str:
+		"""Changes against the last fully sent element list, resending the full list on navigation or large changes."""
+		dom_state = browser_state_summary.dom_state
+		base_state = self._dom_base_state
+		diff = None
+		if base_state is not None and self._dom_base_url == browser_state_summary.url:
+			diff = diff_dom_states(base_state, dom_state)
+			diff_size = len(diff.added) + len(diff.removed) + len(diff.moved) + len(diff.changed)
+			if diff_size > self.dom_delta_resync_ratio * max(len(base_state.selector_map), 1):
+				logger.debug(f'DOM delta too large ({diff}), resending the full element list')
+				diff = None
+
+		if diff is None:
+			self._dom_base_state = dom_state
+			self._dom_base_url = browser_state_summary.url
+			elements_text = dom_state.llm_representation(include_attributes=self.include_attributes) or 'empty page'
+			truncated_text = ''
+			if len(elements_text) > self.max_clickable_elements_length:
+				elements_text = elements_text[: self.max_clickable_elements_length]
+				truncated_text = f' (truncated to {self.max_clickable_elements_length} characters)'
+			base_message = UserMessage(
+				content=(
+					f'<dom_base>\nFull interactive element list of {browser_state_summary.url}{truncated_text}:\n'
+					f'{elements_text}\n</dom_base>'
+				),
+				cache=True,
+			)
+			self._set_message_with_type(base_message, 'dom_base')
+			return 'No changes since the element list in <dom_base>.'
+
+		return (
+			'Changes since the element list in <dom_base> (all other elements and indices there are unchanged):\n'
+			+ serialize_dom_diff(diff, dom_state, self.include_attributes)
+		)
+
 	def _log_history_lines(self) -> str:
 		"""Generate a formatted log string of message history for debugging / printing to terminal"""
 		# TODO: fix logging
@@ -418,11 +473,13 @@ class MessageManager:
 		self.last_input_messages = self.state.history.get_messages()
 		return self.last_input_messages
 
-	def _set_message_with_type(self, message: BaseMessage, message_type: Literal['system', 'state']) -> None:
+	def _set_message_with_type(self, message: BaseMessage, message_type: Literal['system', 'dom_base', 'state']) -> None:
 		"""Replace a specific state message slot with a new message"""
 		# Don't filter system and state messages - they should contain placeholder tags or normal conversation
 		if message_type == 'system':
 			self.state.history.system_message = message
+		elif message_type == 'dom_base':
+			self.state.history.dom_base_message = message
 		elif message_type == 'state':
 			self.state.history.state_message = message
 		else:
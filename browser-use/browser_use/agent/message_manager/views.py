@@ -67,15 +67,19 @@ class MessageHistory(BaseModel):
 	"""History of messages"""
 
 	system_message: BaseMessage | None = None
+	dom_base_message: BaseMessage | None = None
+	"""Full element list that delta-mode state messages are diffed against"""
 	state_message: BaseMessage | None = None
 	context_messages: list[BaseMessage] = Field(default_factory=list)
 	model_config = ConfigDict(arbitrary_types_allowed=True)
 
 	def get_messages(self) -> list[BaseMessage]:
-		"""Get all messages in the correct order: system -> state -> contextual"""
+		"""Get all messages in the correct order: system -> dom base -> state -> contextual"""
 		messages = []
 		if self.system_message:
 			messages.append(self.system_message)
+		if self.dom_base_message:
+			messages.append(self.dom_base_message)
 		if self.state_message:
 			messages.append(self.state_message)
 		messages.extend(self.context_messages)
@@ -184,6 +184,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		sample_images: list[ContentPartTextParam | ContentPartImageParam] | None = None,
 		final_response_after_failure: bool = True,
 		llm_screenshot_size: tuple[int, int] | None = None,
+		dom_prompt_mode: Literal['full', 'delta'] = 'full',
+		dom_delta_resync_ratio: float = 0.3,
 		_url_shortening_limit: int = 25,
 		**kwargs,
 	):
@@ -326,6 +328,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			final_response_after_failure=final_response_after_failure,
 			use_judge=use_judge,
 			ground_truth=ground_truth,
+			dom_prompt_mode=dom_prompt_mode,
+			dom_delta_resync_ratio=dom_delta_resync_ratio,
 		)
 
 		# Token cost service
@@ -419,6 +423,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			include_recent_events=self.include_recent_events,
 			sample_images=self.sample_images,
 			llm_screenshot_size=llm_screenshot_size,
+			dom_prompt_mode=self.settings.dom_prompt_mode,
+			dom_delta_resync_ratio=self.settings.dom_delta_resync_ratio,
 		)
 
 		if self.sensitive_data:
@@ -2023,22 +2029,9 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		results: list[ActionResult] = []
 		time_elapsed = 0
 		total_actions = len(actions)
+		previous_action_end: float | None = None
 
 		assert self.browser_session is not None, 'BrowserSession is not set up'
-		try:
-			if (
-				self.browser_session._cached_browser_state_summary is not None
-				and self.browser_session._cached_browser_state_summary.dom_state is not None
-			):
-				cached_selector_map = dict(self.browser_session._cached_browser_state_summary.dom_state.selector_map)
-				cached_element_hashes = {e.parent_branch_hash() for e in cached_selector_map.values()}
-			else:
-				cached_selector_map = {}
-				cached_element_hashes = set()
-		except Exception as e:
-			self.logger.error(f'Error getting cached selector map: {e}')
-			cached_selector_map = {}
-			cached_element_hashes = set()
 
 		for i, action in enumerate(actions):
 			if i > 0:
@@ -2048,10 +2041,15 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 					self.logger.debug(msg)
 					break
 
-			# wait between actions (only after first action)
+			# wait between actions (only after first action): until the page settled, and at least wait_between_actions
 			if i > 0:
-				self.logger.debug(f'Waiting {self.browser_profile.wait_between_actions} seconds between actions')
-				await asyncio.sleep(self.browser_profile.wait_between_actions)
+				self.logger.debug(
+					f'Waiting for the page to settle (at least {self.browser_profile.wait_between_actions} seconds) between actions'
+				)
+				await asyncio.gather(
+					self.browser_session.wait_for_page_settled(since=previous_action_end),
+					asyncio.sleep(self.browser_profile.wait_between_actions),
+				)
 
 			try:
 				await self._check_stop_or_pause()
@@ -2075,6 +2073,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 				time_end = time.time()
 				time_elapsed = time_end - time_start
+				previous_action_end = time.monotonic()
 
 				if result.error:
 					await self._demo_mode_log(
@@ -2430,18 +2429,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		if not historical_element or not browser_state_summary.dom_state.selector_map:
 			return action
 
-		# selector_hash_map = {hash(e): e for e in browser_state_summary.dom_state.selector_map.values()}
-
-		highlight_index, current_element = next(
-			(
-				(highlight_index, element)
-				for highlight_index, element in browser_state_summary.dom_state.selector_map.items()
-				if element.element_hash == historical_element.element_hash
-			),
-			(None, None),
-		)
-
-		if not current_element or highlight_index is None:
+		highlight_index = browser_state_summary.dom_state.element_hash_index.get(historical_element.element_hash)
+		if highlight_index is None:
 			return None
 
 		old_index = action.get_index()
@@ -55,6 +55,8 @@ class AgentSettings(BaseModel):
 	llm_timeout: int = 60  # Timeout in seconds for LLM calls (auto-detected: 30s for gemini, 90s for o3, 60s default)
 	step_timeout: int = 180  # Timeout in seconds for each step
 	final_response_after_failure: bool = True  # If True, attempt one final recovery call after max_failures
+	dom_prompt_mode: Literal['full', 'delta'] = 'full'  # 'delta': send the full element list only on navigation/large changes
+	dom_delta_resync_ratio: float = 0.3  # Resend the full list when more than this share of its elements changed
 
 
 class AgentState(BaseModel):
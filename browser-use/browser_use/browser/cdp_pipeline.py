@@ -0,0 +1,66 @@
+"""Pipelined CDP commands.
+
+Awaiting every CDP command before sending the next one costs a full round trip per command, even when the next
+command does not need the previous result. A pipeline schedules each command as soon as it is added, so a batch
+of independent commands is written to the socket back-to-back and only the results that are really needed are
+awaited. Chrome runs the commands of a session in the order they arrive, so a later command still sees the
+effects of earlier ones (e.g. coordinates read after a scroll).
+"""
+
+import asyncio
+import logging
+from collections.abc import Coroutine
+from typing import TYPE_CHECKING, Any, Self, TypeVar
+
+if TYPE_CHECKING:
+	from browser_use.browser.session import CDPSession
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class CDPPipeline:
+	"""Batch of CDP commands sent without waiting for each other's responses.
+
+	```python
+	async with cdp_session.pipeline() as pipeline:
+	    send = cdp_session.cdp_client.send
+	    pipeline.add(send.DOM.scrollIntoViewIfNeeded(params=..., session_id=cdp_session.session_id))
+	    quads = pipeline.add(send.DOM.getContentQuads(params=..., session_id=cdp_session.session_id))
+	    print(await quads)  # one round trip for both commands
+	```
+
+	Commands whose result is never awaited are fire-and-forget: leaving the block waits for them and only logs their
+	errors. Await a command's task wherever its success matters.
+	"""
+
+	def __init__(self, cdp_session: 'CDPSession | None' = None):
+		self.cdp_session = cdp_session
+		self._tasks: list[asyncio.Task[Any]] = []
+
+	def add(self, command: Coroutine[Any, Any, T]) -> asyncio.Task[T]:
+		"""Schedule a command now and return the task resolving to its response."""
+		task = asyncio.create_task(command)
+		self._tasks.append(task)
+		return task
+
+	async def drain(self) -> None:
+		"""Wait until every added command has been answered."""
+		tasks, self._tasks = self._tasks, []
+		for task, result in zip(tasks, await asyncio.gather(*tasks, return_exceptions=True)):
+			if isinstance(result, Exception):
+				logger.debug(f'Pipelined CDP command {task.get_coro()} failed: {type(result).__name__}: {result}')
+
+	def cancel(self) -> None:
+		"""Stop waiting for the outstanding responses (commands already sent still run in the browser)."""
+		for task in self._tasks:
+			task.cancel()
+
+	async def __aenter__(self) -> Self:
+		return self
+
+	async def __aexit__(self, exc_type, exc, tb) -> None:
+		if exc_type is not None:
+			self.cancel()
+		await self.drain()
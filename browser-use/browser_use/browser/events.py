@@ -48,6 +48,32 @@ def _get_timeout(env_var: str, default: float) -> float | None:
 # ============================================================================
 
 
+def _detach_node(data: EnhancedDOMTreeNode) -> EnhancedDOMTreeNode:
+	return EnhancedDOMTreeNode(
+		node_id=data.node_id,
+		backend_node_id=data.backend_node_id,
+		session_id=data.session_id,
+		frame_id=data.frame_id,
+		target_id=data.target_id,
+		node_type=data.node_type,
+		node_name=data.node_name,
+		node_value=data.node_value,
+		attributes=data.attributes,
+		is_scrollable=data.is_scrollable,
+		is_visible=data.is_visible,
+		absolute_position=data.absolute_position,
+		# override the circular reference fields in EnhancedDOMTreeNode as they cant be serialized and aren't needed by event handlers
+		# only used internally by the DOM service during DOM tree building process, not intended public API use
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=[],
+		parent_node=None,
+		children_nodes=[],
+		ax_node=None,
+		snapshot_node=None,
+	)
+
+
 class ElementSelectedEvent(BaseEvent[T_EventResultType]):
 	"""An element was selected."""
 
@@ -58,29 +84,7 @@ class ElementSelectedEvent(BaseEvent[T_EventResultType]):
 	def serialize_node(cls, data: EnhancedDOMTreeNode | None) -> EnhancedDOMTreeNode | None:
 		if data is None:
 			return None
-		return EnhancedDOMTreeNode(
-			node_id=data.node_id,
-			backend_node_id=data.backend_node_id,
-			session_id=data.session_id,
-			frame_id=data.frame_id,
-			target_id=data.target_id,
-			node_type=data.node_type,
-			node_name=data.node_name,
-			node_value=data.node_value,
-			attributes=data.attributes,
-			is_scrollable=data.is_scrollable,
-			is_visible=data.is_visible,
-			absolute_position=data.absolute_position,
-			# override the circular reference fields in EnhancedDOMTreeNode as they cant be serialized and aren't needed by event handlers
-			# only used internally by the DOM service during DOM tree building process, not intended public API use
-			content_document=None,
-			shadow_root_type=None,
-			shadow_roots=[],
-			parent_node=None,
-			children_nodes=[],
-			ax_node=None,
-			snapshot_node=None,
-		)
+		return _detach_node(data)
 
 
 # TODO: add page handle to events
@@ -141,10 +145,27 @@ class TypeTextEvent(ElementSelectedEvent[dict | None]):
 	clear: bool = True
 	is_sensitive: bool = False  # Flag to indicate if text contains sensitive data
 	sensitive_key_name: str | None = None  # Name of the sensitive key being typed (e.g., 'username', 'password')
+	input_mode: Literal['keys', 'insert', 'value'] | None = None  # Overrides BrowserProfile.text_input_mode for this field
 
 	event_timeout: float | None = _get_timeout('TIMEOUT_TypeTextEvent', 15.0)  # seconds
 
 
+class FillFormEvent(BaseEvent[list[dict[str, Any]]]):
+	"""Fill several form fields at once.
+
+	Returns one result dict per field: {'index', 'success', 'value' | 'error'}."""
+
+	nodes: list[EnhancedDOMTreeNode]
+	values: list[str]
+
+	event_timeout: float | None = _get_timeout('TIMEOUT_FillFormEvent', 20.0)  # seconds
+
+	@field_validator('nodes', mode='before')
+	@classmethod
+	def serialize_nodes(cls, data: list[EnhancedDOMTreeNode]) -> list[EnhancedDOMTreeNode]:
+		return [_detach_node(node) for node in data]
+
+
 class ScrollEvent(ElementSelectedEvent[None]):
 	"""Scroll the page or element."""
 
@@ -0,0 +1,232 @@
+"""Single round-trip page introspection for browser state requests.
+
+One injected function returns everything a state request used to collect with separate CDP calls: document
+readiness, title, viewport and page metrics, device pixel ratio, iframe scroll positions and pending network
+requests. The function is installed on the page the first time it is evaluated and reused for the rest of the
+document's life, so later calls only pay for the call itself.
+
+The same call reads the page's document version (see DOM_VERSION_TRACKER_JS) and re-arms its change notification,
+so a snapshot captured right after it can be trusted until the page reports a change.
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from browser_use.browser.views import NetworkRequest, PageInfo
+
+if TYPE_CHECKING:
+	from browser_use.browser.session import CDPSession
+
+# Name of the Runtime binding the page calls with its new document version after a change
+DOM_VERSION_BINDING = '__browserUseDocumentChanged'
+
+# Installed on every new top-level document. Each DOM mutation, scroll or resize bumps the version. The first change
+# after being armed is reported through the binding right away, later ones at most every 50ms, which is what page
+# readiness waits on. Changes that touch neither the DOM nor the scroll position (e.g. CSS animations) are not seen.
+DOM_VERSION_TRACKER_JS = """
+(() => {
+	const key = Symbol.for('browser_use.dom_version');
+	if (globalThis[key] || window !== window.top) return;
+	const tracker = { id: Math.random().toString(36).slice(2), version: 0, armed: true, timer: null };
+	const report = () => {
+		clearTimeout(tracker.timer);
+		tracker.timer = null;
+		try {
+			globalThis.__browserUseDocumentChanged(tracker.id + ':' + tracker.version);
+		} catch (e) {
+			// Binding not installed in this target
+		}
+	};
+	const bump = () => {
+		tracker.version++;
+		if (tracker.armed) {
+			tracker.armed = false;
+			report();
+		} else if (tracker.timer === null) {
+			tracker.timer = setTimeout(report, 50);
+		}
+	};
+	globalThis[key] = tracker;
+	new MutationObserver(bump).observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+	window.addEventListener('scroll', bump, { capture: true, passive: true });
+	window.addEventListener('resize', bump, { passive: true });
+	// Announcing the new document invalidates snapshots of the previous one
+	tracker.armed = false;
+	report();
+})()
+"""
+
+# Stored under a registered symbol so it does not show up among the page's own globals
+PAGE_INTROSPECTION_JS = """
+(() => {
+	const key = Symbol.for('browser_use.introspect');
+	if (!globalThis[key]) {
+		// Common ad/tracking domains and patterns to filter out of pending requests
+		const adDomains = [
+			// Standard ad/tracking networks
+			'doubleclick.net', 'googlesyndication.com', 'googletagmanager.com',
+			'facebook.net', 'analytics', 'ads', 'tracking', 'pixel',
+			'hotjar.com', 'clarity.ms', 'mixpanel.com', 'segment.com',
+			// Analytics platforms
+			'demdex.net', 'omtrdc.net', 'adobedtm.com', 'ensighten.com',
+			'newrelic.com', 'nr-data.net', 'google-analytics.com',
+			// Social media trackers
+			'connect.facebook.net', 'platform.twitter.com', 'platform.linkedin.com',
+			// CDN/image hosts (usually not critical for functionality)
+			'.cloudfront.net/image/', '.akamaized.net/image/',
+			// Common tracking paths
+			'/tracker/', '/collector/', '/beacon/', '/telemetry/', '/log/',
+			'/events/', '/eventBatch', '/track.', '/metrics/'
+		];
+		const nonCriticalTypes = ['img', 'image', 'icon', 'font'];
+
+		const pendingRequests = () => {
+			const now = performance.now();
+			const pending = [];
+			for (const entry of performance.getEntriesByType('resource')) {
+				// Resources that are still loading have no responseEnd yet
+				if (entry.responseEnd !== 0) continue;
+				const url = entry.name;
+				if (adDomains.some(domain => url.includes(domain))) continue;
+				// Filter out data: URLs and very long URLs (often inline resources)
+				if (url.startsWith('data:') || url.length > 500) continue;
+				const loadingDuration = now - entry.startTime;
+				// Skip requests that have been loading for >10 seconds (likely stuck/polling)
+				if (loadingDuration > 10000) continue;
+				const resourceType = entry.initiatorType || 'unknown';
+				// Filter out non-critical resources (images, fonts, icons) if loading >3 seconds
+				const isImageUrl = /\\.(jpg|jpeg|png|gif|webp|svg|ico)(\\?|$)/i.test(url);
+				if ((nonCriticalTypes.includes(resourceType) || isImageUrl) && loadingDuration > 3000) continue;
+				pending.push({
+					url: url,
+					method: 'GET',
+					loading_duration_ms: Math.round(loadingDuration),
+					resource_type: resourceType
+				});
+			}
+			return pending;
+		};
+
+		const iframeScrollPositions = () => {
+			const scrollData = {};
+			document.querySelectorAll('iframe').forEach((iframe, index) => {
+				try {
+					const doc = iframe.contentDocument || iframe.contentWindow.document;
+					if (doc) {
+						scrollData[index] = {
+							scrollTop: doc.documentElement.scrollTop || (doc.body && doc.body.scrollTop) || 0,
+							scrollLeft: doc.documentElement.scrollLeft || (doc.body && doc.body.scrollLeft) || 0
+						};
+					}
+				} catch (e) {
+					// Cross-origin iframe, can't access
+				}
+			});
+			return scrollData;
+		};
+
+		globalThis[key] = () => {
+			const root = document.documentElement;
+			const body = document.body;
+			const tracker = globalThis[Symbol.for('browser_use.dom_version')];
+			if (tracker) tracker.armed = true;
+			return {
+				dom_version: tracker ? tracker.id + ':' + tracker.version : null,
+				ready_state: document.readyState,
+				title: document.title,
+				device_pixel_ratio: window.devicePixelRatio || 1,
+				viewport_width: (root && root.clientWidth) || window.innerWidth,
+				viewport_height: (root && root.clientHeight) || window.innerHeight,
+				page_width: Math.max(root ? root.scrollWidth : 0, body ? body.scrollWidth : 0, window.innerWidth),
+				page_height: Math.max(root ? root.scrollHeight : 0, body ? body.scrollHeight : 0, window.innerHeight),
+				scroll_x: window.scrollX,
+				scroll_y: window.scrollY,
+				iframe_scroll_positions: iframeScrollPositions(),
+				pending_requests: pendingRequests()
+			};
+		};
+	}
+	return globalThis[key]();
+})()
+"""
+
+
+@dataclass
+class PageIntrospection:
+	"""State of the current document, as returned by PAGE_INTROSPECTION_JS (CSS pixels)"""
+
+	ready_state: str
+	title: str
+	device_pixel_ratio: float
+	viewport_width: int
+	viewport_height: int
+	page_width: int
+	page_height: int
+	scroll_x: int
+	scroll_y: int
+	iframe_scroll_positions: dict[str, dict[str, float]] = field(default_factory=dict)
+	pending_requests: list[NetworkRequest] = field(default_factory=list)
+	dom_version: str | None = None
+	"""'<document id>:<change count>' from DOM_VERSION_TRACKER_JS, None when the tracker is not installed"""
+
+	@classmethod
+	def from_value(cls, value: dict[str, Any]) -> 'PageIntrospection':
+		return cls(
+			ready_state=value.get('ready_state', 'unknown'),
+			title=value.get('title') or '',
+			device_pixel_ratio=float(value.get('device_pixel_ratio') or 1.0),
+			viewport_width=int(value.get('viewport_width') or 0),
+			viewport_height=int(value.get('viewport_height') or 0),
+			page_width=int(value.get('page_width') or 0),
+			page_height=int(value.get('page_height') or 0),
+			scroll_x=int(value.get('scroll_x') or 0),
+			scroll_y=int(value.get('scroll_y') or 0),
+			iframe_scroll_positions=value.get('iframe_scroll_positions') or {},
+			pending_requests=[
+				NetworkRequest(
+					url=request['url'],
+					method=request.get('method', 'GET'),
+					loading_duration_ms=request.get('loading_duration_ms', 0.0),
+					resource_type=request.get('resource_type'),
+				)
+				for request in (value.get('pending_requests') or [])[:20]  # Limit to 20 to avoid overwhelming the context
+			],
+			dom_version=value.get('dom_version'),
+		)
+
+	@property
+	def page_info(self) -> PageInfo:
+		return PageInfo(
+			viewport_width=self.viewport_width,
+			viewport_height=self.viewport_height,
+			page_width=self.page_width,
+			page_height=self.page_height,
+			scroll_x=self.scroll_x,
+			scroll_y=self.scroll_y,
+			pixels_above=self.scroll_y,
+			pixels_below=max(0, self.page_height - self.viewport_height - self.scroll_y),
+			pixels_left=self.scroll_x,
+			pixels_right=max(0, self.page_width - self.viewport_width - self.scroll_x),
+		)
+
+
+async def introspect_page(cdp_session: 'CDPSession') -> PageIntrospection:
+	"""Collect the page state with a single Runtime.evaluate."""
+	result = await cdp_session.cdp_client.send.Runtime.evaluate(
+		params={'expression': PAGE_INTROSPECTION_JS, 'returnByValue': True}, session_id=cdp_session.session_id
+	)
+	if 'exceptionDetails' in result or result.get('result', {}).get('type') != 'object':
+		raise RuntimeError(f'Page introspection failed: {result.get("exceptionDetails", result.get("result"))}')
+	return PageIntrospection.from_value(result['result']['value'])
+
+
+def document_unchanged(captured_version: str | None, reported_version: str | None) -> bool:
+	"""Whether the page's last reported document version shows no change after the captured one.
+
+	Reports of changes made before the capture can arrive after it; their count is not above the captured one.
+	"""
+	if not captured_version or not reported_version:
+		return False
+	captured_id, _, captured_count = captured_version.partition(':')
+	reported_id, _, reported_count = reported_version.partition(':')
+	return captured_id == reported_id and int(reported_count) <= int(captured_count)
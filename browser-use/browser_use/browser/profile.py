@@ -285,6 +285,7 @@ BROWSERUSE_DEFAULT_CHANNEL = BrowserChannel.CHROMIUM
 UrlStr = Annotated[str, AfterValidator(validate_url)]
 NonNegativeFloat = Annotated[float, AfterValidator(lambda x: validate_float_range(x, 0, float('inf')))]
 CliArgStr = Annotated[str, AfterValidator(validate_cli_arg)]
+TextInputMode = Literal['keys', 'insert', 'value']
 
 
 # ===== Base Models =====
@@ -580,6 +581,10 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 		description='Block navigation to URLs containing IP addresses (both IPv4 and IPv6). When True, blocks all IP-based URLs including localhost and private networks.',
 	)
 	keep_alive: bool | None = Field(default=None, description='Keep browser alive after agent run.')
+	isolated_context: bool = Field(
+		default=False,
+		description='Run this session in its own browser context (Target.createBrowserContext) with separate cookies, storage, downloads and proxy. Lets several sessions share one Chrome via the same cdp_url. The context is disposed when the session disconnects.',
+	)
 
 	# --- Proxy settings ---
 	# New consolidated proxy config (typed)
@@ -623,13 +628,45 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 		default=5,
 		description='Maximum depth for cross-origin iframe recursion (default: 5 levels deep).',
 	)
+	iframe_capture_timeout: float = Field(
+		gt=0,
+		default=3.0,
+		description='Time budget in seconds for capturing all cross-origin iframe documents of one state request. Frames that are not done by then are left out.',
+	)
+	max_iframe_nodes: int = Field(
+		gt=0,
+		default=20_000,
+		description='Skip cross-origin iframe documents whose snapshot has more nodes than this. The frame is still captured (its snapshot is what gets counted); the cap saves the tree building and serialization.',
+	)
 
 	# --- Page load/wait timings ---
 
 	minimum_wait_page_load_time: float = Field(default=0.25, description='Minimum time to wait before capturing page state.')
 	wait_for_network_idle_page_load_time: float = Field(default=0.5, description='Time to wait for network idle.')
 
-	wait_between_actions: float = Field(default=0.1, description='Time to wait between actions.')
+	wait_between_actions: float = Field(
+		default=0.1, description='Minimum time between actions, on top of waiting for the page to settle.'
+	)
+	page_settle_quiet_period: float = Field(
+		ge=0,
+		default=0.15,
+		description='Seconds without network requests or DOM changes after which a page counts as settled.',
+	)
+	page_settle_timeout: float = Field(
+		gt=0,
+		default=3.0,
+		description='Most seconds to wait for a page to settle before acting on it or capturing its state anyway.',
+	)
+
+	# --- Text input ---
+	text_input_mode: TextInputMode = Field(
+		default='keys',
+		description="How text is entered into fields: 'keys' types key by key, 'insert' sends the whole text with one Input.insertText, 'value' sets the value directly and dispatches input/change events.",
+	)
+	text_input_mode_by_domain: dict[str, TextInputMode] = Field(
+		default_factory=dict,
+		description="Per-domain text_input_mode overrides keyed by domain pattern (same syntax as allowed_domains), e.g. {'*.greenhouse.io': 'insert'}.",
+	)
 
 	# --- UI/viewport/DOM ---
 	highlight_elements: bool = Field(default=True, description='Highlight interactive elements on the page.')
@@ -640,6 +677,10 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 		default=True, description='Only show element IDs in highlights if llm_representation is less than 10 characters.'
 	)
 	paint_order_filtering: bool = Field(default=True, description='Enable paint order filtering. Slightly experimental.')
+	incremental_dom: bool = Field(
+		default=False,
+		description='Keep the DOM tree current from CDP mutation events instead of refetching the whole document every step. Experimental.',
+	)
 	interaction_highlight_color: str = Field(
 		default='rgb(255, 127, 39)',
 		description='Color to use for highlighting elements during interactions (CSS color string).',
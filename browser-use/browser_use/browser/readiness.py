@@ -0,0 +1,103 @@
+"""Page readiness from CDP events.
+
+A fixed sleep after an action or before capturing state is too long for pages that are already done and too short
+for slow ones. PageActivity follows what CDP reports about a page (main frame loading, network requests and the DOM
+changes reported by DOM_VERSION_TRACKER_JS) so callers can wait exactly until the page has settled: the main frame
+is not loading, no request is in flight, and nothing happened for a short quiet period. A hard ceiling bounds the
+wait for pages that never settle (polling, streaming, animations).
+"""
+
+import asyncio
+import time
+
+# Connections that stay open for the life of the page (or are never answered) and do not hold up readiness
+IGNORED_RESOURCE_TYPES = frozenset({'WebSocket', 'EventSource', 'Ping'})
+
+
+class PageActivity:
+	"""Loading, network and DOM activity of one page target, fed by CDP events.
+
+	Times are time.monotonic() seconds.
+	"""
+
+	def __init__(self, stale_request_timeout: float = 3.0):
+		# Requests in flight for longer than this (long polling, hung requests) no longer count as pending
+		self.stale_request_timeout = stale_request_timeout
+		self.loading = False
+		self.last_activity = time.monotonic()
+		self._requests: dict[str, float] = {}
+		self._waiters: set[asyncio.Event] = set()
+
+	def _touch(self) -> None:
+		self.last_activity = time.monotonic()
+		for waiter in self._waiters:
+			waiter.set()
+
+	def request_started(self, request_id: str, resource_type: str | None = None) -> None:
+		if resource_type in IGNORED_RESOURCE_TYPES:
+			return
+		self._requests[request_id] = time.monotonic()
+		self._touch()
+
+	def request_finished(self, request_id: str) -> None:
+		if self._requests.pop(request_id, None) is not None:
+			self._touch()
+
+	def loading_started(self) -> None:
+		self.loading = True
+		self._touch()
+
+	def loading_stopped(self) -> None:
+		self.loading = False
+		self._touch()
+
+	def document_changed(self) -> None:
+		self._touch()
+
+	@property
+	def pending_requests(self) -> int:
+		"""Number of requests in flight that still hold up readiness."""
+		cutoff = time.monotonic() - self.stale_request_timeout
+		for request_id in [request_id for request_id, started in self._requests.items() if started <= cutoff]:
+			del self._requests[request_id]
+		return len(self._requests)
+
+	async def wait_until_settled(self, quiet_period: float, timeout: float, since: float | None = None) -> bool:
+		"""Wait until the page is idle and has been quiet for `quiet_period` seconds, for at most `timeout` seconds.
+
+		Args:
+			quiet_period: Seconds without any activity that count as settled
+			timeout: Hard ceiling in seconds
+			since: Start of the quiet period at the earliest, e.g. when an action was sent. Events it causes may not
+				have arrived yet, so an earlier quiet stretch must not count.
+
+		Returns:
+			Whether the page settled before the ceiling
+		"""
+		now = time.monotonic()
+		deadline = now + timeout
+		waiter = asyncio.Event()
+		self._waiters.add(waiter)
+		try:
+			while True:
+				if self.loading:
+					wake_in = deadline - now
+				elif self.pending_requests:
+					# Nothing to do until the next event or until the oldest request stops counting
+					wake_in = min(self._requests.values()) + self.stale_request_timeout - now
+				else:
+					quiet_for = now - max(self.last_activity, since or 0.0)
+					if quiet_for >= quiet_period:
+						return True
+					wake_in = quiet_period - quiet_for
+
+				if now >= deadline:
+					return False
+				waiter.clear()
+				try:
+					await asyncio.wait_for(waiter.wait(), timeout=max(min(wake_in, deadline - now), 0.001))
+				except TimeoutError:
+					pass
+				now = time.monotonic()
+		finally:
+			self._waiters.discard(waiter)
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, Self, Union, cast, overload
@@ -12,10 +13,11 @@ from bubus import EventBus
 from cdp_use import CDPClient
 from cdp_use.cdp.fetch import AuthRequiredEvent, RequestPausedEvent
 from cdp_use.cdp.network import Cookie
-from cdp_use.cdp.target import AttachedToTargetEvent, SessionID, TargetID
+from cdp_use.cdp.target import SessionID, TargetID
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from uuid_extensions import uuid7str
 
+from browser_use.browser.cdp_pipeline import CDPPipeline
 from browser_use.browser.cloud.cloud import CloudBrowserAuthError, CloudBrowserClient, CloudBrowserError
 
 # CDP logging is now handled by setup_logging() in logging_config.py
@@ -40,13 +42,15 @@ from browser_use.browser.events import (
 	TabClosedEvent,
 	TabCreatedEvent,
 )
-from browser_use.browser.profile import BrowserProfile, ProxySettings
+from browser_use.browser.profile import BrowserProfile, ProxySettings, TextInputMode
 from browser_use.browser.views import BrowserStateSummary, TabInfo
 from browser_use.dom.views import DOMRect, EnhancedDOMTreeNode, TargetInfo
 from browser_use.observability import observe_debug
 from browser_use.utils import _log_pretty_url, create_task_with_error_handling, is_new_tab_page
 
 if TYPE_CHECKING:
+	import psutil
+
 	from browser_use.actor.page import Page
 	from browser_use.browser.demo_mode import DemoMode
 
@@ -89,6 +93,10 @@ class CDPSession(BaseModel):
 	_lifecycle_events: Any = PrivateAttr(default=None)
 	_lifecycle_lock: Any = PrivateAttr(default=None)
 
+	def pipeline(self) -> CDPPipeline:
+		"""Start a batch of commands for this session that are sent without waiting for each other's responses."""
+		return CDPPipeline(self)
+
 
 class BrowserSession(BaseModel):
 	"""Event-driven browser session with backwards compatibility.
@@ -143,14 +151,21 @@ class BrowserSession(BaseModel):
 		minimum_wait_page_load_time: float | None = None,
 		wait_for_network_idle_page_load_time: float | None = None,
 		wait_between_actions: float | None = None,
+		page_settle_quiet_period: float | None = None,
+		page_settle_timeout: float | None = None,
 		auto_download_pdfs: bool | None = None,
 		cookie_whitelist_domains: list[str] | None = None,
 		cross_origin_iframes: bool | None = None,
 		highlight_elements: bool | None = None,
 		dom_highlight_elements: bool | None = None,
 		paint_order_filtering: bool | None = None,
+		incremental_dom: bool | None = None,
 		max_iframes: int | None = None,
 		max_iframe_depth: int | None = None,
+		iframe_capture_timeout: float | None = None,
+		max_iframe_nodes: int | None = None,
+		text_input_mode: TextInputMode | None = None,
+		text_input_mode_by_domain: dict[str, TextInputMode] | None = None,
 	) -> None: ...
 
 	# Overload 2: Local browser mode (use local browser params)
@@ -172,17 +187,25 @@ class BrowserSession(BaseModel):
 		headers: dict[str, str] | None = None,
 		allowed_domains: list[str] | None = None,
 		keep_alive: bool | None = None,
+		isolated_context: bool | None = None,
 		minimum_wait_page_load_time: float | None = None,
 		wait_for_network_idle_page_load_time: float | None = None,
 		wait_between_actions: float | None = None,
+		page_settle_quiet_period: float | None = None,
+		page_settle_timeout: float | None = None,
 		auto_download_pdfs: bool | None = None,
 		cookie_whitelist_domains: list[str] | None = None,
 		cross_origin_iframes: bool | None = None,
 		highlight_elements: bool | None = None,
 		dom_highlight_elements: bool | None = None,
 		paint_order_filtering: bool | None = None,
+		incremental_dom: bool | None = None,
 		max_iframes: int | None = None,
 		max_iframe_depth: int | None = None,
+		iframe_capture_timeout: float | None = None,
+		max_iframe_nodes: int | None = None,
+		text_input_mode: TextInputMode | None = None,
+		text_input_mode_by_domain: dict[str, TextInputMode] | None = None,
 		# All other local params
 		env: dict[str, str | float | bool] | None = None,
 		ignore_default_args: list[str] | Literal[True] | None = None,
@@ -271,6 +294,7 @@ class BrowserSession(BaseModel):
 		deterministic_rendering: bool | None = None,
 		allowed_domains: list[str] | None = None,
 		keep_alive: bool | None = None,
+		isolated_context: bool | None = None,
 		proxy: ProxySettings | None = None,
 		enable_default_extensions: bool | None = None,
 		window_size: dict | None = None,
@@ -278,6 +302,8 @@ class BrowserSession(BaseModel):
 		minimum_wait_page_load_time: float | None = None,
 		wait_for_network_idle_page_load_time: float | None = None,
 		wait_between_actions: float | None = None,
+		page_settle_quiet_period: float | None = None,
+		page_settle_timeout: float | None = None,
 		filter_highlight_ids: bool | None = None,
 		auto_download_pdfs: bool | None = None,
 		profile_directory: str | None = None,
@@ -287,9 +313,14 @@ class BrowserSession(BaseModel):
 		highlight_elements: bool | None = None,
 		dom_highlight_elements: bool | None = None,
 		paint_order_filtering: bool | None = None,
+		incremental_dom: bool | None = None,
 		# Iframe processing limits
 		max_iframes: int | None = None,
 		max_iframe_depth: int | None = None,
+		iframe_capture_timeout: float | None = None,
+		max_iframe_nodes: int | None = None,
+		text_input_mode: TextInputMode | None = None,
+		text_input_mode_by_domain: dict[str, TextInputMode] | None = None,
 	):
 		# Following the same pattern as AgentSettings in service.py
 		# Only pass non-None values to avoid validation errors
@@ -386,6 +417,21 @@ class BrowserSession(BaseModel):
 		"""Whether this is a local browser instance from browser profile."""
 		return self.browser_profile.is_local
 
+	@property
+	def browser_context_id(self) -> str | None:
+		"""Browser context owned by this session (None = the browser's default context)."""
+		return self._browser_context_id
+
+	def detach_browser_process(self) -> 'psutil.Process | None':
+		"""Take over the local browser process this session launched (None if it did not launch one).
+
+		The caller becomes responsible for stopping it (see `LocalBrowserWatchdog.terminate_process`): stopping or
+		killing this session no longer terminates it.
+		"""
+		if self._local_browser_watchdog is None:
+			return None
+		return self._local_browser_watchdog.detach_process()
+
 	@property
 	def cloud_browser(self) -> bool:
 		"""Whether to use cloud browser service from browser profile."""
@@ -410,6 +456,8 @@ class BrowserSession(BaseModel):
 
 	# Mutable private state shared between watchdogs
 	_cdp_client_root: CDPClient | None = PrivateAttr(default=None)
+	_browser_context_id: str | None = PrivateAttr(default=None)  # set when browser_profile.isolated_context=True
+	_proxy_auth_enabled: bool = PrivateAttr(default=False)  # set once proxy credentials are answered via CDP Fetch
 	_connection_lock: Any = PrivateAttr(default=None)  # asyncio.Lock for preventing concurrent connections
 
 	# PUBLIC: SessionManager instance (OWNS all targets and sessions)
@@ -484,6 +532,22 @@ class BrowserSession(BaseModel):
 			await self.session_manager.clear()
 			self.session_manager = None
 
+		# Dispose our isolated browser context (closes its tabs) - other sessions may share this browser
+		if self._browser_context_id and self._cdp_client_root:
+			try:
+				await asyncio.wait_for(
+					self._cdp_client_root.send.Target.disposeBrowserContext(
+						params={'browserContextId': self._browser_context_id}
+					),
+					timeout=5.0,
+				)
+				self.logger.debug(f'Disposed browser context {self._browser_context_id[-4:]} during reset')
+			except Exception as e:
+				# disposeOnDetach still cleans it up once the WebSocket closes
+				self.logger.debug(f'Error disposing browser context during reset: {e}')
+		self._browser_context_id = None
+		self._proxy_auth_enabled = False
+
 		# Close CDP WebSocket before clearing to prevent stale event handlers
 		if self._cdp_client_root:
 			try:
@@ -790,14 +854,14 @@ class BrowserSession(BaseModel):
 			raise
 
 	async def _navigate_and_wait(self, url: str, target_id: str, timeout: float | None = None) -> None:
-		"""Navigate to URL and wait for page readiness using CDP lifecycle events.
+		"""Navigate to URL and wait for page readiness.
 
-		Two-strategy approach optimized for speed with robust fallback:
+		Pages tracked by the DOM watchdog are waited on until they settled: the main frame stopped loading, no request
+		is in flight and the DOM stopped changing (see browser_use.browser.readiness). Otherwise, two-strategy
+		approach on CDP lifecycle events:
 		1. networkIdle - Returns ASAP when no network activity (~50-200ms for cached pages)
 		2. load - Fallback when page has ongoing network activity (all resources loaded)
 
-		This gives us instant returns for cached content while being robust for dynamic pages.
-
 		NO handler registration here - handlers are registered ONCE per session in SessionManager.
 		We poll stored events instead to avoid handler accumulation.
 		"""
@@ -815,6 +879,7 @@ class BrowserSession(BaseModel):
 
 		# Start performance tracking
 		nav_start_time = asyncio.get_event_loop().time()
+		nav_started = time.monotonic()
 
 		nav_result = await cdp_session.cdp_client.send.Page.navigate(
 			params={'url': url, 'transitionType': 'address_bar'},
@@ -825,6 +890,15 @@ class BrowserSession(BaseModel):
 		if nav_result.get('errorText'):
 			raise RuntimeError(f'Navigation failed: {nav_result["errorText"]}')
 
+		if self._dom_watchdog and self._dom_watchdog.is_tracking_page(target_id):
+			settled = await self._dom_watchdog.wait_for_page_settled(target_id, since=nav_started, timeout=timeout)
+			duration_ms = (asyncio.get_event_loop().time() - nav_start_time) * 1000
+			if settled:
+				self.logger.debug(f'✅ Page ready for {url} (settled, {duration_ms:.0f}ms)')
+			else:
+				self.logger.warning(f'⚠️ Page readiness timeout ({timeout}s, {duration_ms:.0f}ms) for {url}')
+			return
+
 		# Track this specific navigation
 		navigation_id = nav_result.get('loaderId')
 		start_time = asyncio.get_event_loop().time()
@@ -900,7 +974,9 @@ class BrowserSession(BaseModel):
 			else:
 				# No pages open at all, create a new one (handles switching to it automatically)
 				assert self._cdp_client_root is not None, 'CDP client root not initialized - browser may not be connected yet'
-				new_target = await self._cdp_client_root.send.Target.createTarget(params={'url': 'about:blank'})
+				new_target = await self._cdp_client_root.send.Target.createTarget(
+					params=self._in_browser_context({'url': 'about:blank'})
+				)
 				target_id = new_target['targetId']
 				# Don't await, these may circularly trigger SwitchTabEvent and could deadlock, dispatch to enqueue and return
 				self.event_bus.dispatch(TabCreatedEvent(url='about:blank', target_id=target_id))
@@ -1068,7 +1144,7 @@ class BrowserSession(BaseModel):
 		"""Create a new page (tab)."""
 		from cdp_use.cdp.target.commands import CreateTargetParameters
 
-		params: CreateTargetParameters = {'url': url or 'about:blank'}
+		params: CreateTargetParameters = self._in_browser_context({'url': url or 'about:blank'})
 		result = await self.cdp_client.send.Target.createTarget(params)
 
 		target_id = result['targetId']
@@ -1138,6 +1214,10 @@ class BrowserSession(BaseModel):
 
 	async def clear_cookies(self) -> None:
 		"""Clear all cookies."""
+		if self._browser_context_id:
+			# Network.clearBrowserCookies would wipe every context in a shared browser
+			await self.cdp_client.send.Storage.clearCookies(params={'browserContextId': self._browser_context_id})
+			return
 		await self.cdp_client.send.Network.clearBrowserCookies()
 
 	async def export_storage_state(self, output_path: str | Path | None = None) -> dict[str, Any]:
@@ -1497,10 +1577,15 @@ class BrowserSession(BaseModel):
 
 		try:
 			# Create and store the CDP client for direct CDP communication
-			self._cdp_client_root = CDPClient(self.cdp_url) # Use 200MB limit to handle pages with very large DOMs
+			self._cdp_client_root = CDPClient(self.cdp_url)  # Use 200MB limit to handle pages with very large DOMs
 			assert self._cdp_client_root is not None
 			await self._cdp_client_root.start()
 
+			# Create our own browser context before discovering targets so the
+			# SessionManager only ever sees tabs that belong to this session
+			if self.browser_profile.isolated_context:
+				await self._create_isolated_browser_context()
+
 			# Initialize event-driven session manager FIRST (before enabling autoAttach)
 			# SessionManager will:
 			# 1. Register attach/detach event handlers
@@ -1543,7 +1628,9 @@ class BrowserSession(BaseModel):
 
 			# Ensure we have at least one page
 			if not page_targets_from_manager:
-				new_target = await self._cdp_client_root.send.Target.createTarget(params={'url': 'about:blank'})
+				new_target = await self._cdp_client_root.send.Target.createTarget(
+					params=self._in_browser_context({'url': 'about:blank'})
+				)
 				target_id = new_target['targetId']
 				self.logger.debug(f'📄 Created new blank page: {target_id}')
 			else:
@@ -1606,17 +1693,45 @@ class BrowserSession(BaseModel):
 
 			self.session_manager = None
 			self._cdp_client_root = None
+			self._browser_context_id = None  # disposeOnDetach cleans it up with the WebSocket
 			self.agent_focus_target_id = None
 			# Re-raise as a fatal error
 			raise RuntimeError(f'Failed to establish CDP connection to browser: {e}') from e
 
 		return self
 
+	async def _create_isolated_browser_context(self) -> None:
+		"""Create a dedicated browser context for this session (incognito-like: own cookies, storage and cache).
+
+		The proxy is applied per context, so sessions sharing one browser can each use a different proxy.
+		"""
+		assert self._cdp_client_root
+
+		params: dict[str, Any] = {'disposeOnDetach': True}
+		proxy = self.browser_profile.proxy
+		if proxy and proxy.server:
+			params['proxyServer'] = proxy.server
+			if proxy.bypass:
+				params['proxyBypassList'] = proxy.bypass
+
+		result = await self._cdp_client_root.send.Target.createBrowserContext(params=params)  # type: ignore[arg-type]
+		self._browser_context_id = result['browserContextId']
+		self.logger.debug(f'🧳 Created isolated browser context {self._browser_context_id}')
+
+	def _in_browser_context(self, params: dict[str, Any]) -> Any:
+		"""Add this session's browserContextId to Target.createTarget params (no-op for the default context)."""
+		if self._browser_context_id:
+			params['browserContextId'] = self._browser_context_id
+		return params
+
 	async def _setup_proxy_auth(self) -> None:
 		"""Enable CDP Fetch auth handling for authenticated proxy, if credentials provided.
 
 		Handles HTTP proxy authentication challenges (Basic/Proxy) by providing
 		configured credentials from BrowserProfile.
+
+		With isolated_context, Fetch is only enabled on the sessions of our own targets: enabling it browser-wide
+		would also pause and answer the requests of other sessions sharing the browser, with our credentials.
 		"""
 
 		assert self._cdp_client_root
@@ -1630,28 +1745,17 @@ class BrowserSession(BaseModel):
 				return
 
 			# Enable Fetch domain with auth handling (do not pause all requests)
-			try:
-				await self._cdp_client_root.send.Fetch.enable(params={'handleAuthRequests': True})
-				self.logger.debug('Fetch.enable(handleAuthRequests=True) enabled on root client')
-			except Exception as e:
-				self.logger.debug(f'Fetch.enable on root failed: {type(e).__name__}: {e}')
-
-			# Also enable on the focused target's session if available to ensure events are delivered
-			try:
-				if self.agent_focus_target_id:
-					cdp_session = await self.get_or_create_cdp_session(self.agent_focus_target_id, focus=False)
-					await cdp_session.cdp_client.send.Fetch.enable(
-						params={'handleAuthRequests': True},
-						session_id=cdp_session.session_id,
-					)
-					self.logger.debug('Fetch.enable(handleAuthRequests=True) enabled on focused session')
-			except Exception as e:
-				self.logger.debug(f'Fetch.enable on focused session failed: {type(e).__name__}: {e}')
+			if not self._browser_context_id:
+				try:
+					await self._cdp_client_root.send.Fetch.enable(params={'handleAuthRequests': True})
+					self.logger.debug('Fetch.enable(handleAuthRequests=True) enabled on root client')
+				except Exception as e:
+					self.logger.debug(f'Fetch.enable on root failed: {type(e).__name__}: {e}')
 
 			def _on_auth_required(event: AuthRequiredEvent, session_id: SessionID | None = None):
 				# event keys may be snake_case or camelCase depending on generator; handle both
 				request_id = event.get('requestId') or event.get('request_id')
-				if not request_id:
+				if not request_id or not self._owns_fetch_session(session_id):
 					return
 
 				challenge = event.get('authChallenge') or event.get('auth_challenge') or {}
@@ -1700,7 +1804,7 @@ class BrowserSession(BaseModel):
 			def _on_request_paused(event: RequestPausedEvent, session_id: SessionID | None = None):
 				# Continue all paused requests to avoid stalling the network
 				request_id = event.get('requestId') or event.get('request_id')
-				if not request_id:
+				if not request_id or not self._owns_fetch_session(session_id):
 					return
 
 				async def _continue():
@@ -1717,58 +1821,43 @@ class BrowserSession(BaseModel):
 					_continue(), name='request_continue', logger_instance=self.logger, suppress_exceptions=True
 				)
 
-			# Register event handler on root client
+			# Register event handlers on root client (one handler per method, shared by all sessions)
 			try:
 				self._cdp_client_root.register.Fetch.authRequired(_on_auth_required)
 				self._cdp_client_root.register.Fetch.requestPaused(_on_request_paused)
-				if self.agent_focus_target_id:
-					cdp_session = await self.get_or_create_cdp_session(self.agent_focus_target_id, focus=False)
-					cdp_session.cdp_client.register.Fetch.authRequired(_on_auth_required)
-					cdp_session.cdp_client.register.Fetch.requestPaused(_on_request_paused)
 				self.logger.debug('Registered Fetch.authRequired handlers')
 			except Exception as e:
 				self.logger.debug(f'Failed to register authRequired handlers: {type(e).__name__}: {e}')
 
-			# Auto-enable Fetch on every newly attached target to ensure auth callbacks fire
-			def _on_attached(event: AttachedToTargetEvent, session_id: SessionID | None = None):
-				sid = event.get('sessionId') or event.get('session_id') or session_id
-				if not sid:
-					return
+			# SessionManager enables Fetch on every target attached from now on (only ours, others are detached)
+			self._proxy_auth_enabled = True
 
-				async def _enable():
-					assert self._cdp_client_root
-					try:
-						await self._cdp_client_root.send.Fetch.enable(
-							params={'handleAuthRequests': True},
-							session_id=sid,
-						)
-						self.logger.debug(f'Fetch.enable(handleAuthRequests=True) enabled on attached session {sid}')
-					except Exception as e:
-						self.logger.debug(f'Fetch.enable on attached session failed: {type(e).__name__}: {e}')
-
-				create_task_with_error_handling(
-					_enable(), name='fetch_enable_attached', logger_instance=self.logger, suppress_exceptions=True
-				)
+			# Ensure Fetch is enabled for the targets we are already attached to
+			if self.session_manager:
+				for target_id in self.session_manager.get_all_target_ids():
+					cdp_session = self.session_manager._get_session_for_target(target_id)
+					if cdp_session:
+						await self._enable_proxy_auth(cdp_session.session_id)
+		except Exception as e:
+			self.logger.debug(f'Skipping proxy auth setup: {type(e).__name__}: {e}')
 
-			try:
-				self._cdp_client_root.register.Target.attachedToTarget(_on_attached)
-				self.logger.debug('Registered Target.attachedToTarget handler for Fetch.enable')
-			except Exception as e:
-				self.logger.debug(f'Failed to register attachedToTarget handler: {type(e).__name__}: {e}')
+	def _owns_fetch_session(self, session_id: SessionID | None) -> bool:
+		"""Whether a Fetch event comes from one of our own targets (always true outside isolated_context)."""
+		if not self._browser_context_id:
+			return True
+		return bool(session_id and self.session_manager and self.session_manager.get_target_id_from_session_id(session_id))
 
-			# Ensure Fetch is enabled for the current focused target's session, too
-			try:
-				if self.agent_focus_target_id:
-					# Use safe API with focus=False to avoid changing focus
-					cdp_session = await self.get_or_create_cdp_session(self.agent_focus_target_id, focus=False)
-					await cdp_session.cdp_client.send.Fetch.enable(
-						params={'handleAuthRequests': True, 'patterns': [{'urlPattern': '*'}]},
-						session_id=cdp_session.session_id,
-					)
-			except Exception as e:
-				self.logger.debug(f'Fetch.enable on focused session failed: {type(e).__name__}: {e}')
+	async def _enable_proxy_auth(self, session_id: SessionID) -> None:
+		"""Enable Fetch auth handling on one target session, so its proxy challenges reach _setup_proxy_auth's handlers."""
+		assert self._cdp_client_root
+		try:
+			await self._cdp_client_root.send.Fetch.enable(
+				params={'handleAuthRequests': True, 'patterns': [{'urlPattern': '*'}]},
+				session_id=session_id,
+			)
+			self.logger.debug(f'Fetch.enable(handleAuthRequests=True) enabled on session {session_id}')
 		except Exception as e:
-			self.logger.debug(f'Skipping proxy auth setup: {type(e).__name__}: {e}')
+			self.logger.debug(f'Fetch.enable on session {session_id} failed: {type(e).__name__}: {e}')
 
 	async def get_tabs(self) -> list[TabInfo]:
 		"""Get information about all open tabs using cached target data."""
@@ -1970,6 +2059,20 @@ class BrowserSession(BaseModel):
 			and element.attributes.get('type', '').lower() == 'file'
 		)
 
+	async def wait_for_page_settled(self, since: float | None = None, timeout: float | None = None) -> bool:
+		"""Wait until the focused page stopped loading, has no requests in flight and its DOM stopped changing.
+
+		Args:
+			since: time.monotonic() of the action whose effects to wait for; only quiet time after it counts
+			timeout: Hard ceiling in seconds, defaults to the profile's page_settle_timeout
+
+		Returns:
+			Whether the page settled before the ceiling
+		"""
+		if not self._dom_watchdog:
+			return False
+		return await self._dom_watchdog.wait_for_page_settled(since=since, timeout=timeout)
+
 	async def get_selector_map(self) -> dict[int, EnhancedDOMTreeNode]:
 		"""Get the current selector map from cached state or DOM watchdog.
 
@@ -2706,15 +2809,12 @@ class BrowserSession(BaseModel):
 	async def _cdp_create_new_page(self, url: str = 'about:blank', background: bool = False, new_window: bool = False) -> str:
 		"""Create a new page/tab using CDP Target.createTarget. Returns target ID."""
 		# Use the root CDP client to create tabs at the browser level
+		params = self._in_browser_context({'url': url, 'newWindow': new_window, 'background': background})
 		if self._cdp_client_root:
-			result = await self._cdp_client_root.send.Target.createTarget(
-				params={'url': url, 'newWindow': new_window, 'background': background}
-			)
+			result = await self._cdp_client_root.send.Target.createTarget(params=params)
 		else:
 			# Fallback to using cdp_client if root is not available
-			result = await self.cdp_client.send.Target.createTarget(
-				params={'url': url, 'newWindow': new_window, 'background': background}
-			)
+			result = await self.cdp_client.send.Target.createTarget(params=params)
 		return result['targetId']
 
 	async def _cdp_close_page(self, target_id: TargetID) -> None:
@@ -45,6 +45,10 @@ class SessionManager:
 		# Reverse mapping: session -> target it belongs to
 		self._session_to_target: dict[SessionID, TargetID] = {}
 
+		# Sessions Chrome auto-attached for targets in other browser contexts (isolated_context mode).
+		# We detach from them immediately and ignore their detach events.
+		self._foreign_sessions: set[SessionID] = set()
+
 		self._lock = asyncio.Lock()
 		self._recovery_lock = asyncio.Lock()
 
@@ -111,6 +115,15 @@ class SessionManager:
 		# Discover and initialize ALL existing targets
 		await self._initialize_existing_targets()
 
+	def owns_target(self, target_info: dict) -> bool:
+		"""Whether a target belongs to this browser session's browser context.
+
+		Always True for sessions using the browser's default context; with isolated_context,
+		only targets created in our own context are tracked.
+		"""
+		context_id = self.browser_session.browser_context_id
+		return context_id is None or target_info.get('browserContextId') == context_id
+
 	def _get_session_for_target(self, target_id: TargetID) -> 'CDPSession | None':
 		"""Internal: Get ANY valid session for a target (picks first available).
 
@@ -180,6 +193,7 @@ class SessionManager:
 			self._sessions.clear()
 			self._target_sessions.clear()
 			self._session_to_target.clear()
+			self._foreign_sessions.clear()
 
 		self.logger.info('[SessionManager] Cleared all owned data (targets, sessions, mappings)')
 
@@ -383,6 +397,18 @@ class SessionManager:
 			f'type={target_type}, waitingForDebugger={waiting_for_debugger})'
 		)
 
+		# Another session's tab in a shared browser - let go of it so we never route events or actions there
+		if not self.owns_target(target_info):
+			self._foreign_sessions.add(session_id)
+			if self.browser_session._cdp_client_root is not None:
+				try:
+					if waiting_for_debugger:
+						await self.browser_session._cdp_client_root.send.Runtime.runIfWaitingForDebugger(session_id=session_id)
+					await self.browser_session._cdp_client_root.send.Target.detachFromTarget(params={'sessionId': session_id})
+				except Exception as e:
+					self.logger.debug(f'[SessionManager] Failed to detach from foreign target {target_id[:8]}...: {e}')
+			return
+
 		# Defensive check: browser may be shutting down and _cdp_client_root could be None
 		if self.browser_session._cdp_client_root is None:
 			self.logger.debug(
@@ -401,6 +427,10 @@ class SessionManager:
 			if '-32001' not in error_str and 'Session with given id not found' not in error_str:
 				self.logger.debug(f'[SessionManager] Auto-attach failed for {target_type}: {e}')
 
+		# Answer proxy auth challenges of this target too (Fetch is enabled per owned target, not browser-wide)
+		if self.browser_session._proxy_auth_enabled:
+			await self.browser_session._enable_proxy_auth(session_id)
+
 		async with self._lock:
 			# Track this session for the target
 			if target_id not in self._target_sessions:
@@ -487,6 +517,10 @@ class SessionManager:
 		session_id = event['sessionId']
 		target_id = event.get('targetId')  # May be empty
 
+		if session_id in self._foreign_sessions:
+			self._foreign_sessions.discard(session_id)
+			return
+
 		# If targetId not in event, look it up via session mapping
 		if not target_id:
 			async with self._lock:
@@ -758,6 +792,9 @@ class SessionManager:
 			target_id = target['targetId']
 			target_type = target.get('type', 'unknown')
 
+			if not self.owns_target(target):
+				continue  # Belongs to another browser context
+
 			try:
 				# Just attach - event handler does everything
 				await cdp_client.send.Target.attachToTarget(params={'targetId': target_id, 'flatten': True})
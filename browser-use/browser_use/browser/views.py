@@ -5,7 +5,7 @@ from bubus import BaseEvent
 from cdp_use.cdp.target import TargetID
 from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_serializer
 
-from browser_use.dom.views import DOMInteractedElement, SerializedDOMState
+from browser_use.dom.views import DOMInteractedElement, DOMStateDiff, SerializedDOMState
 
 # Known placeholder image data for about:blank pages - a 4x4 white PNG
 PLACEHOLDER_4PX_SCREENSHOT = (
@@ -108,6 +108,7 @@ class BrowserStateSummary:
 	pending_network_requests: list[NetworkRequest] = field(default_factory=list)  # Currently loading network requests
 	pagination_buttons: list[PaginationButton] = field(default_factory=list)  # Detected pagination buttons
 	closed_popup_messages: list[str] = field(default_factory=list)  # Messages from auto-closed JavaScript dialogs
+	dom_diff: DOMStateDiff | None = None  # Interactive element changes since the previous state (None without a DOM build)
 
 
 @dataclass
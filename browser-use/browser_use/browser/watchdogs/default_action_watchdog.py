@@ -2,12 +2,15 @@
 
 import asyncio
 import json
+import time
+from typing import Any
 
 from cdp_use.cdp.input.commands import DispatchKeyEventParameters
 
 from browser_use.actor.utils import get_key_info
 from browser_use.browser.events import (
 	ClickElementEvent,
+	FillFormEvent,
 	GetDropdownOptionsEvent,
 	GoBackEvent,
 	GoForwardEvent,
@@ -20,14 +23,18 @@ from browser_use.browser.events import (
 	UploadFileEvent,
 	WaitEvent,
 )
+from browser_use.browser.profile import TextInputMode
 from browser_use.browser.views import BrowserError, URLNotAllowedError
 from browser_use.browser.watchdog_base import BaseWatchdog
 from browser_use.dom.service import EnhancedDOMTreeNode
+from browser_use.dom.views import DOMRect, NodeType
 from browser_use.observability import observe_debug
+from browser_use.utils import match_url_with_domain_pattern
 
 # Import EnhancedDOMTreeNode and rebuild event models that have forward references to it
 # This must be done after all imports are complete
 ClickElementEvent.model_rebuild()
+FillFormEvent.model_rebuild()
 GetDropdownOptionsEvent.model_rebuild()
 SelectDropdownOptionEvent.model_rebuild()
 TypeTextEvent.model_rebuild()
@@ -222,7 +229,7 @@ class DefaultActionWatchdog(BaseWatchdog):
 			# Check if this is index 0 or a falsy index - type to the page (whatever has focus)
 			if not element_node.backend_node_id or element_node.backend_node_id == 0:
 				# Type to the page without focusing any specific element
-				await self._type_to_page(event.text)
+				await self._type_to_page(event.text, input_mode=event.input_mode)
 				# Log with sensitive data protection
 				if event.is_sensitive:
 					if event.sensitive_key_name:
@@ -240,6 +247,7 @@ class DefaultActionWatchdog(BaseWatchdog):
 						event.text,
 						clear=event.clear or (not event.text),
 						is_sensitive=event.is_sensitive,
+						input_mode=event.input_mode,
 					)
 					# Log with sensitive data protection
 					if event.is_sensitive:
@@ -258,7 +266,7 @@ class DefaultActionWatchdog(BaseWatchdog):
 						await asyncio.wait_for(self._click_element_node_impl(element_node), timeout=10.0)
 					except Exception as e:
 						pass
-					await self._type_to_page(event.text)
+					await self._type_to_page(event.text, input_mode=event.input_mode)
 					# Log with sensitive data protection
 					if event.is_sensitive:
 						if event.sensitive_key_name:
@@ -327,7 +335,32 @@ class DefaultActionWatchdog(BaseWatchdog):
 
 	# ========== Implementation Methods ==========
 
-	async def _check_element_occlusion(self, backend_node_id: int, x: float, y: float, cdp_session) -> bool:
+	@staticmethod
+	def _rect_from_quad(quad: list[float]) -> DOMRect | None:
+		"""Bounding rect of a content quad, or None when it is degenerate."""
+		if len(quad) < 8:
+			return None
+		xs = [quad[i] for i in range(0, 8, 2)]
+		ys = [quad[i] for i in range(1, 8, 2)]
+		width, height = max(xs) - min(xs), max(ys) - min(ys)
+		if width <= 0 or height <= 0:
+			return None
+		return DOMRect(x=min(xs), y=min(ys), width=width, height=height)
+
+	def _snapshot_click_point(self, element_node: EnhancedDOMTreeNode) -> tuple[float, float] | None:
+		"""Click point from the cached DOM snapshot, or None when the live page has to be asked."""
+		dom_watchdog = self.browser_session._dom_watchdog
+		if dom_watchdog is None:
+			return None
+		try:
+			return dom_watchdog.snapshot_click_point(element_node)
+		except Exception as e:
+			self.logger.debug(f'Snapshot click point failed: {type(e).__name__}: {e}')
+			return None
+
+	async def _check_element_occlusion(
+		self, backend_node_id: int, x: float, y: float, cdp_session, object_id: str | None = None
+	) -> bool:
 		"""Check if an element is occluded by other elements at the given coordinates.
 
 		Args:
@@ -335,6 +368,7 @@ class DefaultActionWatchdog(BaseWatchdog):
 			x: X coordinate to check
 			y: Y coordinate to check
 			cdp_session: CDP session to use
+			object_id: Already resolved object ID of the element, saves a DOM.resolveNode round trip
 
 		Returns:
 			True if element is occluded, False if clickable
@@ -342,16 +376,17 @@ class DefaultActionWatchdog(BaseWatchdog):
 		try:
 			session_id = cdp_session.session_id
 
-			# Get target element info for comparison
-			target_result = await cdp_session.cdp_client.send.DOM.resolveNode(
-				params={'backendNodeId': backend_node_id}, session_id=session_id
-			)
+			if object_id is None:
+				# Get target element info for comparison
+				target_result = await cdp_session.cdp_client.send.DOM.resolveNode(
+					params={'backendNodeId': backend_node_id}, session_id=session_id
+				)
 
-			if 'object' not in target_result:
-				self.logger.debug('Could not resolve target element, assuming occluded')
-				return True
+				if 'object' not in target_result:
+					self.logger.debug('Could not resolve target element, assuming occluded')
+					return True
 
-			object_id = target_result['object']['objectId']
+				object_id = target_result['object']['objectId']
 
 			# Get target element info
 			target_info_result = await cdp_session.cdp_client.send.Runtime.callFunctionOn(
@@ -447,170 +482,197 @@ class DefaultActionWatchdog(BaseWatchdog):
 			# Get the correct session ID for the element's frame
 			session_id = cdp_session.session_id
 
+			send = cdp_session.cdp_client.send
+
 			# Get element bounds
 			backend_node_id = element_node.backend_node_id
 
-			# Get viewport dimensions for visibility checks
-			layout_metrics = await cdp_session.cdp_client.send.Page.getLayoutMetrics(session_id=session_id)
-			viewport_width = layout_metrics['layoutViewport']['clientWidth']
-			viewport_height = layout_metrics['layoutViewport']['clientHeight']
-
-			# Scroll element into view FIRST before getting coordinates
-			try:
-				await cdp_session.cdp_client.send.DOM.scrollIntoViewIfNeeded(
-					params={'backendNodeId': backend_node_id}, session_id=session_id
-				)
-				await asyncio.sleep(0.05)  # Wait for scroll to complete
-				self.logger.debug('Scrolled element into view before getting coordinates')
-			except Exception as e:
-				self.logger.debug(f'Failed to scroll element into view: {e}')
-
-			# Get element coordinates using the unified method AFTER scrolling
-			element_rect = await self.browser_session.get_element_coordinates(backend_node_id, cdp_session)
-
-			# Convert rect to quads format if we got coordinates
-			quads = []
-			if element_rect:
-				# Convert DOMRect to quad format
-				x, y, w, h = element_rect.x, element_rect.y, element_rect.width, element_rect.height
-				quads = [
-					[
-						x,
-						y,  # top-left
-						x + w,
-						y,  # top-right
-						x + w,
-						y + h,  # bottom-right
-						x,
-						y + h,  # bottom-left
-					]
-				]
-				self.logger.debug(
-					f'Got coordinates from unified method: {element_rect.x}, {element_rect.y}, {element_rect.width}x{element_rect.height}'
-				)
-
-			# If we still don't have quads, fall back to JS click
-			if not quads:
-				self.logger.warning('Could not get element geometry from any method, falling back to JavaScript click')
-				try:
-					result = await cdp_session.cdp_client.send.DOM.resolveNode(
-						params={'backendNodeId': backend_node_id},
-						session_id=session_id,
+			# A snapshot of the unchanged document already tells where the element is and whether it is covered,
+			# otherwise ask the live page
+			object_id: str | None = None
+			snapshot_point = self._snapshot_click_point(element_node)
+			if snapshot_point is not None:
+				center_x, center_y = snapshot_point
+				self.logger.debug(f'Using click point from the DOM snapshot: {center_x}, {center_y}')
+			else:
+				# Viewport size, scroll, element quads and object ID only depend on the node, so they go out in one round trip.
+				# Chrome runs them in order, so the quads are measured after the scroll.
+				async with cdp_session.pipeline() as pipeline:
+					layout_metrics_task = pipeline.add(send.Page.getLayoutMetrics(session_id=session_id))
+					scroll_task = pipeline.add(
+						send.DOM.scrollIntoViewIfNeeded(params={'backendNodeId': backend_node_id}, session_id=session_id)
 					)
-					assert 'object' in result and 'objectId' in result['object'], (
-						'Failed to find DOM element based on backendNodeId, maybe page content changed?'
+					content_quads_task = pipeline.add(
+						send.DOM.getContentQuads(params={'backendNodeId': backend_node_id}, session_id=session_id)
 					)
-					object_id = result['object']['objectId']
-
-					await cdp_session.cdp_client.send.Runtime.callFunctionOn(
-						params={
-							'functionDeclaration': 'function() { this.click(); }',
-							'objectId': object_id,
-						},
-						session_id=session_id,
+					resolve_task = pipeline.add(
+						send.DOM.resolveNode(params={'backendNodeId': backend_node_id}, session_id=session_id)
 					)
-					await asyncio.sleep(0.05)
-					# Navigation is handled by BrowserSession via events
-					return None
-				except Exception as js_e:
-					self.logger.warning(f'CDP JavaScript click also failed: {js_e}')
-					if 'No node with given id found' in str(js_e):
-						raise Exception('Element with given id not found')
-					else:
-						raise Exception(f'Failed to click element: {js_e}')
-
-			# Find the largest visible quad within the viewport
-			best_quad = None
-			best_area = 0
-
-			for quad in quads:
-				if len(quad) < 8:
-					continue
-
-				# Calculate quad bounds
-				xs = [quad[i] for i in range(0, 8, 2)]
-				ys = [quad[i] for i in range(1, 8, 2)]
-				min_x, max_x = min(xs), max(xs)
-				min_y, max_y = min(ys), max(ys)
-
-				# Check if quad intersects with viewport
-				if max_x < 0 or max_y < 0 or min_x > viewport_width or min_y > viewport_height:
-					continue  # Quad is completely outside viewport
-
-				# Calculate visible area (intersection with viewport)
-				visible_min_x = max(0, min_x)
-				visible_max_x = min(viewport_width, max_x)
-				visible_min_y = max(0, min_y)
-				visible_max_y = min(viewport_height, max_y)
-
-				visible_width = visible_max_x - visible_min_x
-				visible_height = visible_max_y - visible_min_y
-				visible_area = visible_width * visible_height
-
-				if visible_area > best_area:
-					best_area = visible_area
-					best_quad = quad
 
-			if not best_quad:
-				# No visible quad found, use the first quad anyway
-				best_quad = quads[0]
-				self.logger.warning('No visible quad found, using first quad')
+				layout_metrics = layout_metrics_task.result()
+				viewport_width = layout_metrics['layoutViewport']['clientWidth']
+				viewport_height = layout_metrics['layoutViewport']['clientHeight']
 
-			# Calculate center point of the best quad
-			center_x = sum(best_quad[i] for i in range(0, 8, 2)) / 4
-			center_y = sum(best_quad[i] for i in range(1, 8, 2)) / 4
+				if scroll_task.exception():
+					self.logger.debug(f'Failed to scroll element into view: {scroll_task.exception()}')
+				else:
+					self.logger.debug('Scrolled element into view before getting coordinates')
+
+				if not resolve_task.exception():
+					object_id = resolve_task.result().get('object', {}).get('objectId')
+
+				quads = [] if content_quads_task.exception() else content_quads_task.result().get('quads', [])
+				if quads:
+					self.logger.debug(f'Got {len(quads)} quads from DOM.getContentQuads')
+
+				# Fall back to the box model / getBoundingClientRect methods when the element has no content quads
+				element_rect = None if quads else await self.browser_session.get_element_coordinates(backend_node_id, cdp_session)
+
+				# Convert rect to quads format if we got coordinates
+				if element_rect:
+					# Convert DOMRect to quad format
+					x, y, w, h = element_rect.x, element_rect.y, element_rect.width, element_rect.height
+					quads = [
+						[
+							x,
+							y,  # top-left
+							x + w,
+							y,  # top-right
+							x + w,
+							y + h,  # bottom-right
+							x,
+							y + h,  # bottom-left
+						]
+					]
+					self.logger.debug(
+						f'Got coordinates from unified method: {element_rect.x}, {element_rect.y}, {element_rect.width}x{element_rect.height}'
+					)
 
-			# Ensure click point is within viewport bounds
-			center_x = max(0, min(viewport_width - 1, center_x))
-			center_y = max(0, min(viewport_height - 1, center_y))
+				# If we still don't have quads, fall back to JS click
+				if not quads:
+					self.logger.warning('Could not get element geometry from any method, falling back to JavaScript click')
+					try:
+						if object_id is None:
+							result = await cdp_session.cdp_client.send.DOM.resolveNode(
+								params={'backendNodeId': backend_node_id},
+								session_id=session_id,
+							)
+							assert 'object' in result and 'objectId' in result['object'], (
+								'Failed to find DOM element based on backendNodeId, maybe page content changed?'
+							)
+							object_id = result['object']['objectId']
 
-			# Check for occlusion before attempting CDP click
-			is_occluded = await self._check_element_occlusion(backend_node_id, center_x, center_y, cdp_session)
+						await cdp_session.cdp_client.send.Runtime.callFunctionOn(
+							params={
+								'functionDeclaration': 'function() { this.click(); }',
+								'objectId': object_id,
+							},
+							session_id=session_id,
+						)
+						await asyncio.sleep(0.05)
+						# Navigation is handled by BrowserSession via events
+						return None
+					except Exception as js_e:
+						self.logger.warning(f'CDP JavaScript click also failed: {js_e}')
+						if 'No node with given id found' in str(js_e):
+							raise Exception('Element with given id not found')
+						else:
+							raise Exception(f'Failed to click element: {js_e}')
+
+				# Find the largest visible quad within the viewport
+				best_quad = None
+				best_area = 0
+
+				for quad in quads:
+					if len(quad) < 8:
+						continue
+
+					# Calculate quad bounds
+					xs = [quad[i] for i in range(0, 8, 2)]
+					ys = [quad[i] for i in range(1, 8, 2)]
+					min_x, max_x = min(xs), max(xs)
+					min_y, max_y = min(ys), max(ys)
+
+					# Check if quad intersects with viewport
+					if max_x < 0 or max_y < 0 or min_x > viewport_width or min_y > viewport_height:
+						continue  # Quad is completely outside viewport
+
+					# Calculate visible area (intersection with viewport)
+					visible_min_x = max(0, min_x)
+					visible_max_x = min(viewport_width, max_x)
+					visible_min_y = max(0, min_y)
+					visible_max_y = min(viewport_height, max_y)
+
+					visible_width = visible_max_x - visible_min_x
+					visible_height = visible_max_y - visible_min_y
+					visible_area = visible_width * visible_height
+
+					if visible_area > best_area:
+						best_area = visible_area
+						best_quad = quad
+
+				if not best_quad:
+					# No visible quad found, use the first quad anyway
+					best_quad = quads[0]
+					self.logger.warning('No visible quad found, using first quad')
+
+				# Calculate center point of the best quad
+				center_x = sum(best_quad[i] for i in range(0, 8, 2)) / 4
+				center_y = sum(best_quad[i] for i in range(1, 8, 2)) / 4
+
+				# Ensure click point is within viewport bounds
+				center_x = max(0, min(viewport_width - 1, center_x))
+				center_y = max(0, min(viewport_height - 1, center_y))
+
+				# Check for occlusion before attempting CDP click
+				is_occluded = await self._check_element_occlusion(
+					backend_node_id, center_x, center_y, cdp_session, object_id=object_id
+				)
 
-			if is_occluded:
-				self.logger.debug('🚫 Element is occluded, falling back to JavaScript click')
-				try:
-					result = await cdp_session.cdp_client.send.DOM.resolveNode(
-						params={'backendNodeId': backend_node_id},
-						session_id=session_id,
-					)
-					assert 'object' in result and 'objectId' in result['object'], (
-						'Failed to find DOM element based on backendNodeId'
-					)
-					object_id = result['object']['objectId']
+				if is_occluded:
+					self.logger.debug('🚫 Element is occluded, falling back to JavaScript click')
+					try:
+						if object_id is None:
+							result = await cdp_session.cdp_client.send.DOM.resolveNode(
+								params={'backendNodeId': backend_node_id},
+								session_id=session_id,
+							)
+							assert 'object' in result and 'objectId' in result['object'], (
+								'Failed to find DOM element based on backendNodeId'
+							)
+							object_id = result['object']['objectId']
 
-					await cdp_session.cdp_client.send.Runtime.callFunctionOn(
-						params={
-							'functionDeclaration': 'function() { this.click(); }',
-							'objectId': object_id,
-						},
-						session_id=session_id,
-					)
-					await asyncio.sleep(0.05)
-					return None
-				except Exception as js_e:
-					self.logger.error(f'JavaScript click fallback failed: {js_e}')
-					raise Exception(f'Failed to click occluded element: {js_e}')
+						await cdp_session.cdp_client.send.Runtime.callFunctionOn(
+							params={
+								'functionDeclaration': 'function() { this.click(); }',
+								'objectId': object_id,
+							},
+							session_id=session_id,
+						)
+						await asyncio.sleep(0.05)
+						return None
+					except Exception as js_e:
+						self.logger.error(f'JavaScript click fallback failed: {js_e}')
+						raise Exception(f'Failed to click occluded element: {js_e}')
 
 			# Perform the click using CDP (element is not occluded)
 			try:
-				self.logger.debug(f'👆 Dragging mouse over element before clicking x: {center_x}px y: {center_y}px ...')
-				# Move mouse to element
-				await cdp_session.cdp_client.send.Input.dispatchMouseEvent(
-					params={
-						'type': 'mouseMoved',
-						'x': center_x,
-						'y': center_y,
-					},
-					session_id=session_id,
-				)
-				await asyncio.sleep(0.05)
-
-				# Mouse down
-				self.logger.debug(f'👆🏾 Clicking x: {center_x}px y: {center_y}px ...')
-				try:
-					await asyncio.wait_for(
-						cdp_session.cdp_client.send.Input.dispatchMouseEvent(
+				self.logger.debug(f'👆 Clicking x: {center_x}px y: {center_y}px ...')
+				# Move, press and release go out back-to-back; Chrome dispatches them in order, so hover handlers still run
+				# before the press. Only the press and release acknowledgements are awaited.
+				async with cdp_session.pipeline() as pipeline:
+					pipeline.add(
+						send.Input.dispatchMouseEvent(
+							params={
+								'type': 'mouseMoved',
+								'x': center_x,
+								'y': center_y,
+							},
+							session_id=session_id,
+						)
+					)
+					pressed_task = pipeline.add(
+						send.Input.dispatchMouseEvent(
 							params={
 								'type': 'mousePressed',
 								'x': center_x,
@@ -619,18 +681,10 @@ class DefaultActionWatchdog(BaseWatchdog):
 								'clickCount': 1,
 							},
 							session_id=session_id,
-						),
-						timeout=3.0,  # 3 second timeout for mousePressed
+						)
 					)
-					await asyncio.sleep(0.08)
-				except TimeoutError:
-					self.logger.debug('⏱️ Mouse down timed out (likely due to dialog), continuing...')
-					# Don't sleep if we timed out
-
-				# Mouse up
-				try:
-					await asyncio.wait_for(
-						cdp_session.cdp_client.send.Input.dispatchMouseEvent(
+					released_task = pipeline.add(
+						send.Input.dispatchMouseEvent(
 							params={
 								'type': 'mouseReleased',
 								'x': center_x,
@@ -639,11 +693,18 @@ class DefaultActionWatchdog(BaseWatchdog):
 								'clickCount': 1,
 							},
 							session_id=session_id,
-						),
-						timeout=5.0,  # 5 second timeout for mouseReleased
+						)
 					)
-				except TimeoutError:
-					self.logger.debug('⏱️ Mouse up timed out (possibly due to lag or dialog popup), continuing...')
+
+					try:
+						await asyncio.wait_for(pressed_task, timeout=3.0)  # 3 second timeout for mousePressed
+					except TimeoutError:
+						self.logger.debug('⏱️ Mouse down timed out (likely due to dialog), continuing...')
+
+					try:
+						await asyncio.wait_for(released_task, timeout=5.0)  # 5 second timeout for mouseReleased
+					except TimeoutError:
+						self.logger.debug('⏱️ Mouse up timed out (possibly due to lag or dialog popup), continuing...')
 
 				self.logger.debug('🖱️ Clicked successfully using x,y coordinates')
 
@@ -654,14 +715,15 @@ class DefaultActionWatchdog(BaseWatchdog):
 				self.logger.warning(f'CDP click failed: {type(e).__name__}: {e}')
 				# Fall back to JavaScript click via CDP
 				try:
-					result = await cdp_session.cdp_client.send.DOM.resolveNode(
-						params={'backendNodeId': backend_node_id},
-						session_id=session_id,
-					)
-					assert 'object' in result and 'objectId' in result['object'], (
-						'Failed to find DOM element based on backendNodeId, maybe page content changed?'
-					)
-					object_id = result['object']['objectId']
+					if object_id is None:
+						result = await cdp_session.cdp_client.send.DOM.resolveNode(
+							params={'backendNodeId': backend_node_id},
+							session_id=session_id,
+						)
+						assert 'object' in result and 'objectId' in result['object'], (
+							'Failed to find DOM element based on backendNodeId, maybe page content changed?'
+						)
+						object_id = result['object']['objectId']
 
 					await cdp_session.cdp_client.send.Runtime.callFunctionOn(
 						params={
@@ -715,7 +777,7 @@ class DefaultActionWatchdog(BaseWatchdog):
 				long_term_memory=error_detail,
 			)
 
-	async def _type_to_page(self, text: str):
+	async def _type_to_page(self, text: str, input_mode: TextInputMode | None = None):
 		"""
 		Type text to the page (whatever element currently has focus).
 		This is used when index is 0 or when an element can't be found.
@@ -724,6 +786,11 @@ class DefaultActionWatchdog(BaseWatchdog):
 			# Get CDP client and session
 			cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=None, focus=True)
 
+			if (input_mode or await self._text_input_mode_for_page()) != 'keys':
+				# There is no element to set a value on, so 'value' mode inserts into the focused element as well
+				await self._insert_text(cdp_session, text, newline_as_enter=True)
+				return
+
 			# Type the text character by character to the focused element
 			for char in text:
 				# Handle newline characters as Enter key
@@ -1133,27 +1200,34 @@ class DefaultActionWatchdog(BaseWatchdog):
 
 				self.logger.debug(f'🎯 Attempting click-to-focus at ({click_x:.1f}, {click_y:.1f})')
 
-				# Click to focus
-				await cdp_session.cdp_client.send.Input.dispatchMouseEvent(
-					params={
-						'type': 'mousePressed',
-						'x': click_x,
-						'y': click_y,
-						'button': 'left',
-						'clickCount': 1,
-					},
-					session_id=cdp_session.session_id,
-				)
-				await cdp_session.cdp_client.send.Input.dispatchMouseEvent(
-					params={
-						'type': 'mouseReleased',
-						'x': click_x,
-						'y': click_y,
-						'button': 'left',
-						'clickCount': 1,
-					},
-					session_id=cdp_session.session_id,
-				)
+				# Click to focus, press and release sent back-to-back
+				async with cdp_session.pipeline() as pipeline:
+					pressed_task = pipeline.add(
+						cdp_session.cdp_client.send.Input.dispatchMouseEvent(
+							params={
+								'type': 'mousePressed',
+								'x': click_x,
+								'y': click_y,
+								'button': 'left',
+								'clickCount': 1,
+							},
+							session_id=cdp_session.session_id,
+						)
+					)
+					released_task = pipeline.add(
+						cdp_session.cdp_client.send.Input.dispatchMouseEvent(
+							params={
+								'type': 'mouseReleased',
+								'x': click_x,
+								'y': click_y,
+								'button': 'left',
+								'clickCount': 1,
+							},
+							session_id=cdp_session.session_id,
+						)
+					)
+					await pressed_task
+					await released_task
 
 				self.logger.debug('✅ Element focused using click method')
 				return True
@@ -1305,18 +1379,22 @@ class DefaultActionWatchdog(BaseWatchdog):
 			raise
 
 	async def _input_text_element_node_impl(
-		self, element_node: EnhancedDOMTreeNode, text: str, clear: bool = True, is_sensitive: bool = False
+		self,
+		element_node: EnhancedDOMTreeNode,
+		text: str,
+		clear: bool = True,
+		is_sensitive: bool = False,
+		input_mode: TextInputMode | None = None,
 	) -> dict | None:
 		"""
 		Input text into an element using pure CDP with improved focus fallbacks.
 
-		For date/time inputs, uses direct value assignment instead of typing.
+		For date/time inputs, uses direct value assignment instead of typing. Other fields use the input mode of the
+		event, the page's domain or the browser profile; bulk modes fall back to key typing when the resulting value
+		does not match the text (see `_retype_text`).
 		"""
 
 		try:
-			# Get CDP client
-			cdp_client = self.browser_session.cdp_client
-
 			# Get the correct session ID for the element's iframe
 			# session_id = await self._get_session_id_for_element(element_node)
 
@@ -1329,15 +1407,31 @@ class DefaultActionWatchdog(BaseWatchdog):
 			# Track coordinates for metadata
 			input_coordinates = None
 
-			# Scroll element into view
-			try:
-				await cdp_session.cdp_client.send.DOM.scrollIntoViewIfNeeded(
-					params={'backendNodeId': backend_node_id}, session_id=cdp_session.session_id
+			# Scroll, object ID and element quads go out in one round trip; Chrome runs them in order,
+			# so the quads are measured after the scroll. An element the snapshot places in view needs neither.
+			snapshot_point = self._snapshot_click_point(element_node)
+			scroll_task: asyncio.Task[Any] | None = None
+			content_quads_task: asyncio.Task[Any] | None = None
+			send = cdp_session.cdp_client.send
+			async with cdp_session.pipeline() as pipeline:
+				if snapshot_point is None:
+					scroll_task = pipeline.add(
+						send.DOM.scrollIntoViewIfNeeded(
+							params={'backendNodeId': backend_node_id}, session_id=cdp_session.session_id
+						)
+					)
+				resolve_task = pipeline.add(
+					send.DOM.resolveNode(params={'backendNodeId': backend_node_id}, session_id=cdp_session.session_id)
 				)
-				await asyncio.sleep(0.01)
-			except Exception as e:
+				if snapshot_point is None:
+					content_quads_task = pipeline.add(
+						send.DOM.getContentQuads(params={'backendNodeId': backend_node_id}, session_id=cdp_session.session_id)
+					)
+
+			if scroll_task is not None and scroll_task.exception():
 				# Node detached errors are common with shadow DOM and dynamic content
 				# The element can still be interacted with even if scrolling fails
+				e = scroll_task.exception()
 				error_str = str(e)
 				if 'Node is detached from document' in error_str or 'detached from document' in error_str:
 					self.logger.debug(
@@ -1347,33 +1441,39 @@ class DefaultActionWatchdog(BaseWatchdog):
 					self.logger.debug(f'Failed to scroll element {element_node} into view before typing: {type(e).__name__}: {e}')
 
 			# Get object ID for the element
-			result = await cdp_client.send.DOM.resolveNode(
-				params={'backendNodeId': backend_node_id},
-				session_id=cdp_session.session_id,
-			)
+			result = resolve_task.result()
 			assert 'object' in result and 'objectId' in result['object'], (
 				'Failed to find DOM element based on backendNodeId, maybe page content changed?'
 			)
 			object_id = result['object']['objectId']
 
-			# Get current coordinates using unified method
-			coords = await self.browser_session.get_element_coordinates(backend_node_id, cdp_session)
-			if coords:
-				center_x = coords.x + coords.width / 2
-				center_y = coords.y + coords.height / 2
-
-				# Check for occlusion before using coordinates for focus
-				is_occluded = await self._check_element_occlusion(backend_node_id, center_x, center_y, cdp_session)
+			if snapshot_point is not None:
+				input_coordinates = {'input_x': snapshot_point[0], 'input_y': snapshot_point[1]}
+				self.logger.debug(f'Using snapshot coordinates: x={snapshot_point[0]:.1f}, y={snapshot_point[1]:.1f}')
+			elif content_quads_task is not None:
+				# Get current coordinates from the content quads, or the unified method when there are none
+				quads = [] if content_quads_task.exception() else content_quads_task.result().get('quads', [])
+				coords = self._rect_from_quad(quads[0]) if quads else None
+				if coords is None:
+					coords = await self.browser_session.get_element_coordinates(backend_node_id, cdp_session)
+				if coords:
+					center_x = coords.x + coords.width / 2
+					center_y = coords.y + coords.height / 2
+
+					# Check for occlusion before using coordinates for focus
+					is_occluded = await self._check_element_occlusion(
+						backend_node_id, center_x, center_y, cdp_session, object_id=object_id
+					)
 
-				if is_occluded:
-					self.logger.debug('🚫 Input element is occluded, skipping coordinate-based focus')
-					input_coordinates = None  # Force fallback to CDP-only focus
+					if is_occluded:
+						self.logger.debug('🚫 Input element is occluded, skipping coordinate-based focus')
+						input_coordinates = None  # Force fallback to CDP-only focus
+					else:
+						input_coordinates = {'input_x': center_x, 'input_y': center_y}
+						self.logger.debug(f'Using unified coordinates: x={center_x:.1f}, y={center_y:.1f}')
 				else:
-					input_coordinates = {'input_x': center_x, 'input_y': center_y}
-					self.logger.debug(f'Using unified coordinates: x={center_x:.1f}, y={center_y:.1f}')
-			else:
-				input_coordinates = None
-				self.logger.debug('No coordinates found for element')
+					input_coordinates = None
+					self.logger.debug('No coordinates found for element')
 
 			# Ensure we have a valid object_id before proceeding
 			if not object_id:
@@ -1403,111 +1503,213 @@ class DefaultActionWatchdog(BaseWatchdog):
 				if not cleared_successfully:
 					self.logger.warning('⚠️ Text field clearing failed, typing may append to existing text')
 
-			# Step 4: Type the text character by character using proper human-like key events
-			# This emulates exactly how a human would type, which modern websites expect
-			if is_sensitive:
-				# Note: sensitive_key_name is not passed to this low-level method,
-				# but we could extend the signature if needed for more granular logging
-				self.logger.debug('🎯 Typing <sensitive> character by character')
+			# Step 4: Enter the text with the resolved input mode
+			mode = self._resolve_text_input_mode(element_node, text, input_mode or await self._text_input_mode_for_page())
+			text_for_log = '<sensitive>' if is_sensitive else f'"{text}"'
+			# Bulk modes append to an uncleared field; keep its value so a fallback to key typing can start from it again
+			previous_value = None
+			if mode != 'keys' and not clear and self._has_settable_value(element_node):
+				previous_value = await self._read_text_value(object_id, cdp_session)
+			if mode == 'keys':
+				self.logger.debug(f'🎯 Typing text character by character: {text_for_log}')
+				await self._type_characters(cdp_session, text)
+			elif mode == 'insert':
+				self.logger.debug(f'🎯 Inserting text in one Input.insertText call: {text_for_log}')
+				await self._insert_text(cdp_session, text, newline_as_enter=False)
 			else:
-				self.logger.debug(f'🎯 Typing text character by character: "{text}"')
-
-			for i, char in enumerate(text):
-				# Handle newline characters as Enter key
-				if char == '\n':
-					# Send proper Enter key sequence
-					await cdp_session.cdp_client.send.Input.dispatchKeyEvent(
-						params={
-							'type': 'keyDown',
-							'key': 'Enter',
-							'code': 'Enter',
-							'windowsVirtualKeyCode': 13,
-						},
-						session_id=cdp_session.session_id,
-					)
+				self.logger.debug(f'🎯 Setting text value directly: {text_for_log}')
+				await self._set_text_value(object_id, text, cdp_session, append=True)
 
-					# Small delay to emulate human typing speed
-					await asyncio.sleep(0.001)
-
-					# Send char event with carriage return
-					await cdp_session.cdp_client.send.Input.dispatchKeyEvent(
-						params={
-							'type': 'char',
-							'text': '\r',
-							'key': 'Enter',
-						},
-						session_id=cdp_session.session_id,
-					)
+			# Step 5: Trigger framework-aware DOM events after typing completion
+			# Modern JavaScript frameworks (React, Vue, Angular) rely on these events
+			# to update their internal state and trigger re-renders
+			await self._trigger_framework_events(object_id=object_id, cdp_session=cdp_session)
 
-					# Send keyUp event
-					await cdp_session.cdp_client.send.Input.dispatchKeyEvent(
-						params={
-							'type': 'keyUp',
-							'key': 'Enter',
-							'code': 'Enter',
-							'windowsVirtualKeyCode': 13,
-						},
-						session_id=cdp_session.session_id,
-					)
+			# Step 6: Verify the field holds the text; sites with input masks or key handlers need key typing
+			if not await self._text_value_matches(object_id, text, clear, cdp_session):
+				if mode == 'keys':
+					self.logger.debug('⚠️ Field value differs from the typed text (the site may reformat input)')
 				else:
-					# Handle regular characters
-					# Get proper modifiers, VK code, and base key for the character
-					modifiers, vk_code, base_key = self._get_char_modifiers_and_vk(char)
-					key_code = self._get_key_code_for_char(base_key)
+					self.logger.debug(f'⚠️ Field value does not match after {mode} input')
+					await self._retype_text(element_node, object_id, text, clear, previous_value, cdp_session)
 
-					# self.logger.debug(f'🎯 Typing character {i + 1}/{len(text)}: "{char}" (base_key: {base_key}, code: {key_code}, modifiers: {modifiers}, vk: {vk_code})')
+			# Return coordinates metadata if available
+			return input_coordinates
 
-					# Step 1: Send keyDown event (NO text parameter)
-					await cdp_session.cdp_client.send.Input.dispatchKeyEvent(
-						params={
-							'type': 'keyDown',
-							'key': base_key,
-							'code': key_code,
-							'modifiers': modifiers,
-							'windowsVirtualKeyCode': vk_code,
-						},
-						session_id=cdp_session.session_id,
-					)
+		except Exception as e:
+			self.logger.error(f'Failed to input text via CDP: {type(e).__name__}: {e}')
+			raise BrowserError(f'Failed to input text into element: {repr(element_node)}')
 
-					# Small delay to emulate human typing speed
-					await asyncio.sleep(0.005)
+	async def _text_input_mode_for_page(self) -> TextInputMode:
+		"""Text input mode configured for the current page's domain, or the profile default."""
+		profile = self.browser_session.browser_profile
+		if profile.text_input_mode_by_domain:
+			url = await self.browser_session.get_current_page_url()
+			for domain_pattern, mode in profile.text_input_mode_by_domain.items():
+				if match_url_with_domain_pattern(url, domain_pattern):
+					return mode
+		return profile.text_input_mode
+
+	@staticmethod
+	def _resolve_text_input_mode(element_node: EnhancedDOMTreeNode, text: str, mode: TextInputMode) -> TextInputMode:
+		"""Adjust the configured mode to what the element supports."""
+		tag_name = (element_node.tag_name or '').lower()
+		is_content_editable = (element_node.attributes or {}).get('contenteditable', 'false').lower() != 'false'
+		# Newlines in single-line fields are Enter key presses (e.g. submitting a search), which only key typing reproduces
+		if mode != 'keys' and '\n' in text and tag_name != 'textarea' and not is_content_editable:
+			return 'keys'
+		# Rich text editors keep their own model of the content, setting it directly would bypass them
+		if mode == 'value' and tag_name not in ('input', 'textarea'):
+			return 'insert'
+		return mode
+
+	async def _type_characters(self, cdp_session, text: str) -> None:
+		"""Type text into the focused element with keyDown/char/keyUp events per character.
+
+		The three events of a character are pipelined, so each character costs one round trip instead of three.
+		"""
+		for char in text:
+			# Handle newline characters as Enter key
+			if char == '\n':
+				# Send proper Enter key sequence, with a carriage return char event
+				key_events: list[DispatchKeyEventParameters] = [
+					{'type': 'keyDown', 'key': 'Enter', 'code': 'Enter', 'windowsVirtualKeyCode': 13},
+					{'type': 'char', 'text': '\r', 'key': 'Enter'},
+					{'type': 'keyUp', 'key': 'Enter', 'code': 'Enter', 'windowsVirtualKeyCode': 13},
+				]
+			else:
+				# Handle regular characters
+				# Get proper modifiers, VK code, and base key for the character
+				modifiers, vk_code, base_key = self._get_char_modifiers_and_vk(char)
+				key_code = self._get_key_code_for_char(base_key)
+
+				# keyDown and keyUp carry NO text parameter; the char event WITH text is crucial for text input
+				key_events = [
+					{
+						'type': 'keyDown',
+						'key': base_key,
+						'code': key_code,
+						'modifiers': modifiers,
+						'windowsVirtualKeyCode': vk_code,
+					},
+					{'type': 'char', 'text': char, 'key': char},
+					{
+						'type': 'keyUp',
+						'key': base_key,
+						'code': key_code,
+						'modifiers': modifiers,
+						'windowsVirtualKeyCode': vk_code,
+					},
+				]
 
-					# Step 2: Send char event (WITH text parameter) - this is crucial for text input
-					await cdp_session.cdp_client.send.Input.dispatchKeyEvent(
-						params={
-							'type': 'char',
-							'text': char,
-							'key': char,
-						},
-						session_id=cdp_session.session_id,
+			async with cdp_session.pipeline() as pipeline:
+				tasks = [
+					pipeline.add(
+						cdp_session.cdp_client.send.Input.dispatchKeyEvent(params=params, session_id=cdp_session.session_id)
 					)
+					for params in key_events
+				]
+				for task in tasks:
+					await task
 
-					# Step 3: Send keyUp event (NO text parameter)
-					await cdp_session.cdp_client.send.Input.dispatchKeyEvent(
-						params={
-							'type': 'keyUp',
-							'key': base_key,
-							'code': key_code,
-							'modifiers': modifiers,
-							'windowsVirtualKeyCode': vk_code,
-						},
-						session_id=cdp_session.session_id,
-					)
+			# Small delay between characters to look human (realistic typing speed)
+			await asyncio.sleep(0.001)
 
-				# Small delay between characters to look human (realistic typing speed)
-				await asyncio.sleep(0.001)
+	async def _insert_text(self, cdp_session, text: str, newline_as_enter: bool) -> None:
+		"""Insert text into the focused element with Input.insertText, like an IME commit.
 
-			# Step 4: Trigger framework-aware DOM events after typing completion
-			# Modern JavaScript frameworks (React, Vue, Angular) rely on these events
-			# to update their internal state and trigger re-renders
-			await self._trigger_framework_events(object_id=object_id, cdp_session=cdp_session)
+		With newline_as_enter, each newline is sent as an Enter key press between the inserted lines.
+		"""
+		lines = text.split('\n') if newline_as_enter else [text]
+		for i, line in enumerate(lines):
+			if i > 0:
+				await self._dispatch_key_event(cdp_session, 'keyDown', 'Enter')
+				await cdp_session.cdp_client.send.Input.dispatchKeyEvent(
+					params={'type': 'char', 'text': '\r'}, session_id=cdp_session.session_id
+				)
+				await self._dispatch_key_event(cdp_session, 'keyUp', 'Enter')
+			if line:
+				await cdp_session.cdp_client.send.Input.insertText(params={'text': line}, session_id=cdp_session.session_id)
+
+	@staticmethod
+	def _has_settable_value(element_node: EnhancedDOMTreeNode) -> bool:
+		"""Whether the element's text is a plain value that can be read back and set (inputs and textareas)."""
+		return (element_node.tag_name or '').lower() in ('input', 'textarea')
+
+	async def _set_text_value(self, object_id: str, text: str, cdp_session, append: bool = False) -> None:
+		"""Set (or append to) an input or textarea value with the native setter, so framework-controlled fields see the change."""
+		await cdp_session.cdp_client.send.Runtime.callFunctionOn(
+			params={
+				'objectId': object_id,
+				'functionDeclaration': """
+				function(text, append) {
+					const prototype = this instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+					Object.getOwnPropertyDescriptor(prototype, 'value').set.call(this, append ? this.value + text : text);
+				}
+				""",
+				'arguments': [{'value': text}, {'value': append}],
+			},
+			session_id=cdp_session.session_id,
+		)
+
+	async def _read_text_value(self, object_id: str, cdp_session) -> str | None:
+		"""The field's text (innerText for contenteditable elements), or None if it cannot be read."""
+		try:
+			result = await cdp_session.cdp_client.send.Runtime.callFunctionOn(
+				params={
+					'objectId': object_id,
+					'functionDeclaration': """
+					function() {
+						return this.isContentEditable ? this.innerText : this.value;
+					}
+					""",
+					'returnByValue': True,
+				},
+				session_id=cdp_session.session_id,
+			)
+		except Exception as e:
+			self.logger.debug(f'Could not read back field value: {type(e).__name__}: {e}')
+			return None
 
-			# Return coordinates metadata if available
-			return input_coordinates
+		value = result.get('result', {}).get('value')
+		return value if isinstance(value, str) else None
+
+	async def _text_value_matches(self, object_id: str, text: str, cleared: bool, cdp_session) -> bool:
+		"""Check that the field holds the entered text (at its end, if the field was not cleared first)."""
+		value = await self._read_text_value(object_id, cdp_session)
+		if value is None:
+			return True  # Nothing to compare against, keep what was entered
+
+		value = value.replace('\r\n', '\n').rstrip('\n')
+		expected = text.replace('\r\n', '\n').rstrip('\n')
+		return value == expected if cleared else value.endswith(expected)
+
+	async def _retype_text(
+		self,
+		element_node: EnhancedDOMTreeNode,
+		object_id: str,
+		text: str,
+		clear: bool,
+		previous_value: str | None,
+		cdp_session,
+	) -> None:
+		"""Replace text entered in a bulk mode with key typing, for sites with input masks or key handlers.
+
+		The field is first cleared, or without `clear` put back to the value it held before the bulk entry. When that
+		value is unknown (contenteditable elements), retyping would append the text a second time, so the entered
+		text is kept and only the mismatch is logged.
+		"""
+		if clear:
+			await self._clear_text_field(object_id=object_id, cdp_session=cdp_session)
+		elif previous_value is not None and self._has_settable_value(element_node):
+			await self._set_text_value(object_id, previous_value, cdp_session)
+		else:
+			self.logger.debug('⚠️ Cannot restore the field value from before the input, keeping the entered text')
+			return
 
-		except Exception as e:
-			self.logger.error(f'Failed to input text via CDP: {type(e).__name__}: {e}')
-			raise BrowserError(f'Failed to input text into element: {repr(element_node)}')
+		self.logger.debug('⚠️ Retyping the text key by key')
+		await self._type_characters(cdp_session, text)
+		await self._trigger_framework_events(object_id=object_id, cdp_session=cdp_session)
 
 	async def _trigger_framework_events(self, object_id: str, cdp_session) -> None:
 		"""
@@ -1797,12 +1999,13 @@ class DefaultActionWatchdog(BaseWatchdog):
 
 			# Navigate to the previous entry
 			previous_entry_id = entries[current_index - 1]['id']
+			sent = time.monotonic()
 			await cdp_session.cdp_client.send.Page.navigateToHistoryEntry(
 				params={'entryId': previous_entry_id}, session_id=cdp_session.session_id
 			)
 
 			# Wait for navigation
-			await asyncio.sleep(0.5)
+			await self.browser_session.wait_for_page_settled(since=sent)
 			# Navigation is handled by BrowserSession via events
 
 			self.logger.info(f'🔙 Navigated back to {entries[current_index - 1]["url"]}')
@@ -1825,12 +2028,13 @@ class DefaultActionWatchdog(BaseWatchdog):
 
 			# Navigate to the next entry
 			next_entry_id = entries[current_index + 1]['id']
+			sent = time.monotonic()
 			await cdp_session.cdp_client.send.Page.navigateToHistoryEntry(
 				params={'entryId': next_entry_id}, session_id=cdp_session.session_id
 			)
 
 			# Wait for navigation
-			await asyncio.sleep(0.5)
+			await self.browser_session.wait_for_page_settled(since=sent)
 			# Navigation is handled by BrowserSession via events
 
 			self.logger.info(f'🔜 Navigated forward to {entries[current_index + 1]["url"]}')
@@ -1842,10 +2046,11 @@ class DefaultActionWatchdog(BaseWatchdog):
 		cdp_session = await self.browser_session.get_or_create_cdp_session()
 		try:
 			# Reload the target
+			sent = time.monotonic()
 			await cdp_session.cdp_client.send.Page.reload(session_id=cdp_session.session_id)
 
 			# Wait for reload
-			await asyncio.sleep(1.0)
+			await self.browser_session.wait_for_page_settled(since=sent)
 
 			# Note: We don't clear cached state here - let the next state fetch rebuild as needed
 
@@ -2094,6 +2299,182 @@ class DefaultActionWatchdog(BaseWatchdog):
 		except Exception as e:
 			raise
 
+	@staticmethod
+	def _owner_document_id(node: EnhancedDOMTreeNode) -> int | None:
+		"""Backend node id of the document a node belongs to (None when the tree above it is unknown)."""
+		ancestor = node.parent_node
+		while ancestor is not None and ancestor.node_type != NodeType.DOCUMENT_NODE:
+			ancestor = ancestor.parent_node
+		return ancestor.backend_node_id if ancestor is not None else None
+
+	async def on_FillFormEvent(self, event: FillFormEvent) -> list[dict[str, Any]]:
+		"""Fill several form fields with one Runtime.callFunctionOn per frame document.
+
+		Returns one result per node, in the order of event.nodes."""
+		results: list[dict[str, Any]] = [{'success': False, 'error': 'Field was not processed'} for _ in event.nodes]
+
+		# Runtime.callFunctionOn only takes arguments from the execution context of `objectId`. Same-origin iframes
+		# share the page's CDP session but have their own context, so fields are grouped by session and document.
+		# Event nodes are detached from their tree, the selector map still has the parents
+		selector_map = await self.browser_session.get_selector_map()
+		groups: dict[tuple[str | None, int | None], tuple[Any, list[int]]] = {}
+		for position, node in enumerate(event.nodes):
+			try:
+				cdp_session = await self.browser_session.cdp_client_for_node(node)
+			except Exception as e:
+				results[position] = {'success': False, 'error': f'No CDP session for element: {e}'}
+				continue
+			key = (cdp_session.session_id, self._owner_document_id(selector_map.get(node.backend_node_id, node)))
+			groups.setdefault(key, (cdp_session, []))[1].append(position)
+
+		# Receives the field elements followed by the list of values; `this` is the first field
+		fill_script = """
+		function(...args) {
+			const values = args.pop();
+			const truthy = ['true', 'yes', '1', 'on', 'checked'];
+
+			function fire(element, type) {
+				element.dispatchEvent(new Event(type, { bubbles: true, cancelable: true }));
+			}
+
+			// Use the prototype setter so React/Vue value trackers notice the change
+			function setNativeValue(element, value) {
+				const proto = element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+				Object.getOwnPropertyDescriptor(proto, 'value').set.call(element, value);
+			}
+
+			function fill(element, value) {
+				if (!element || !element.isConnected) {
+					return { success: false, error: 'Element is no longer in the page' };
+				}
+				if (element.disabled || element.readOnly) {
+					return { success: false, error: 'Field is disabled or read-only' };
+				}
+				const tag = element.tagName.toLowerCase();
+
+				if (tag === 'select') {
+					const target = value.trim().toLowerCase();
+					const option = Array.from(element.options).find(
+						o => o.text.trim().toLowerCase() === target || o.value.toLowerCase() === target
+					);
+					if (!option) {
+						const available = Array.from(element.options).slice(0, 10).map(o => o.text.trim());
+						return { success: false, error: `No option "${value}". Available: ${available.join(', ')}` };
+					}
+					element.focus();
+					element.value = option.value;
+					option.selected = true;
+					fire(element, 'input');
+					fire(element, 'change');
+					element.blur();
+					return { success: true, value: option.text.trim() };
+				}
+
+				if (tag === 'input') {
+					const type = (element.type || 'text').toLowerCase();
+					if (type === 'file') {
+						return { success: false, error: 'File inputs must be filled with upload_file' };
+					}
+					if (type === 'checkbox' || type === 'radio') {
+						const wanted = truthy.includes(value.trim().toLowerCase());
+						if (element.checked !== wanted) {
+							if (type === 'radio' && !wanted) {
+								return { success: false, error: 'A radio button is unchecked by choosing another option' };
+							}
+							element.click();
+						}
+						return { success: element.checked === wanted, value: String(element.checked) };
+					}
+				}
+
+				if (tag === 'input' || tag === 'textarea') {
+					element.focus();
+					setNativeValue(element, value);
+					fire(element, 'input');
+					fire(element, 'change');
+					element.blur();
+					// Masked inputs may reformat the value, so report what the field ended up with
+					return { success: true, value: element.value };
+				}
+
+				if (element.isContentEditable) {
+					element.focus();
+					document.execCommand('selectAll', false);
+					document.execCommand('insertText', false, value);
+					return { success: true, value: element.innerText };
+				}
+
+				return { success: false, error: `<${tag}> is not a form field` };
+			}
+
+			return args.map((element, i) => {
+				try {
+					return fill(element, values[i]);
+				} catch (e) {
+					return { success: false, error: e.message };
+				}
+			});
+		}
+		"""
+
+		async def fill_group(cdp_session: Any, positions: list[int]) -> None:
+			resolved = await asyncio.gather(
+				*(
+					cdp_session.cdp_client.send.DOM.resolveNode(
+						params={'backendNodeId': event.nodes[position].backend_node_id}, session_id=cdp_session.session_id
+					)
+					for position in positions
+				),
+				return_exceptions=True,
+			)
+			object_ids: list[str] = []
+			filled_positions: list[int] = []
+			for position, result in zip(positions, resolved):
+				object_id = result.get('object', {}).get('objectId') if isinstance(result, dict) else None
+				if not object_id:
+					results[position] = {'success': False, 'error': 'Element is no longer in the page'}
+					continue
+				object_ids.append(object_id)
+				filled_positions.append(position)
+			if not object_ids:
+				return
+
+			try:
+				call_result = await cdp_session.cdp_client.send.Runtime.callFunctionOn(
+					params={
+						'functionDeclaration': fill_script,
+						'objectId': object_ids[0],
+						'arguments': [{'objectId': object_id} for object_id in object_ids]
+						+ [{'value': [event.values[position] for position in filled_positions]}],
+						'returnByValue': True,
+					},
+					session_id=cdp_session.session_id,
+				)
+			except Exception as e:
+				if len(filled_positions) > 1:
+					# Most likely fields from different execution contexts whose document was not known; fill one by one
+					self.logger.debug(f'Batched fill of {len(filled_positions)} fields failed ({e}), retrying per field')
+					for position in filled_positions:
+						await fill_group(cdp_session, [position])
+					return
+				results[filled_positions[0]] = {'success': False, 'error': f'Fill call failed: {e}'}
+				return
+
+			if 'exceptionDetails' in call_result:
+				error = call_result['exceptionDetails'].get('text', 'script error')
+				for position in filled_positions:
+					results[position] = {'success': False, 'error': f'Fill script failed: {error}'}
+				return
+			for position, field_result in zip(filled_positions, call_result.get('result', {}).get('value') or []):
+				results[position] = field_result
+
+		for cdp_session, positions in groups.values():
+			await fill_group(cdp_session, positions)
+
+		filled = sum(1 for result in results if result.get('success'))
+		self.logger.info(f'📝 Filled {filled}/{len(results)} form fields in {len(groups)} call(s)')
+		return results
+
 	async def on_ScrollToTextEvent(self, event: ScrollToTextEvent) -> None:
 		"""Handle scroll to text request with CDP. Raises exception if text not found."""
 
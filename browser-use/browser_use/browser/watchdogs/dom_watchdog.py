@@ -8,9 +8,20 @@ from browser_use.browser.events import (
 	BrowserErrorEvent,
 	BrowserStateRequestEvent,
 	ScreenshotEvent,
+	TabClosedEvent,
 	TabCreatedEvent,
 )
+from browser_use.browser.introspection import (
+	DOM_VERSION_BINDING,
+	DOM_VERSION_TRACKER_JS,
+	PageIntrospection,
+	document_unchanged,
+	introspect_page,
+)
+from browser_use.browser.readiness import PageActivity
 from browser_use.browser.watchdog_base import BaseWatchdog
+from browser_use.dom.diff import diff_dom_states
+from browser_use.dom.hit_test import click_point
 from browser_use.dom.service import DomService
 from browser_use.dom.views import (
 	EnhancedDOMTreeNode,
@@ -20,7 +31,7 @@ from browser_use.observability import observe_debug
 from browser_use.utils import create_task_with_error_handling, time_execution_async
 
 if TYPE_CHECKING:
-	from browser_use.browser.views import BrowserStateSummary, NetworkRequest, PageInfo, PaginationButton
+	from browser_use.browser.views import BrowserStateSummary, PageInfo, PaginationButton
 
 
 class DOMWatchdog(BaseWatchdog):
@@ -31,7 +42,7 @@ class DOMWatchdog(BaseWatchdog):
 	helper methods for other watchdogs.
 	"""
 
-	LISTENS_TO = [TabCreatedEvent, BrowserStateRequestEvent]
+	LISTENS_TO = [TabCreatedEvent, TabClosedEvent, BrowserStateRequestEvent]
 	EMITS = [BrowserErrorEvent]
 
 	# Public properties for other watchdogs
@@ -42,12 +53,119 @@ class DOMWatchdog(BaseWatchdog):
 	# Internal DOM service
 	_dom_service: DomService | None = None
 
-	# Network tracking - maps request_id to (url, start_time, method, resource_type)
-	_pending_requests: dict[str, tuple[str, float, str, str | None]] = {}
+	# Latest document version reported by each target's DOM_VERSION_TRACKER_JS
+	_document_versions: dict[str, str] = {}
+	# Loading, network and DOM activity of each page target, for waiting until the page settled
+	_page_activity: dict[str, PageActivity] = {}
+	_cdp_handlers_registered: bool = False
 
 	async def on_TabCreatedEvent(self, event: TabCreatedEvent) -> None:
-		# self.logger.debug('Setting up init scripts in browser')
-		return None
+		"""Start tracking the page's activity and install the document version tracker.
+
+		The tracker tells when the page changed since the last snapshot and feeds DOM mutations into page readiness.
+		Network and loading events come from the Network and Page domains SessionManager enables on every page.
+		"""
+		self._page_activity.setdefault(event.target_id, PageActivity())
+		try:
+			cdp_session = await self.browser_session.get_or_create_cdp_session(event.target_id, focus=False)
+			if not self._cdp_handlers_registered:
+				# Handlers are per method on the shared client, so they are registered once for all targets
+				register = cdp_session.cdp_client.register
+				register.Runtime.bindingCalled(self._on_binding_called)
+				register.Network.requestWillBeSent(self._on_request_will_be_sent)
+				register.Network.loadingFinished(self._on_loading_finished)
+				register.Network.loadingFailed(self._on_loading_finished)
+				register.Page.frameStartedLoading(self._on_frame_started_loading)
+				register.Page.frameStoppedLoading(self._on_frame_stopped_loading)
+				self._cdp_handlers_registered = True
+
+			# The binding has to exist before the tracker announces the current document
+			send = cdp_session.cdp_client.send
+			async with cdp_session.pipeline() as pipeline:
+				binding_task = pipeline.add(
+					send.Runtime.addBinding(params={'name': DOM_VERSION_BINDING}, session_id=cdp_session.session_id)
+				)
+				script_task = pipeline.add(
+					send.Page.addScriptToEvaluateOnNewDocument(
+						params={'source': DOM_VERSION_TRACKER_JS, 'runImmediately': True}, session_id=cdp_session.session_id
+					)
+				)
+				await binding_task
+				await script_task
+		except Exception as e:
+			self.logger.debug(f'Failed to install document version tracker for target {event.target_id}: {e}')
+
+	async def on_TabClosedEvent(self, event: TabClosedEvent) -> None:
+		self._page_activity.pop(event.target_id, None)
+		self._document_versions.pop(event.target_id, None)
+
+	def _target_id_for_session(self, session_id: str | None) -> str | None:
+		if not session_id or not self.browser_session.session_manager:
+			return None
+		return self.browser_session.session_manager.get_target_id_from_session_id(session_id)
+
+	def _on_binding_called(self, event, session_id=None) -> None:
+		if event.get('name') != DOM_VERSION_BINDING:
+			return
+		target_id = self._target_id_for_session(session_id)
+		if target_id:
+			self._document_versions[target_id] = event.get('payload', '')
+			if activity := self._page_activity.get(target_id):
+				activity.document_changed()
+
+	def _on_request_will_be_sent(self, event, session_id=None) -> None:
+		activity = self._page_activity.get(self._target_id_for_session(session_id) or '')
+		if activity:
+			activity.request_started(event['requestId'], event.get('type'))
+
+	def _on_loading_finished(self, event, session_id=None) -> None:
+		activity = self._page_activity.get(self._target_id_for_session(session_id) or '')
+		if activity:
+			activity.request_finished(event['requestId'])
+
+	def _on_frame_started_loading(self, event, session_id=None) -> None:
+		# The main frame of a page target has the target's id
+		activity = self._page_activity.get(event['frameId'])
+		if activity and self._target_id_for_session(session_id) == event['frameId']:
+			activity.loading_started()
+
+	def _on_frame_stopped_loading(self, event, session_id=None) -> None:
+		activity = self._page_activity.get(event['frameId'])
+		if activity and self._target_id_for_session(session_id) == event['frameId']:
+			activity.loading_stopped()
+
+	def is_tracking_page(self, target_id: str) -> bool:
+		return target_id in self._page_activity
+
+	async def wait_for_page_settled(
+		self, target_id: str | None = None, since: float | None = None, timeout: float | None = None
+	) -> bool:
+		"""Wait until the page finished loading, has no requests in flight and its DOM stopped changing.
+
+		Args:
+			target_id: Page to wait for, defaults to the focused one
+			since: time.monotonic() of the action whose effects to wait for; only quiet time after it counts
+			timeout: Hard ceiling in seconds, defaults to the profile's page_settle_timeout
+
+		Returns:
+			Whether the page settled. Untracked pages return False right away.
+		"""
+		profile = self.browser_session.browser_profile
+		activity = self._page_activity.get(target_id or self.browser_session.agent_focus_target_id or '')
+		if activity is None:
+			return False
+		timeout = profile.page_settle_timeout if timeout is None else timeout
+		start = time.monotonic()
+		settled = await activity.wait_until_settled(profile.page_settle_quiet_period, timeout, since=since)
+		elapsed_ms = (time.monotonic() - start) * 1000
+		if settled:
+			self.logger.debug(f'Page settled after {elapsed_ms:.0f}ms')
+		else:
+			self.logger.debug(
+				f'Page did not settle within {timeout}s (loading={activity.loading}, '
+				f'pending_requests={activity.pending_requests}), continuing anyway'
+			)
+		return settled
 
 	def _get_recent_events_str(self, limit: int = 10) -> str | None:
 		"""Get the most recent events from the event bus as JSON.
@@ -88,155 +206,24 @@ class DOMWatchdog(BaseWatchdog):
 
 		return json.dumps([])  # Return empty JSON array on error
 
-	async def _get_pending_network_requests(self) -> list['NetworkRequest']:
-		"""Get list of currently pending network requests.
+	async def _introspect_page(self) -> PageIntrospection | None:
+		"""Get readiness, title, viewport metrics and pending network requests of the focused page in one CDP call.
 
-		Uses document.readyState and performance API to detect pending requests.
-		Filters out ads, tracking, and other noise.
-
-		Returns:
-			List of NetworkRequest objects representing currently loading resources
+		Pending requests are detected with the performance API, filtering out ads, tracking, and other noise.
 		"""
-		from browser_use.browser.views import NetworkRequest
-
 		try:
 			# get_or_create_cdp_session() now handles focus validation automatically
 			cdp_session = await self.browser_session.get_or_create_cdp_session(focus=True)
-
-			# Use performance API to get pending requests
-			js_code = """
-(function() {
-	const now = performance.now();
-	const resources = performance.getEntriesByType('resource');
-	const pending = [];
-
-	// Check document readyState
-	const docLoading = document.readyState !== 'complete';
-
-	// Common ad/tracking domains and patterns to filter out
-	const adDomains = [
-		// Standard ad/tracking networks
-		'doubleclick.net', 'googlesyndication.com', 'googletagmanager.com',
-		'facebook.net', 'analytics', 'ads', 'tracking', 'pixel',
-		'hotjar.com', 'clarity.ms', 'mixpanel.com', 'segment.com',
-		// Analytics platforms
-		'demdex.net', 'omtrdc.net', 'adobedtm.com', 'ensighten.com',
-		'newrelic.com', 'nr-data.net', 'google-analytics.com',
-		// Social media trackers
-		'connect.facebook.net', 'platform.twitter.com', 'platform.linkedin.com',
-		// CDN/image hosts (usually not critical for functionality)
-		'.cloudfront.net/image/', '.akamaized.net/image/',
-		// Common tracking paths
-		'/tracker/', '/collector/', '/beacon/', '/telemetry/', '/log/',
-		'/events/', '/eventBatch', '/track.', '/metrics/'
-	];
-
-	// Get resources that are still loading (responseEnd is 0)
-	let totalResourcesChecked = 0;
-	let filteredByResponseEnd = 0;
-	const allDomains = new Set();
-
-	for (const entry of resources) {
-		totalResourcesChecked++;
-
-		// Track all domains from recent resources (for logging)
-		try {
-			const hostname = new URL(entry.name).hostname;
-			if (hostname) allDomains.add(hostname);
-		} catch (e) {}
-
-		if (entry.responseEnd === 0) {
-			filteredByResponseEnd++;
-			const url = entry.name;
-
-			// Filter out ads and tracking
-			const isAd = adDomains.some(domain => url.includes(domain));
-			if (isAd) continue;
-
-			// Filter out data: URLs and very long URLs (often inline resources)
-			if (url.startsWith('data:') || url.length > 500) continue;
-
-			const loadingDuration = now - entry.startTime;
-
-			// Skip requests that have been loading for >10 seconds (likely stuck/polling)
-			if (loadingDuration > 10000) continue;
-
-			const resourceType = entry.initiatorType || 'unknown';
-
-			// Filter out non-critical resources (images, fonts, icons) if loading >3 seconds
-			const nonCriticalTypes = ['img', 'image', 'icon', 'font'];
-			if (nonCriticalTypes.includes(resourceType) && loadingDuration > 3000) continue;
-
-			// Filter out image URLs even if type is unknown
-			const isImageUrl = /\\.(jpg|jpeg|png|gif|webp|svg|ico)(\\?|$)/i.test(url);
-			if (isImageUrl && loadingDuration > 3000) continue;
-
-			pending.push({
-				url: url,
-				method: 'GET',
-				loading_duration_ms: Math.round(loadingDuration),
-				resource_type: resourceType
-			});
-		}
-	}
-
-	return {
-		pending_requests: pending,
-		document_loading: docLoading,
-		document_ready_state: document.readyState,
-		debug: {
-			total_resources: totalResourcesChecked,
-			with_response_end_zero: filteredByResponseEnd,
-			after_all_filters: pending.length,
-			all_domains: Array.from(allDomains)
-		}
-	};
-})()
-"""
-
-			result = await cdp_session.cdp_client.send.Runtime.evaluate(
-				params={'expression': js_code, 'returnByValue': True}, session_id=cdp_session.session_id
-			)
-
-			if result.get('result', {}).get('type') == 'object':
-				data = result['result'].get('value', {})
-				pending = data.get('pending_requests', [])
-				doc_state = data.get('document_ready_state', 'unknown')
-				doc_loading = data.get('document_loading', False)
-				debug_info = data.get('debug', {})
-
-				# Get all domains that had recent activity (from JS)
-				all_domains = debug_info.get('all_domains', [])
-				all_domains_str = ', '.join(sorted(all_domains)[:5]) if all_domains else 'none'
-				if len(all_domains) > 5:
-					all_domains_str += f' +{len(all_domains) - 5} more'
-
-				# Debug logging
-				self.logger.debug(
-					f'🔍 Network check: document.readyState={doc_state}, loading={doc_loading}, '
-					f'total_resources={debug_info.get("total_resources", 0)}, '
-					f'responseEnd=0: {debug_info.get("with_response_end_zero", 0)}, '
-					f'after_filters={len(pending)}, domains=[{all_domains_str}]'
-				)
-
-				# Convert to NetworkRequest objects
-				network_requests = []
-				for req in pending[:20]:  # Limit to 20 to avoid overwhelming the context
-					network_requests.append(
-						NetworkRequest(
-							url=req['url'],
-							method=req.get('method', 'GET'),
-							loading_duration_ms=req.get('loading_duration_ms', 0.0),
-							resource_type=req.get('resource_type'),
-						)
-					)
-
-				return network_requests
-
+			introspection = await asyncio.wait_for(introspect_page(cdp_session), timeout=1.0)
 		except Exception as e:
-			self.logger.debug(f'Failed to get pending network requests: {e}')
+			self.logger.debug(f'Page introspection failed: {e}')
+			return None
 
-		return []
+		self.logger.debug(
+			f'🔍 Network check: document.readyState={introspection.ready_state}, '
+			f'pending_requests={len(introspection.pending_requests)}'
+		)
+		return introspection
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='browser_state_request_event')
 	async def on_BrowserStateRequestEvent(self, event: BrowserStateRequestEvent) -> 'BrowserStateSummary':
@@ -266,20 +253,16 @@ class DOMWatchdog(BaseWatchdog):
 		# Check for pending network requests BEFORE waiting (so we can see what's loading)
 		pending_requests_before_wait = []
 		if not not_a_meaningful_website:
-			try:
-				pending_requests_before_wait = await self._get_pending_network_requests()
-				if pending_requests_before_wait:
-					self.logger.debug(f'🔍 Found {len(pending_requests_before_wait)} pending requests before stability wait')
-			except Exception as e:
-				self.logger.debug(f'Failed to get pending requests before wait: {e}')
+			initial_introspection = await self._introspect_page()
+			if initial_introspection and initial_introspection.pending_requests:
+				pending_requests_before_wait = initial_introspection.pending_requests
+				self.logger.debug(f'🔍 Found {len(pending_requests_before_wait)} pending requests before stability wait')
 		pending_requests = pending_requests_before_wait
-		# Wait for page stability using browser profile settings (main branch pattern)
+		# Wait until network and DOM activity stopped, bounded by the profile's page_settle_timeout
 		if not not_a_meaningful_website:
 			self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ⏳ Waiting for page stability...')
 			try:
-				if pending_requests_before_wait:
-					# Reduced from 1s to 0.3s for faster DOM builds while still allowing critical resources to load
-					await asyncio.sleep(0.3)
+				await self.wait_for_page_settled()
 				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ Page stability complete')
 			except Exception as e:
 				self.logger.warning(
@@ -349,11 +332,13 @@ class DOMWatchdog(BaseWatchdog):
 					closed_popup_messages=self.browser_session._closed_popup_messages.copy(),
 				)
 
-			# Execute DOM building and screenshot capture in parallel
+			# Execute DOM building, screenshot capture and page introspection in parallel
 			dom_task = None
 			screenshot_task = None
+			introspection_task = None
 
 			# Start DOM building task if requested
+			previous_state = None
 			if event.include_dom:
 				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: 🌳 Starting DOM tree build task...')
 
@@ -380,14 +365,26 @@ class DOMWatchdog(BaseWatchdog):
 					suppress_exceptions=True,
 				)
 
-			# Wait for both tasks to complete
+			# The DOM build introspects the page alongside its snapshot, otherwise do it here
+			if not dom_task:
+				introspection_task = create_task_with_error_handling(
+					self._introspect_page(),
+					name='introspect_page',
+					logger_instance=self.logger,
+					suppress_exceptions=True,
+				)
+
+			# Wait for all tasks to complete
 			content = None
 			screenshot_b64 = None
+			introspection = None
 
 			if dom_task:
 				try:
 					content = await dom_task
 					self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ DOM tree build completed')
+					if self._dom_service is not None:
+						introspection = self._dom_service.page_introspection
 				except Exception as e:
 					self.logger.warning(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: DOM build failed: {e}, using minimal state')
 					content = SerializedDOMState(_root=None, selector_map={})
@@ -419,20 +416,29 @@ class DOMWatchdog(BaseWatchdog):
 
 			# Tabs info already fetched at the beginning
 
+			if introspection_task:
+				introspection = await introspection_task
+
 			# Get target title safely
-			try:
-				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting page title...')
-				title = await asyncio.wait_for(self.browser_session.get_current_page_title(), timeout=1.0)
-				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got title: {title}')
-			except Exception as e:
-				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get title: {e}')
-				title = 'Page'
+			if introspection and introspection.title:
+				title = introspection.title
+			else:
+				try:
+					self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting page title...')
+					title = await asyncio.wait_for(self.browser_session.get_current_page_title(), timeout=1.0)
+					self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got title: {title}')
+				except Exception as e:
+					self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get title: {e}')
+					title = 'Page'
 
-			# Get comprehensive page info from CDP with timeout
+			# Get comprehensive page info, from the introspection if it succeeded or from CDP with timeout
 			try:
-				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting page info from CDP...')
-				page_info = await asyncio.wait_for(self._get_page_info(), timeout=1.0)
-				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got page info from CDP: {page_info}')
+				if introspection:
+					page_info = introspection.page_info
+				else:
+					self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting page info from CDP...')
+					page_info = await asyncio.wait_for(self._get_page_info(), timeout=1.0)
+				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got page info: {page_info}')
 			except Exception as e:
 				self.logger.debug(
 					f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get page info from CDP: {e}, using fallback'
@@ -470,6 +476,9 @@ class DOMWatchdog(BaseWatchdog):
 					'🔍 DOMWatchdog.on_BrowserStateRequestEvent: 📸 Creating BrowserStateSummary WITHOUT screenshot'
 				)
 
+			# Diff against the previous state in one pass over both selector maps
+			dom_diff = diff_dom_states(previous_state, content) if dom_task else None
+
 			browser_state = BrowserStateSummary(
 				dom_state=content,
 				url=page_url,
@@ -485,6 +494,7 @@ class DOMWatchdog(BaseWatchdog):
 				pending_network_requests=pending_requests,
 				pagination_buttons=pagination_buttons_data,
 				closed_popup_messages=self.browser_session._closed_popup_messages.copy(),
+				dom_diff=dom_diff,
 			)
 
 			# Cache the state
@@ -547,6 +557,9 @@ class DOMWatchdog(BaseWatchdog):
 					paint_order_filtering=self.browser_session.browser_profile.paint_order_filtering,
 					max_iframes=self.browser_session.browser_profile.max_iframes,
 					max_iframe_depth=self.browser_session.browser_profile.max_iframe_depth,
+					iframe_capture_timeout=self.browser_session.browser_profile.iframe_capture_timeout,
+					max_iframe_nodes=self.browser_session.browser_profile.max_iframe_nodes,
+					incremental_dom=self.browser_session.browser_profile.incremental_dom,
 				)
 
 			# Get serialized DOM tree using the service
@@ -568,11 +581,8 @@ class DOMWatchdog(BaseWatchdog):
 			get_all_trees_ms = timing_info.get('get_all_trees_total_ms', 0)
 			if get_all_trees_ms > 0:
 				timing_lines.append(f'  ├─ get_all_trees: {get_all_trees_ms:.2f}ms')
-				iframe_scroll_ms = timing_info.get('iframe_scroll_detection_ms', 0)
 				cdp_parallel_ms = timing_info.get('cdp_parallel_calls_ms', 0)
 				snapshot_proc_ms = timing_info.get('snapshot_processing_ms', 0)
-				if iframe_scroll_ms > 0.01:
-					timing_lines.append(f'  │  ├─ iframe_scroll_detection: {iframe_scroll_ms:.2f}ms')
 				if cdp_parallel_ms > 0.01:
 					timing_lines.append(f'  │  ├─ cdp_parallel_calls: {cdp_parallel_ms:.2f}ms')
 				if snapshot_proc_ms > 0.01:
@@ -829,6 +839,24 @@ class DOMWatchdog(BaseWatchdog):
 
 		return self.selector_map.get(index) if self.selector_map else None
 
+	def snapshot_click_point(self, node: EnhancedDOMTreeNode) -> tuple[float, float] | None:
+		"""Click point of an element from the current snapshot, or None when the live page has to be asked.
+
+		Only answers while the page has reported no DOM mutation, scroll or resize since the snapshot was captured,
+		and when the snapshot shows the point in view and not covered by another element.
+		"""
+		document = self.enhanced_dom_tree
+		introspection = self._dom_service.page_introspection if self._dom_service else None
+		if document is None or introspection is None or not self.selector_map:
+			return None
+		if not document_unchanged(introspection.dom_version, self._document_versions.get(document.target_id)):
+			return None
+
+		element = self.selector_map.get(node.backend_node_id)
+		if element is None or element.target_id != node.target_id:
+			return None
+		return click_point(document, element, introspection.viewport_width, introspection.viewport_height)
+
 	def clear_cache(self) -> None:
 		"""Clear cached DOM state to force rebuild on next access."""
 		self.selector_map = None
@@ -277,13 +277,15 @@ class DownloadsWatchdog(BaseWatchdog):
 					return
 				# Ensure path is properly expanded (~ -> absolute path)
 				expanded_downloads_path = Path(downloads_path).expanduser().resolve()
-				await cdp_client.send.Browser.setDownloadBehavior(
-					params={
-						'behavior': 'allow',
-						'downloadPath': str(expanded_downloads_path),  # Use expanded absolute path
-						'eventsEnabled': True,
-					}
-				)
+				download_params = {
+					'behavior': 'allow',
+					'downloadPath': str(expanded_downloads_path),  # Use expanded absolute path
+					'eventsEnabled': True,
+				}
+				if self.browser_session.browser_context_id:
+					# Per-context download dir when several sessions share one browser
+					download_params['browserContextId'] = self.browser_session.browser_context_id
+				await cdp_client.send.Browser.setDownloadBehavior(params=download_params)  # type: ignore[arg-type]
 
 				# Register the handlers with CDP
 				cdp_client.register.Browser.downloadWillBegin(download_will_begin_handler)  # type: ignore[arg-type]
@@ -65,7 +65,7 @@ class LocalBrowserWatchdog(BaseWatchdog):
 		self.logger.debug('[LocalBrowserWatchdog] Killing local browser process')
 
 		if self._subprocess:
-			await self._cleanup_process(self._subprocess)
+			await self.terminate_process(self._subprocess)
 			self._subprocess = None
 
 		# Clean up temp directories if any were created
@@ -383,8 +383,10 @@ class LocalBrowserWatchdog(BaseWatchdog):
 		raise TimeoutError(f'Browser did not start within {timeout} seconds')
 
 	@staticmethod
-	async def _cleanup_process(process: psutil.Process) -> None:
-		"""Clean up browser process.
+	async def terminate_process(process: psutil.Process) -> None:
+		"""Terminate a browser process, killing it if it has not exited after 5 seconds.
+
+		Also used by callers that took over a process with `detach_process`.
 
 		Args:
 			process: psutil.Process to terminate
@@ -432,6 +434,14 @@ class LocalBrowserWatchdog(BaseWatchdog):
 		except Exception as e:
 			self.logger.debug(f'Failed to cleanup temp dir {temp_dir}: {e}')
 
+	def detach_process(self) -> psutil.Process | None:
+		"""Hand the launched browser process over to the caller, who becomes responsible for stopping it.
+
+		Stopping or killing the session afterwards no longer terminates the browser; use `terminate_process` for that.
+		"""
+		process, self._subprocess = self._subprocess, None
+		return process
+
 	@property
 	def browser_pid(self) -> int | None:
 		"""Get the browser process ID."""
@@ -0,0 +1,78 @@
+"""
+Diff between consecutive serialized DOM states.
+
+Selector maps are keyed by backend node id, which is stable while the element stays in the document,
+so one pass over each selector map is enough to classify every interactive element.
+"""
+
+from browser_use.dom.serializer.serializer import DOMTreeSerializer
+from browser_use.dom.utils import cap_text_length
+from browser_use.dom.views import DOMStateDiff, EnhancedDOMTreeNode, NodeType, SerializedDOMState
+
+
+def _element_text(node: EnhancedDOMTreeNode) -> str:
+	"""Cheap text fingerprint: the accessible name, else the element's own text nodes (no subtree walk)."""
+	if node.ax_node and node.ax_node.name:
+		return node.ax_node.name
+	return ''.join(child.node_value for child in node.children if child.node_type == NodeType.TEXT_NODE)
+
+
+def _ax_state(node: EnhancedDOMTreeNode) -> list[tuple[str, object]]:
+	"""Typed values, checked/expanded state etc. live in AX properties, not in DOM attributes."""
+	if not node.ax_node or not node.ax_node.properties:
+		return []
+	return [(prop.name, prop.value) for prop in node.ax_node.properties]
+
+
+def _position(node: EnhancedDOMTreeNode) -> tuple[float, float] | None:
+	if node.absolute_position is None:
+		return None
+	return node.absolute_position.x, node.absolute_position.y
+
+
+def diff_dom_states(previous: SerializedDOMState | None, current: SerializedDOMState) -> DOMStateDiff:
+	"""Classify interactive elements of `current` against `previous`; with no previous state everything is added."""
+	if previous is None:
+		return DOMStateDiff(added=list(current.selector_map))
+
+	diff = DOMStateDiff()
+	previous_map = previous.selector_map
+	for index, node in current.selector_map.items():
+		old = previous_map.get(index)
+		if old is None:
+			diff.added.append(index)
+			continue
+		if old is node:
+			continue
+		if old.parent_branch_hash() != node.parent_branch_hash() or _position(old) != _position(node):
+			diff.moved.append(index)
+		if old.attributes != node.attributes or _element_text(old) != _element_text(node) or _ax_state(old) != _ax_state(node):
+			diff.changed.append(index)
+
+	current_map = current.selector_map
+	diff.removed = [index for index in previous_map if index not in current_map]
+	return diff
+
+
+def _element_line(index: int, node: EnhancedDOMTreeNode, include_attributes: list[str]) -> str:
+	line = f'[{index}]<{node.tag_name}'
+	attributes = DOMTreeSerializer._build_attributes_string(node, include_attributes, '')
+	if attributes:
+		line += f' {attributes}'
+	line += ' />'
+	text = cap_text_length(node.get_meaningful_text_for_llm(), 100)
+	if text:
+		line += f' {text}'
+	return line
+
+
+def serialize_dom_diff(diff: DOMStateDiff, current: SerializedDOMState, include_attributes: list[str]) -> str:
+	"""Compact text of a diff: one line per new, changed or moved element, and the indices of removed ones."""
+	sections = []
+	for title, indices in (('New', diff.added), ('Changed', diff.changed), ('Moved', diff.moved)):
+		lines = [_element_line(index, current.selector_map[index], include_attributes) for index in indices]
+		if lines:
+			sections.append(f'{title} elements:\n' + '\n'.join(lines))
+	if diff.removed:
+		sections.append('Removed elements: ' + ', '.join(f'[{index}]' for index in diff.removed))
+	return '\n'.join(sections) if sections else 'No changes.'
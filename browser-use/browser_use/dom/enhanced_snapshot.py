@@ -3,17 +3,30 @@ Enhanced snapshot processing for browser-use DOM tree extraction.
 
 This module provides stateless functions for parsing Chrome DevTools Protocol (CDP) DOMSnapshot data
 to extract visibility, clickability, cursor styles, and other layout information.
+
+Each snapshot document is turned into per-layout-node columns in bulk (with NumPy when it is
+installed), and `EnhancedSnapshotNode` objects are only built when a backend node is looked up.
 """
 
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
 from cdp_use.cdp.domsnapshot.commands import CaptureSnapshotReturns
 from cdp_use.cdp.domsnapshot.types import (
 	LayoutTreeSnapshot,
 	NodeTreeSnapshot,
-	RareBooleanData,
 )
 
 from browser_use.dom.views import DOMRect, EnhancedSnapshotNode
 
+try:
+	import numpy as np
+
+	NUMPY_AVAILABLE = True
+except ImportError:
+	NUMPY_AVAILABLE = False
+
 # Only the ESSENTIAL computed styles for interactivity and visibility detection
 REQUIRED_COMPUTED_STYLES = [
 	# Only styles actually accessed in the codebase (prevents Chrome crashes on heavy sites)
@@ -30,11 +43,6 @@ REQUIRED_COMPUTED_STYLES = [
 ]
 
 
-def _parse_rare_boolean_data(rare_data: RareBooleanData, index: int) -> bool | None:
-	"""Parse rare boolean data from snapshot - returns True if index is in the rare data."""
-	return index in rare_data['index']
-
-
 def _parse_computed_styles(strings: list[str], style_indices: list[int]) -> dict[str, str]:
 	"""Parse computed styles from layout tree using string indices."""
 	styles = {}
@@ -44,118 +52,200 @@ def _parse_computed_styles(strings: list[str], style_indices: list[int]) -> dict
 	return styles
 
 
+# Position of each style in a layout node's `styles` row
+STYLE_POSITIONS = {name: position for position, name in enumerate(REQUIRED_COMPUTED_STYLES)}
+
+
+def _rect(values: list[float] | None) -> DOMRect | None:
+	if values and len(values) >= 4:
+		return DOMRect(x=values[0], y=values[1], width=values[2], height=values[3])
+	return None
+
+
+@dataclass(slots=True)
+class SnapshotColumns:
+	"""One snapshot document, flattened into lists indexed by snapshot node or layout node.
+
+	Shared by every EnhancedSnapshotNode of the document; the decode methods take a layout index.
+	"""
+
+	strings: list[str]
+	layout_of_node: list[int]
+	"""Snapshot node index -> its first layout node index (-1 when it has no layout node)"""
+	clickable: list[bool] | None
+	"""Per snapshot node; None when the document carries no isClickable data"""
+	bounds: list[list[float] | None]
+	"""Per layout node, already converted from device to CSS pixels"""
+	# With NumPy the three columns above are arrays (a few bytes per node instead of Python objects)
+	styles: list[list[int]]
+	paint_orders: list[int]
+	client_rects: list[list[float]]
+	scroll_rects: list[list[float]]
+	stacking_contexts: list[int]
+	stacking_contexts_len: int
+
+	def node(self, snapshot_index: int) -> EnhancedSnapshotNode:
+		is_clickable = bool(self.clickable[snapshot_index]) if self.clickable is not None else None
+
+		layout_idx = int(self.layout_of_node[snapshot_index]) if snapshot_index < len(self.layout_of_node) else -1
+		if not 0 <= layout_idx < len(self.bounds):
+			return EnhancedSnapshotNode(
+				is_clickable=is_clickable,
+				cursor_style=None,
+				bounds=None,
+				clientRects=None,
+				scrollRects=None,
+				computed_styles=None,
+				paint_order=None,
+				stacking_contexts=None,
+			)
+
+		paint_order = self.paint_orders[layout_idx] if layout_idx < len(self.paint_orders) else None
+		# stackingContexts is rare boolean data ({'index': [...]}); this mirrors how it has always been read
+		stacking_contexts = None
+		if layout_idx < self.stacking_contexts_len and layout_idx < len(self.stacking_contexts):
+			stacking_contexts = self.stacking_contexts[layout_idx]
+
+		return EnhancedSnapshotNode.from_columns(self, layout_idx, is_clickable, paint_order, stacking_contexts)
+
+	def bounds_rect(self, layout_idx: int) -> DOMRect | None:
+		bounds = self.bounds[layout_idx]
+		if bounds is None:
+			return None
+		return DOMRect(x=float(bounds[0]), y=float(bounds[1]), width=float(bounds[2]), height=float(bounds[3]))
+
+	def client_rect(self, layout_idx: int) -> DOMRect | None:
+		return _rect(self.client_rects[layout_idx]) if layout_idx < len(self.client_rects) else None
+
+	def scroll_rect(self, layout_idx: int) -> DOMRect | None:
+		return _rect(self.scroll_rects[layout_idx]) if layout_idx < len(self.scroll_rects) else None
+
+	def computed_styles(self, layout_idx: int) -> dict[str, str] | None:
+		if layout_idx >= len(self.styles):
+			return None
+		return _parse_computed_styles(self.strings, self.styles[layout_idx]) or None
+
+	def style(self, layout_idx: int, name: str) -> str | None:
+		position = STYLE_POSITIONS.get(name)
+		if position is None or layout_idx >= len(self.styles):
+			return None
+		row = self.styles[layout_idx]
+		if position < len(row) and 0 <= row[position] < len(self.strings):
+			return self.strings[row[position]]
+		return None
+
+
+def _layout_of_node(node_index: list[int], node_count: int) -> list[int]:
+	"""First layout index for every snapshot node (duplicates keep their first occurrence)."""
+	if NUMPY_AVAILABLE and node_index:
+		indices = np.asarray(node_index, dtype=np.int64)
+		unique, first = np.unique(indices, return_index=True)
+		in_range = (unique >= 0) & (unique < node_count)
+		lookup = np.full(node_count, -1, dtype=np.int64)
+		lookup[unique[in_range]] = first[in_range]
+		return lookup  # type: ignore[return-value]
+
+	lookup = [-1] * node_count
+	for layout_idx, snapshot_index in enumerate(node_index):
+		if 0 <= snapshot_index < node_count and lookup[snapshot_index] == -1:
+			lookup[snapshot_index] = layout_idx
+	return lookup
+
+
+def _clickable_mask(indices: list[int], node_count: int) -> list[bool]:
+	if NUMPY_AVAILABLE and indices:
+		index_array = np.asarray(indices, dtype=np.int64)
+		mask = np.zeros(node_count, dtype=bool)
+		mask[index_array[(index_array >= 0) & (index_array < node_count)]] = True
+		return mask  # type: ignore[return-value]
+
+	mask = [False] * node_count
+	for snapshot_index in indices:
+		if 0 <= snapshot_index < node_count:
+			mask[snapshot_index] = True
+	return mask
+
+
+def _css_bounds(bounds: list[list[float]], device_pixel_ratio: float) -> list[list[float] | None]:
+	"""CDP bounds are in device pixels; convert them to CSS pixels."""
+	if NUMPY_AVAILABLE and bounds:
+		array = np.asarray(bounds, dtype=np.float64) if len({len(b) for b in bounds}) == 1 else None
+		if array is not None and array.ndim == 2 and array.shape[1] >= 4:
+			return array[:, :4] / device_pixel_ratio  # type: ignore[return-value]
+
+	return [[value / device_pixel_ratio for value in b[:4]] if len(b) >= 4 else None for b in bounds]
+
+
+def _document_columns(document: Any, strings: list[str], device_pixel_ratio: float) -> tuple[list[int], SnapshotColumns]:
+	nodes: NodeTreeSnapshot = document['nodes']
+	layout: LayoutTreeSnapshot = document['layout'] or {}  # type: ignore[assignment]
+
+	backend_node_ids: list[int] = nodes.get('backendNodeId', [])
+	node_count = len(backend_node_ids)
+	stacking = layout.get('stackingContexts', {})
+
+	columns = SnapshotColumns(
+		strings=strings,
+		layout_of_node=_layout_of_node(layout.get('nodeIndex', []), node_count),
+		clickable=_clickable_mask(nodes['isClickable']['index'], node_count) if 'isClickable' in nodes else None,
+		bounds=_css_bounds(layout.get('bounds', []), device_pixel_ratio),
+		styles=layout.get('styles', []),
+		paint_orders=layout.get('paintOrders', []),
+		client_rects=layout.get('clientRects', []),
+		scroll_rects=layout.get('scrollRects', []),
+		stacking_contexts=stacking.get('index', []),
+		stacking_contexts_len=len(stacking),
+	)
+	return backend_node_ids, columns
+
+
+class SnapshotLookup(Mapping[int, EnhancedSnapshotNode]):
+	"""Backend node id -> EnhancedSnapshotNode, each built from its document's columns on first access."""
+
+	def __init__(self) -> None:
+		self._documents: list[SnapshotColumns] = []
+		# Backend node id -> (document number << 32 | snapshot index) until first access, then the node itself
+		self._entries: dict[int, int | EnhancedSnapshotNode] = {}
+
+	def _add_document(self, backend_node_ids: list[int], columns: SnapshotColumns) -> None:
+		document_bits = len(self._documents) << 32
+		self._documents.append(columns)
+		# Later documents win for duplicate backend node ids, as do later nodes within a document
+		self._entries.update(zip(backend_node_ids, range(document_bits, document_bits + len(backend_node_ids))))
+
+	def __getitem__(self, backend_node_id: int) -> EnhancedSnapshotNode:
+		entry = self._entries[backend_node_id]
+		if isinstance(entry, int):
+			entry = self._entries[backend_node_id] = self._documents[entry >> 32].node(entry & 0xFFFFFFFF)
+		return entry
+
+	def get(self, backend_node_id: int, default: Any = None) -> Any:  # type: ignore[override]
+		if backend_node_id in self._entries:
+			return self[backend_node_id]
+		return default
+
+	def __contains__(self, backend_node_id: object) -> bool:
+		return backend_node_id in self._entries
+
+	def __iter__(self) -> Iterator[int]:
+		return iter(self._entries)
+
+	def __len__(self) -> int:
+		return len(self._entries)
+
+
 def build_snapshot_lookup(
 	snapshot: CaptureSnapshotReturns,
 	device_pixel_ratio: float = 1.0,
-) -> dict[int, EnhancedSnapshotNode]:
-	"""Build a lookup table of backend node ID to enhanced snapshot data with everything calculated upfront."""
-	snapshot_lookup: dict[int, EnhancedSnapshotNode] = {}
+) -> SnapshotLookup:
+	"""Build a lookup table of backend node ID to enhanced snapshot data."""
+	snapshot_lookup = SnapshotLookup()
 
 	if not snapshot['documents']:
 		return snapshot_lookup
 
 	strings = snapshot['strings']
-
 	for document in snapshot['documents']:
-		nodes: NodeTreeSnapshot = document['nodes']
-		layout: LayoutTreeSnapshot = document['layout']
-
-		# Build backend node id to snapshot index lookup
-		backend_node_to_snapshot_index = {}
-		if 'backendNodeId' in nodes:
-			for i, backend_node_id in enumerate(nodes['backendNodeId']):
-				backend_node_to_snapshot_index[backend_node_id] = i
-
-		# PERFORMANCE: Pre-build layout index map to eliminate O(n²) double lookups
-		# Preserve original behavior: use FIRST occurrence for duplicates
-		layout_index_map = {}
-		if layout and 'nodeIndex' in layout:
-			for layout_idx, node_index in enumerate(layout['nodeIndex']):
-				if node_index not in layout_index_map:  # Only store first occurrence
-					layout_index_map[node_index] = layout_idx
-
-		# Build snapshot lookup for each backend node id
-		for backend_node_id, snapshot_index in backend_node_to_snapshot_index.items():
-			is_clickable = None
-			if 'isClickable' in nodes:
-				is_clickable = _parse_rare_boolean_data(nodes['isClickable'], snapshot_index)
-
-			# Find corresponding layout node
-			cursor_style = None
-			is_visible = None
-			bounding_box = None
-			computed_styles = {}
-
-			# Look for layout tree node that corresponds to this snapshot node
-			paint_order = None
-			client_rects = None
-			scroll_rects = None
-			stacking_contexts = None
-			if snapshot_index in layout_index_map:
-				layout_idx = layout_index_map[snapshot_index]
-				if layout_idx < len(layout.get('bounds', [])):
-					# Parse bounding box
-					bounds = layout['bounds'][layout_idx]
-					if len(bounds) >= 4:
-						# IMPORTANT: CDP coordinates are in device pixels, convert to CSS pixels
-						# by dividing by the device pixel ratio
-						raw_x, raw_y, raw_width, raw_height = bounds[0], bounds[1], bounds[2], bounds[3]
-
-						# Apply device pixel ratio scaling to convert device pixels to CSS pixels
-						bounding_box = DOMRect(
-							x=raw_x / device_pixel_ratio,
-							y=raw_y / device_pixel_ratio,
-							width=raw_width / device_pixel_ratio,
-							height=raw_height / device_pixel_ratio,
-						)
-
-					# Parse computed styles for this layout node
-					if layout_idx < len(layout.get('styles', [])):
-						style_indices = layout['styles'][layout_idx]
-						computed_styles = _parse_computed_styles(strings, style_indices)
-						cursor_style = computed_styles.get('cursor')
-
-					# Extract paint order if available
-					if layout_idx < len(layout.get('paintOrders', [])):
-						paint_order = layout.get('paintOrders', [])[layout_idx]
-
-					# Extract client rects if available
-					client_rects_data = layout.get('clientRects', [])
-					if layout_idx < len(client_rects_data):
-						client_rect_data = client_rects_data[layout_idx]
-						if client_rect_data and len(client_rect_data) >= 4:
-							client_rects = DOMRect(
-								x=client_rect_data[0],
-								y=client_rect_data[1],
-								width=client_rect_data[2],
-								height=client_rect_data[3],
-							)
-
-					# Extract scroll rects if available
-					scroll_rects_data = layout.get('scrollRects', [])
-					if layout_idx < len(scroll_rects_data):
-						scroll_rect_data = scroll_rects_data[layout_idx]
-						if scroll_rect_data and len(scroll_rect_data) >= 4:
-							scroll_rects = DOMRect(
-								x=scroll_rect_data[0],
-								y=scroll_rect_data[1],
-								width=scroll_rect_data[2],
-								height=scroll_rect_data[3],
-							)
-
-					# Extract stacking contexts if available
-					if layout_idx < len(layout.get('stackingContexts', [])):
-						stacking_contexts = layout.get('stackingContexts', {}).get('index', [])[layout_idx]
-
-			snapshot_lookup[backend_node_id] = EnhancedSnapshotNode(
-				is_clickable=is_clickable,
-				cursor_style=cursor_style,
-				bounds=bounding_box,
-				clientRects=client_rects,
-				scrollRects=scroll_rects,
-				computed_styles=computed_styles if computed_styles else None,
-				paint_order=paint_order,
-				stacking_contexts=stacking_contexts,
-			)
+		snapshot_lookup._add_document(*_document_columns(document, strings, device_pixel_ratio))
 
 	return snapshot_lookup
@@ -0,0 +1,121 @@
+"""
+Click targeting from a captured DOM snapshot.
+
+The snapshot already has the viewport position, paint order and computed styles of every node in the top-level
+document, which is enough to pick a click point and to tell what the browser would hit there (what
+document.elementFromPoint answers on the live page). This only holds while the document is unchanged since capture;
+callers check that first and query the live page otherwise.
+
+Elements inside iframes are not resolved here: their paint order is local to their own document.
+"""
+
+from browser_use.dom.views import DOMRect, EnhancedDOMTreeNode, NodeType
+
+# Overflow values that clip descendants to the element's box
+_CLIPPING_OVERFLOW = ('hidden', 'clip', 'auto', 'scroll')
+
+
+def _intersect(a: DOMRect, b: DOMRect) -> DOMRect | None:
+	x1, y1 = max(a.x, b.x), max(a.y, b.y)
+	x2, y2 = min(a.x + a.width, b.x + b.width), min(a.y + a.height, b.y + b.height)
+	if x2 <= x1 or y2 <= y1:
+		return None
+	return DOMRect(x=x1, y=y1, width=x2 - x1, height=y2 - y1)
+
+
+def _contains_point(rect: DOMRect, x: float, y: float) -> bool:
+	return rect.x <= x < rect.x + rect.width and rect.y <= y < rect.y + rect.height
+
+
+def _clips_descendants(node: EnhancedDOMTreeNode) -> bool:
+	"""Whether an element's box clips its descendants. The root scroller is clipped by the viewport instead."""
+	if node.node_type != NodeType.ELEMENT_NODE or node.tag_name in ('html', 'body'):
+		return False
+	styles = node.snapshot_node.computed_styles if node.snapshot_node else None
+	if not styles:
+		return False
+	return any(styles.get(name) in _CLIPPING_OVERFLOW for name in ('overflow', 'overflow-x', 'overflow-y'))
+
+
+def _is_hit_testable(node: EnhancedDOMTreeNode) -> bool:
+	snapshot_node = node.snapshot_node
+	if snapshot_node is None or snapshot_node.paint_order is None or node.absolute_position is None:
+		return False
+	styles = snapshot_node.computed_styles or {}
+	return (
+		styles.get('pointer-events') != 'none'
+		and styles.get('visibility') not in ('hidden', 'collapse')
+		and styles.get('display') != 'none'
+	)
+
+
+def element_at_point(document: EnhancedDOMTreeNode, x: float, y: float) -> EnhancedDOMTreeNode | None:
+	"""Topmost element of the document at a viewport point, by paint order (later DOM order wins ties).
+
+	Iframe elements are hit as a whole, their documents are not entered. Text hits resolve to their parent element.
+	"""
+	best: EnhancedDOMTreeNode | None = None
+	best_paint_order = -1
+	stack: list[tuple[EnhancedDOMTreeNode, DOMRect | None]] = [(document, None)]
+	while stack:
+		node, clip = stack.pop()
+		position = node.absolute_position
+		if _is_hit_testable(node) and position is not None and _contains_point(position, x, y):
+			if clip is None or _contains_point(clip, x, y):
+				paint_order = node.snapshot_node.paint_order  # type: ignore[union-attr]
+				if paint_order is not None and paint_order >= best_paint_order:
+					best, best_paint_order = node, paint_order
+
+		child_clip = clip
+		if position is not None and _clips_descendants(node):
+			child_clip = _intersect(clip, position) if clip is not None else position
+			if child_clip is None:
+				continue  # Nothing inside is visible
+		# Reversed so children are popped in document order
+		for child in reversed(node.children_and_shadow_roots):
+			stack.append((child, child_clip))
+
+	if best is not None and best.node_type == NodeType.TEXT_NODE:
+		return best.parent_node
+	return best
+
+
+def _is_related(a: EnhancedDOMTreeNode, b: EnhancedDOMTreeNode) -> bool:
+	"""Whether a and b are the same node or one contains the other (through shadow roots too)."""
+	for start, other in ((a, b), (b, a)):
+		node: EnhancedDOMTreeNode | None = start
+		while node is not None:
+			if node is other:
+				return True
+			node = node.parent_node
+	return False
+
+
+def click_point(
+	document: EnhancedDOMTreeNode, element: EnhancedDOMTreeNode, viewport_width: float, viewport_height: float
+) -> tuple[float, float] | None:
+	"""Center of the element's visible part, if nothing else is painted on top of it there.
+
+	Returns None when the snapshot cannot decide: the element is outside the top-level document, out of view or
+	clipped away, or something covers the point. Callers then fall back to the live page.
+	"""
+	if element.absolute_position is None:
+		return None
+
+	visible = _intersect(element.absolute_position, DOMRect(x=0, y=0, width=viewport_width, height=viewport_height))
+	ancestor = element.parent_node
+	while ancestor is not document:
+		# The element must be part of this document, not of an iframe inside it
+		if ancestor is None or ancestor.node_type == NodeType.DOCUMENT_NODE:
+			return None
+		if visible is not None and ancestor.absolute_position is not None and _clips_descendants(ancestor):
+			visible = _intersect(visible, ancestor.absolute_position)
+		ancestor = ancestor.parent_node
+	if visible is None:
+		return None
+
+	x, y = visible.x + visible.width / 2, visible.y + visible.height / 2
+	hit = element_at_point(document, x, y)
+	if hit is None or not _is_related(hit, element):
+		return None
+	return x, y
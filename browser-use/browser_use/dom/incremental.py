@@ -0,0 +1,318 @@
+"""
+Incremental maintenance of the CDP DOM tree.
+
+`DOM.getDocument(depth=-1, pierce=True)` serializes the whole document (every frame and
+shadow root) on every capture. `DOMTreeMirror` fetches it once per document, then keeps a
+local copy current by applying the DOM domain's mutation events. A capture only asks Chrome
+for the children of subtrees inserted since the previous capture.
+
+Layout (DOMSnapshot) and the accessibility tree are still captured in full: CDP has no
+per-subtree snapshot, and form state changes (value, checked) emit no DOM events.
+
+Event handlers never mutate a `children`/`shadowRoots`/`attributes` list in place, they swap
+in a new list, so a capture that is still walking the tree sees a consistent version of it.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+from cdp_use.cdp.dom.types import Node
+
+if TYPE_CHECKING:
+	from browser_use.browser.session import CDPSession
+
+# Beyond this many inserted subtrees it is cheaper to fetch the whole document again
+MAX_PENDING_SUBTREES = 50
+
+# Mirrors kept at once (tabs plus cross-origin iframe targets); the least recently read is dropped
+MAX_MIRRORS = 8
+
+FRAME_OWNER_NAMES = ('IFRAME', 'FRAME')
+
+
+class DOMTreeMirror:
+	"""Local copy of one target's DOM tree, kept current from DOM mutation events."""
+
+	def __init__(self, cdp_session: 'CDPSession', logger: logging.Logger | None = None):
+		self.cdp_session = cdp_session
+		self.logger = logger or logging.getLogger(__name__)
+		self.root: Node | None = None
+		self.stats = {'full_fetches': 0, 'incremental_reads': 0, 'mutations': 0, 'subtree_fetches': 0}
+		self._nodes: dict[int, Node] = {}
+		self._pending: set[int] = set()
+		self._valid = False
+		# Events received while a full fetch is in flight
+		self._buffer: list[tuple[str, dict[str, Any]]] | None = None
+
+	@property
+	def valid(self) -> bool:
+		return self._valid and self.root is not None
+
+	def invalidate(self, reason: str) -> None:
+		if self._valid:
+			self.logger.debug(f'🔁 DOM mirror invalidated: {reason}')
+		self._valid = False
+
+	def _index(self, node: Node, parent_id: int | None = None) -> None:
+		if parent_id is not None:
+			node['parentId'] = parent_id
+		self._nodes[node['nodeId']] = node
+		for child in node.get('children') or []:
+			self._index(child, node['nodeId'])
+		for shadow_root in node.get('shadowRoots') or []:
+			self._index(shadow_root)
+		if node.get('contentDocument'):
+			self._index(node['contentDocument'])
+
+	def _unindex(self, node: Node) -> None:
+		self._nodes.pop(node['nodeId'], None)
+		self._pending.discard(node['nodeId'])
+		for child in node.get('children') or []:
+			self._unindex(child)
+		for shadow_root in node.get('shadowRoots') or []:
+			self._unindex(shadow_root)
+		if node.get('contentDocument'):
+			self._unindex(node['contentDocument'])
+
+	def _track_incomplete(self, node: Node) -> None:
+		"""Queue subtrees Chrome sent without their children (inserted nodes arrive at depth 0)."""
+		if node['nodeName'].upper() in FRAME_OWNER_NAMES:
+			# A (re)loaded frame's content document is only delivered by getDocument
+			self.invalidate('frame inserted')
+			return
+		if node.get('childNodeCount', 0) > len(node.get('children') or []):
+			self._pending.add(node['nodeId'])
+		for child in node.get('children') or []:
+			self._track_incomplete(child)
+		for shadow_root in node.get('shadowRoots') or []:
+			self._track_incomplete(shadow_root)
+
+	def _node(self, node_id: int) -> Node:
+		node = self._nodes.get(node_id)
+		if node is None:
+			raise KeyError(node_id)
+		return node
+
+	def apply(self, method: str, event: dict[str, Any]) -> None:
+		"""Apply one `DOM.*` event; anything the mirror cannot follow invalidates it."""
+		if self._buffer is not None:
+			self._buffer.append((method, event))
+			return
+		if not self._valid:
+			return
+		handler = getattr(self, f'_on_{method}', None)
+		if handler is None:
+			return
+		self.stats['mutations'] += 1
+		try:
+			handler(event)
+		except (KeyError, StopIteration) as e:
+			self.invalidate(f'{method} for unknown node {e}')
+
+	def _on_documentUpdated(self, event: dict[str, Any]) -> None:
+		self.invalidate('document updated')
+
+	def _on_setChildNodes(self, event: dict[str, Any]) -> None:
+		parent = self._node(event['parentId'])
+		for child in parent.get('children') or []:
+			self._unindex(child)
+		children = list(event['nodes'])
+		for child in children:
+			self._index(child, parent['nodeId'])
+			self._track_incomplete(child)
+		parent['children'] = children
+		parent['childNodeCount'] = len(children)
+		self._pending.discard(parent['nodeId'])
+
+	def _on_childNodeInserted(self, event: dict[str, Any]) -> None:
+		parent = self._node(event['parentNodeId'])
+		node = event['node']
+		children = list(parent.get('children') or [])
+		position = 0
+		if event.get('previousNodeId'):
+			position = next(i for i, child in enumerate(children) if child['nodeId'] == event['previousNodeId']) + 1
+		children.insert(position, node)
+		self._index(node, parent['nodeId'])
+		self._track_incomplete(node)
+		parent['children'] = children
+		parent['childNodeCount'] = len(children)
+
+	def _on_childNodeRemoved(self, event: dict[str, Any]) -> None:
+		parent = self._node(event['parentNodeId'])
+		node = self._node(event['nodeId'])
+		parent['children'] = [child for child in parent.get('children') or [] if child['nodeId'] != node['nodeId']]
+		parent['childNodeCount'] = len(parent['children'])
+		self._unindex(node)
+
+	def _on_childNodeCountUpdated(self, event: dict[str, Any]) -> None:
+		# Chrome only sends this for containers whose children were never pushed to us
+		node = self._node(event['nodeId'])
+		node['childNodeCount'] = event['childNodeCount']
+		self._pending.add(node['nodeId'])
+
+	def _on_attributeModified(self, event: dict[str, Any]) -> None:
+		node = self._node(event['nodeId'])
+		attributes = list(node.get('attributes') or [])
+		for i in range(0, len(attributes), 2):
+			if attributes[i] == event['name']:
+				attributes[i + 1] = event['value']
+				break
+		else:
+			attributes += [event['name'], event['value']]
+		node['attributes'] = attributes
+
+	def _on_attributeRemoved(self, event: dict[str, Any]) -> None:
+		node = self._node(event['nodeId'])
+		attributes = node.get('attributes') or []
+		remaining: list[str] = []
+		for i in range(0, len(attributes), 2):
+			if attributes[i] != event['name']:
+				remaining += attributes[i : i + 2]
+		node['attributes'] = remaining
+
+	def _on_characterDataModified(self, event: dict[str, Any]) -> None:
+		self._node(event['nodeId'])['nodeValue'] = event['characterData']
+
+	def _on_scrollableFlagUpdated(self, event: dict[str, Any]) -> None:
+		self._node(event['nodeId'])['isScrollable'] = event['isScrollable']
+
+	def _on_shadowRootPushed(self, event: dict[str, Any]) -> None:
+		host = self._node(event['hostId'])
+		root = event['root']
+		host['shadowRoots'] = [*(host.get('shadowRoots') or []), root]
+		self._index(root)
+		self._track_incomplete(root)
+
+	def _on_shadowRootPopped(self, event: dict[str, Any]) -> None:
+		host = self._node(event['hostId'])
+		root = self._node(event['rootId'])
+		host['shadowRoots'] = [shadow for shadow in host.get('shadowRoots') or [] if shadow['nodeId'] != root['nodeId']]
+		self._unindex(root)
+
+	async def _fetch(self) -> None:
+		self._buffer = []
+		try:
+			document = await self.cdp_session.cdp_client.send.DOM.getDocument(
+				params={'depth': -1, 'pierce': True}, session_id=self.cdp_session.session_id
+			)
+		finally:
+			buffered, self._buffer = self._buffer, None
+
+		self._nodes.clear()
+		self._pending.clear()
+		self.root = document['root']
+		self._index(self.root)
+		self._valid = True
+		self.stats['full_fetches'] += 1
+
+		# Events that raced the response: ones about nodes from before the fetch (getDocument
+		# discards old node ids, and ids are never reused) are already reflected in the document
+		for method, event in buffered:
+			handler = getattr(self, f'_on_{method}', None)
+			if handler is None or method == 'documentUpdated':
+				continue
+			try:
+				handler(event)
+			except (KeyError, StopIteration):
+				pass
+
+	async def _bindings_intact(self) -> bool:
+		"""Whether Chrome still knows our node ids (another getDocument call on this session discards them)."""
+		assert self.root is not None
+		try:
+			described = await self.cdp_session.cdp_client.send.DOM.describeNode(
+				params={'nodeId': self.root['nodeId']}, session_id=self.cdp_session.session_id
+			)
+		except Exception:
+			return False
+		return described['node']['backendNodeId'] == self.root['backendNodeId']
+
+	async def _fetch_pending_subtrees(self) -> None:
+		while self._pending and self._valid:
+			if len(self._pending) > MAX_PENDING_SUBTREES:
+				self.invalidate(f'{len(self._pending)} inserted subtrees')
+				return
+			pending, self._pending = self._pending, set()
+			# setChildNodes events for these arrive before the command responses
+			await asyncio.gather(
+				*(
+					self.cdp_session.cdp_client.send.DOM.requestChildNodes(
+						params={'nodeId': node_id, 'depth': -1, 'pierce': True}, session_id=self.cdp_session.session_id
+					)
+					for node_id in pending
+				)
+			)
+			self.stats['subtree_fetches'] += len(pending)
+
+	async def get_document(self) -> dict[str, Node]:
+		"""Current tree in `DOM.getDocument` shape, fetched in full only when the mirror cannot be trusted."""
+		if self.valid:
+			try:
+				if not await self._bindings_intact():
+					self.invalidate('node bindings reset')
+				else:
+					await self._fetch_pending_subtrees()
+			except Exception as e:
+				self.invalidate(f'subtree fetch failed: {e}')
+
+		if not self.valid:
+			await self._fetch()
+		else:
+			self.stats['incremental_reads'] += 1
+
+		assert self.root is not None
+		return {'root': self.root}
+
+
+# DOM events that change the tree shape or the fields the enhanced tree reads
+MIRRORED_EVENTS = (
+	'documentUpdated',
+	'setChildNodes',
+	'childNodeInserted',
+	'childNodeRemoved',
+	'childNodeCountUpdated',
+	'attributeModified',
+	'attributeRemoved',
+	'characterDataModified',
+	'scrollableFlagUpdated',
+	'shadowRootPushed',
+	'shadowRootPopped',
+)
+
+
+class IncrementalDOMTrees:
+	"""Owns one `DOMTreeMirror` per target and routes DOM events to them by CDP session."""
+
+	def __init__(self, logger: logging.Logger | None = None):
+		self.logger = logger or logging.getLogger(__name__)
+		self._mirrors: dict[str, DOMTreeMirror] = {}
+		self._registered_clients: list[Any] = []
+
+	def _on_event(self, method: str, event: dict[str, Any], session_id: str | None) -> None:
+		for mirror in self._mirrors.values():
+			if mirror.cdp_session.session_id == session_id:
+				mirror.apply(method, event)
+				return
+
+	def _register(self, cdp_client: Any) -> None:
+		if any(client is cdp_client for client in self._registered_clients):
+			return
+		for method in MIRRORED_EVENTS:
+			getattr(cdp_client.register.DOM, method)(
+				lambda event, session_id=None, method=method: self._on_event(method, event, session_id)
+			)
+		self._registered_clients.append(cdp_client)
+
+	async def get_document(self, cdp_session: 'CDPSession') -> dict[str, Node]:
+		mirror = self._mirrors.get(cdp_session.target_id)
+		if mirror is None or mirror.cdp_session.session_id != cdp_session.session_id:
+			# New target, or the target was re-attached under a new session
+			self._register(cdp_session.cdp_client)
+			await cdp_session.cdp_client.send.DOM.enable(session_id=cdp_session.session_id)
+			mirror = DOMTreeMirror(cdp_session, self.logger)
+		self._mirrors.pop(cdp_session.target_id, None)
+		self._mirrors[cdp_session.target_id] = mirror
+		while len(self._mirrors) > MAX_MIRRORS:
+			self._mirrors.pop(next(iter(self._mirrors)))
+		return await mirror.get_document()
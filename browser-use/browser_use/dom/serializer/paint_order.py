@@ -128,6 +128,128 @@ class RectUnionPure:
 		return True
 
 
+class RectUnionGrid(RectUnionPure):
+	"""
+	Same disjoint union as RectUnionPure, indexed for pages with tens of thousands of rectangles.
+
+	Every stored rectangle is bucketed into a uniform grid, so a query only meets the rectangles
+	sharing a cell with it. Splitting then follows each piece separately with the candidates that
+	still touch it, which produces exactly RectUnionPure's pieces in the same order.
+	"""
+
+	__slots__ = ('_cell_size', '_cells', '_large')
+
+	CELL_SIZE = 256.0
+	MAX_CELLS_PER_RECT = 1024
+	"""Rectangles spanning more cells than this (page-sized backgrounds) are checked against every query"""
+
+	def __init__(self, cell_size: float = CELL_SIZE):
+		super().__init__()
+		self._cell_size = cell_size
+		self._cells: dict[tuple[int, int], list[int]] = {}
+		self._large: list[int] = []
+
+	@staticmethod
+	def _touches(a: Rect, b: Rect) -> bool:
+		"""Closed overlap: unlike `intersects`, also true for edge contact, where `contains` can still hold."""
+		return a.x1 <= b.x2 and b.x1 <= a.x2 and a.y1 <= b.y2 and b.y1 <= a.y2
+
+	def _cell_span(self, r: Rect) -> tuple[int, int, int, int]:
+		size = self._cell_size
+		return int(r.x1 // size), int(r.y1 // size), int(r.x2 // size), int(r.y2 // size)
+
+	def _candidates(self, r: Rect) -> list[Rect]:
+		cx1, cy1, cx2, cy2 = self._cell_span(r)
+		indices = set(self._large)
+		if (cx2 - cx1 + 1) * (cy2 - cy1 + 1) > len(self._cells):
+			# Query larger than the occupied grid: walk the occupied cells instead of the span
+			for (cx, cy), bucket in self._cells.items():
+				if cx1 <= cx <= cx2 and cy1 <= cy <= cy2:
+					indices.update(bucket)
+		else:
+			for cx in range(cx1, cx2 + 1):
+				for cy in range(cy1, cy2 + 1):
+					bucket = self._cells.get((cx, cy))
+					if bucket:
+						indices.update(bucket)
+		# Insertion order keeps the split sequence identical to RectUnionPure's walk
+		return [s for s in (self._rects[i] for i in sorted(indices)) if self._touches(s, r)]
+
+	def _insert(self, r: Rect) -> None:
+		index = len(self._rects)
+		self._rects.append(r)
+		cx1, cy1, cx2, cy2 = self._cell_span(r)
+		if (cx2 - cx1 + 1) * (cy2 - cy1 + 1) > self.MAX_CELLS_PER_RECT:
+			self._large.append(index)
+			return
+		for cx in range(cx1, cx2 + 1):
+			for cy in range(cy1, cy2 + 1):
+				self._cells.setdefault((cx, cy), []).append(index)
+
+	def _subtract(self, r: Rect, candidates: list[Rect], drop_contained: bool, stop_at_first: bool = False) -> list[Rect]:
+		"""
+		Pieces of r that survive the candidates, walked in order.
+		`drop_contained` mirrors RectUnionPure.contains (a containing rect removes even a degenerate
+		piece); without it only intersecting rects split, as in RectUnionPure.add.
+		"""
+		surviving: list[Rect] = []
+		stack = [(r, candidates)]
+		while stack:
+			piece, rest = stack.pop()
+			for i, s in enumerate(rest):
+				if drop_contained and s.contains(piece):
+					break
+				if piece.intersects(s):
+					later = rest[i + 1 :]
+					for part in reversed(self._split_diff(piece, s)):
+						stack.append((part, [t for t in later if self._touches(t, part)]))
+					break
+			else:
+				surviving.append(piece)
+				if stop_at_first:
+					break
+		return surviving
+
+	def _covered(self, r: Rect, candidates: list[Rect]) -> bool:
+		if not candidates:
+			return False
+		area = r.area()
+		if area > 0:
+			# Stored rects are disjoint, so their overlap areas add up: a clear shortfall means uncovered
+			overlap = 0.0
+			for s in candidates:
+				width = min(r.x2, s.x2) - max(r.x1, s.x1)
+				height = min(r.y2, s.y2) - max(r.y1, s.y1)
+				if width > 0 and height > 0:
+					overlap += width * height
+			if overlap < area * (1 - 1e-9):
+				return False
+		return not self._subtract(r, candidates, drop_contained=True, stop_at_first=True)
+
+	# -----------------------------------------------------------------
+	def contains(self, r: Rect) -> bool:
+		"""
+		True iff r is fully covered by the current union.
+		"""
+		if not self._rects:
+			return False
+		return self._covered(r, self._candidates(r))
+
+	# -----------------------------------------------------------------
+	def add(self, r: Rect) -> bool:
+		"""
+		Insert r unless it is already covered.
+		Returns True if the union grew.
+		"""
+		candidates = self._candidates(r)
+		if self._covered(r, candidates):
+			return False
+
+		for piece in self._subtract(r, candidates, drop_contained=False):
+			self._insert(piece)
+		return True
+
+
 class PaintOrderRemover:
 	"""
 	Calculates which elements should be removed based on the paint order parameter.
@@ -158,7 +280,7 @@ class PaintOrderRemover:
 			if node.original_node.snapshot_node and node.original_node.snapshot_node.paint_order is not None:
 				grouped_by_paint_order[node.original_node.snapshot_node.paint_order].append(node)
 
-		rect_union = RectUnionPure()
+		rect_union = RectUnionGrid()
 
 		for paint_order, nodes in sorted(grouped_by_paint_order.items(), key=lambda x: -x[0]):
 			rects_to_add = []
@@ -1,5 +1,6 @@
 # @file purpose: Serializes enhanced DOM trees to string format for LLM consumption
 
+from collections.abc import Callable
 from typing import Any
 
 from browser_use.dom.serializer.clickable_elements import ClickableElementDetector
@@ -38,6 +39,66 @@ SVG_ELEMENTS = {
 }
 
 
+class _LRUCache:
+	"""Bounded least-recently-used cache, shared by every serializer in the process.
+
+	Bounded by entry count and by the total characters of the cached text (`max_chars`), so a page whose large
+	subtrees change every step cannot pin many copies of itself.
+	"""
+
+	__slots__ = ('_entries', '_max_entries', '_max_chars', '_sizeof', 'chars')
+
+	def __init__(self, max_entries: int, max_chars: int, sizeof: Callable[[Any], int] = len):
+		self._entries: dict[Any, Any] = {}
+		self._max_entries = max_entries
+		self._max_chars = max_chars
+		self._sizeof = sizeof
+		self.chars = 0
+
+	def __len__(self) -> int:
+		return len(self._entries)
+
+	def get(self, key: Any) -> Any:
+		value = self._entries.pop(key, None)
+		if value is not None:
+			self._entries[key] = value  # re-insert as most recently used
+		return value
+
+	def put(self, key: Any, value: Any) -> None:
+		previous = self._entries.pop(key, None)
+		if previous is not None:
+			self.chars -= self._sizeof(previous)
+		self._entries[key] = value
+		self.chars += self._sizeof(value)
+		while self._entries and (len(self._entries) > self._max_entries or self.chars > self._max_chars):
+			oldest = next(iter(self._entries))
+			self.chars -= self._sizeof(self._entries.pop(oldest))
+
+	def clear(self) -> None:
+		self._entries.clear()
+		self.chars = 0
+
+
+class _Fragment:
+	"""Serialized text of one subtree.
+
+	Fragments are interned: equal subtrees map to the same object while it is cached, so parent keys can hold
+	their children's fragments and compare them by identity. An evicted child yields a new fragment next time,
+	which only turns the parent lookup into a miss, never into a wrong hit.
+	"""
+
+	__slots__ = ('text',)
+
+	def __init__(self, text: str):
+		self.text = text
+
+
+# Keys are content based, so lines and subtrees are reused across steps and across agents rendering the same page
+_LINE_CACHE = _LRUCache(max_entries=50_000, max_chars=2_000_000)
+# Each fragment holds the full text of its subtree, so this budget is what bounds the serializer's memory
+_SUBTREE_CACHE = _LRUCache(max_entries=50_000, max_chars=8_000_000, sizeof=lambda fragment: len(fragment.text))
+
+
 class DOMTreeSerializer:
 	"""Serializes enhanced DOM trees to string format."""
 
@@ -647,9 +708,8 @@ class DOMTreeSerializer:
 				if node.is_compound_component:
 					node.is_new = True
 				elif self._previous_cached_selector_map:
-					# Check if node is new for regular elements
-					previous_backend_node_ids = {node.backend_node_id for node in self._previous_cached_selector_map.values()}
-					if node.original_node.backend_node_id not in previous_backend_node_ids:
+					# Check if node is new for regular elements (selector maps are keyed by backend_node_id)
+					if node.original_node.backend_node_id not in self._previous_cached_selector_map:
 						node.is_new = True
 
 		# Process children
@@ -811,191 +871,239 @@ class DOMTreeSerializer:
 
 	@staticmethod
 	def serialize_tree(node: SimplifiedNode | None, include_attributes: list[str], depth: int = 0) -> str:
-		"""Serialize the optimized tree to string format."""
+		"""Serialize the optimized tree to string format.
+
+		Each node is keyed by the raw inputs of its own line plus its children's interned fragments. Lines and
+		joined subtree texts are only built for keys not seen before, so the string work of a step tracks what
+		changed on the page; the walk that computes the keys stays linear but does no formatting.
+		"""
 		if not node:
 			return ''
+		return DOMTreeSerializer._serialize_subtree(node, include_attributes, tuple(include_attributes), depth).text
+
+	@staticmethod
+	def _serialize_subtree(
+		node: SimplifiedNode, include_attributes: list[str], include_key: tuple[str, ...], depth: int
+	) -> _Fragment:
+		line_key = DOMTreeSerializer._line_key(node, include_key, depth)
+		children = node.children
+		child_depth = depth
+		if line_key is not None:
+			kind = line_key[0]
+			if kind == 'svg':
+				# Don't process children for SVG
+				children = []
+			elif kind == 'element' or kind == 'shadow':
+				child_depth = depth + 1
+
+		key = (
+			line_key,
+			tuple(
+				DOMTreeSerializer._serialize_subtree(child, include_attributes, include_key, child_depth) for child in children
+			),
+		)
+		fragment = _SUBTREE_CACHE.get(key)
+		if fragment is None:
+			depth_str = depth * '\t'
+			parts = []
+			if line_key is not None:
+				line = _LINE_CACHE.get(line_key)
+				if line is None:
+					line = DOMTreeSerializer._build_line(node, line_key, include_attributes, depth_str)
+					_LINE_CACHE.put(line_key, line)
+				if line:
+					parts.append(line)
+			parts.extend(child.text for child in key[1] if child.text)
+			# Close shadow DOM indicator, only if we had content
+			if line_key is not None and line_key[0] == 'shadow' and children:
+				parts.append(f'{depth_str}Shadow End')
+			fragment = _Fragment('\n'.join(parts))
+			_SUBTREE_CACHE.put(key, fragment)
+		return fragment
 
+	@staticmethod
+	def _line_key(node: SimplifiedNode, include_key: tuple[str, ...], depth: int) -> tuple | None:
+		"""Everything the node's own line depends on, or None if the node has no line of its own."""
 		# Skip rendering excluded nodes, but process their children
-		if hasattr(node, 'excluded_by_parent') and node.excluded_by_parent:
-			formatted_text = []
-			for child in node.children:
-				child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, depth)
-				if child_text:
-					formatted_text.append(child_text)
-			return '\n'.join(formatted_text)
-
-		formatted_text = []
-		depth_str = depth * '\t'
-		next_depth = depth
-
-		if node.original_node.node_type == NodeType.ELEMENT_NODE:
-			# Skip displaying nodes marked as should_display=False
-			if not node.should_display:
-				for child in node.children:
-					child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, depth)
-					if child_text:
-						formatted_text.append(child_text)
-				return '\n'.join(formatted_text)
+		if node.excluded_by_parent:
+			return None
+		original = node.original_node
+		node_type = original.node_type
 
+		if node_type == NodeType.ELEMENT_NODE:
+			# Nodes marked as should_display=False only pass their children through
+			if not node.should_display:
+				return None
+			backend_node_id = original.backend_node_id if node.is_interactive else None
 			# Special handling for SVG elements - show the tag but collapse children
-			if node.original_node.tag_name.lower() == 'svg':
-				shadow_prefix = ''
-				if node.is_shadow_host:
-					has_closed_shadow = any(
-						child.original_node.node_type == NodeType.DOCUMENT_FRAGMENT_NODE
-						and child.original_node.shadow_root_type
-						and child.original_node.shadow_root_type.lower() == 'closed'
-						for child in node.children
-					)
-					shadow_prefix = '|SHADOW(closed)|' if has_closed_shadow else '|SHADOW(open)|'
-
-				line = f'{depth_str}{shadow_prefix}'
-				# Add interactive marker if clickable
-				if node.is_interactive:
-					new_prefix = '*' if node.is_new else ''
-					line += f'{new_prefix}[{node.original_node.backend_node_id}]'
-				line += '<svg'
-				attributes_html_str = DOMTreeSerializer._build_attributes_string(node.original_node, include_attributes, '')
-				if attributes_html_str:
-					line += f' {attributes_html_str}'
-				line += ' /> <!-- SVG content collapsed -->'
-				formatted_text.append(line)
-				# Don't process children for SVG
-				return '\n'.join(formatted_text)
+			if original.tag_name.lower() == 'svg':
+				return (
+					'svg',
+					depth,
+					DOMTreeSerializer._shadow_prefix(node),
+					backend_node_id,
+					node.is_new,
+					DOMTreeSerializer._attributes_key(original, include_key),
+				)
 
 			# Add element if clickable, scrollable, or iframe
-			is_any_scrollable = node.original_node.is_actually_scrollable or node.original_node.is_scrollable
-			should_show_scroll = node.original_node.should_show_scroll_info
-			if (
-				node.is_interactive
-				or is_any_scrollable
-				or node.original_node.tag_name.upper() == 'IFRAME'
-				or node.original_node.tag_name.upper() == 'FRAME'
-			):
-				next_depth += 1
-
-				# Build attributes string with compound component info
-				text_content = ''
-				attributes_html_str = DOMTreeSerializer._build_attributes_string(
-					node.original_node, include_attributes, text_content
-				)
+			is_any_scrollable = original.is_actually_scrollable or original.is_scrollable
+			tag_name = original.tag_name
+			tag_upper = tag_name.upper()
+			if not (node.is_interactive or is_any_scrollable or tag_upper == 'IFRAME' or tag_upper == 'FRAME'):
+				return None
+			should_show_scroll = original.should_show_scroll_info
+			return (
+				'element',
+				depth,
+				DOMTreeSerializer._shadow_prefix(node),
+				tag_name,
+				backend_node_id,
+				node.is_new,
+				should_show_scroll,
+				DOMTreeSerializer._attributes_key(original, include_key),
+				repr(original._compound_children) if original._compound_children else None,
+				original.get_scroll_info_text() if should_show_scroll else None,
+			)
 
-				# Add compound component information to attributes if present
-				if node.original_node._compound_children:
-					compound_info = []
-					for child_info in node.original_node._compound_children:
-						parts = []
-						if child_info['name']:
-							parts.append(f'name={child_info["name"]}')
-						if child_info['role']:
-							parts.append(f'role={child_info["role"]}')
-						if child_info['valuemin'] is not None:
-							parts.append(f'min={child_info["valuemin"]}')
-						if child_info['valuemax'] is not None:
-							parts.append(f'max={child_info["valuemax"]}')
-						if child_info['valuenow'] is not None:
-							parts.append(f'current={child_info["valuenow"]}')
-
-						# Add select-specific information
-						if 'options_count' in child_info and child_info['options_count'] is not None:
-							parts.append(f'count={child_info["options_count"]}')
-						if 'first_options' in child_info and child_info['first_options']:
-							options_str = '|'.join(child_info['first_options'][:4])  # Limit to 4 options
-							parts.append(f'options={options_str}')
-						if 'format_hint' in child_info and child_info['format_hint']:
-							parts.append(f'format={child_info["format_hint"]}')
-
-						if parts:
-							compound_info.append(f'({",".join(parts)})')
-
-					if compound_info:
-						compound_attr = f'compound_components={",".join(compound_info)}'
-						if attributes_html_str:
-							attributes_html_str += f' {compound_attr}'
-						else:
-							attributes_html_str = compound_attr
-
-				# Build the line with shadow host indicator
-				shadow_prefix = ''
-				if node.is_shadow_host:
-					# Check if any shadow children are closed
-					has_closed_shadow = any(
-						child.original_node.node_type == NodeType.DOCUMENT_FRAGMENT_NODE
-						and child.original_node.shadow_root_type
-						and child.original_node.shadow_root_type.lower() == 'closed'
-						for child in node.children
-					)
-					shadow_prefix = '|SHADOW(closed)|' if has_closed_shadow else '|SHADOW(open)|'
-
-				if should_show_scroll and not node.is_interactive:
-					# Scrollable container but not clickable
-					line = f'{depth_str}{shadow_prefix}|SCROLL|<{node.original_node.tag_name}'
-				elif node.is_interactive:
-					# Clickable (and possibly scrollable) - show backend_node_id
-					new_prefix = '*' if node.is_new else ''
-					scroll_prefix = '|SCROLL[' if should_show_scroll else '['
-					line = f'{depth_str}{shadow_prefix}{new_prefix}{scroll_prefix}{node.original_node.backend_node_id}]<{node.original_node.tag_name}'
-				elif node.original_node.tag_name.upper() == 'IFRAME':
-					# Iframe element (not interactive)
-					line = f'{depth_str}{shadow_prefix}|IFRAME|<{node.original_node.tag_name}'
-				elif node.original_node.tag_name.upper() == 'FRAME':
-					# Frame element (not interactive)
-					line = f'{depth_str}{shadow_prefix}|FRAME|<{node.original_node.tag_name}'
-				else:
-					line = f'{depth_str}{shadow_prefix}<{node.original_node.tag_name}'
+		if node_type == NodeType.DOCUMENT_FRAGMENT_NODE:
+			# Shadow DOM representation - show clearly to LLM
+			is_closed = bool(original.shadow_root_type and original.shadow_root_type.lower() == 'closed')
+			return ('shadow', depth, is_closed)
 
-				if attributes_html_str:
-					line += f' {attributes_html_str}'
+		if node_type == NodeType.TEXT_NODE:
+			# Include visible text
+			node_value = original.node_value
+			if node_value and original.snapshot_node and original.is_visible:
+				clean_text = node_value.strip()
+				if len(clean_text) > 1:
+					return ('text', depth, clean_text)
 
-				line += ' />'
+		return None
 
-				# Add scroll information only when we should show it
-				if should_show_scroll:
-					scroll_info_text = node.original_node.get_scroll_info_text()
-					if scroll_info_text:
-						line += f' ({scroll_info_text})'
+	@staticmethod
+	def _attributes_key(node: EnhancedDOMTreeNode, include_key: tuple[str, ...]) -> tuple:
+		"""Everything `_build_attributes_string` reads from the node."""
+		ax_node = node.ax_node
+		return (
+			node.node_name,
+			tuple(node.attributes.items()) if node.attributes else (),
+			(ax_node.role, tuple((prop.name, prop.value) for prop in ax_node.properties or ())) if ax_node else None,
+			include_key,
+		)
 
-				formatted_text.append(line)
+	@staticmethod
+	def _build_line(node: SimplifiedNode, line_key: tuple, include_attributes: list[str], depth_str: str) -> str:
+		kind = line_key[0]
+		if kind == 'text':
+			return f'{depth_str}{line_key[2]}'
+		if kind == 'shadow':
+			return f'{depth_str}Closed Shadow' if line_key[2] else f'{depth_str}Open Shadow'
+		if kind == 'svg':
+			return DOMTreeSerializer._svg_line(node, include_attributes, depth_str)
+		return DOMTreeSerializer._element_line(node, include_attributes, depth_str, scroll_info_text=line_key[-1])
 
-		elif node.original_node.node_type == NodeType.DOCUMENT_FRAGMENT_NODE:
-			# Shadow DOM representation - show clearly to LLM
-			if node.original_node.shadow_root_type and node.original_node.shadow_root_type.lower() == 'closed':
-				formatted_text.append(f'{depth_str}Closed Shadow')
-			else:
-				formatted_text.append(f'{depth_str}Open Shadow')
+	@staticmethod
+	def _svg_line(node: SimplifiedNode, include_attributes: list[str], depth_str: str) -> str:
+		line = f'{depth_str}{DOMTreeSerializer._shadow_prefix(node)}'
+		# Add interactive marker if clickable
+		if node.is_interactive:
+			new_prefix = '*' if node.is_new else ''
+			line += f'{new_prefix}[{node.original_node.backend_node_id}]'
+		line += '<svg'
+		attributes_html_str = DOMTreeSerializer._build_attributes_string(node.original_node, include_attributes, '')
+		if attributes_html_str:
+			line += f' {attributes_html_str}'
+		line += ' /> <!-- SVG content collapsed -->'
+		return line
+
+	@staticmethod
+	def _element_line(node: SimplifiedNode, include_attributes: list[str], depth_str: str, scroll_info_text: str | None) -> str:
+		"""Line of a clickable, scrollable or (i)frame element."""
+		should_show_scroll = node.original_node.should_show_scroll_info
+		tag_upper = node.original_node.tag_name.upper()
+
+		# Build attributes string with compound component info
+		attributes_html_str = DOMTreeSerializer._build_attributes_string(node.original_node, include_attributes, '')
+
+		# Add compound component information to attributes if present
+		if node.original_node._compound_children:
+			compound_info = []
+			for child_info in node.original_node._compound_children:
+				parts = []
+				if child_info['name']:
+					parts.append(f'name={child_info["name"]}')
+				if child_info['role']:
+					parts.append(f'role={child_info["role"]}')
+				if child_info['valuemin'] is not None:
+					parts.append(f'min={child_info["valuemin"]}')
+				if child_info['valuemax'] is not None:
+					parts.append(f'max={child_info["valuemax"]}')
+				if child_info['valuenow'] is not None:
+					parts.append(f'current={child_info["valuenow"]}')
+
+				# Add select-specific information
+				if 'options_count' in child_info and child_info['options_count'] is not None:
+					parts.append(f'count={child_info["options_count"]}')
+				if 'first_options' in child_info and child_info['first_options']:
+					options_str = '|'.join(child_info['first_options'][:4])  # Limit to 4 options
+					parts.append(f'options={options_str}')
+				if 'format_hint' in child_info and child_info['format_hint']:
+					parts.append(f'format={child_info["format_hint"]}')
+
+				if parts:
+					compound_info.append(f'({",".join(parts)})')
+
+			if compound_info:
+				compound_attr = f'compound_components={",".join(compound_info)}'
+				if attributes_html_str:
+					attributes_html_str += f' {compound_attr}'
+				else:
+					attributes_html_str = compound_attr
+
+		# Build the line with shadow host indicator
+		shadow_prefix = DOMTreeSerializer._shadow_prefix(node)
+
+		if should_show_scroll and not node.is_interactive:
+			# Scrollable container but not clickable
+			line = f'{depth_str}{shadow_prefix}|SCROLL|<{node.original_node.tag_name}'
+		elif node.is_interactive:
+			# Clickable (and possibly scrollable) - show backend_node_id
+			new_prefix = '*' if node.is_new else ''
+			scroll_prefix = '|SCROLL[' if should_show_scroll else '['
+			line = f'{depth_str}{shadow_prefix}{new_prefix}{scroll_prefix}{node.original_node.backend_node_id}]<{node.original_node.tag_name}'
+		elif tag_upper == 'IFRAME':
+			# Iframe element (not interactive)
+			line = f'{depth_str}{shadow_prefix}|IFRAME|<{node.original_node.tag_name}'
+		elif tag_upper == 'FRAME':
+			# Frame element (not interactive)
+			line = f'{depth_str}{shadow_prefix}|FRAME|<{node.original_node.tag_name}'
+		else:
+			line = f'{depth_str}{shadow_prefix}<{node.original_node.tag_name}'
 
-			next_depth += 1
+		if attributes_html_str:
+			line += f' {attributes_html_str}'
 
-			# Process shadow DOM children
-			for child in node.children:
-				child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, next_depth)
-				if child_text:
-					formatted_text.append(child_text)
+		line += ' />'
 
-			# Close shadow DOM indicator
-			if node.children:  # Only show close if we had content
-				formatted_text.append(f'{depth_str}Shadow End')
+		# Add scroll information only when we should show it
+		if should_show_scroll and scroll_info_text:
+			line += f' ({scroll_info_text})'
 
-		elif node.original_node.node_type == NodeType.TEXT_NODE:
-			# Include visible text
-			is_visible = node.original_node.snapshot_node and node.original_node.is_visible
-			if (
-				is_visible
-				and node.original_node.node_value
-				and node.original_node.node_value.strip()
-				and len(node.original_node.node_value.strip()) > 1
-			):
-				clean_text = node.original_node.node_value.strip()
-				formatted_text.append(f'{depth_str}{clean_text}')
-
-		# Process children (for non-shadow elements)
-		if node.original_node.node_type != NodeType.DOCUMENT_FRAGMENT_NODE:
-			for child in node.children:
-				child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, next_depth)
-				if child_text:
-					formatted_text.append(child_text)
-
-		return '\n'.join(formatted_text)
+		return line
+
+	@staticmethod
+	def _shadow_prefix(node: SimplifiedNode) -> str:
+		if not node.is_shadow_host:
+			return ''
+		# Check if any shadow children are closed
+		has_closed_shadow = any(
+			child.original_node.node_type == NodeType.DOCUMENT_FRAGMENT_NODE
+			and child.original_node.shadow_root_type
+			and child.original_node.shadow_root_type.lower() == 'closed'
+			for child in node.children
+		)
+		return '|SHADOW(closed)|' if has_closed_shadow else '|SHADOW(open)|'
 
 	@staticmethod
 	def _build_attributes_string(node: EnhancedDOMTreeNode, include_attributes: list[str], text: str) -> str:
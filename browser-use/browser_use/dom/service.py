@@ -8,10 +8,12 @@ from cdp_use.cdp.accessibility.types import AXNode
 from cdp_use.cdp.dom.types import Node
 from cdp_use.cdp.target import TargetID
 
+from browser_use.browser.introspection import PageIntrospection, introspect_page
 from browser_use.dom.enhanced_snapshot import (
 	REQUIRED_COMPUTED_STYLES,
 	build_snapshot_lookup,
 )
+from browser_use.dom.incremental import IncrementalDOMTrees
 from browser_use.dom.serializer.serializer import DOMTreeSerializer
 from browser_use.dom.views import (
 	DOMRect,
@@ -50,6 +52,9 @@ class DomService:
 		paint_order_filtering: bool = True,
 		max_iframes: int = 100,
 		max_iframe_depth: int = 5,
+		incremental_dom: bool = False,
+		iframe_capture_timeout: float = 3.0,
+		max_iframe_nodes: int = 20_000,
 	):
 		self.browser_session = browser_session
 		self.logger = logger or browser_session.logger
@@ -57,6 +62,12 @@ class DomService:
 		self.paint_order_filtering = paint_order_filtering
 		self.max_iframes = max_iframes
 		self.max_iframe_depth = max_iframe_depth
+		self.iframe_capture_timeout = iframe_capture_timeout
+		# Introspection of the last top-level document captured by get_dom_tree (None if it failed)
+		self.page_introspection: PageIntrospection | None = None
+		self.max_iframe_nodes = max_iframe_nodes
+		# Keeps the DOM tree current from mutation events instead of refetching it every step
+		self.incremental_trees = IncrementalDOMTrees(self.logger) if incremental_dom else None
 
 	async def __aenter__(self):
 		return self
@@ -130,11 +141,10 @@ class DomService:
 		if not node.snapshot_node:
 			return False
 
-		computed_styles = node.snapshot_node.computed_styles or {}
-
-		display = computed_styles.get('display', '').lower()
-		visibility = computed_styles.get('visibility', '').lower()
-		opacity = computed_styles.get('opacity', '1')
+		# Read single styles: decoding the whole computed_styles dict for every node is wasted work
+		display = (node.snapshot_node.style('display') or '').lower()
+		visibility = (node.snapshot_node.style('visibility') or '').lower()
+		opacity = node.snapshot_node.style('opacity', '1')
 
 		if display == 'none' or visibility == 'hidden':
 			return False
@@ -248,56 +258,9 @@ class DomService:
 	async def _get_all_trees(self, target_id: TargetID) -> TargetAllTrees:
 		cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
 
-		# Wait for the page to be ready first
-		try:
-			ready_state = await cdp_session.cdp_client.send.Runtime.evaluate(
-				params={'expression': 'document.readyState'}, session_id=cdp_session.session_id
-			)
-		except Exception as e:
-			pass  # Page might not be ready yet
 		# DEBUG: Log before capturing snapshot
 		self.logger.debug(f'🔍 DEBUG: Capturing DOM snapshot for target {target_id}')
 
-		# Get actual scroll positions for all iframes before capturing snapshot
-		start_iframe_scroll = time.time()
-		iframe_scroll_positions = {}
-		try:
-			scroll_result = await cdp_session.cdp_client.send.Runtime.evaluate(
-				params={
-					'expression': """
-					(() => {
-						const scrollData = {};
-						const iframes = document.querySelectorAll('iframe');
-						iframes.forEach((iframe, index) => {
-							try {
-								const doc = iframe.contentDocument || iframe.contentWindow.document;
-								if (doc) {
-									scrollData[index] = {
-										scrollTop: doc.documentElement.scrollTop || doc.body.scrollTop || 0,
-										scrollLeft: doc.documentElement.scrollLeft || doc.body.scrollLeft || 0
-									};
-								}
-							} catch (e) {
-								// Cross-origin iframe, can't access
-							}
-						});
-						return scrollData;
-					})()
-					""",
-					'returnByValue': True,
-				},
-				session_id=cdp_session.session_id,
-			)
-			if scroll_result and 'result' in scroll_result and 'value' in scroll_result['result']:
-				iframe_scroll_positions = scroll_result['result']['value']
-				for idx, scroll_data in iframe_scroll_positions.items():
-					self.logger.debug(
-						f'🔍 DEBUG: Iframe {idx} actual scroll position - scrollTop={scroll_data.get("scrollTop", 0)}, scrollLeft={scroll_data.get("scrollLeft", 0)}'
-					)
-		except Exception as e:
-			self.logger.debug(f'Failed to get iframe scroll positions: {e}')
-		iframe_scroll_ms = (time.time() - start_iframe_scroll) * 1000
-
 		# Define CDP request factories to avoid duplication
 		def create_snapshot_request():
 			return cdp_session.cdp_client.send.DOMSnapshot.captureSnapshot(
@@ -312,18 +275,29 @@ class DomService:
 			)
 
 		def create_dom_tree_request():
+			if self.incremental_trees is not None:
+				return self.incremental_trees.get_document(cdp_session)
 			return cdp_session.cdp_client.send.DOM.getDocument(
 				params={'depth': -1, 'pierce': True}, session_id=cdp_session.session_id
 			)
 
+		async def create_introspection_request() -> PageIntrospection | None:
+			# Readiness, iframe scroll positions and device pixel ratio in one call, sent alongside the snapshot
+			try:
+				return await introspect_page(cdp_session)
+			except Exception as e:
+				self.logger.debug(f'Page introspection failed: {e}')
+				return None
+
 		start_cdp_calls = time.time()
 
-		# Create initial tasks
+		# Create initial tasks. The introspection goes out first: Chrome runs the commands in order, so the document
+		# version it reads is never newer than the snapshot.
 		tasks = {
+			'introspection': create_task_with_error_handling(create_introspection_request(), name='introspect_page'),
 			'snapshot': create_task_with_error_handling(create_snapshot_request(), name='get_snapshot'),
 			'dom_tree': create_task_with_error_handling(create_dom_tree_request(), name='get_dom_tree'),
 			'ax_tree': create_task_with_error_handling(self._get_ax_tree_for_all_frames(target_id), name='get_ax_tree'),
-			'device_pixel_ratio': create_task_with_error_handling(self._get_viewport_ratio(target_id), name='get_viewport_ratio'),
 		}
 
 		# Wait for all tasks with timeout
@@ -341,8 +315,8 @@ class DomService:
 				tasks['ax_tree']: lambda: create_task_with_error_handling(
 					self._get_ax_tree_for_all_frames(target_id), name='get_ax_tree_retry'
 				),
-				tasks['device_pixel_ratio']: lambda: create_task_with_error_handling(
-					self._get_viewport_ratio(target_id), name='get_viewport_ratio_retry'
+				tasks['introspection']: lambda: create_task_with_error_handling(
+					create_introspection_request(), name='introspect_page_retry'
 				),
 			}
 
@@ -379,7 +353,18 @@ class DomService:
 		snapshot = results['snapshot']
 		dom_tree = results['dom_tree']
 		ax_tree = results['ax_tree']
-		device_pixel_ratio = results['device_pixel_ratio']
+		introspection: PageIntrospection | None = results['introspection']
+		if introspection is not None and pending:
+			# Retried requests lose their order, the snapshot may predate the document version
+			introspection.dom_version = None
+		if introspection is not None:
+			device_pixel_ratio = introspection.device_pixel_ratio
+			for idx, scroll_data in introspection.iframe_scroll_positions.items():
+				self.logger.debug(
+					f'🔍 DEBUG: Iframe {idx} actual scroll position - scrollTop={scroll_data.get("scrollTop", 0)}, scrollLeft={scroll_data.get("scrollLeft", 0)}'
+				)
+		else:
+			device_pixel_ratio = await self._get_viewport_ratio(target_id)
 		end_cdp_calls = time.time()
 		cdp_calls_ms = (end_cdp_calls - start_cdp_calls) * 1000
 
@@ -413,8 +398,8 @@ class DomService:
 			dom_tree=dom_tree,
 			ax_tree=ax_tree,
 			device_pixel_ratio=device_pixel_ratio,
+			introspection=introspection,
 			cdp_timing={
-				'iframe_scroll_detection_ms': iframe_scroll_ms,
 				'cdp_parallel_calls_ms': cdp_calls_ms,
 				'snapshot_processing_ms': snapshot_processing_ms,
 			},
@@ -428,6 +413,7 @@ class DomService:
 		initial_html_frames: list[EnhancedDOMTreeNode] | None = None,
 		initial_total_frame_offset: DOMRect | None = None,
 		iframe_depth: int = 0,
+		iframe_deadline: float | None = None,
 	) -> tuple[EnhancedDOMTreeNode, dict[str, float]]:
 		"""Get the DOM tree for a specific target.
 
@@ -437,6 +423,7 @@ class DomService:
 			initial_html_frames: List of HTML frame nodes encountered so far
 			initial_total_frame_offset: Accumulated coordinate offset
 			iframe_depth: Current depth of iframe nesting to prevent infinite recursion
+			iframe_deadline: time.monotonic() deadline shared by all cross-origin iframe captures of this request
 
 		Returns:
 			Tuple of (enhanced_dom_tree_node, timing_info)
@@ -455,6 +442,15 @@ class DomService:
 		ax_tree = trees.ax_tree
 		snapshot = trees.snapshot
 		device_pixel_ratio = trees.device_pixel_ratio
+		if iframe_depth == 0:
+			self.page_introspection = trees.introspection
+
+		# Cap the size of cross-origin iframe documents (the main document is never skipped). The frame's snapshot,
+		# DOM and AX tree have already been fetched by now, so this bounds tree building and serialization, not capture.
+		if iframe_depth > 0:
+			iframe_node_count = sum(len(doc.get('nodes', {}).get('nodeType', [])) for doc in snapshot.get('documents', []))
+			if iframe_node_count > self.max_iframe_nodes:
+				raise ValueError(f'iframe document has {iframe_node_count} nodes (max_iframe_nodes: {self.max_iframe_nodes})')
 
 		# Build AX tree lookup
 		start_ax = time.time()
@@ -471,6 +467,10 @@ class DomService:
 		snapshot_lookup = build_snapshot_lookup(snapshot, device_pixel_ratio)
 		timing_info['build_snapshot_lookup_ms'] = (time.time() - start_snapshot) * 1000
 
+		# Cross-origin iframes found while constructing the tree: (iframe node, frame id, frame offset)
+		# They are captured concurrently once the tree is built, instead of one at a time inside the recursion
+		cross_origin_iframes: list[tuple[EnhancedDOMTreeNode, str, DOMRect]] = []
+
 		async def _construct_enhanced_node(
 			node: Node,
 			html_frames: list[EnhancedDOMTreeNode] | None,
@@ -686,45 +686,20 @@ class DomService:
 					else:
 						self.logger.debug('Skipping invisible cross-origin iframe')
 
-					if should_process_iframe:
-						# Lazy fetch all_frames only when actually needed (for cross-origin iframes)
-						if all_frames is None:
-							all_frames, _ = await self.browser_session.get_all_frames()
-
-						# Use pre-fetched all_frames to find the iframe's target (no redundant CDP call)
-						frame_id = node.get('frameId', None)
-						if frame_id:
-							frame_info = all_frames.get(frame_id)
-							iframe_document_target = None
-							if frame_info and frame_info.get('frameTargetId'):
-								iframe_target_id = frame_info['frameTargetId']
-								iframe_target = self.browser_session.session_manager.get_target(iframe_target_id)
-								if iframe_target:
-									iframe_document_target = {
-										'targetId': iframe_target.target_id,
-										'url': iframe_target.url,
-										'title': iframe_target.title,
-										'type': iframe_target.target_type,
-									}
-						else:
-							iframe_document_target = None
-						# if target actually exists in one of the frames, just recursively build the dom tree for it
-						if iframe_document_target:
-							self.logger.debug(
-								f'Getting content document for iframe {node.get("frameId", None)} at depth {iframe_depth + 1}'
-							)
-							content_document, _ = await self.get_dom_tree(
-								target_id=iframe_document_target['targetId'],
-								all_frames=all_frames,
-								# TODO: experiment with this values -> not sure whether the whole cross origin iframe should be ALWAYS included as soon as some part of it is visible or not.
-								# Current config: if the cross origin iframe is AT ALL visible, then just include everything inside of it!
-								# initial_html_frames=updated_html_frames,
-								initial_total_frame_offset=total_frame_offset,
-								iframe_depth=iframe_depth + 1,
+					frame_id = node.get('frameId', None)
+					if should_process_iframe and frame_id:
+						cross_origin_iframes.append(
+							(
+								dom_tree_node,
+								frame_id,
+								DOMRect(
+									total_frame_offset.x,
+									total_frame_offset.y,
+									total_frame_offset.width,
+									total_frame_offset.height,
+								),
 							)
-
-							dom_tree_node.content_document = content_document
-							dom_tree_node.content_document.parent_node = dom_tree_node
+						)
 
 			return dom_tree_node
 
@@ -737,6 +712,11 @@ class DomService:
 		)
 		timing_info['construct_enhanced_tree_ms'] = (time.time() - start_construct) * 1000
 
+		if cross_origin_iframes:
+			start_iframes = time.time()
+			await self._capture_cross_origin_iframes(cross_origin_iframes, all_frames, iframe_depth, iframe_deadline)
+			timing_info['cross_origin_iframes_ms'] = (time.time() - start_iframes) * 1000
+
 		# Calculate total time for get_dom_tree
 		total_get_dom_tree_ms = (time.time() - timing_start_total) * 1000
 		timing_info['get_dom_tree_total_ms'] = total_get_dom_tree_ms
@@ -747,6 +727,7 @@ class DomService:
 			+ timing_info.get('build_ax_lookup_ms', 0)
 			+ timing_info.get('build_snapshot_lookup_ms', 0)
 			+ timing_info.get('construct_enhanced_tree_ms', 0)
+			+ timing_info.get('cross_origin_iframes_ms', 0)
 		)
 		get_dom_tree_overhead_ms = total_get_dom_tree_ms - tracked_sub_operations_ms
 		if get_dom_tree_overhead_ms > 0.1:
@@ -754,6 +735,72 @@ class DomService:
 
 		return enhanced_dom_tree_node, timing_info
 
+	async def _capture_cross_origin_iframes(
+		self,
+		iframes: list[tuple[EnhancedDOMTreeNode, str, DOMRect]],
+		all_frames: dict | None,
+		iframe_depth: int,
+		deadline: float | None,
+	) -> None:
+		"""Capture cross-origin iframe documents concurrently and attach the ones ready before the deadline.
+
+		All nesting levels of one state request share a single deadline. A frame that is too slow, too large
+		or fails is left without content_document; the rest of the page is still returned.
+		"""
+		if deadline is None:
+			deadline = time.monotonic() + self.iframe_capture_timeout
+
+		# Lazy fetch all_frames only when actually needed (for cross-origin iframes)
+		if all_frames is None:
+			all_frames, _ = await self.browser_session.get_all_frames()
+
+		captures: list[tuple[EnhancedDOMTreeNode, str, asyncio.Task]] = []
+		for iframe_node, frame_id, frame_offset in iframes:
+			# Use pre-fetched all_frames to find the iframe's target (no redundant CDP call)
+			frame_info = all_frames.get(frame_id)
+			iframe_target_id = frame_info.get('frameTargetId') if frame_info else None
+			if not iframe_target_id or not self.browser_session.session_manager.get_target(iframe_target_id):
+				continue
+			self.logger.debug(f'Getting content document for iframe {frame_id} at depth {iframe_depth + 1}')
+			# Plain tasks: failures and skipped frames are expected here and reported below, not as background errors
+			task = asyncio.create_task(
+				self.get_dom_tree(
+					target_id=iframe_target_id,
+					all_frames=all_frames,
+					# TODO: experiment with this values -> not sure whether the whole cross origin iframe should be ALWAYS included as soon as some part of it is visible or not.
+					# Current config: if the cross origin iframe is AT ALL visible, then just include everything inside of it!
+					# initial_html_frames=updated_html_frames,
+					initial_total_frame_offset=frame_offset,
+					iframe_depth=iframe_depth + 1,
+					iframe_deadline=deadline,
+				),
+				name='get_iframe_dom_tree',
+			)
+			captures.append((iframe_node, frame_id, task))
+
+		if not captures:
+			return
+
+		tasks = [task for _, _, task in captures]
+		try:
+			_, pending = await asyncio.wait(tasks, timeout=max(0.0, deadline - time.monotonic()))
+		finally:
+			for task in tasks:
+				task.cancel()
+		# Let the cancelled captures unwind before reading the results
+		await asyncio.gather(*pending, return_exceptions=True)
+
+		for iframe_node, frame_id, task in captures:
+			if task.cancelled():
+				self.logger.debug(f'Skipping cross-origin iframe {frame_id}: not captured within {self.iframe_capture_timeout}s')
+				continue
+			if task.exception() is not None:
+				self.logger.debug(f'Skipping cross-origin iframe {frame_id}: {task.exception()}')
+				continue
+			content_document, _ = task.result()
+			iframe_node.content_document = content_document
+			content_document.parent_node = iframe_node
+
 	@observe_debug(ignore_input=True, ignore_output=True, name='get_serialized_dom_tree')
 	async def get_serialized_dom_tree(
 		self, previous_cached_state: SerializedDOMState | None = None
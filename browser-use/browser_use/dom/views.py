@@ -1,7 +1,7 @@
 import hashlib
 from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from cdp_use.cdp.accessibility.commands import GetFullAXTreeReturns
 from cdp_use.cdp.accessibility.types import AXPropertyName
@@ -14,6 +14,10 @@ from uuid_extensions import uuid7str
 from browser_use.dom.utils import cap_text_length
 from browser_use.observability import observe_debug
 
+if TYPE_CHECKING:
+	from browser_use.browser.introspection import PageIntrospection
+	from browser_use.dom.enhanced_snapshot import SnapshotColumns
+
 # Serializer types
 DEFAULT_INCLUDE_ATTRIBUTES = [
 	'title',
@@ -148,6 +152,8 @@ class TargetAllTrees:
 	ax_tree: GetFullAXTreeReturns
 	device_pixel_ratio: float
 	cdp_timing: dict[str, float]
+	introspection: 'PageIntrospection | None' = None
+	"""Page state collected alongside the snapshot, None if the introspection call failed"""
 
 
 @dataclass(slots=True)
@@ -266,38 +272,160 @@ class EnhancedAXNode:
 	child_ids: list[str] | None
 
 
-@dataclass(slots=True)
-class EnhancedSnapshotNode:
-	"""Snapshot data extracted from DOMSnapshot for enhanced functionality."""
+_UNDECODED: Any = object()
 
-	is_clickable: bool | None
-	cursor_style: str | None
-	bounds: DOMRect | None
-	"""
-	Document coordinates (origin = top-left of the page, ignores current scroll).
-	Equivalent JS API: layoutNode.boundingBox in the older API.
-	Typical use: Quick hit-test that doesn't care about scroll position.
-	"""
 
-	clientRects: DOMRect | None
-	"""
-	Viewport coordinates (origin = top-left of the visible scrollport).
-	Equivalent JS API: element.getClientRects() / getBoundingClientRect().
-	Typical use: Pixel-perfect hit-testing on screen, taking current scroll into account.
-	"""
+class EnhancedSnapshotNode:
+	"""Snapshot data extracted from DOMSnapshot for enhanced functionality.
 
-	scrollRects: DOMRect | None
-	"""
-	Scrollable area of the element.
+	Nodes built by `build_snapshot_lookup` share their document's snapshot columns: bounds, rects
+	and computed styles are decoded on first access and then cached on the node.
 	"""
 
-	computed_styles: dict[str, str] | None
-	"""Computed styles from the layout tree"""
+	__slots__ = (
+		'is_clickable',
+		'paint_order',
+		'stacking_contexts',
+		'_columns',
+		'_layout_index',
+		'_cursor_style',
+		'_bounds',
+		'_client_rects',
+		'_scroll_rects',
+		'_computed_styles',
+	)
+
+	is_clickable: bool | None
 	paint_order: int | None
 	"""Paint order from the layout tree"""
 	stacking_contexts: int | None
 	"""Stacking contexts from the layout tree"""
 
+	def __init__(
+		self,
+		is_clickable: bool | None,
+		cursor_style: str | None,
+		bounds: 'DOMRect | None',
+		clientRects: 'DOMRect | None',
+		scrollRects: 'DOMRect | None',
+		computed_styles: dict[str, str] | None,
+		paint_order: int | None,
+		stacking_contexts: int | None,
+	):
+		self.is_clickable = is_clickable
+		self.paint_order = paint_order
+		self.stacking_contexts = stacking_contexts
+		self._columns: 'SnapshotColumns | None' = None
+		self._layout_index = -1
+		self._cursor_style = cursor_style
+		self._bounds = bounds
+		self._client_rects = clientRects
+		self._scroll_rects = scrollRects
+		self._computed_styles = computed_styles
+
+	@classmethod
+	def from_columns(
+		cls,
+		columns: 'SnapshotColumns',
+		layout_index: int,
+		is_clickable: bool | None,
+		paint_order: int | None,
+		stacking_contexts: int | None,
+	) -> 'EnhancedSnapshotNode':
+		"""Node whose layout fields are decoded from `columns` when first read."""
+		node = cls.__new__(cls)
+		node.is_clickable = is_clickable
+		node.paint_order = paint_order
+		node.stacking_contexts = stacking_contexts
+		node._columns = columns
+		node._layout_index = layout_index
+		node._cursor_style = _UNDECODED
+		node._bounds = _UNDECODED
+		node._client_rects = _UNDECODED
+		node._scroll_rects = _UNDECODED
+		node._computed_styles = _UNDECODED
+		return node
+
+	@property
+	def bounds(self) -> 'DOMRect | None':
+		"""
+		Document coordinates (origin = top-left of the page, ignores current scroll).
+		Equivalent JS API: layoutNode.boundingBox in the older API.
+		Typical use: Quick hit-test that doesn't care about scroll position.
+		"""
+		if self._bounds is _UNDECODED:
+			assert self._columns is not None
+			self._bounds = self._columns.bounds_rect(self._layout_index)
+		return self._bounds
+
+	@property
+	def clientRects(self) -> 'DOMRect | None':
+		"""
+		Viewport coordinates (origin = top-left of the visible scrollport).
+		Equivalent JS API: element.getClientRects() / getBoundingClientRect().
+		Typical use: Pixel-perfect hit-testing on screen, taking current scroll into account.
+		"""
+		if self._client_rects is _UNDECODED:
+			assert self._columns is not None
+			self._client_rects = self._columns.client_rect(self._layout_index)
+		return self._client_rects
+
+	@property
+	def scrollRects(self) -> 'DOMRect | None':
+		"""
+		Scrollable area of the element.
+		"""
+		if self._scroll_rects is _UNDECODED:
+			assert self._columns is not None
+			self._scroll_rects = self._columns.scroll_rect(self._layout_index)
+		return self._scroll_rects
+
+	@property
+	def computed_styles(self) -> dict[str, str] | None:
+		"""Computed styles from the layout tree"""
+		if self._computed_styles is _UNDECODED:
+			assert self._columns is not None
+			self._computed_styles = self._columns.computed_styles(self._layout_index)
+		return self._computed_styles
+
+	@property
+	def cursor_style(self) -> str | None:
+		if self._cursor_style is _UNDECODED:
+			self._cursor_style = self.style('cursor')
+		return self._cursor_style
+
+	def style(self, name: str, default: str | None = None) -> str | None:
+		"""One computed style, decoded without building the full `computed_styles` dict."""
+		if self._computed_styles is _UNDECODED:
+			assert self._columns is not None
+			value = self._columns.style(self._layout_index, name)
+		else:
+			value = (self._computed_styles or {}).get(name)
+		return default if value is None else value
+
+	def to_dict(self) -> dict[str, Any]:
+		return {
+			'is_clickable': self.is_clickable,
+			'cursor_style': self.cursor_style,
+			'bounds': self.bounds.to_dict() if self.bounds else None,
+			'clientRects': self.clientRects.to_dict() if self.clientRects else None,
+			'scrollRects': self.scrollRects.to_dict() if self.scrollRects else None,
+			'computed_styles': self.computed_styles,
+			'paint_order': self.paint_order,
+			'stacking_contexts': self.stacking_contexts,
+		}
+
+	def __eq__(self, other: object) -> bool:
+		if not isinstance(other, EnhancedSnapshotNode):
+			return NotImplemented
+		return self.to_dict() == other.to_dict()
+
+	__hash__ = None  # type: ignore[assignment]
+
+	def __repr__(self) -> str:
+		fields = ', '.join(f'{key}={value!r}' for key, value in self.to_dict().items())
+		return f'EnhancedSnapshotNode({fields})'
+
 
 # @dataclass(slots=True)
 # class SuperSelector:
@@ -391,6 +519,10 @@ class EnhancedDOMTreeNode:
 
 	uuid: str = field(default_factory=uuid7str)
 
+	# Hashes are computed once per node: a node belongs to one snapshot and is not re-parented after the tree is built
+	_element_hash: int | None = field(default=None, repr=False, compare=False)
+	_parent_branch_hash: int | None = field(default=None, repr=False, compare=False)
+
 	@property
 	def parent(self) -> 'EnhancedDOMTreeNode | None':
 		return self.parent_node
@@ -480,7 +612,7 @@ class EnhancedDOMTreeNode:
 			'content_document': self.content_document.__json__() if self.content_document else None,
 			'shadow_root_type': self.shadow_root_type,
 			'ax_node': asdict(self.ax_node) if self.ax_node else None,
-			'snapshot_node': asdict(self.snapshot_node) if self.snapshot_node else None,
+			'snapshot_node': self.snapshot_node.to_dict() if self.snapshot_node else None,
 			# these two in the end, so it's easier to read json
 			'shadow_roots': [r.__json__() for r in self.shadow_roots] if self.shadow_roots else [],
 			'children_nodes': [c.__json__() for c in self.children_nodes] if self.children_nodes else [],
@@ -762,6 +894,8 @@ class EnhancedDOMTreeNode:
 
 		TODO: migrate this to use only backendNodeId + current SessionId
 		"""
+		if self._element_hash is not None:
+			return self._element_hash
 
 		# Get parent branch path
 		parent_branch_path = self._get_parent_branch_path()
@@ -776,17 +910,22 @@ class EnhancedDOMTreeNode:
 		element_hash = hashlib.sha256(combined_string.encode()).hexdigest()
 
 		# Convert to int for __hash__ return type - use first 16 chars and convert from hex to int
-		return int(element_hash[:16], 16)
+		self._element_hash = int(element_hash[:16], 16)
+		return self._element_hash
 
 	def parent_branch_hash(self) -> int:
 		"""
 		Hash the element based on its parent branch path and attributes.
 		"""
+		if self._parent_branch_hash is not None:
+			return self._parent_branch_hash
+
 		parent_branch_path = self._get_parent_branch_path()
 		parent_branch_path_string = '/'.join(parent_branch_path)
 		element_hash = hashlib.sha256(parent_branch_path_string.encode()).hexdigest()
 
-		return int(element_hash[:16], 16)
+		self._parent_branch_hash = int(element_hash[:16], 16)
+		return self._parent_branch_hash
 
 	def _get_parent_branch_path(self) -> list[str]:
 		"""Get the parent branch path as a list of tag names from root to current element."""
@@ -812,6 +951,19 @@ class SerializedDOMState:
 
 	selector_map: DOMSelectorMap
 
+	_element_hash_index: dict[int, int] | None = field(default=None, init=False, repr=False, compare=False)
+
+	@property
+	def element_hash_index(self) -> dict[int, int]:
+		"""Element hash -> selector map index, built once per state"""
+		if self._element_hash_index is None:
+			element_hash_index: dict[int, int] = {}
+			# setdefault keeps the first match in selector map order, like a linear scan would
+			for index, node in self.selector_map.items():
+				element_hash_index.setdefault(node.element_hash, index)
+			self._element_hash_index = element_hash_index
+		return self._element_hash_index
+
 	@observe_debug(ignore_input=True, ignore_output=True, name='llm_representation')
 	def llm_representation(
 		self,
@@ -851,6 +1003,25 @@ class SerializedDOMState:
 		return DOMEvalSerializer.serialize_tree(self._root, include_attributes)
 
 
+@dataclass(slots=True)
+class DOMStateDiff:
+	"""Interactive elements that changed between two consecutive `SerializedDOMState`s, by selector map index."""
+
+	added: list[int] = field(default_factory=list)
+	removed: list[int] = field(default_factory=list)
+	moved: list[int] = field(default_factory=list)
+	"""In both states, but at a different DOM path or document position"""
+	changed: list[int] = field(default_factory=list)
+	"""In both states, with different attributes, text or accessibility state (e.g. a typed value)"""
+
+	@property
+	def is_empty(self) -> bool:
+		return not (self.added or self.removed or self.moved or self.changed)
+
+	def __str__(self) -> str:
+		return f'{len(self.added)} added, {len(self.removed)} removed, {len(self.moved)} moved, {len(self.changed)} changed'
+
+
 @dataclass
 class DOMInteractedElement:
 	"""
@@ -31,14 +31,18 @@ if TYPE_CHECKING:
 	from browser_use.llm.aws.chat_bedrock import ChatAWSBedrock
 	from browser_use.llm.azure.chat import ChatAzureOpenAI
 	from browser_use.llm.browser_use.chat import ChatBrowserUse
+	from browser_use.llm.cache import ChatCached
+	from browser_use.llm.cassette import ChatCassette
 	from browser_use.llm.cerebras.chat import ChatCerebras
 	from browser_use.llm.deepseek.chat import ChatDeepSeek
 	from browser_use.llm.google.chat import ChatGoogle
 	from browser_use.llm.groq.chat import ChatGroq
+	from browser_use.llm.hedged import ChatHedged
 	from browser_use.llm.oci_raw.chat import ChatOCIRaw
 	from browser_use.llm.ollama.chat import ChatOllama
 	from browser_use.llm.openai.chat import ChatOpenAI
 	from browser_use.llm.openrouter.chat import ChatOpenRouter
+	from browser_use.llm.rate_limit import ChatRateLimited
 
 	# Type stubs for model instances - enables IDE autocomplete
 	openai_gpt_4o: ChatOpenAI
@@ -90,6 +94,11 @@ _LAZY_IMPORTS = {
 	'ChatOllama': ('browser_use.llm.ollama.chat', 'ChatOllama'),
 	'ChatOpenAI': ('browser_use.llm.openai.chat', 'ChatOpenAI'),
 	'ChatOpenRouter': ('browser_use.llm.openrouter.chat', 'ChatOpenRouter'),
+	# Wrappers
+	'ChatCached': ('browser_use.llm.cache', 'ChatCached'),
+	'ChatCassette': ('browser_use.llm.cassette', 'ChatCassette'),
+	'ChatHedged': ('browser_use.llm.hedged', 'ChatHedged'),
+	'ChatRateLimited': ('browser_use.llm.rate_limit', 'ChatRateLimited'),
 }
 
 # Cache for model instances - only created when accessed
@@ -152,4 +161,8 @@ __all__ = [
 	'ChatOllama',
 	'ChatOpenRouter',
 	'ChatCerebras',
+	'ChatRateLimited',
+	'ChatHedged',
+	'ChatCached',
+	'ChatCassette',
 ]
@@ -21,6 +21,7 @@ from pydantic import BaseModel
 
 from browser_use.llm.anthropic.serializer import AnthropicMessageSerializer
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.client_pool import get_shared_client, get_shared_http_client
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.schema import SchemaOptimizer
@@ -102,11 +103,18 @@ class ChatAnthropic(BaseChatModel):
 		"""
 		Returns an AsyncAnthropic client.
 
+		The client is shared by every model with the same endpoint and credentials and
+		uses the process-wide keep-alive HTTP pool, unless an http_client was provided.
+
 		Returns:
 			AsyncAnthropic: An instance of the AsyncAnthropic client.
 		"""
 		client_params = self._get_client_params()
-		return AsyncAnthropic(**client_params)
+		if self.http_client is not None:
+			return AsyncAnthropic(**client_params)
+		return get_shared_client(
+			self.provider, client_params, lambda params: AsyncAnthropic(**params, http_client=get_shared_http_client())
+		)
 
 	@property
 	def name(self) -> str:
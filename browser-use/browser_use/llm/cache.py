@@ -0,0 +1,271 @@
+"""
+Opt-in response cache for chat models.
+
+Rerun summaries, judge calls, `extract` on identical pages and retried steps often send
+exactly the same prompt again. `ChatCached` wraps a chat model and answers repeated
+prompts from a two-tier cache:
+
+- an in-memory LRU (per wrapper)
+- a SQLite file shared by every process using the same path, with TTL and size-based
+  eviction (least recently used first)
+
+The key is a hash of (provider, model, output schema, serialized messages, call kwargs), so a
+different model, schema, call option (e.g. temperature or tools) or any change in the
+conversation is a miss. Cache hits report no usage,
+since nothing was billed.
+
+Example:
+	llm = ChatCached(ChatGoogle(model='gemini-2.5-pro'), ttl_seconds=24 * 3600)
+	agent = Agent(task=..., llm=llm, page_extraction_llm=llm)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar, overload
+
+from pydantic import BaseModel
+
+from browser_use.config import CONFIG
+from browser_use.llm.base import BaseChatModel
+from browser_use.llm.messages import BaseMessage
+from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T', bound=BaseModel)
+
+
+def default_cache_path() -> Path:
+	return Path(CONFIG.XDG_CACHE_HOME) / 'browser_use' / 'llm_cache.sqlite'
+
+
+def cache_key(
+	provider: str,
+	model: str,
+	output_format: type[BaseModel] | None,
+	messages: list[BaseMessage],
+	kwargs: dict[str, Any] | None = None,
+) -> str:
+	"""Stable hash of everything that determines the response.
+
+	Call kwargs that are not JSON values are hashed by their repr, so an object without a stable repr makes every
+	call a miss rather than a wrong hit.
+	"""
+	payload = {
+		'provider': provider,
+		'model': model,
+		'schema': output_format.model_json_schema() if output_format is not None else None,
+		'messages': [message.model_dump(mode='json') for message in messages],
+		'kwargs': kwargs or {},
+	}
+	return hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(',', ':'), default=repr).encode()).hexdigest()
+
+
+def serialize_completion(result: ChatInvokeCompletion[Any]) -> dict[str, Any]:
+	"""JSON-safe form of a completion (without usage)."""
+	completion = result.completion
+	return {
+		'completion': completion.model_dump(mode='json') if isinstance(completion, BaseModel) else completion,
+		'thinking': result.thinking,
+		'redacted_thinking': result.redacted_thinking,
+		'stop_reason': result.stop_reason,
+	}
+
+
+def deserialize_completion(
+	data: dict[str, Any], output_format: type[BaseModel] | None, usage: ChatInvokeUsage | None = None
+) -> ChatInvokeCompletion[Any]:
+	"""Inverse of serialize_completion; structured completions are validated against output_format."""
+	completion = output_format.model_validate(data['completion']) if output_format is not None else data['completion']
+	return ChatInvokeCompletion(
+		completion=completion,
+		thinking=data['thinking'],
+		redacted_thinking=data['redacted_thinking'],
+		stop_reason=data['stop_reason'],
+		usage=usage,
+	)
+
+
+class SQLiteResponseStore:
+	"""Disk tier: key -> serialized completion, with TTL and total-size eviction."""
+
+	def __init__(self, path: Path, ttl_seconds: float | None, max_bytes: int):
+		self.path = path
+		self.ttl_seconds = ttl_seconds
+		self.max_bytes = max_bytes
+		self.evictions = 0
+
+		path.parent.mkdir(parents=True, exist_ok=True)
+		self._lock = threading.Lock()
+		self._db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+		self._db.execute('PRAGMA journal_mode=WAL')
+		self._db.execute(
+			'CREATE TABLE IF NOT EXISTS responses ('
+			'key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+		)
+		self._db.execute('CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)')
+
+	def get(self, key: str) -> str | None:
+		now = time.time()
+		with self._lock:
+			row = self._db.execute('SELECT value, created_at FROM responses WHERE key = ?', (key,)).fetchone()
+			if row is None:
+				return None
+			value, created_at = row
+			if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+				self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+				self.evictions += 1
+				return None
+			self._db.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+			return value
+
+	def put(self, key: str, value: str) -> None:
+		now = time.time()
+		with self._lock:
+			self._db.execute(
+				'INSERT OR REPLACE INTO responses (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)',
+				(key, value, len(value), now, now),
+			)
+			self._evict(now)
+
+	def _evict(self, now: float) -> None:
+		if self.ttl_seconds is not None:
+			self.evictions += self._db.execute('DELETE FROM responses WHERE created_at < ?', (now - self.ttl_seconds,)).rowcount
+
+		total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+		if total <= self.max_bytes:
+			return
+		# Drop least recently used entries until back under the limit
+		for key, size in self._db.execute('SELECT key, size FROM responses ORDER BY accessed_at').fetchall():
+			if total <= self.max_bytes:
+				break
+			self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+			total -= size
+			self.evictions += 1
+
+	def clear(self) -> None:
+		with self._lock:
+			self._db.execute('DELETE FROM responses')
+
+	def close(self) -> None:
+		with self._lock:
+			self._db.close()
+
+
+@dataclass
+class ChatCached(BaseChatModel):
+	"""
+	Wraps a chat model with a memory + SQLite response cache.
+
+	Args:
+		llm: The chat model to wrap
+		cache_path: SQLite file (default: ~/.cache/browser_use/llm_cache.sqlite); None with `disk=False` keeps it in memory only
+		disk: Use the SQLite tier
+		max_memory_entries: Size of the in-memory LRU
+		ttl_seconds: Entries older than this are misses and get evicted (None = never expire)
+		max_disk_bytes: Total size of cached responses on disk before LRU eviction
+	"""
+
+	llm: BaseChatModel
+	cache_path: str | Path | None = None
+	disk: bool = True
+	max_memory_entries: int = 256
+	ttl_seconds: float | None = 7 * 24 * 3600
+	max_disk_bytes: int = 200 * 1024 * 1024
+
+	model: str = field(init=False)
+	stats: dict[str, int] = field(init=False)
+	_memory: OrderedDict[str, tuple[float, str]] = field(init=False, repr=False)
+	_store: SQLiteResponseStore | None = field(init=False, repr=False)
+
+	def __post_init__(self) -> None:
+		self.model = self.llm.model
+		self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+		self._memory = OrderedDict()
+		self._store = None
+		if self.disk:
+			path = Path(self.cache_path).expanduser() if self.cache_path else default_cache_path()
+			self._store = SQLiteResponseStore(path, self.ttl_seconds, self.max_disk_bytes)
+
+	@property
+	def provider(self) -> str:
+		return self.llm.provider
+
+	@property
+	def name(self) -> str:
+		return self.llm.name
+
+	@property
+	def evictions(self) -> int:
+		return self._store.evictions if self._store else 0
+
+	def _memory_get(self, key: str) -> str | None:
+		entry = self._memory.get(key)
+		if entry is None:
+			return None
+		created_at, value = entry
+		if self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds:
+			del self._memory[key]
+			return None
+		self._memory.move_to_end(key)
+		return value
+
+	def _memory_put(self, key: str, value: str) -> None:
+		self._memory[key] = (time.time(), value)
+		self._memory.move_to_end(key)
+		while len(self._memory) > self.max_memory_entries:
+			self._memory.popitem(last=False)
+
+	def clear(self) -> None:
+		"""Drop every cached response (both tiers)."""
+		self._memory.clear()
+		if self._store:
+			self._store.clear()
+
+	@overload
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: None = None, **kwargs: Any
+	) -> ChatInvokeCompletion[str]: ...
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: type[T], **kwargs: Any) -> ChatInvokeCompletion[T]: ...
+
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: type[T] | None = None, **kwargs: Any
+	) -> ChatInvokeCompletion[T] | ChatInvokeCompletion[str]:
+		key = cache_key(self.llm.provider, self.llm.model, output_format, messages, kwargs)
+
+		tier = 'memory_hits'
+		value = self._memory_get(key)
+		if value is None and self._store is not None:
+			tier = 'disk_hits'
+			value = await asyncio.to_thread(self._store.get, key)
+
+		if value is not None:
+			try:
+				cached = deserialize_completion(json.loads(value), output_format)
+			except Exception as e:
+				# Schema changed in a way the hash did not capture (e.g. validators) - treat as a miss
+				logger.debug(f'Discarding unreadable cached response: {type(e).__name__}: {e}')
+			else:
+				self.stats[tier] += 1
+				if tier == 'disk_hits':
+					self._memory_put(key, value)
+				return cached
+
+		self.stats['misses'] += 1
+		result = await self.llm.ainvoke(messages, output_format, **kwargs)
+
+		value = json.dumps(serialize_completion(result))
+		self._memory_put(key, value)
+		if self._store is not None:
+			await asyncio.to_thread(self._store.put, key, value)
+		return result
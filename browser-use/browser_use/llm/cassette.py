@@ -0,0 +1,203 @@
+"""
+Record/replay cassettes for chat models.
+
+To measure browser and DOM overhead without a network (or a bill), run an agent once with
+a live model in record mode, then replay the run offline:
+
+	# record: calls go to the real model and are appended to the cassette
+	llm = ChatCassette('runs/greenhouse.jsonl', llm=ChatGoogle(model='gemini-2.5-pro'), mode='record')
+
+	# replay: no model needed, recorded answers are served with simulated latency
+	llm = ChatCassette('runs/greenhouse.jsonl', mode='replay', latency=0.0)
+
+The cassette is JSON lines, one entry per `ainvoke`: messages, output schema, completion,
+usage and latency. Images are stored as a SHA-256 digest of their URL instead of the base64
+data, which keeps a long run small. Replay matches a call to a recorded entry by a hash of
+its text content and output schema (screenshots change between runs, so images are ignored
+unless `match_images=True`); when nothing matches, the next unused entry in recorded order
+is served, unless `strict=True`.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal, TypeVar, overload
+
+from pydantic import BaseModel
+
+from browser_use.llm.base import BaseChatModel
+from browser_use.llm.cache import deserialize_completion, serialize_completion
+from browser_use.llm.messages import BaseMessage
+from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T', bound=BaseModel)
+
+CassetteMode = Literal['record', 'replay']
+
+
+class CassetteMissError(LookupError):
+	"""Replay found no recorded entry for a call."""
+
+
+def _image_digest(url: str) -> str:
+	return 'sha256:' + hashlib.sha256(url.encode()).hexdigest()
+
+
+def _dump_messages(messages: list[BaseMessage], include_images: bool) -> list[dict[str, Any]]:
+	"""Messages as JSON, with images replaced by a digest of their data (or dropped unless include_images)."""
+	dumped = [message.model_dump(mode='json') for message in messages]
+	for message in dumped:
+		if not isinstance(message.get('content'), list):
+			continue
+		if include_images:
+			for part in message['content']:
+				if part.get('type') == 'image_url':
+					part['image_url']['url'] = _image_digest(part['image_url']['url'])
+		else:
+			message['content'] = [part for part in message['content'] if part.get('type') != 'image_url']
+	return dumped
+
+
+def cassette_key(messages: list[BaseMessage], output_format: type[BaseModel] | None, include_images: bool = False) -> str:
+	payload = {
+		'schema': output_format.model_json_schema() if output_format is not None else None,
+		'messages': _dump_messages(messages, include_images),
+	}
+	return hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(',', ':')).encode()).hexdigest()
+
+
+@dataclass
+class ChatCassette(BaseChatModel):
+	"""
+	Records a chat model's calls to a file, or replays them without the model.
+
+	Args:
+		path: Cassette file (JSON lines)
+		llm: Live model; required for record mode, optional for replay (only used for model/provider names)
+		mode: 'record' appends every call to the cassette, 'replay' serves recorded answers
+		latency: Replay delay per call in seconds; None = the recorded latency
+		latency_scale: Multiplier applied to the recorded latency (e.g. 0.0 for no delay, 0.5 for a faster model)
+		match_images: Include screenshots (by digest) when matching calls to recorded entries
+		strict: In replay, raise CassetteMissError instead of serving the next entry in order
+	"""
+
+	path: str | Path
+	llm: BaseChatModel | None = None
+	mode: CassetteMode = 'replay'
+	latency: float | None = None
+	latency_scale: float = 1.0
+	match_images: bool = False
+	strict: bool = False
+
+	model: str = field(init=False)
+	stats: dict[str, int] = field(init=False)
+	_entries: list[dict[str, Any]] = field(init=False, repr=False)
+	_used: set[int] = field(init=False, repr=False)
+	_cursor: int = field(init=False, repr=False)
+
+	def __post_init__(self) -> None:
+		self.path = Path(self.path).expanduser()
+		self.stats = {'recorded': 0, 'replayed': 0, 'matched': 0, 'out_of_order': 0}
+		self._entries = []
+		self._used = set()
+		self._cursor = 0
+
+		if self.mode == 'record':
+			if self.llm is None:
+				raise ValueError('ChatCassette needs a live llm to record')
+			self.path.parent.mkdir(parents=True, exist_ok=True)
+			self.path.write_text('')
+		else:
+			with self.path.open() as f:
+				self._entries = [json.loads(line) for line in f if line.strip()]
+			logger.debug(f'📼 Loaded {len(self._entries)} recorded LLM calls from {self.path}')
+
+		if self.llm is not None:
+			self.model = self.llm.model
+		elif self._entries:
+			self.model = self._entries[0]['model']
+		else:
+			self.model = 'cassette'
+
+	@property
+	def provider(self) -> str:
+		if self.llm is not None:
+			return self.llm.provider
+		return self._entries[0]['provider'] if self._entries else 'cassette'
+
+	@property
+	def name(self) -> str:
+		return self.llm.name if self.llm is not None else self.model
+
+	def _record(
+		self,
+		messages: list[BaseMessage],
+		output_format: type[BaseModel] | None,
+		result: ChatInvokeCompletion[Any],
+		latency: float,
+	) -> None:
+		assert self.llm is not None
+		entry = {
+			'key': cassette_key(messages, output_format, self.match_images),
+			'provider': self.llm.provider,
+			'model': self.llm.model,
+			'output_format': output_format.__name__ if output_format is not None else None,
+			'messages': _dump_messages(messages, include_images=True),
+			'response': serialize_completion(result),
+			'usage': result.usage.model_dump() if result.usage else None,
+			'latency': latency,
+		}
+		with Path(self.path).open('a') as f:
+			f.write(json.dumps(entry) + '\n')
+		self.stats['recorded'] += 1
+
+	def _next_entry(self, key: str) -> dict[str, Any]:
+		for index, entry in enumerate(self._entries):
+			if index not in self._used and entry['key'] == key:
+				self._used.add(index)
+				self.stats['matched'] += 1
+				return entry
+
+		if self.strict:
+			raise CassetteMissError(f'No recorded LLM call matches this request (cassette {self.path})')
+
+		while self._cursor < len(self._entries) and self._cursor in self._used:
+			self._cursor += 1
+		if self._cursor >= len(self._entries):
+			raise CassetteMissError(f'Cassette {self.path} has no unused recorded LLM calls left')
+		self._used.add(self._cursor)
+		self.stats['out_of_order'] += 1
+		return self._entries[self._cursor]
+
+	@overload
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: None = None, **kwargs: Any
+	) -> ChatInvokeCompletion[str]: ...
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: type[T], **kwargs: Any) -> ChatInvokeCompletion[T]: ...
+
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: type[T] | None = None, **kwargs: Any
+	) -> ChatInvokeCompletion[T] | ChatInvokeCompletion[str]:
+		if self.mode == 'record':
+			assert self.llm is not None
+			start = time.monotonic()
+			result = await self.llm.ainvoke(messages, output_format, **kwargs)
+			self._record(messages, output_format, result, time.monotonic() - start)
+			return result
+
+		entry = self._next_entry(cassette_key(messages, output_format, self.match_images))
+		delay = self.latency if self.latency is not None else entry['latency'] * self.latency_scale
+		if delay > 0:
+			await asyncio.sleep(delay)
+
+		self.stats['replayed'] += 1
+		usage = ChatInvokeUsage.model_validate(entry['usage']) if entry['usage'] else None
+		return deserialize_completion(entry['response'], output_format, usage)
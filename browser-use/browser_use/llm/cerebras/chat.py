@@ -17,6 +17,7 @@ from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.cerebras.serializer import CerebrasMessageSerializer
+from browser_use.llm.client_pool import get_shared_client, get_shared_http_client
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
@@ -47,11 +48,16 @@ class ChatCerebras(BaseChatModel):
 		return 'cerebras'
 
 	def _client(self) -> AsyncOpenAI:
-		return AsyncOpenAI(
-			api_key=self.api_key,
-			base_url=self.base_url,
-			timeout=self.timeout,
+		params = {
+			'api_key': self.api_key,
+			'base_url': self.base_url,
+			'timeout': self.timeout,
 			**(self.client_params or {}),
+		}
+		if 'http_client' in params:
+			return AsyncOpenAI(**params)
+		return get_shared_client(
+			self.provider, params, lambda params: AsyncOpenAI(**params, http_client=get_shared_http_client())
 		)
 
 	@property
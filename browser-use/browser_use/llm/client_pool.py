@@ -0,0 +1,117 @@
+"""
+Process-wide registry of provider SDK clients and their HTTP connection pools.
+
+Chat models used to build a fresh SDK client (and with it a fresh httpx connection pool)
+on every call, so each LLM step paid DNS + TCP + TLS setup again. Models now fetch their
+client from this registry instead: every chat model with the same provider, endpoint and
+credentials shares one SDK client, and all SDK clients share one long-lived keep-alive
+httpx.AsyncClient (HTTP/2 when the optional `h2` package is installed).
+
+httpx connections are bound to the event loop they were opened on, so clients are
+cached per running loop.
+"""
+
+import asyncio
+import hashlib
+import logging
+import weakref
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+try:
+	import h2  # noqa: F401
+
+	HTTP2_AVAILABLE = True
+except ImportError:
+	HTTP2_AVAILABLE = False
+
+# Generous keep-alive so concurrent agents in one worker never queue on the pool
+DEFAULT_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=120.0)
+DEFAULT_TIMEOUT = httpx.Timeout(timeout=600.0, connect=10.0)
+
+
+class _LoopClients:
+	"""Clients owned by one event loop."""
+
+	def __init__(self) -> None:
+		self.http_client: httpx.AsyncClient | None = None
+		self.sdk_clients: dict[tuple[str, str], Any] = {}
+
+
+_loop_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClients]' = weakref.WeakKeyDictionary()
+_no_loop_clients = _LoopClients()
+
+# Counters for monitoring / tests
+stats: dict[str, int] = {'sdk_clients_created': 0, 'sdk_client_hits': 0, 'http_clients_created': 0}
+
+
+def _current_clients() -> _LoopClients:
+	try:
+		loop = asyncio.get_running_loop()
+	except RuntimeError:
+		return _no_loop_clients
+
+	clients = _loop_clients.get(loop)
+	if clients is None:
+		clients = _LoopClients()
+		_loop_clients[loop] = clients
+	return clients
+
+
+def _params_fingerprint(params: dict[str, Any]) -> str:
+	"""Stable key for client params (credentials are hashed, never stored in the key)."""
+	parts = [f'{key}={params[key]!r}' for key in sorted(params)]
+	return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+	"""Return the long-lived keep-alive httpx.AsyncClient for the current event loop."""
+	clients = _current_clients()
+	if clients.http_client is None or clients.http_client.is_closed:
+		clients.http_client = httpx.AsyncClient(
+			http2=HTTP2_AVAILABLE,
+			limits=DEFAULT_LIMITS,
+			timeout=DEFAULT_TIMEOUT,
+			follow_redirects=True,
+		)
+		stats['http_clients_created'] += 1
+		logger.debug(f'Created shared LLM HTTP client (http2={HTTP2_AVAILABLE})')
+	return clients.http_client
+
+
+def get_shared_client(provider: str, params: dict[str, Any], factory: Callable[[dict[str, Any]], T]) -> T:
+	"""Return the shared SDK client for (provider, params), creating it with factory(params) on first use.
+
+	Args:
+		provider: Provider name, part of the cache key (e.g. 'openai', 'anthropic')
+		params: Client constructor params (endpoint, credentials, retries, headers...)
+		factory: Builds the SDK client from params; called at most once per key and event loop
+	"""
+	clients = _current_clients()
+	key = (provider, _params_fingerprint(params))
+
+	client = clients.sdk_clients.get(key)
+	if client is not None:
+		stats['sdk_client_hits'] += 1
+		return client
+
+	client = factory(params)
+	clients.sdk_clients[key] = client
+	stats['sdk_clients_created'] += 1
+	logger.debug(f'Created shared {provider} client ({len(clients.sdk_clients)} cached)')
+	return client
+
+
+async def aclose_shared_clients() -> None:
+	"""Close the shared HTTP client of the current event loop and forget its SDK clients."""
+	clients = _current_clients()
+	clients.sdk_clients.clear()
+	if clients.http_client is not None:
+		await clients.http_client.aclose()
+		clients.http_client = None
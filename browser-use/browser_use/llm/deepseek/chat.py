@@ -16,6 +16,7 @@ from openai import (
 from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.client_pool import get_shared_client, get_shared_http_client
 from browser_use.llm.deepseek.serializer import DeepSeekMessageSerializer
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
@@ -48,11 +49,16 @@ class ChatDeepSeek(BaseChatModel):
 		return 'deepseek'
 
 	def _client(self) -> AsyncOpenAI:
-		return AsyncOpenAI(
-			api_key=self.api_key,
-			base_url=self.base_url,
-			timeout=self.timeout,
+		params = {
+			'api_key': self.api_key,
+			'base_url': self.base_url,
+			'timeout': self.timeout,
 			**(self.client_params or {}),
+		}
+		if 'http_client' in params:
+			return AsyncOpenAI(**params)
+		return get_shared_client(
+			self.provider, params, lambda params: AsyncOpenAI(**params, http_client=get_shared_http_client())
 		)
 
 	@property
@@ -12,9 +12,11 @@ from google.genai.types import MediaModality
 from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.client_pool import get_shared_client
 from browser_use.llm.exceptions import ModelProviderError
 from browser_use.llm.google.serializer import GoogleMessageSerializer
 from browser_use.llm.messages import BaseMessage
+from browser_use.llm.rate_limit import backoff_delay, retry_after_seconds
 from browser_use.llm.schema import SchemaOptimizer
 from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
 
@@ -62,7 +64,7 @@ class ChatGoogle(BaseChatModel):
 		supports_structured_output: If True, uses native JSON mode; if False, uses prompt-based fallback
 		max_retries: Number of retries for retryable errors (default: 3)
 		retryable_status_codes: List of HTTP status codes to retry on (default: [403,  503])
-		retry_delay: Delay in seconds between retries (default: 0.01)
+		retry_delay: Base delay in seconds for jittered exponential backoff between retries (default: 1.0)
 
 	Example:
 		from google.genai import types
@@ -74,7 +76,7 @@ class ChatGoogle(BaseChatModel):
 			},
 			max_retries=5,
 			retryable_status_codes=[403, 503],
-			retry_delay=0.02
+			retry_delay=0.5
 		)
 	"""
 
@@ -90,7 +92,7 @@ class ChatGoogle(BaseChatModel):
 	supports_structured_output: bool = True  # New flag
 	max_retries: int = 3  # Number of retries for retryable errors
 	retryable_status_codes: list[int] = field(default_factory=lambda: [403, 503])  # Status codes to retry on
-	retry_delay: float = 0.01  # Delay in seconds between retries
+	retry_delay: float = 1.0  # Base delay for jittered exponential backoff between retries
 
 	# Client initialization parameters
 	api_key: str | None = None
@@ -134,14 +136,14 @@ class ChatGoogle(BaseChatModel):
 		"""
 		Returns a genai.Client instance.
 
+		The client (and its connection pool) is shared by every ChatGoogle with the same
+		credentials, so a new model instance per job does not mean new connections.
+
 		Returns:
 			genai.Client: An instance of the Google genai client.
 		"""
-		if self._client is not None:
-			return self._client
-
 		client_params = self._get_client_params()
-		self._client = genai.Client(**client_params)
+		self._client = get_shared_client(self.provider, client_params, lambda params: genai.Client(**params))
 		return self._client
 
 	@property
@@ -420,8 +422,13 @@ class ChatGoogle(BaseChatModel):
 			except ModelProviderError as e:
 				# Retry if status code is in retryable list and we have attempts left
 				if e.status_code in self.retryable_status_codes and attempt < self.max_retries - 1:
-					self.logger.warning(f'⚠️ Got {e.status_code} error, retrying... (attempt {attempt + 1}/{self.max_retries})')
-					await asyncio.sleep(self.retry_delay)
+					# Honor Retry-After when the API sends it, otherwise back off exponentially with jitter
+					retry_after = retry_after_seconds(e)
+					delay = retry_after if retry_after is not None else backoff_delay(attempt, self.retry_delay)
+					self.logger.warning(
+						f'⚠️ Got {e.status_code} error, retrying in {delay:.2f}s... (attempt {attempt + 1}/{self.max_retries})'
+					)
+					await asyncio.sleep(delay)
 					continue
 				# Otherwise raise
 				raise
@@ -0,0 +1,191 @@
+"""
+Hedged requests across two chat models for tail-latency control.
+
+One slow response stalls a whole agent step. `ChatHedged` sends each call to a primary
+model and, if it has not answered once the primary's usual latency (a percentile of its
+recent calls) has passed, fires the same call at a backup model. The first valid answer
+wins and the other request is cancelled. If the primary fails outright, the backup is
+used as a failover.
+
+Example:
+	llm = ChatHedged(
+		primary=ChatGoogle(model='gemini-2.5-pro'),
+		backup=ChatAnthropic(model='claude-sonnet-4-0'),
+		hedge_percentile=0.9,
+	)
+	agent = Agent(task=..., llm=llm)
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar, overload
+
+from pydantic import BaseModel
+
+from browser_use.llm.base import BaseChatModel
+from browser_use.llm.messages import BaseMessage
+from browser_use.llm.views import ChatInvokeCompletion
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T', bound=BaseModel)
+
+
+def is_valid_completion(completion: ChatInvokeCompletion[Any], output_format: type[BaseModel] | None) -> bool:
+	"""Default validity check: the structured output parsed, and an agent step contains at least one action."""
+	if output_format is None:
+		return isinstance(completion.completion, str)
+	if not isinstance(completion.completion, output_format):
+		return False
+	action = getattr(completion.completion, 'action', None)
+	if isinstance(action, list) and not action:
+		return False
+	return True
+
+
+@dataclass
+class ChatHedged(BaseChatModel):
+	"""
+	Sends calls to `primary` and hedges to `backup` when the primary is slow or fails.
+
+	Args:
+		primary: Model every call goes to first
+		backup: Model used for hedged and failover calls (usually a different provider)
+		hedge_after: Fixed hedge delay in seconds; None = derive it from the primary's latency history
+		hedge_percentile: Percentile of recent primary latencies after which the backup is fired
+		min_samples: Latency samples needed before the percentile is trusted (until then `initial_hedge_after` is used)
+		initial_hedge_after: Hedge delay used while there is not enough history
+		window: Number of recent primary latencies kept
+		failover: Call the backup when the primary fails or gives an invalid answer before the hedge delay
+		validator: Decides whether a completion counts as an answer (default: `is_valid_completion`)
+	"""
+
+	primary: BaseChatModel
+	backup: BaseChatModel
+	hedge_after: float | None = None
+	hedge_percentile: float = 0.9
+	min_samples: int = 10
+	initial_hedge_after: float = 20.0
+	window: int = 100
+	failover: bool = True
+	validator: Callable[[ChatInvokeCompletion[Any], type[BaseModel] | None], bool] = is_valid_completion
+
+	model: str = field(init=False)
+	stats: dict[str, int] = field(init=False)
+	_latencies: deque[float] = field(init=False, repr=False)
+
+	def __post_init__(self) -> None:
+		self.model = self.primary.model
+		self.stats = {'calls': 0, 'hedged': 0, 'backup_wins': 0, 'failovers': 0}
+		self._latencies = deque(maxlen=self.window)
+
+	@property
+	def provider(self) -> str:
+		return self.primary.provider
+
+	@property
+	def name(self) -> str:
+		return self.primary.name
+
+	def current_hedge_delay(self) -> float:
+		"""Seconds to wait for the primary before firing the backup."""
+		if self.hedge_after is not None:
+			return self.hedge_after
+		if len(self._latencies) < self.min_samples:
+			return self.initial_hedge_after
+		ordered = sorted(self._latencies)
+		index = min(len(ordered) - 1, int(self.hedge_percentile * len(ordered)))
+		return ordered[index]
+
+	async def _call(
+		self, llm: BaseChatModel, messages: list[BaseMessage], output_format: type[T] | None, kwargs: dict[str, Any]
+	) -> ChatInvokeCompletion[Any]:
+		# Provider-specific kwargs (e.g. request_type for browser-use) only go to models of that provider
+		call_kwargs = kwargs if llm.provider == self.primary.provider else {}
+		return await llm.ainvoke(messages, output_format, **call_kwargs)
+
+	@overload
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: None = None, **kwargs: Any
+	) -> ChatInvokeCompletion[str]: ...
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: type[T], **kwargs: Any) -> ChatInvokeCompletion[T]: ...
+
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: type[T] | None = None, **kwargs: Any
+	) -> ChatInvokeCompletion[T] | ChatInvokeCompletion[str]:
+		self.stats['calls'] += 1
+		hedge_delay = self.current_hedge_delay()
+		start = time.monotonic()
+
+		primary = asyncio.create_task(self._call(self.primary, messages, output_format, kwargs))
+		backup: asyncio.Task[ChatInvokeCompletion[Any]] | None = None
+		pending: set[asyncio.Task[ChatInvokeCompletion[Any]]] = {primary}
+		# Error raised if no answer arrives (the primary's when it failed)
+		failure: BaseException | None = None
+		# Answers that came back but failed validation; returned only if nothing better arrives
+		fallback: ChatInvokeCompletion[Any] | None = None
+
+		try:
+			done, pending = await asyncio.wait(pending, timeout=hedge_delay)
+			if done:
+				failure = primary.exception()
+				if failure is None:
+					self._latencies.append(time.monotonic() - start)
+					result = primary.result()
+					if self.validator(result, output_format):
+						return result
+					fallback = result
+				if not self.failover:
+					# The primary's answer as is, valid or not (raises its error if it failed)
+					return primary.result()
+				self.stats['failovers'] += 1
+				logger.warning(f'⚠️ {self.primary.name} gave no usable answer, failing over to {self.backup.name}')
+			else:
+				self.stats['hedged'] += 1
+				logger.debug(f'⏱️ {self.primary.name} slower than {hedge_delay:.1f}s, hedging to {self.backup.name}')
+
+			backup = asyncio.create_task(self._call(self.backup, messages, output_format, kwargs))
+			pending.add(backup)
+
+			# First valid completion wins; a failed or invalid answer leaves the other request racing
+			while pending:
+				done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+				for task in done:
+					error = task.exception()
+					if task is primary:
+						self._latencies.append(time.monotonic() - start)
+					if error is not None:
+						if task is primary:
+							failure = error
+						else:
+							logger.debug(f'Backup {self.backup.name} failed: {type(error).__name__}: {error}')
+							failure = failure or error
+						continue
+
+					result = task.result()
+					if self.validator(result, output_format):
+						if task is backup:
+							self.stats['backup_wins'] += 1
+						return result
+					if fallback is None or task is primary:
+						fallback = result
+
+			if fallback is not None:
+				return fallback
+			assert failure is not None
+			raise failure
+		finally:
+			losers = [task for task in (primary, backup) if task is not None and not task.done()]
+			if not primary.done():
+				# Censored sample: the primary took at least this long
+				self._latencies.append(time.monotonic() - start)
+			for task in losers:
+				task.cancel()
+			# Let the losers finish unwinding (closing their connections) before returning
+			await asyncio.gather(*losers, return_exceptions=True)
@@ -12,6 +12,7 @@ from openai.types.shared_params.response_format_json_schema import JSONSchema, R
 from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.client_pool import get_shared_client, get_shared_http_client
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.openai.serializer import OpenAIMessageSerializer
@@ -110,11 +111,18 @@ class ChatOpenAI(BaseChatModel):
 		"""
 		Returns an AsyncOpenAI client.
 
+		The client is shared by every model with the same endpoint and credentials and
+		uses the process-wide keep-alive HTTP pool, unless an http_client was provided.
+
 		Returns:
 			AsyncOpenAI: An instance of the AsyncOpenAI client.
 		"""
 		client_params = self._get_client_params()
-		return AsyncOpenAI(**client_params)
+		if self.http_client is not None:
+			return AsyncOpenAI(**client_params)
+		return get_shared_client(
+			self.provider, client_params, lambda params: AsyncOpenAI(**params, http_client=get_shared_http_client())
+		)
 
 	@property
 	def name(self) -> str:
@@ -0,0 +1,345 @@
+"""
+Cross-provider rate limiting and retry layer for chat models.
+
+Each provider client retries on its own, so when many agents share one API key a burst of
+429s turns into a retry storm. `ChatRateLimited` wraps any BaseChatModel and routes every
+call through a `RateLimiter` shared by all wrappers of the same (provider, model) in the
+process:
+
+- a request bucket (requests per minute) and a token bucket (tokens per minute, estimated
+  before the call and reconciled with the reported usage afterwards)
+- a shared cooldown when the provider answers 429, honoring Retry-After, so every caller
+  backs off together instead of each retrying on its own schedule
+- jittered exponential backoff for other retryable errors: overload/timeout statuses, and 500/502 only when
+  they were caused by a timeout or dropped connection (providers report any failure, including invalid
+  output, as 502)
+- queue-time metrics (how long calls waited for capacity)
+
+Example:
+	llm = ChatRateLimited(ChatGoogle(model='gemini-2.5-pro'), requests_per_minute=150, tokens_per_minute=1_000_000)
+	agent = Agent(task=..., llm=llm)
+"""
+
+import asyncio
+import logging
+import random
+import time
+import weakref
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any, TypeVar, overload
+
+import httpx
+from pydantic import BaseModel
+
+from browser_use.llm.base import BaseChatModel
+from browser_use.llm.exceptions import ModelProviderError
+from browser_use.llm.messages import BaseMessage
+from browser_use.llm.views import ChatInvokeCompletion
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T', bound=BaseModel)
+
+# Rough prompt-size heuristics used until the provider reports real usage
+CHARS_PER_TOKEN = 4
+TOKENS_PER_IMAGE = 1000
+
+# SDK exception classes (matched by name, to avoid importing every provider SDK) that mean the request
+# never got a real answer: openai/anthropic/groq APITimeoutError subclasses APIConnectionError
+TRANSIENT_ERROR_NAMES = frozenset({'APIConnectionError', 'DeadlineExceeded', 'ServiceUnavailable'})
+
+
+def backoff_delay(attempt: int, base_delay: float = 1.0, max_delay: float = 60.0) -> float:
+	"""Full-jitter exponential backoff: uniform in [0, min(max_delay, base_delay * 2**attempt)]."""
+	return random.uniform(0, min(max_delay, base_delay * (2**attempt)))
+
+
+def _cause_chain(error: BaseException) -> Iterator[BaseException]:
+	"""The error and everything it was raised from (provider wrappers raise ModelProviderError `from` the SDK exception)."""
+	seen: set[int] = set()
+	current: BaseException | None = error
+	while current is not None and id(current) not in seen:
+		seen.add(id(current))
+		yield current
+		current = current.__cause__ or current.__context__
+
+
+def is_transient_failure(error: BaseException) -> bool:
+	"""Whether a provider error was caused by a timeout or a dropped connection rather than by the request itself."""
+	for current in _cause_chain(error):
+		if isinstance(current, (TimeoutError, ConnectionError, httpx.TimeoutException, httpx.NetworkError)):
+			return True
+		if any(cls.__name__ in TRANSIENT_ERROR_NAMES for cls in type(current).__mro__):
+			return True
+	return False
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+	"""Read Retry-After (or retry-after-ms) from the HTTP response behind a provider error, if any.
+
+	The whole cause chain is searched.
+	"""
+	for current in _cause_chain(error):
+		response = getattr(current, 'response', None)
+		headers = getattr(response, 'headers', None)
+		if headers is not None:
+			try:
+				retry_after_ms = headers.get('retry-after-ms')
+				if retry_after_ms is not None:
+					return float(retry_after_ms) / 1000
+				retry_after = headers.get('retry-after')
+				if retry_after is not None:
+					return float(retry_after)
+			except (TypeError, ValueError):
+				pass  # HTTP-date form or malformed header - fall back to backoff
+	return None
+
+
+def estimate_tokens(messages: list[BaseMessage]) -> int:
+	"""Cheap prompt-size estimate (characters / 4, plus a flat cost per image)."""
+	total = 0
+	for message in messages:
+		content = message.content
+		if isinstance(content, str):
+			total += len(content) // CHARS_PER_TOKEN
+		elif isinstance(content, list):
+			for part in content:
+				if part.type == 'text':
+					total += len(part.text) // CHARS_PER_TOKEN
+				elif part.type == 'image_url':
+					total += TOKENS_PER_IMAGE
+	return total
+
+
+class TokenBucket:
+	"""Continuously refilling bucket. The level may go negative when actual usage exceeds the estimate."""
+
+	def __init__(self, rate_per_minute: float, capacity: float | None = None):
+		self.rate = rate_per_minute / 60.0
+		self.capacity = capacity if capacity is not None else rate_per_minute
+		self.level = self.capacity
+		self._updated_at = time.monotonic()
+
+	def _refill(self) -> None:
+		now = time.monotonic()
+		self.level = min(self.capacity, self.level + (now - self._updated_at) * self.rate)
+		self._updated_at = now
+
+	def wait_time(self, amount: float) -> float:
+		"""Seconds until `amount` can be taken (0 if available now)."""
+		self._refill()
+		# Requests larger than the whole bucket only wait for a full bucket
+		amount = min(amount, self.capacity)
+		if self.level >= amount:
+			return 0.0
+		return (amount - self.level) / self.rate
+
+	def take(self, amount: float) -> None:
+		self._refill()
+		self.level -= amount
+
+
+class RateLimiter:
+	"""Request/token buckets and shared 429 cooldown for one (provider, model)."""
+
+	def __init__(self, name: str, requests_per_minute: float | None = None, tokens_per_minute: float | None = None):
+		self.name = name
+		self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+		self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+		self.cooldown_until = 0.0
+
+		# asyncio.Lock is bound to the loop it is first used on
+		self._locks: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]' = weakref.WeakKeyDictionary()
+
+		self.calls = 0
+		self.throttled_calls = 0
+		self.rate_limit_errors = 0
+		self.retries = 0
+		self.total_queue_time = 0.0
+		self.max_queue_time = 0.0
+
+	def configure(self, requests_per_minute: float | None, tokens_per_minute: float | None) -> None:
+		"""Set limits that were not configured yet (first configured wrapper wins)."""
+		if requests_per_minute and self.requests is None:
+			self.requests = TokenBucket(requests_per_minute)
+		if tokens_per_minute and self.tokens is None:
+			self.tokens = TokenBucket(tokens_per_minute)
+
+	def _lock(self) -> asyncio.Lock:
+		loop = asyncio.get_running_loop()
+		lock = self._locks.get(loop)
+		if lock is None:
+			lock = asyncio.Lock()
+			self._locks[loop] = lock
+		return lock
+
+	async def acquire(self, estimated_tokens: int) -> float:
+		"""Wait for request and token capacity. Returns the time spent queued, in seconds.
+
+		Callers are served in arrival order (asyncio.Lock is FIFO), so throughput is smoothed
+		instead of every caller polling the buckets at once.
+		"""
+		start = time.monotonic()
+		async with self._lock():
+			while True:
+				wait = max(0.0, self.cooldown_until - time.monotonic())
+				if self.requests:
+					wait = max(wait, self.requests.wait_time(1))
+				if self.tokens:
+					wait = max(wait, self.tokens.wait_time(estimated_tokens))
+				if wait <= 0:
+					break
+				await asyncio.sleep(wait)
+
+			if self.requests:
+				self.requests.take(1)
+			if self.tokens:
+				self.tokens.take(estimated_tokens)
+
+		queue_time = time.monotonic() - start
+		self.calls += 1
+		self.total_queue_time += queue_time
+		self.max_queue_time = max(self.max_queue_time, queue_time)
+		if queue_time > 0.01:
+			self.throttled_calls += 1
+		return queue_time
+
+	def record_usage(self, estimated_tokens: int, actual_tokens: int | None) -> None:
+		"""Correct the token bucket once the provider reports real usage."""
+		if self.tokens and actual_tokens is not None:
+			self.tokens.take(actual_tokens - estimated_tokens)
+
+	def cool_down(self, delay: float) -> None:
+		"""Pause every caller of this limiter for `delay` seconds (after a 429)."""
+		self.rate_limit_errors += 1
+		self.cooldown_until = max(self.cooldown_until, time.monotonic() + delay)
+
+	def stats(self) -> dict[str, Any]:
+		return {
+			'calls': self.calls,
+			'throttled_calls': self.throttled_calls,
+			'rate_limit_errors': self.rate_limit_errors,
+			'retries': self.retries,
+			'avg_queue_time_ms': int(self.total_queue_time / self.calls * 1000) if self.calls else 0,
+			'max_queue_time_ms': int(self.max_queue_time * 1000),
+		}
+
+
+_limiters: dict[tuple[str, str], RateLimiter] = {}
+
+
+def get_rate_limiter(
+	provider: str, model: str, requests_per_minute: float | None = None, tokens_per_minute: float | None = None
+) -> RateLimiter:
+	"""Return the process-wide limiter for (provider, model), creating it on first use."""
+	key = (provider, model)
+	limiter = _limiters.get(key)
+	if limiter is None:
+		limiter = RateLimiter(f'{provider}/{model}', requests_per_minute, tokens_per_minute)
+		_limiters[key] = limiter
+	else:
+		limiter.configure(requests_per_minute, tokens_per_minute)
+	return limiter
+
+
+def rate_limit_stats() -> dict[str, dict[str, Any]]:
+	"""Metrics of every limiter in the process, keyed by 'provider/model'."""
+	return {limiter.name: limiter.stats() for limiter in _limiters.values()}
+
+
+@dataclass
+class ChatRateLimited(BaseChatModel):
+	"""
+	Wraps a chat model with shared rate limiting and retries.
+
+	Args:
+		llm: The chat model to wrap
+		requests_per_minute: Request budget shared by all wrappers of this provider/model (None = unlimited)
+		tokens_per_minute: Token budget shared by all wrappers of this provider/model (None = unlimited)
+		max_retries: Retries for retryable errors
+		retryable_status_codes: Statuses that are always retried (rate limits, overload, timeouts)
+		transient_status_codes: Statuses retried only when caused by a timeout or dropped connection
+		base_delay: First backoff step in seconds (doubles per attempt, full jitter)
+		max_delay: Upper bound for a single backoff / Retry-After wait
+		expected_completion_tokens: Completion size assumed when reserving tokens before the call
+	"""
+
+	llm: BaseChatModel
+	requests_per_minute: float | None = None
+	tokens_per_minute: float | None = None
+	max_retries: int = 5
+	base_delay: float = 1.0
+	max_delay: float = 60.0
+	retryable_status_codes: list[int] = field(default_factory=lambda: [408, 429, 503, 504, 529])
+	transient_status_codes: list[int] = field(default_factory=lambda: [500, 502])
+	expected_completion_tokens: int = 500
+
+	model: str = field(init=False)
+	limiter: RateLimiter = field(init=False, repr=False)
+
+	def __post_init__(self) -> None:
+		self.model = self.llm.model
+		self.limiter = get_rate_limiter(self.llm.provider, self.llm.model, self.requests_per_minute, self.tokens_per_minute)
+
+	@property
+	def provider(self) -> str:
+		return self.llm.provider
+
+	def _is_retryable(self, error: ModelProviderError) -> bool:
+		if error.status_code in self.retryable_status_codes:
+			return True
+		return error.status_code in self.transient_status_codes and is_transient_failure(error)
+
+	@property
+	def name(self) -> str:
+		return self.llm.name
+
+	@overload
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: None = None, **kwargs: Any
+	) -> ChatInvokeCompletion[str]: ...
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: type[T], **kwargs: Any) -> ChatInvokeCompletion[T]: ...
+
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: type[T] | None = None, **kwargs: Any
+	) -> ChatInvokeCompletion[T] | ChatInvokeCompletion[str]:
+		estimated_tokens = estimate_tokens(messages) + self.expected_completion_tokens
+
+		for attempt in range(self.max_retries + 1):
+			queue_time = await self.limiter.acquire(estimated_tokens)
+			if queue_time > 1:
+				logger.debug(f'⏳ {self.limiter.name}: waited {queue_time:.1f}s for rate limit capacity')
+
+			try:
+				result = await self.llm.ainvoke(messages, output_format, **kwargs)
+			except ModelProviderError as e:
+				if not self._is_retryable(e) or attempt >= self.max_retries:
+					raise
+
+				self.limiter.retries += 1
+				retry_after = retry_after_seconds(e)
+				delay = min(self.max_delay, retry_after) if retry_after is not None else None
+				if e.status_code == 429:
+					# Everyone sharing this key backs off together; acquire() waits out the cooldown
+					delay = delay if delay is not None else backoff_delay(attempt, self.base_delay, self.max_delay)
+					self.limiter.cool_down(delay)
+					logger.warning(
+						f'⚠️ {self.limiter.name} rate limited, pausing all callers for {delay:.1f}s '
+						f'(attempt {attempt + 1}/{self.max_retries})'
+					)
+				else:
+					delay = delay if delay is not None else backoff_delay(attempt, self.base_delay, self.max_delay)
+					logger.warning(
+						f'⚠️ {self.limiter.name} returned {e.status_code}, retrying in {delay:.1f}s '
+						f'(attempt {attempt + 1}/{self.max_retries})'
+					)
+					await asyncio.sleep(delay)
+				continue
+
+			self.limiter.record_usage(estimated_tokens, result.usage.total_tokens if result.usage else None)
+			return result
+
+		raise RuntimeError('Retry loop completed without return or exception')
@@ -16,6 +16,7 @@ from browser_use.browser import BrowserSession
 from browser_use.browser.events import (
 	ClickElementEvent,
 	CloseTabEvent,
+	FillFormEvent,
 	GetDropdownOptionsEvent,
 	GoBackEvent,
 	NavigateToUrlEvent,
@@ -39,6 +40,8 @@ from browser_use.tools.views import (
 	CloseTabAction,
 	DoneAction,
 	ExtractAction,
+	FillFormAction,
+	FormFieldValue,
 	GetDropdownOptionsAction,
 	InputTextAction,
 	NavigateAction,
@@ -58,6 +61,7 @@ logger = logging.getLogger(__name__)
 # Import EnhancedDOMTreeNode and rebuild event models that have forward references to it
 # This must be done after all imports are complete
 ClickElementEvent.model_rebuild()
+FillFormEvent.model_rebuild()
 TypeTextEvent.model_rebuild()
 ScrollEvent.model_rebuild()
 UploadFileEvent.model_rebuild()
@@ -428,6 +432,58 @@ class Tools(Generic[Context]):
 				error_msg = f'Failed to type text into element {params.index}: {e}'
 				return ActionResult(error=error_msg)
 
+		@self.registry.action(
+			'Fill several form fields in one step: text inputs, textareas, selects (option text), checkboxes and radios (true/false). Use upload_file for file inputs.',
+			param_model=FillFormAction,
+		)
+		async def fill_form(
+			params: FillFormAction,
+			browser_session: BrowserSession,
+			has_sensitive_data: bool = False,
+			sensitive_data: dict[str, str | dict[str, str]] | None = None,
+		):
+			nodes: list[EnhancedDOMTreeNode] = []
+			fields: list[FormFieldValue] = []
+			lines: list[str] = []
+			for field in params.fields:
+				node = await browser_session.get_element_by_index(field.index)
+				if node is None:
+					lines.append(f'[{field.index}] not available - page may have changed')
+					continue
+				nodes.append(node)
+				fields.append(field)
+
+			if not nodes:
+				msg = 'None of the form fields are available - page may have changed. Try refreshing browser state.'
+				logger.warning(f'⚠️ {msg}')
+				return ActionResult(extracted_content=msg)
+
+			try:
+				event = browser_session.event_bus.dispatch(FillFormEvent(nodes=nodes, values=[field.value for field in fields]))
+				await event
+				results = await event.event_result(raise_if_any=True, raise_if_none=True)
+			except BrowserError as e:
+				return handle_browser_error(e)
+			except Exception as e:
+				logger.error(f'Failed to dispatch FillFormEvent: {type(e).__name__}: {e}')
+				return ActionResult(error=f'Failed to fill form fields: {e}')
+
+			failed = 0
+			for field, result in zip(fields, results or []):
+				if not result.get('success'):
+					failed += 1
+					lines.append(f'[{field.index}] failed: {result.get("error")}')
+				elif has_sensitive_data:
+					key_name = _detect_sensitive_key_name(field.value, sensitive_data) if sensitive_data else None
+					lines.append(f'[{field.index}] filled {key_name or "sensitive data"}')
+				else:
+					lines.append(f"[{field.index}] = '{result.get('value', field.value)}'")
+			failed += len(params.fields) - len(fields)
+
+			msg = f'Filled {len(params.fields) - failed}/{len(params.fields)} form fields:\n' + '\n'.join(lines)
+			logger.debug(msg)
+			return ActionResult(extracted_content=msg, long_term_memory=msg)
+
 		@self.registry.action(
 			'',
 			param_model=UploadFileAction,
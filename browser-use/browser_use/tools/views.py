@@ -48,6 +48,15 @@ class InputTextAction(BaseModel):
 	clear: bool = Field(default=True, description='1=clear, 0=append')
 
 
+class FormFieldValue(BaseModel):
+	index: int = Field(ge=1, description='from browser_state')
+	value: str = Field(description='text, option text for selects, true/false for checkboxes and radios')
+
+
+class FillFormAction(BaseModel):
+	fields: list[FormFieldValue] = Field(min_length=1)
+
+
 class DoneAction(BaseModel):
 	text: str = Field(description='Final user message in the format the user requested')
 	success: bool = Field(default=True, description='True if user_request completed successfully')
@@ -0,0 +1,92 @@
+"""
+Tests for pipelined CDP commands: commands are written back-to-back before any response arrives,
+and only the awaited results decide success.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from bubus import EventBus
+
+from browser_use.browser.cdp_pipeline import CDPPipeline
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.watchdogs.default_action_watchdog import DefaultActionWatchdog
+
+
+class SlowCDP:
+	"""Records when commands are sent; responses only arrive once `respond` is set"""
+
+	def __init__(self):
+		self.sent: list[str] = []
+		self.answered: list[str] = []
+		self.respond = asyncio.Event()
+		self.session_id = 'session'
+		self.cdp_client = SimpleNamespace(send=self)
+
+	def pipeline(self) -> CDPPipeline:
+		return CDPPipeline(self)  # type: ignore[arg-type]
+
+	async def command(self, name: str, fail: bool = False) -> dict:
+		self.sent.append(name)
+		await self.respond.wait()
+		self.answered.append(name)
+		if fail:
+			raise RuntimeError(f'{name} failed')
+		return {'name': name}
+
+	def __getattr__(self, domain: str):
+		fake = self
+
+		class Domain:
+			def __getattr__(self, method: str):
+				async def command(params=None, session_id=None):
+					return await fake.command(f'{domain}.{method}:{(params or {}).get("type")}')
+
+				return command
+
+		return Domain()
+
+
+async def test_commands_are_sent_before_any_response():
+	cdp = SlowCDP()
+
+	async with CDPPipeline() as pipeline:
+		scroll = pipeline.add(cdp.command('DOM.scrollIntoViewIfNeeded'))
+		quads = pipeline.add(cdp.command('DOM.getContentQuads'))
+		pipeline.add(cdp.command('DOM.resolveNode'))
+		await asyncio.sleep(0)
+
+		assert cdp.sent == ['DOM.scrollIntoViewIfNeeded', 'DOM.getContentQuads', 'DOM.resolveNode']
+		assert cdp.answered == []
+		cdp.respond.set()
+		assert await quads == {'name': 'DOM.getContentQuads'}
+
+	assert scroll.done() and cdp.answered == cdp.sent
+
+
+async def test_only_awaited_failures_raise():
+	cdp = SlowCDP()
+	cdp.respond.set()
+
+	async with CDPPipeline() as pipeline:
+		ignored = pipeline.add(cdp.command('Input.dispatchMouseEvent', fail=True))
+		needed = pipeline.add(cdp.command('DOM.resolveNode', fail=True))
+		with pytest.raises(RuntimeError, match='DOM.resolveNode failed'):
+			await needed
+
+	assert isinstance(ignored.exception(), RuntimeError)
+
+
+async def test_key_events_of_a_character_share_a_round_trip():
+	watchdog = DefaultActionWatchdog(event_bus=EventBus(), browser_session=BrowserSession(browser_profile=BrowserProfile()))
+	cdp = SlowCDP()
+
+	typing = asyncio.create_task(watchdog._type_characters(cdp, 'ab'))
+	await asyncio.sleep(0.01)
+
+	assert cdp.sent == ['Input.dispatchKeyEvent:keyDown', 'Input.dispatchKeyEvent:char', 'Input.dispatchKeyEvent:keyUp']
+	cdp.respond.set()
+	await typing
+	assert len(cdp.answered) == 6
@@ -0,0 +1,116 @@
+"""Tests for delta-only DOM prompts: full element list on navigation or large changes, diffs in between."""
+
+from pathlib import Path
+
+from browser_use.agent.message_manager.service import MessageManager
+from browser_use.agent.message_manager.views import MessageManagerState
+from browser_use.browser.views import BrowserStateSummary, TabInfo
+from browser_use.dom.views import SerializedDOMState
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm.messages import SystemMessage
+from tests.ci.conftest import create_dom_node
+
+
+def _state(url: str, *backend_node_ids: int) -> BrowserStateSummary:
+	return BrowserStateSummary(
+		url=url,
+		title='Apply',
+		tabs=[TabInfo(target_id='test-0', url=url, title='Apply')],
+		dom_state=SerializedDOMState(
+			_root=None,
+			selector_map={
+				i: create_dom_node(i, 'button', attributes={'aria-label': f'Button {i}'}, target_id='test-0')
+				for i in backend_node_ids
+			},
+		),
+	)
+
+
+def test_delta_mode_sends_full_list_only_on_resync(tmp_path: Path):
+	mm = MessageManager(
+		task='apply',
+		system_message=SystemMessage(content='system'),
+		file_system=FileSystem(tmp_path),
+		state=MessageManagerState(),
+		include_attributes=['aria-label'],
+		dom_prompt_mode='delta',
+	)
+	ids = list(range(1, 11))
+
+	mm.create_state_messages(_state('https://jobs.example/apply', *ids), use_vision=False)
+	base_message = mm.state.history.dom_base_message
+	assert base_message is not None
+	assert 'No changes since the element list in <dom_base>' in (mm.last_state_message_text or '')
+
+	# One element added: only the delta is sent, the cached base message is untouched
+	mm.create_state_messages(_state('https://jobs.example/apply', *ids, 11), use_vision=False)
+	assert mm.state.history.dom_base_message is base_message
+	assert '[11]<button aria-label=Button 11 />' in (mm.last_state_message_text or '')
+	assert mm.get_messages()[1] is base_message
+
+	# More than 30% of the base changed: resync
+	mm.create_state_messages(_state('https://jobs.example/apply', *ids[:5], 20, 21, 22), use_vision=False)
+	assert mm.state.history.dom_base_message is not base_message
+
+	# Navigation always resyncs
+	base_message = mm.state.history.dom_base_message
+	mm.create_state_messages(_state('https://jobs.example/apply/2', *ids[:5], 20, 21, 22), use_vision=False)
+	assert mm.state.history.dom_base_message is not base_message
+
+
+def test_full_mode_has_no_base_message(tmp_path: Path):
+	mm = MessageManager(
+		task='apply',
+		system_message=SystemMessage(content='system'),
+		file_system=FileSystem(tmp_path),
+		state=MessageManagerState(),
+	)
+
+	mm.create_state_messages(_state('https://jobs.example/apply', 1, 2), use_vision=False)
+
+	assert mm.state.history.dom_base_message is None
+	assert len(mm.get_messages()) == 2
+
+
+def test_delta_mode_keeps_page_markers_and_truncates_base(tmp_path: Path):
+	mm = MessageManager(
+		task='apply',
+		system_message=SystemMessage(content='system'),
+		file_system=FileSystem(tmp_path),
+		state=MessageManagerState(),
+		include_attributes=['aria-label'],
+		dom_prompt_mode='delta',
+		max_clickable_elements_length=20,
+	)
+
+	mm.create_state_messages(_state('https://jobs.example/apply', *range(1, 11)), use_vision=False)
+
+	base_text = mm.state.history.dom_base_message.text  # type: ignore[union-attr]
+	assert '(truncated to 20 characters)' in base_text
+	assert len(base_text.split(':\n', 1)[1]) == len('\n</dom_base>') + 20
+	assert '[Start of page]' in (mm.last_state_message_text or '')
+	assert '[End of page]' in (mm.last_state_message_text or '')
+
+
+def test_restored_state_resends_the_full_list(tmp_path: Path):
+	def message_manager(state: MessageManagerState) -> MessageManager:
+		return MessageManager(
+			task='apply',
+			system_message=SystemMessage(content='system'),
+			file_system=FileSystem(tmp_path),
+			state=state,
+			include_attributes=['aria-label'],
+			dom_prompt_mode='delta',
+		)
+
+	mm = message_manager(MessageManagerState())
+	mm.create_state_messages(_state('https://jobs.example/apply', 1, 2), use_vision=False)
+	restored_state = MessageManagerState.model_validate(mm.state.model_dump())
+	assert restored_state.history.dom_base_message is not None
+
+	# The element list the base message was built from is gone, so the next step starts a new base
+	restored = message_manager(restored_state)
+	assert restored.state.history.dom_base_message is None
+	restored.create_state_messages(_state('https://jobs.example/apply', 1, 2, 3), use_vision=False)
+	assert restored.state.history.dom_base_message is not None
+	assert 'No changes since the element list in <dom_base>' in (restored.last_state_message_text or '')
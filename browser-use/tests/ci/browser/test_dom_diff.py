@@ -0,0 +1,53 @@
+"""
+Tests for diff_dom_states: added, removed, moved and changed interactive elements between two states.
+"""
+
+from browser_use.dom.diff import diff_dom_states
+from browser_use.dom.views import DOMRect, EnhancedDOMTreeNode, NodeType, SerializedDOMState
+from tests.ci.conftest import create_dom_node
+
+
+def _button(backend_node_id: int, text: str, parent: EnhancedDOMTreeNode, y: float = 0, **attributes: str):
+	button = create_dom_node(
+		backend_node_id, 'button', parent, attributes=attributes, position=DOMRect(x=0, y=y, width=10, height=10)
+	)
+	create_dom_node(backend_node_id + 1000, '#text', button, node_type=NodeType.TEXT_NODE, value=text)
+	return button
+
+
+def test_first_state_is_all_added():
+	form = create_dom_node(1, 'form')
+	state = SerializedDOMState(_root=None, selector_map={2: _button(2, 'Next', form)})
+
+	assert diff_dom_states(None, state).added == [2]
+
+
+def test_classifies_elements_in_one_pass():
+	form, section = create_dom_node(1, 'form'), create_dom_node(9, 'section')
+	previous = SerializedDOMState(
+		_root=None,
+		selector_map={
+			2: _button(2, 'Next', form),
+			3: _button(3, 'Back', form),
+			4: _button(4, 'Upload', form),
+			5: _button(5, 'Save', form, type='button'),
+		},
+	)
+	current = SerializedDOMState(
+		_root=None,
+		selector_map={
+			2: _button(2, 'Next', form),
+			4: _button(4, 'Upload', section, y=200),
+			5: _button(5, 'Saved', form, type='submit'),
+			6: _button(6, 'Submit', form),
+		},
+	)
+
+	diff = diff_dom_states(previous, current)
+
+	assert diff.added == [6]
+	assert diff.removed == [3]
+	assert diff.moved == [4]
+	assert diff.changed == [5]
+	assert not diff.is_empty
+	assert diff_dom_states(current, current).is_empty
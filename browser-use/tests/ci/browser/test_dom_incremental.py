@@ -0,0 +1,143 @@
+"""
+Tests for the incremental DOM mirror: applying CDP mutation events to the cached tree,
+fetching only inserted subtrees, and falling back to a full getDocument when needed.
+"""
+
+import copy
+from types import SimpleNamespace
+
+from browser_use.dom.incremental import DOMTreeMirror
+
+
+def element(node_id, name, children=None, attributes=None, **extra):
+	node = {
+		'nodeId': node_id,
+		'backendNodeId': node_id + 1000,
+		'nodeType': 1,
+		'nodeName': name,
+		'localName': name.lower(),
+		'nodeValue': '',
+		'attributes': attributes or [],
+		'childNodeCount': len(children or []),
+		**extra,
+	}
+	if children is not None:
+		node['children'] = children
+	return node
+
+
+def text(node_id, value):
+	return {'nodeId': node_id, 'backendNodeId': node_id + 1000, 'nodeType': 3, 'nodeName': '#text', 'nodeValue': value}
+
+
+def make_document():
+	form = element(4, 'FORM', [element(5, 'INPUT', attributes=['name', 'email']), element(6, 'BUTTON', [text(7, 'Next')])])
+	return {'root': element(1, '#document', [element(2, 'HTML', [element(3, 'BODY', [form])])])}
+
+
+class FakeDOM:
+	def __init__(self, mirror_ref):
+		self.mirror_ref = mirror_ref
+		self.get_document_calls = 0
+		self.requested_children = []
+		self.subtrees = {}
+		self.bindings_reset = False
+
+	async def getDocument(self, params, session_id):
+		self.get_document_calls += 1
+		self.bindings_reset = False
+		return copy.deepcopy(make_document())
+
+	async def describeNode(self, params, session_id):
+		if self.bindings_reset:
+			raise RuntimeError('Could not find node with given id')
+		return {'node': {'nodeId': params['nodeId'], 'backendNodeId': params['nodeId'] + 1000}}
+
+	async def requestChildNodes(self, params, session_id):
+		self.requested_children.append(params['nodeId'])
+		# Chrome delivers the subtree as a setChildNodes event before the command returns
+		self.mirror_ref[0].apply('setChildNodes', {'parentId': params['nodeId'], 'nodes': self.subtrees[params['nodeId']]})
+		return {}
+
+
+def make_mirror():
+	mirror_ref = []
+	dom = FakeDOM(mirror_ref)
+	session = SimpleNamespace(cdp_client=SimpleNamespace(send=SimpleNamespace(DOM=dom)), session_id='s1', target_id='t1')
+	mirror = DOMTreeMirror(session)  # type: ignore[arg-type]
+	mirror_ref.append(mirror)
+	return mirror, dom
+
+
+def find(node, node_id):
+	if node['nodeId'] == node_id:
+		return node
+	for child in node.get('children') or []:
+		found = find(child, node_id)
+		if found:
+			return found
+	return None
+
+
+async def test_mutations_are_applied_without_refetching():
+	mirror, dom = make_mirror()
+	await mirror.get_document()
+
+	mirror.apply('attributeModified', {'nodeId': 5, 'name': 'aria-invalid', 'value': 'true'})
+	mirror.apply('attributeModified', {'nodeId': 5, 'name': 'name', 'value': 'work_email'})
+	mirror.apply('characterDataModified', {'nodeId': 7, 'characterData': 'Submit'})
+	mirror.apply('childNodeRemoved', {'parentNodeId': 4, 'nodeId': 5})
+	document = await mirror.get_document()
+
+	assert dom.get_document_calls == 1
+	assert mirror.stats['incremental_reads'] == 1
+	form = find(document['root'], 4)
+	assert [child['nodeId'] for child in form['children']] == [6]
+	assert find(document['root'], 7)['nodeValue'] == 'Submit'
+	assert mirror._nodes.get(5) is None
+
+
+async def test_inserted_subtree_is_fetched_on_its_own():
+	mirror, dom = make_mirror()
+	await mirror.get_document()
+
+	# Inserted nodes arrive without children; their subtree is requested at capture time
+	dom.subtrees[20] = [element(21, 'LABEL', [text(22, 'Phone')]), element(23, 'INPUT', attributes=['name', 'phone'])]
+	inserted = element(20, 'DIV', attributes=['class', 'step-2'])
+	inserted['childNodeCount'] = 2
+	mirror.apply('childNodeInserted', {'parentNodeId': 4, 'previousNodeId': 5, 'node': inserted})
+	document = await mirror.get_document()
+
+	assert dom.get_document_calls == 1
+	assert dom.requested_children == [20]
+	form = find(document['root'], 4)
+	assert [child['nodeId'] for child in form['children']] == [5, 20, 6]
+	assert find(document['root'], 23)['parentId'] == 20
+
+
+async def test_unknown_nodes_and_frames_force_a_full_fetch():
+	mirror, dom = make_mirror()
+	await mirror.get_document()
+	mirror.apply('attributeModified', {'nodeId': 999, 'name': 'class', 'value': 'x'})
+	await mirror.get_document()
+	assert dom.get_document_calls == 2
+
+	mirror.apply('childNodeInserted', {'parentNodeId': 3, 'previousNodeId': 4, 'node': element(30, 'IFRAME')})
+	await mirror.get_document()
+	assert dom.get_document_calls == 3
+
+	mirror.apply('documentUpdated', {})
+	await mirror.get_document()
+	assert dom.get_document_calls == 4
+
+
+async def test_reset_bindings_are_detected():
+	mirror, dom = make_mirror()
+	await mirror.get_document()
+
+	# Another caller ran DOM.getDocument on the same session, discarding our node ids
+	dom.bindings_reset = True
+	await mirror.get_document()
+
+	assert dom.get_document_calls == 2
+	assert mirror.valid
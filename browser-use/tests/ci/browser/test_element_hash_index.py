@@ -0,0 +1,29 @@
+"""
+Tests for cached element hashes and the element hash -> selector index map on SerializedDOMState.
+"""
+
+from browser_use.dom.views import SerializedDOMState
+from tests.ci.conftest import create_dom_node
+
+
+def test_hashes_are_computed_once():
+	form = create_dom_node(1, 'form')
+	button = create_dom_node(2, 'button', form, attributes={'name': 'submit'})
+
+	assert button._element_hash is None
+	element_hash = button.__hash__()
+	assert button._element_hash == element_hash
+	assert button.element_hash == hash(button)
+	assert button.parent_branch_hash() == button._parent_branch_hash
+
+
+def test_hash_index_maps_to_selector_indices():
+	form = create_dom_node(1, 'form')
+	first = create_dom_node(2, 'input', form, attributes={'name': 'email'})
+	second = create_dom_node(3, 'input', form, attributes={'name': 'phone'})
+	duplicate = create_dom_node(4, 'input', form, attributes={'name': 'email'})
+	dom_state = SerializedDOMState(_root=None, selector_map={2: first, 3: second, 4: duplicate})
+
+	# Same hash: the first element in selector map order wins, like a linear scan
+	assert dom_state.element_hash_index == {first.element_hash: 2, second.element_hash: 3}
+	assert dom_state.element_hash_index is dom_state.element_hash_index
@@ -0,0 +1,139 @@
+"""
+Tests for batched form filling: fields are resolved concurrently and filled with one
+Runtime.callFunctionOn per frame document, with a result per field in request order.
+"""
+
+from types import SimpleNamespace
+
+from bubus import EventBus
+
+from browser_use.browser.events import FillFormEvent
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.watchdogs.default_action_watchdog import DefaultActionWatchdog
+from browser_use.dom.views import EnhancedDOMTreeNode, NodeType
+from tests.ci.conftest import create_dom_node
+
+
+class FakeCDPSession:
+	"""Resolves every backend node except `detached` and answers fill calls with success per field
+
+	`contexts` maps backend node ids to execution contexts (default 0); like Chrome, a call whose arguments come
+	from another context than its objectId fails.
+	"""
+
+	def __init__(self, session_id: str, detached: set[int] | None = None, contexts: dict[int, int] | None = None):
+		self.session_id = session_id
+		self.detached = detached or set()
+		self.contexts = contexts or {}
+		self.fill_calls: list[dict] = []
+		self.cdp_client = SimpleNamespace(
+			send=SimpleNamespace(
+				DOM=SimpleNamespace(resolveNode=self.resolve_node),
+				Runtime=SimpleNamespace(callFunctionOn=self.call_function_on),
+			)
+		)
+
+	async def resolve_node(self, params, session_id=None):
+		if params['backendNodeId'] in self.detached:
+			raise RuntimeError('No node with given id found')
+		return {'object': {'objectId': f'obj-{params["backendNodeId"]}'}}
+
+	def _context(self, object_id: str) -> int:
+		return self.contexts.get(int(object_id.removeprefix('obj-')), 0)
+
+	async def call_function_on(self, params, session_id=None):
+		self.fill_calls.append(params)
+		context = self._context(params['objectId'])
+		if any(self._context(argument['objectId']) != context for argument in params['arguments'] if 'objectId' in argument):
+			raise RuntimeError('Argument should belong to the same JavaScript world as target object')
+		values = params['arguments'][-1]['value']
+		return {'result': {'type': 'object', 'value': [{'success': True, 'value': value} for value in values]}}
+
+
+def _watchdog(
+	monkeypatch, sessions: dict[str, FakeCDPSession], selector_map: dict[int, EnhancedDOMTreeNode] | None = None
+) -> DefaultActionWatchdog:
+	async def cdp_client_for_node(self, node):
+		return sessions[node.session_id or 'main']
+
+	monkeypatch.setattr(BrowserSession, 'cdp_client_for_node', cdp_client_for_node)
+	browser_session = BrowserSession(browser_profile=BrowserProfile())
+	browser_session.update_cached_selector_map(selector_map or {})
+	return DefaultActionWatchdog(event_bus=EventBus(), browser_session=browser_session)
+
+
+async def test_fields_in_one_frame_are_filled_with_one_call(monkeypatch):
+	main = FakeCDPSession('main')
+	watchdog = _watchdog(monkeypatch, {'main': main})
+	event = FillFormEvent(
+		nodes=[create_dom_node(1, 'input'), create_dom_node(2, 'select'), create_dom_node(3, 'textarea')],
+		values=['Ada Lovelace', 'United Kingdom', 'I enjoy analytical engines.'],
+	)
+
+	results = await watchdog.on_FillFormEvent(event)
+
+	assert len(main.fill_calls) == 1
+	call = main.fill_calls[0]
+	assert call['objectId'] == 'obj-1'
+	assert call['arguments'] == [
+		{'objectId': 'obj-1'},
+		{'objectId': 'obj-2'},
+		{'objectId': 'obj-3'},
+		{'value': ['Ada Lovelace', 'United Kingdom', 'I enjoy analytical engines.']},
+	]
+	assert [result['value'] for result in results] == ['Ada Lovelace', 'United Kingdom', 'I enjoy analytical engines.']
+
+
+async def test_fields_are_grouped_by_frame_and_detached_fields_reported(monkeypatch):
+	main = FakeCDPSession('main', detached={2})
+	iframe = FakeCDPSession('iframe')
+	watchdog = _watchdog(monkeypatch, {'main': main, 'iframe': iframe})
+	event = FillFormEvent(
+		nodes=[create_dom_node(1, 'input'), create_dom_node(2, 'input'), create_dom_node(7, 'input', session_id='iframe')],
+		values=['ada@example.com', 'gone', '4111 1111 1111 1111'],
+	)
+
+	results = await watchdog.on_FillFormEvent(event)
+
+	assert len(main.fill_calls) == 1 and len(iframe.fill_calls) == 1
+	assert main.fill_calls[0]['arguments'][-1] == {'value': ['ada@example.com']}
+	assert iframe.fill_calls[0]['arguments'][-1] == {'value': ['4111 1111 1111 1111']}
+	assert [result['success'] for result in results] == [True, False, True]
+	assert results[1]['error'] == 'Element is no longer in the page'
+
+
+async def test_same_session_iframe_fields_are_filled_in_their_own_context(monkeypatch):
+	# A same-origin iframe shares the page's session but not its execution context
+	page = FakeCDPSession('main', contexts={7: 2})
+	document = create_dom_node(100, '#document', node_type=NodeType.DOCUMENT_NODE)
+	iframe_document = create_dom_node(
+		200, '#document', parent=create_dom_node(150, 'iframe', document), node_type=NodeType.DOCUMENT_NODE
+	)
+	fields = [
+		create_dom_node(1, 'input', document),
+		create_dom_node(7, 'input', iframe_document),
+		create_dom_node(2, 'input', document),
+	]
+	watchdog = _watchdog(monkeypatch, {'main': page}, selector_map={field.backend_node_id: field for field in fields})
+	event = FillFormEvent(nodes=fields, values=['Ada', '4111 1111 1111 1111', 'Lovelace'])
+
+	results = await watchdog.on_FillFormEvent(event)
+
+	assert [call['arguments'][-1] for call in page.fill_calls] == [
+		{'value': ['Ada', 'Lovelace']},
+		{'value': ['4111 1111 1111 1111']},
+	]
+	assert [result['value'] for result in results] == ['Ada', '4111 1111 1111 1111', 'Lovelace']
+
+
+async def test_failed_batch_is_retried_per_field(monkeypatch):
+	# Fields missing from the selector map have no known document, so the first call mixes contexts
+	page = FakeCDPSession('main', contexts={7: 2})
+	watchdog = _watchdog(monkeypatch, {'main': page})
+	event = FillFormEvent(nodes=[create_dom_node(1, 'input'), create_dom_node(7, 'input')], values=['Ada', '4111 1111 1111 1111'])
+
+	results = await watchdog.on_FillFormEvent(event)
+
+	assert len(page.fill_calls) == 3
+	assert [result['value'] for result in results] == ['Ada', '4111 1111 1111 1111']
@@ -0,0 +1,104 @@
+"""
+Tests for concurrent cross-origin iframe capture: frames are fetched in parallel under one time budget,
+slow or failing frames are left out, and oversized frame documents are skipped.
+"""
+
+import asyncio
+import logging
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from browser_use.dom.service import DomService
+from browser_use.dom.views import DOMRect, EnhancedDOMTreeNode, NodeType, TargetAllTrees
+from tests.ci.conftest import create_dom_node
+
+
+def _service(delays: dict[str, float | Exception], iframe_capture_timeout: float = 1.0) -> DomService:
+	all_frames = {f'frame-{target_id}': {'frameTargetId': target_id} for target_id in delays}
+	browser_session = SimpleNamespace(
+		logger=logging.getLogger('test'),
+		session_manager=SimpleNamespace(get_target=lambda target_id: target_id in delays),
+	)
+
+	async def get_all_frames():
+		return all_frames, {}
+
+	browser_session.get_all_frames = get_all_frames
+	service = DomService(browser_session, iframe_capture_timeout=iframe_capture_timeout)  # type: ignore[arg-type]
+
+	async def get_dom_tree(target_id, iframe_deadline=None, **kwargs):
+		assert iframe_deadline is not None
+		delay = delays[target_id]
+		if isinstance(delay, Exception):
+			raise delay
+		await asyncio.sleep(delay)
+		return create_dom_node(hash(target_id) % 1000, '#document', node_type=NodeType.DOCUMENT_NODE), {}
+
+	service.get_dom_tree = get_dom_tree  # type: ignore[method-assign]
+	return service
+
+
+def _iframes(*target_ids: str) -> list[tuple[EnhancedDOMTreeNode, str, DOMRect]]:
+	return [(create_dom_node(i, 'iframe'), f'frame-{target_id}', DOMRect(0, 0, 0, 0)) for i, target_id in enumerate(target_ids)]
+
+
+async def test_iframes_are_captured_concurrently():
+	service = _service({'a': 0.2, 'b': 0.2, 'c': 0.2})
+	iframes = _iframes('a', 'b', 'c')
+
+	start = time.monotonic()
+	await service._capture_cross_origin_iframes(iframes, None, 0, None)
+
+	assert time.monotonic() - start < 0.5
+	for iframe_node, _, _ in iframes:
+		assert iframe_node.content_document is not None
+		assert iframe_node.content_document.parent_node is iframe_node
+
+
+async def test_slow_and_failing_frames_are_left_out():
+	service = _service({'fast': 0.0, 'slow': 10.0, 'broken': RuntimeError('target detached')}, iframe_capture_timeout=0.3)
+	fast, slow, broken = iframes = _iframes('fast', 'slow', 'broken')
+
+	start = time.monotonic()
+	await service._capture_cross_origin_iframes(iframes, None, 0, None)
+
+	assert time.monotonic() - start < 1.0
+	assert fast[0].content_document is not None
+	assert slow[0].content_document is None
+	assert broken[0].content_document is None
+
+
+async def test_skipped_frames_are_not_reported_as_background_errors(caplog):
+	loop_errors = []
+	asyncio.get_running_loop().set_exception_handler(lambda loop, context: loop_errors.append(context))
+	service = _service({'ad': ValueError('iframe document has 50000 nodes (max_iframe_nodes: 20000)')})
+	(ad,) = iframes = _iframes('ad')
+
+	with caplog.at_level(logging.DEBUG, logger='test'):
+		await service._capture_cross_origin_iframes(iframes, None, 0, None)
+		await asyncio.sleep(0)
+
+	assert ad[0].content_document is None
+	assert [record.levelno for record in caplog.records] == [logging.DEBUG, logging.DEBUG]
+	assert 'Skipping cross-origin iframe frame-ad: iframe document has 50000 nodes' in caplog.text
+	assert loop_errors == []
+
+
+async def test_oversized_iframe_documents_are_rejected():
+	service = DomService(SimpleNamespace(logger=logging.getLogger('test')), max_iframe_nodes=10)  # type: ignore[arg-type]
+
+	async def get_all_trees(target_id):
+		return TargetAllTrees(
+			snapshot={'documents': [{'nodes': {'nodeType': [1] * 11}}], 'strings': []},  # type: ignore[typeddict-item]
+			dom_tree={'root': {}},  # type: ignore[typeddict-item]
+			ax_tree={'nodes': []},
+			device_pixel_ratio=1.0,
+			cdp_timing={},
+		)
+
+	service._get_all_trees = get_all_trees  # type: ignore[method-assign]
+
+	with pytest.raises(ValueError, match='max_iframe_nodes'):
+		await service.get_dom_tree('iframe-target', iframe_depth=1)
@@ -0,0 +1,147 @@
+"""Tests for isolated browser contexts (several BrowserSessions sharing one Chrome)."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser.profile import ProxySettings
+from browser_use.browser.session_manager import SessionManager
+
+
+class StubCDP:
+	"""Records the Target commands the session sends."""
+
+	def __init__(self) -> None:
+		self.calls: list[tuple[str, dict[str, Any] | None]] = []
+
+		outer = self
+
+		class _TargetSend:
+			async def createBrowserContext(self, params: dict) -> dict:
+				outer.calls.append(('createBrowserContext', params))
+				return {'browserContextId': 'ctx-1'}
+
+			async def disposeBrowserContext(self, params: dict) -> None:
+				outer.calls.append(('disposeBrowserContext', params))
+
+			async def detachFromTarget(self, params: dict) -> None:
+				outer.calls.append(('detachFromTarget', params))
+
+		class _Send:
+			Target = _TargetSend()
+
+		self.send = _Send()
+
+	async def stop(self) -> None:
+		self.calls.append(('stop', None))
+
+
+def _make_session(**kwargs) -> tuple[BrowserSession, StubCDP]:
+	session = BrowserSession(
+		browser_profile=BrowserProfile(cdp_url='ws://127.0.0.1:9222/devtools/browser/x', isolated_context=True, **kwargs)
+	)
+	stub = StubCDP()
+	session._cdp_client_root = stub  # type: ignore
+	return session, stub
+
+
+async def test_isolated_context_created_with_per_context_proxy():
+	session, stub = _make_session(proxy=ProxySettings(server='http://proxy.local:8080', bypass='localhost'))
+
+	await session._create_isolated_browser_context()
+
+	assert session.browser_context_id == 'ctx-1'
+	assert stub.calls == [
+		(
+			'createBrowserContext',
+			{'disposeOnDetach': True, 'proxyServer': 'http://proxy.local:8080', 'proxyBypassList': 'localhost'},
+		)
+	]
+	assert session._in_browser_context({'url': 'about:blank'}) == {'url': 'about:blank', 'browserContextId': 'ctx-1'}
+
+
+async def test_default_context_leaves_create_target_params_untouched():
+	session = BrowserSession(cdp_url='ws://127.0.0.1:9222/devtools/browser/x')
+
+	assert session.browser_context_id is None
+	assert session._in_browser_context({'url': 'about:blank'}) == {'url': 'about:blank'}
+
+
+async def test_session_manager_ignores_targets_from_other_contexts():
+	session, stub = _make_session()
+	await session._create_isolated_browser_context()
+	manager = SessionManager(session)
+
+	assert manager.owns_target({'targetId': 'a', 'browserContextId': 'ctx-1'})
+	assert not manager.owns_target({'targetId': 'b', 'browserContextId': 'ctx-other'})
+
+	await manager._handle_target_attached(
+		{
+			'sessionId': 'foreign-session',
+			'targetInfo': {'targetId': 'b', 'type': 'page', 'url': 'https://other.example', 'browserContextId': 'ctx-other'},
+			'waitingForDebugger': False,
+		}  # type: ignore[arg-type]
+	)
+
+	# Not tracked, and we let go of it
+	assert manager.get_all_target_ids() == []
+	assert ('detachFromTarget', {'sessionId': 'foreign-session'}) in stub.calls
+
+	# Its detach event is swallowed instead of being treated as an unknown session
+	await manager._handle_target_detached({'sessionId': 'foreign-session'})  # type: ignore[arg-type]
+	assert 'foreign-session' not in manager._foreign_sessions
+
+
+async def test_reset_disposes_isolated_context():
+	session, stub = _make_session()
+	await session._create_isolated_browser_context()
+
+	await session.reset()
+
+	assert ('disposeBrowserContext', {'browserContextId': 'ctx-1'}) in stub.calls
+	assert ('stop', None) in stub.calls
+	assert session.browser_context_id is None
+
+
+async def test_proxy_auth_is_scoped_to_own_targets():
+	session, stub = _make_session(proxy=ProxySettings(server='http://proxy.local:8080', username='user', password='pass'))
+	await session._create_isolated_browser_context()
+	fetch_calls: list[tuple[str, dict, str | None]] = []
+	handlers: dict[str, Any] = {}
+
+	class _FetchSend:
+		async def enable(self, params: dict, session_id: str | None = None) -> None:
+			fetch_calls.append(('enable', params, session_id))
+
+		async def continueWithAuth(self, params: dict, session_id: str | None = None) -> None:
+			fetch_calls.append(('continueWithAuth', params, session_id))
+
+	class _FetchRegister:
+		def authRequired(self, callback) -> None:
+			handlers['authRequired'] = callback
+
+		def requestPaused(self, callback) -> None:
+			handlers['requestPaused'] = callback
+
+	stub.send.Fetch = _FetchSend()  # type: ignore[attr-defined]
+	stub.register = SimpleNamespace(Fetch=_FetchRegister())  # type: ignore[attr-defined]
+	session.session_manager = SimpleNamespace(  # type: ignore[assignment]
+		get_all_target_ids=lambda: ['own-page'],
+		_get_session_for_target=lambda target_id: SimpleNamespace(session_id='own-session'),
+		get_target_id_from_session_id={'own-session': 'own-page'}.get,
+	)
+
+	await session._setup_proxy_auth()
+
+	# Fetch is never enabled browser-wide, only on our own target's session
+	assert [(name, session_id) for name, _, session_id in fetch_calls] == [('enable', 'own-session')]
+
+	# Challenges from sessions we do not own are not answered with our credentials
+	handlers['authRequired']({'requestId': 'r1', 'authChallenge': {'source': 'Proxy'}}, session_id=None)
+	handlers['authRequired']({'requestId': 'r2', 'authChallenge': {'source': 'Proxy'}}, session_id='foreign-session')
+	handlers['authRequired']({'requestId': 'r3', 'authChallenge': {'source': 'Proxy'}}, session_id='own-session')
+	await asyncio.sleep(0.05)
+
+	answered = [(params['requestId'], session_id) for name, params, session_id in fetch_calls if name == 'continueWithAuth']
+	assert answered == [('r3', 'own-session')]
@@ -0,0 +1,65 @@
+"""
+Tests for the single round-trip page introspection used by browser state requests.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from browser_use.browser.introspection import PAGE_INTROSPECTION_JS, PageIntrospection, introspect_page
+
+VALUE = {
+	'ready_state': 'interactive',
+	'title': 'Apply - Greenhouse',
+	'device_pixel_ratio': 2,
+	'viewport_width': 1280,
+	'viewport_height': 720,
+	'page_width': 1280,
+	'page_height': 3000,
+	'scroll_x': 0,
+	'scroll_y': 500,
+	'iframe_scroll_positions': {'0': {'scrollTop': 10, 'scrollLeft': 0}},
+	'pending_requests': [{'url': 'https://boards.example/api/form', 'loading_duration_ms': 120, 'resource_type': 'fetch'}],
+}
+
+
+class FakeRuntime:
+	def __init__(self, result):
+		self.result = result
+		self.calls = []
+
+	async def evaluate(self, params, session_id):
+		self.calls.append(params)
+		return self.result
+
+
+def _cdp_session(result):
+	runtime = FakeRuntime(result)
+	return SimpleNamespace(cdp_client=SimpleNamespace(send=SimpleNamespace(Runtime=runtime)), session_id='s1'), runtime
+
+
+def test_page_info_is_derived_from_introspection():
+	introspection = PageIntrospection.from_value(VALUE)
+
+	assert introspection.pending_requests[0].url == 'https://boards.example/api/form'
+	assert introspection.pending_requests[0].method == 'GET'
+	page_info = introspection.page_info
+	assert (page_info.pixels_above, page_info.pixels_below) == (500, 1780)
+	assert (page_info.pixels_left, page_info.pixels_right) == (0, 0)
+
+
+async def test_introspection_is_one_evaluate_call():
+	cdp_session, runtime = _cdp_session({'result': {'type': 'object', 'value': VALUE}})
+
+	introspection = await introspect_page(cdp_session)  # type: ignore[arg-type]
+
+	assert introspection.device_pixel_ratio == 2.0
+	assert introspection.iframe_scroll_positions == {'0': {'scrollTop': 10, 'scrollLeft': 0}}
+	assert runtime.calls == [{'expression': PAGE_INTROSPECTION_JS, 'returnByValue': True}]
+
+
+async def test_failed_introspection_raises():
+	cdp_session, _ = _cdp_session({'result': {'type': 'object'}, 'exceptionDetails': {'text': 'Uncaught'}})
+
+	with pytest.raises(RuntimeError, match='Page introspection failed'):
+		await introspect_page(cdp_session)  # type: ignore[arg-type]
@@ -0,0 +1,89 @@
+"""
+Tests for event-driven page readiness: a page counts as settled once the main frame stopped loading, no request is
+in flight and no activity happened for the quiet period, with a hard ceiling for pages that never settle.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from bubus import EventBus
+
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.readiness import PageActivity
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.watchdogs.dom_watchdog import DOMWatchdog
+
+TARGET_ID = 'ABCD1234ABCD1234ABCD1234ABCD1234ABCD1234'
+
+
+async def test_quiet_page_settles_after_the_quiet_period_from_the_action():
+	activity = PageActivity()
+	await asyncio.sleep(0.05)
+
+	# Activity before the wait already counts
+	start = time.monotonic()
+	assert await activity.wait_until_settled(quiet_period=0.05, timeout=1.0)
+	assert time.monotonic() - start < 0.03
+
+	# Quiet time before the action does not
+	start = time.monotonic()
+	assert await activity.wait_until_settled(quiet_period=0.05, timeout=1.0, since=start)
+	assert 0.05 <= time.monotonic() - start < 0.2
+
+
+async def test_waits_for_loading_and_requests_to_finish():
+	activity = PageActivity()
+	activity.loading_started()
+	activity.request_started('document', 'Document')
+	activity.request_started('socket', 'WebSocket')  # long-lived, never finishes
+
+	async def page_loads():
+		await asyncio.sleep(0.1)
+		activity.request_finished('document')
+		activity.request_started('xhr', 'XHR')
+		activity.loading_stopped()
+		await asyncio.sleep(0.1)
+		activity.request_finished('xhr')
+
+	start = time.monotonic()
+	loading = asyncio.create_task(page_loads())
+	assert await activity.wait_until_settled(quiet_period=0.05, timeout=2.0)
+	await loading
+	assert 0.25 <= time.monotonic() - start < 0.5
+
+
+async def test_never_settling_page_hits_the_ceiling_and_stale_requests_stop_counting():
+	activity = PageActivity(stale_request_timeout=0.2)
+	activity.request_started('long-poll', 'XHR')
+
+	start = time.monotonic()
+	assert not await activity.wait_until_settled(quiet_period=0.05, timeout=0.1)
+	assert time.monotonic() - start < 0.2
+
+	# The long poll stops counting once it is older than stale_request_timeout
+	assert await activity.wait_until_settled(quiet_period=0.05, timeout=1.0)
+	assert activity.pending_requests == 0
+
+
+async def test_watchdog_routes_cdp_events_to_the_page_of_the_session():
+	browser_session = BrowserSession(browser_profile=BrowserProfile(page_settle_quiet_period=0.05))
+	sessions = {'page-session': TARGET_ID, 'other-session': 'OTHER'}
+	browser_session.session_manager = SimpleNamespace(get_target_id_from_session_id=sessions.get)  # type: ignore[assignment]
+	watchdog = DOMWatchdog(event_bus=EventBus(), browser_session=browser_session)
+	watchdog._page_activity[TARGET_ID] = activity = PageActivity()
+
+	watchdog._on_frame_started_loading({'frameId': TARGET_ID}, session_id='page-session')
+	watchdog._on_request_will_be_sent({'requestId': '1', 'type': 'Script'}, session_id='page-session')
+	watchdog._on_request_will_be_sent({'requestId': '2', 'type': 'Script'}, session_id='other-session')
+	assert activity.loading and activity.pending_requests == 1
+
+	waiting = asyncio.create_task(watchdog.wait_for_page_settled(TARGET_ID, timeout=1.0))
+	watchdog._on_loading_finished({'requestId': '1'}, session_id='page-session')
+	watchdog._on_frame_stopped_loading({'frameId': TARGET_ID}, session_id='page-session')
+	watchdog._on_binding_called({'name': '__browserUseDocumentChanged', 'payload': 'doc1:3'}, session_id='page-session')
+	assert await waiting
+	assert watchdog._document_versions[TARGET_ID] == 'doc1:3'
+
+	# Untracked pages do not block
+	assert not await watchdog.wait_for_page_settled('UNKNOWN', timeout=1.0)
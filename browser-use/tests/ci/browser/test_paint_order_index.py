@@ -0,0 +1,37 @@
+"""
+Tests for RectUnionGrid: it must keep exactly the same disjoint union as RectUnionPure,
+including degenerate (zero-area) rectangles and rectangles spanning many grid cells.
+"""
+
+import random
+
+import pytest
+
+from browser_use.dom.serializer.paint_order import Rect, RectUnionGrid, RectUnionPure
+
+
+@pytest.mark.parametrize('cell_size', [16.0, 256.0])
+@pytest.mark.parametrize('seed', range(5))
+def test_grid_union_matches_pure_union(seed, cell_size):
+	rng = random.Random(seed)
+	pure, grid = RectUnionPure(), RectUnionGrid(cell_size=cell_size)
+
+	for _ in range(300):
+		x, y = rng.randint(-50, 900), rng.randint(-50, 3000)
+		width = rng.choice([0, rng.randint(1, 300), rng.randint(1, 2000)])
+		rect = Rect(x, y, x + width, y + rng.randint(0, 400))
+
+		assert grid.contains(rect) == pure.contains(rect)
+		assert grid.add(rect) == pure.add(rect)
+
+	assert grid._rects == pure._rects
+
+
+def test_page_sized_rects_cover_everything_below():
+	grid = RectUnionGrid(cell_size=10.0)
+	grid.add(Rect(0, 0, 1920, 50000))
+
+	assert grid._large == [0]
+	assert grid.contains(Rect(100, 40000, 200, 40100))
+	assert not grid.contains(Rect(1900, 100, 1930, 120))
+	assert not grid.add(Rect(5, 5, 10, 10))
@@ -0,0 +1,133 @@
+"""
+Tests for subtree-memoized DOMTreeSerializer.serialize_tree: output is unchanged and unchanged subtrees are reused.
+"""
+
+import tracemalloc
+
+from browser_use.dom.serializer import serializer
+from browser_use.dom.serializer.serializer import DOMTreeSerializer, _LRUCache
+from browser_use.dom.views import EnhancedSnapshotNode, NodeType, SimplifiedNode
+from tests.ci.conftest import create_dom_node
+
+INCLUDE_ATTRIBUTES = ['name', 'aria-label']
+
+
+def _visible() -> EnhancedSnapshotNode:
+	"""The serializer only renders nodes that have layout data"""
+	return EnhancedSnapshotNode(None, None, None, None, None, None, None, None)
+
+
+def _text(backend_node_id: int, value: str) -> SimplifiedNode:
+	return SimplifiedNode(
+		original_node=create_dom_node(
+			backend_node_id, '#text', node_type=NodeType.TEXT_NODE, value=value, snapshot_node=_visible()
+		),
+		children=[],
+	)
+
+
+def _input(backend_node_id: int, name: str) -> SimplifiedNode:
+	return SimplifiedNode(
+		original_node=create_dom_node(backend_node_id, 'input', attributes={'name': name}, snapshot_node=_visible()),
+		children=[],
+		is_interactive=True,
+	)
+
+
+def _form(email_label: str) -> SimplifiedNode:
+	section = SimplifiedNode(
+		original_node=create_dom_node(3, 'div', snapshot_node=_visible()),
+		children=[_text(4, email_label), _input(5, 'email')],
+	)
+	button = SimplifiedNode(
+		original_node=create_dom_node(6, 'button', attributes={'aria-label': 'Submit'}, snapshot_node=_visible()),
+		children=[_text(7, 'Submit application')],
+		is_interactive=True,
+	)
+	return SimplifiedNode(original_node=create_dom_node(1, 'form', snapshot_node=_visible()), children=[section, button])
+
+
+def test_output_matches_tree_layout():
+	text = DOMTreeSerializer.serialize_tree(_form('Email'), INCLUDE_ATTRIBUTES)
+
+	assert text == '\n'.join(
+		[
+			'Email',
+			'[5]<input name=email />',
+			'[6]<button aria-label=Submit />',
+			'\tSubmit application',
+		]
+	)
+
+
+def test_unchanged_subtrees_are_reused(monkeypatch):
+	DOMTreeSerializer.serialize_tree(_form('Email'), INCLUDE_ATTRIBUTES)
+
+	built = []
+	build_line = DOMTreeSerializer._build_line
+
+	def counting_build_line(node, line_key, include_attributes, depth_str):
+		built.append(line_key[0])
+		return build_line(node, line_key, include_attributes, depth_str)
+
+	monkeypatch.setattr(DOMTreeSerializer, '_build_line', staticmethod(counting_build_line))
+
+	# Freshly built but identical tree: every line and fragment comes from the cache
+	assert DOMTreeSerializer.serialize_tree(_form('Email'), INCLUDE_ATTRIBUTES).startswith('Email\n')
+	assert built == []
+
+	# Only the changed text line is built, the input and button lines are reused
+	changed = DOMTreeSerializer.serialize_tree(_form('Work email'), INCLUDE_ATTRIBUTES)
+	assert changed.splitlines()[:2] == ['Work email', '[5]<input name=email />']
+	assert built == ['text']
+
+	# Different depth or attribute selection never hits another entry
+	assert DOMTreeSerializer.serialize_tree(_form('Email'), INCLUDE_ATTRIBUTES, depth=1).startswith('\tEmail\n')
+	assert '<input />' in DOMTreeSerializer.serialize_tree(_form('Email'), ['aria-label'])
+
+
+def test_equal_subtrees_share_one_fragment():
+	include_key = tuple(INCLUDE_ATTRIBUTES)
+	first = DOMTreeSerializer._serialize_subtree(_form('Email'), INCLUDE_ATTRIBUTES, include_key, 0)
+	second = DOMTreeSerializer._serialize_subtree(_form('Email'), INCLUDE_ATTRIBUTES, include_key, 0)
+	other = DOMTreeSerializer._serialize_subtree(_form('Phone'), INCLUDE_ATTRIBUTES, include_key, 0)
+
+	# Parent keys hold these objects, so a match is exact rather than a hash comparison
+	assert first is second
+	assert other is not first
+
+
+def _deep_page(ticker: str, depth: int = 30) -> SimplifiedNode:
+	"""Nested sections with a paragraph each and a ticking clock at the bottom"""
+	node = _text(1000, ticker)
+	for level in range(depth):
+		paragraph = _text(2000 + level, f'Section {level}: ' + 'lorem ipsum dolor sit amet ' * 8)
+		node = SimplifiedNode(
+			original_node=create_dom_node(3000 + level, 'div', snapshot_node=_visible()), children=[paragraph, node]
+		)
+	return node
+
+
+def test_subtree_cache_memory_is_bounded_across_steps(monkeypatch):
+	budget = 200_000
+	monkeypatch.setattr(
+		serializer, '_SUBTREE_CACHE', _LRUCache(max_entries=50_000, max_chars=budget, sizeof=lambda f: len(f.text))
+	)
+	monkeypatch.setattr(serializer, '_LINE_CACHE', _LRUCache(max_entries=50_000, max_chars=budget))
+
+	# Every step changes one text node, so every ancestor gets a new fragment holding most of the page
+	tracemalloc.start()
+	try:
+		for step in range(50):
+			DOMTreeSerializer.serialize_tree(_deep_page(f'00:00:{step:02d}'), INCLUDE_ATTRIBUTES)
+		warmed_up, _ = tracemalloc.get_traced_memory()
+		for step in range(50, 300):
+			text = DOMTreeSerializer.serialize_tree(_deep_page(f'00:{step:04d}'), INCLUDE_ATTRIBUTES)
+		after, _ = tracemalloc.get_traced_memory()
+	finally:
+		tracemalloc.stop()
+
+	assert text.endswith('00:0299')
+	assert serializer._SUBTREE_CACHE.chars <= budget and serializer._LINE_CACHE.chars <= budget
+	# Unbounded, the 250 extra steps would keep ~250 x 30 ancestors x ~6k chars (tens of MB) alive
+	assert after - warmed_up < 2_000_000
@@ -0,0 +1,104 @@
+"""
+Tests for deciding click points and occlusion from the DOM snapshot, and for the document version
+that tells whether the snapshot still matches the page.
+"""
+
+from types import SimpleNamespace
+
+from bubus import EventBus
+
+from browser_use.browser.introspection import PageIntrospection, document_unchanged
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.watchdogs.dom_watchdog import DOMWatchdog
+from browser_use.dom.hit_test import click_point, element_at_point
+from browser_use.dom.views import DOMRect, EnhancedDOMTreeNode, EnhancedSnapshotNode, NodeType
+from tests.ci.conftest import TEST_TARGET_ID, create_dom_node
+
+
+def _node(
+	backend_node_id: int,
+	tag: str,
+	rect: tuple[float, float, float, float] | None = None,
+	paint_order: int | None = None,
+	parent: EnhancedDOMTreeNode | None = None,
+	node_type: NodeType = NodeType.ELEMENT_NODE,
+	**styles: str,
+) -> EnhancedDOMTreeNode:
+	"""Node with a layout snapshot: viewport rect, paint order and computed styles"""
+	position = DOMRect(*rect) if rect else None
+	snapshot_node = None
+	if paint_order is not None:
+		snapshot_node = EnhancedSnapshotNode(
+			is_clickable=None,
+			cursor_style=None,
+			bounds=position,
+			clientRects=None,
+			scrollRects=None,
+			computed_styles={name.replace('_', '-'): value for name, value in styles.items()},
+			paint_order=paint_order,
+			stacking_contexts=None,
+		)
+	return create_dom_node(backend_node_id, tag, parent, node_type=node_type, position=position, snapshot_node=snapshot_node)
+
+
+def _page():
+	document = _node(1, '#document', node_type=NodeType.DOCUMENT_NODE)
+	html = _node(2, 'html', (0, 0, 1280, 2000), 0, document)
+	body = _node(3, 'body', (0, 0, 1280, 2000), 0, html)
+	button = _node(4, 'button', (100, 100, 200, 40), 2, body)
+	return document, body, button
+
+
+def test_uncovered_element_is_clicked_at_its_center():
+	document, _, button = _page()
+
+	assert click_point(document, button, 1280, 720) == (200, 120)
+
+
+def test_covering_element_defers_to_live_page():
+	document, body, button = _page()
+	_node(5, 'div', (0, 0, 1280, 720), 9, body)  # cookie banner painted above the button
+
+	assert element_at_point(document, 200, 120).backend_node_id == 5  # type: ignore[union-attr]
+	assert click_point(document, button, 1280, 720) is None
+
+	# Overlays that let clicks through do not count
+	document, body, button = _page()
+	_node(5, 'div', (0, 0, 1280, 720), 9, body, pointer_events='none')
+	assert click_point(document, button, 1280, 720) == (200, 120)
+
+
+def test_scrolled_out_and_clipped_elements():
+	document, body, _ = _page()
+	below_fold = _node(6, 'a', (100, 900, 100, 20), 3, body)
+	assert click_point(document, below_fold, 1280, 720) is None
+
+	# Only the part of the button inside its overflow container is clickable
+	container = _node(7, 'div', (0, 300, 400, 100), 1, body, overflow='hidden')
+	button = _node(8, 'button', (300, 300, 200, 40), 4, container)
+	assert click_point(document, button, 1280, 720) == (350, 320)
+
+
+def test_document_version_comparison():
+	assert document_unchanged('doc1:5', 'doc1:5')
+	# A report of a change made before the capture can arrive late
+	assert document_unchanged('doc1:5', 'doc1:3')
+	assert not document_unchanged('doc1:5', 'doc1:6')
+	assert not document_unchanged('doc1:5', 'doc2:0')
+	assert not document_unchanged(None, 'doc1:5')
+
+
+def test_watchdog_uses_snapshot_only_for_unchanged_document():
+	document, _, button = _page()
+	watchdog = DOMWatchdog(event_bus=EventBus(), browser_session=BrowserSession(browser_profile=BrowserProfile()))
+	watchdog.enhanced_dom_tree = document
+	watchdog.selector_map = {button.backend_node_id: button}
+	introspection = PageIntrospection.from_value({'viewport_width': 1280, 'viewport_height': 720, 'dom_version': 'doc1:5'})
+	watchdog._dom_service = SimpleNamespace(page_introspection=introspection)  # type: ignore[assignment]
+
+	watchdog._document_versions[TEST_TARGET_ID] = 'doc1:5'
+	assert watchdog.snapshot_click_point(button) == (200, 120)
+
+	watchdog._document_versions[TEST_TARGET_ID] = 'doc1:6'
+	assert watchdog.snapshot_click_point(button) is None
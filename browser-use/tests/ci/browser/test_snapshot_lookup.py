@@ -0,0 +1,101 @@
+"""
+Tests for build_snapshot_lookup: device pixel scaling, layout joins, lazy node creation and
+lazy decoding of layout fields, with and without NumPy.
+"""
+
+import pytest
+
+from browser_use.dom import enhanced_snapshot
+from browser_use.dom.enhanced_snapshot import REQUIRED_COMPUTED_STYLES, build_snapshot_lookup
+from browser_use.dom.views import _UNDECODED, DOMRect, EnhancedSnapshotNode
+
+STRINGS = ['pointer', 'block', 'visible', 'auto']
+
+
+def style_row(cursor: int) -> list[int]:
+	row = [-1] * len(REQUIRED_COMPUTED_STYLES)
+	row[REQUIRED_COMPUTED_STYLES.index('display')] = 1
+	row[REQUIRED_COMPUTED_STYLES.index('cursor')] = cursor
+	return row
+
+
+SNAPSHOT = {
+	'strings': STRINGS,
+	'documents': [
+		{
+			'nodes': {'backendNodeId': [10, 11, 12, 13], 'isClickable': {'index': [2]}},
+			'layout': {
+				# node 2 appears twice: the first layout node wins; node 3 has no layout
+				'nodeIndex': [0, 2, 1, 2],
+				'bounds': [[0, 0, 200, 100], [20, 40, 60, 30], [2, 4, 6, 8], [0, 0, 1, 1]],
+				'styles': [style_row(3), style_row(0), style_row(3), style_row(3)],
+				'paintOrders': [0, 5, 3, 9],
+				'clientRects': [[], [10, 20, 30, 15], [], []],
+				'scrollRects': [[0, 50, 200, 400], [], [], []],
+				'stackingContexts': {'index': [0]},
+			},
+		}
+	],
+}
+
+
+@pytest.fixture(params=[True, False], ids=['numpy', 'python'])
+def numpy_available(request, monkeypatch):
+	if request.param and not enhanced_snapshot.NUMPY_AVAILABLE:
+		pytest.skip('numpy not installed')
+	monkeypatch.setattr(enhanced_snapshot, 'NUMPY_AVAILABLE', request.param)
+	return request.param
+
+
+def test_nodes_are_joined_to_their_first_layout_node(numpy_available):
+	lookup = build_snapshot_lookup(SNAPSHOT, device_pixel_ratio=2.0)  # type: ignore[arg-type]
+
+	assert len(lookup) == 4
+	button = lookup[12]
+	assert button.is_clickable is True
+	assert button.bounds == DOMRect(x=10, y=20, width=30, height=15)
+	assert button.clientRects == DOMRect(x=10, y=20, width=30, height=15)
+	assert button.cursor_style == 'pointer'
+	assert button.computed_styles == {'display': 'block', 'cursor': 'pointer'}
+	assert button.paint_order == 5
+
+	root = lookup[10]
+	assert root.is_clickable is False
+	assert root.scrollRects == DOMRect(x=0, y=50, width=200, height=400)
+	assert root.clientRects is None
+	assert root.stacking_contexts == 0
+
+	no_layout = lookup[13]
+	assert no_layout.bounds is None and no_layout.computed_styles is None and no_layout.paint_order is None
+
+
+def test_nodes_are_created_once_on_first_lookup(numpy_available):
+	lookup = build_snapshot_lookup(SNAPSHOT)  # type: ignore[arg-type]
+
+	assert lookup.get(11) is lookup.get(11)
+	assert lookup.get(999) is None
+	assert [key for key, entry in lookup._entries.items() if not isinstance(entry, int)] == [11]
+
+
+def test_layout_fields_decode_on_first_access(numpy_available):
+	lookup = build_snapshot_lookup(SNAPSHOT)  # type: ignore[arg-type]
+	button = lookup[12]
+
+	# Single styles are read straight from the shared columns
+	assert button.style('display') == 'block'
+	assert button.style('visibility', 'visible') == 'visible'
+	assert button._computed_styles is _UNDECODED
+	assert button.bounds is button.bounds
+
+	eager = EnhancedSnapshotNode(
+		is_clickable=True,
+		cursor_style='pointer',
+		bounds=DOMRect(x=20, y=40, width=60, height=30),
+		clientRects=DOMRect(x=10, y=20, width=30, height=15),
+		scrollRects=None,
+		computed_styles={'display': 'block', 'cursor': 'pointer'},
+		paint_order=5,
+		stacking_contexts=None,
+	)
+	assert button == eager
+	assert button.to_dict()['bounds'] == {'x': 20, 'y': 40, 'width': 60, 'height': 30}
@@ -0,0 +1,122 @@
+"""
+Tests for bulk text entry: resolving the input mode per field and domain, Input.insertText dispatch,
+reading back the field value to verify it, and the fallback to key typing.
+"""
+
+from types import SimpleNamespace
+
+from bubus import EventBus
+
+from browser_use.browser.cdp_pipeline import CDPPipeline
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.watchdogs.default_action_watchdog import DefaultActionWatchdog
+from tests.ci.conftest import create_dom_node
+
+
+class FakeCDP:
+	"""Records CDP commands sent through cdp_client.send.<Domain>.<method>"""
+
+	def __init__(self, value: str = ''):
+		self.calls: list[tuple[str, dict]] = []
+		self.value = value
+		self.cdp_client = SimpleNamespace(send=self)
+		self.session_id = 'session'
+
+	def pipeline(self) -> CDPPipeline:
+		return CDPPipeline()
+
+	def __getattr__(self, domain: str):
+		fake = self
+
+		class Domain:
+			def __getattr__(self, method: str):
+				async def command(params=None, session_id=None):
+					fake.calls.append((f'{domain}.{method}', params or {}))
+					return {'result': {'type': 'string', 'value': fake.value}}
+
+				return command
+
+		return Domain()
+
+
+def _watchdog(**profile_kwargs) -> DefaultActionWatchdog:
+	browser_session = BrowserSession(browser_profile=BrowserProfile(**profile_kwargs))
+	return DefaultActionWatchdog(event_bus=EventBus(), browser_session=browser_session)
+
+
+def test_mode_is_adjusted_to_the_element():
+	resolve = DefaultActionWatchdog._resolve_text_input_mode
+
+	assert resolve(create_dom_node(1, 'textarea'), 'Dear team,\nI am applying', 'insert') == 'insert'
+	# Enter in a single-line field has to stay a key press
+	assert resolve(create_dom_node(1, 'input', attributes={'type': 'search'}), 'engineer\n', 'insert') == 'keys'
+	assert resolve(create_dom_node(1, 'div', attributes={'contenteditable': 'true'}), 'cover letter', 'value') == 'insert'
+	assert resolve(create_dom_node(1, 'input'), 'Ada', 'value') == 'value'
+
+
+async def test_domain_overrides_profile_mode(monkeypatch):
+	watchdog = _watchdog(text_input_mode='keys', text_input_mode_by_domain={'*.greenhouse.io': 'insert'})
+
+	async def current_url(self):
+		return 'https://boards.greenhouse.io/acme/jobs/1'
+
+	monkeypatch.setattr(BrowserSession, 'get_current_page_url', current_url)
+	assert await watchdog._text_input_mode_for_page() == 'insert'
+
+	async def other_url(self):
+		return 'https://jobs.lever.co/acme/1'
+
+	monkeypatch.setattr(BrowserSession, 'get_current_page_url', other_url)
+	assert await watchdog._text_input_mode_for_page() == 'keys'
+
+
+async def test_insert_text_is_one_command_per_line():
+	watchdog = _watchdog()
+	cdp = FakeCDP()
+
+	await watchdog._insert_text(cdp, 'x' * 2000, newline_as_enter=False)
+	assert cdp.calls == [('Input.insertText', {'text': 'x' * 2000})]
+
+	cdp.calls.clear()
+	await watchdog._insert_text(cdp, 'python\nrust', newline_as_enter=True)
+	assert [method for method, _ in cdp.calls] == [
+		'Input.insertText',
+		'Input.dispatchKeyEvent',
+		'Input.dispatchKeyEvent',
+		'Input.dispatchKeyEvent',
+		'Input.insertText',
+	]
+	assert cdp.calls[-1][1] == {'text': 'rust'}
+
+
+async def test_value_is_verified_after_entry():
+	watchdog = _watchdog()
+
+	assert await watchdog._text_value_matches('obj', 'Ada Lovelace', True, FakeCDP('Ada Lovelace'))
+	assert not await watchdog._text_value_matches('obj', '5551234567', True, FakeCDP('(555) 123-4567'))
+	# Without clearing, the text only has to end the value
+	assert await watchdog._text_value_matches('obj', ' Lovelace', False, FakeCDP('Ada Lovelace'))
+
+
+async def test_uncleared_field_is_restored_before_retyping():
+	watchdog = _watchdog()
+	cdp = FakeCDP()
+
+	await watchdog._retype_text(create_dom_node(1, 'input'), 'obj', '42', False, 'Phone: ', cdp)
+
+	# The bulk-entered text is replaced by the value from before the input, then the text is typed once
+	method, params = cdp.calls[0]
+	assert method == 'Runtime.callFunctionOn'
+	assert params['arguments'] == [{'value': 'Phone: '}, {'value': False}]
+	typed = [params['text'] for method, params in cdp.calls if params.get('type') == 'char']
+	assert typed == ['4', '2']
+
+
+async def test_unrestorable_field_keeps_the_entered_text():
+	watchdog = _watchdog()
+	cdp = FakeCDP()
+
+	await watchdog._retype_text(create_dom_node(1, 'div', attributes={'contenteditable': 'true'}), 'obj', '42', False, None, cdp)
+
+	assert cdp.calls == []
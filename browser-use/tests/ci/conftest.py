@@ -20,6 +20,7 @@ socketserver.ThreadingMixIn.block_on_close = False
 socketserver.ThreadingMixIn.daemon_threads = True
 
 from browser_use.agent.views import AgentOutput
+from browser_use.dom.views import DOMRect, EnhancedDOMTreeNode, EnhancedSnapshotNode, NodeType
 from browser_use.llm import BaseChatModel
 from browser_use.llm.views import ChatInvokeCompletion
 from browser_use.tools.service import Tools
@@ -72,6 +73,58 @@ def setup_test_environment():
 			os.environ[key] = value
 
 
+TEST_TARGET_ID = 'ABCD1234ABCD1234ABCD1234ABCD1234ABCD1234'
+
+
+# not a fixture, a helper so unit tests can build small DOM trees without a browser
+def create_dom_node(
+	backend_node_id: int,
+	tag: str = 'div',
+	parent: EnhancedDOMTreeNode | None = None,
+	*,
+	node_type: NodeType = NodeType.ELEMENT_NODE,
+	value: str = '',
+	attributes: dict[str, str] | None = None,
+	position: DOMRect | None = None,
+	session_id: str | None = None,
+	target_id: str = TEST_TARGET_ID,
+	snapshot_node: EnhancedSnapshotNode | None = None,
+) -> EnhancedDOMTreeNode:
+	"""Create an EnhancedDOMTreeNode (node_id = backend_node_id), appended to the children of `parent` if given.
+
+	Args:
+		backend_node_id: Backend node id, also used as node id
+		tag: Tag name for elements (upper-cased like CDP reports it), or the node name ('#text', '#document')
+		parent: Parent node; the new node is linked into its children
+	"""
+	node = EnhancedDOMTreeNode(
+		node_id=backend_node_id,
+		backend_node_id=backend_node_id,
+		node_type=node_type,
+		node_name=tag.upper() if node_type == NodeType.ELEMENT_NODE else tag,
+		node_value=value,
+		attributes=attributes or {},
+		is_scrollable=False,
+		is_visible=True,
+		absolute_position=position,
+		session_id=session_id,
+		target_id=target_id,
+		frame_id=None,
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=None,
+		parent_node=parent,
+		children_nodes=None,
+		ax_node=None,
+		snapshot_node=snapshot_node,
+	)
+	if parent is not None:
+		if parent.children_nodes is None:
+			parent.children_nodes = []
+		parent.children_nodes.append(node)
+	return node
+
+
 # not a fixture, mock_llm() provides this in a fixture below, this is a helper so that it can accept args
 def create_mock_llm(actions: list[str] | None = None) -> BaseChatModel:
 	"""Create a mock LLM that returns specified actions or a default done action.
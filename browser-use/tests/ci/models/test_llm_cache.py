@@ -0,0 +1,143 @@
+"""
+Tests for the response cache: memory and SQLite tiers, key composition,
+TTL and size-based eviction.
+"""
+
+import asyncio
+from dataclasses import dataclass
+
+from pydantic import BaseModel
+
+from browser_use.agent.views import AgentOutput
+from browser_use.llm.cache import ChatCached, SQLiteResponseStore
+from browser_use.llm.messages import SystemMessage, UserMessage
+from browser_use.llm.views import ChatInvokeCompletion
+from browser_use.tools.service import Tools
+
+
+class Summary(BaseModel):
+	title: str
+	score: int
+
+
+@dataclass
+class CountingChat:
+	model: str = 'counting'
+	calls: int = 0
+
+	@property
+	def provider(self) -> str:
+		return 'fake'
+
+	@property
+	def name(self) -> str:
+		return self.model
+
+	async def ainvoke(self, messages, output_format=None, **kwargs):
+		self.calls += 1
+		if output_format is None:
+			return ChatInvokeCompletion(completion=f'answer {self.calls}', usage=None, stop_reason='end_turn')
+		return ChatInvokeCompletion(completion=output_format(title=f'answer {self.calls}', score=self.calls), usage=None)
+
+
+MESSAGES = [SystemMessage(content='You summarize pages.'), UserMessage(content='<page>hello</page>')]
+
+
+async def test_repeated_prompt_is_served_from_memory(tmp_path):
+	inner = CountingChat()
+	llm = ChatCached(inner, cache_path=tmp_path / 'cache.sqlite')
+
+	first = await llm.ainvoke(MESSAGES)
+	second = await llm.ainvoke(MESSAGES)
+
+	assert inner.calls == 1
+	assert second.completion == first.completion
+	assert second.stop_reason == 'end_turn'
+	assert second.usage is None
+	assert llm.stats == {'memory_hits': 1, 'disk_hits': 0, 'misses': 1}
+
+
+async def test_disk_tier_is_shared_between_wrappers(tmp_path):
+	path = tmp_path / 'cache.sqlite'
+	await ChatCached(CountingChat(), cache_path=path).ainvoke(MESSAGES, output_format=Summary)
+
+	inner = CountingChat()
+	llm = ChatCached(inner, cache_path=path)
+	result = await llm.ainvoke(MESSAGES, output_format=Summary)
+
+	assert inner.calls == 0
+	assert result.completion == Summary(title='answer 1', score=1)
+	assert llm.stats['disk_hits'] == 1
+
+
+async def test_key_includes_messages_model_and_schema(tmp_path):
+	inner = CountingChat()
+	llm = ChatCached(inner, disk=False)
+
+	await llm.ainvoke(MESSAGES)
+	await llm.ainvoke(MESSAGES, output_format=Summary)
+	await llm.ainvoke([*MESSAGES, UserMessage(content='and again')])
+	await ChatCached(CountingChat(model='other'), disk=False).ainvoke(MESSAGES)
+
+	assert inner.calls == 3
+	assert llm.stats['misses'] == 3
+
+
+async def test_key_includes_call_kwargs(tmp_path):
+	inner = CountingChat()
+	llm = ChatCached(inner, disk=False)
+
+	await llm.ainvoke(MESSAGES, temperature=0.0)
+	await llm.ainvoke(MESSAGES, temperature=0.7)
+	await llm.ainvoke(MESSAGES, temperature=0.0, tools=[{'name': 'search'}])
+	cached = await llm.ainvoke(MESSAGES, temperature=0.0)
+
+	assert inner.calls == 3
+	assert cached.completion == 'answer 1'
+
+
+async def test_agent_output_round_trips(tmp_path):
+	agent_output = AgentOutput.type_with_custom_actions(Tools().registry.create_action_model())
+	expected = agent_output.model_validate_json(
+		'{"evaluation_previous_goal": "ok", "memory": "m", "next_goal": "n", "action": [{"done": {"text": "finished", "success": true}}]}'
+	)
+
+	@dataclass
+	class AgentChat(CountingChat):
+		async def ainvoke(self, messages, output_format=None, **kwargs):
+			self.calls += 1
+			return ChatInvokeCompletion(completion=expected, usage=None)
+
+	inner = AgentChat()
+	path = tmp_path / 'cache.sqlite'
+	await ChatCached(inner, cache_path=path).ainvoke(MESSAGES, output_format=agent_output)
+	cached = await ChatCached(inner, cache_path=path).ainvoke(MESSAGES, output_format=agent_output)
+
+	assert inner.calls == 1
+	assert cached.completion.model_dump() == expected.model_dump()
+
+
+async def test_expired_entries_are_misses(tmp_path):
+	inner = CountingChat()
+	llm = ChatCached(inner, cache_path=tmp_path / 'cache.sqlite', ttl_seconds=0.05)
+
+	await llm.ainvoke(MESSAGES)
+	await asyncio.sleep(0.1)
+	await llm.ainvoke(MESSAGES)
+
+	assert inner.calls == 2
+	assert llm.evictions == 1
+
+
+def test_store_evicts_least_recently_used_over_size_limit(tmp_path):
+	store = SQLiteResponseStore(tmp_path / 'cache.sqlite', ttl_seconds=None, max_bytes=25)
+
+	store.put('a', 'x' * 10)
+	store.put('b', 'x' * 10)
+	assert store.get('a') is not None  # a is now more recently used than b
+	store.put('c', 'x' * 10)
+
+	assert store.get('b') is None
+	assert store.get('a') is not None
+	assert store.get('c') is not None
+	assert store.evictions == 1
@@ -0,0 +1,127 @@
+"""
+Tests for record/replay cassettes: a recorded run can be replayed without the
+live model, matching calls by content and falling back to recorded order.
+"""
+
+import time
+from dataclasses import dataclass
+
+import pytest
+from pydantic import BaseModel
+
+from browser_use.llm.cassette import CassetteMissError, ChatCassette
+from browser_use.llm.messages import ContentPartImageParam, ContentPartTextParam, ImageURL, UserMessage
+from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
+
+
+class Step(BaseModel):
+	goal: str
+
+
+@dataclass
+class ScriptedChat:
+	model: str = 'scripted'
+	calls: int = 0
+
+	@property
+	def provider(self) -> str:
+		return 'fake'
+
+	@property
+	def name(self) -> str:
+		return self.model
+
+	async def ainvoke(self, messages, output_format=None, **kwargs):
+		self.calls += 1
+		usage = ChatInvokeUsage(
+			prompt_tokens=10 * self.calls,
+			prompt_cached_tokens=None,
+			prompt_cache_creation_tokens=None,
+			prompt_image_tokens=None,
+			completion_tokens=1,
+			total_tokens=10 * self.calls + 1,
+		)
+		completion = output_format(goal=f'goal {self.calls}') if output_format else f'text {self.calls}'
+		return ChatInvokeCompletion(completion=completion, usage=usage)
+
+
+def _screenshot_message(text: str, image: str) -> UserMessage:
+	return UserMessage(
+		content=[ContentPartTextParam(text=text), ContentPartImageParam(image_url=ImageURL(url=f'data:image/png;base64,{image}'))]
+	)
+
+
+async def test_record_then_replay_without_live_model(tmp_path):
+	path = tmp_path / 'run.jsonl'
+	recorder = ChatCassette(path, llm=ScriptedChat(), mode='record')
+	await recorder.ainvoke([_screenshot_message('step 1', 'AAAA')], output_format=Step)
+	await recorder.ainvoke([UserMessage(content='summarize')])
+	assert recorder.stats['recorded'] == 2
+
+	player = ChatCassette(path, mode='replay', latency=0)
+	assert player.model == 'scripted'
+	assert player.provider == 'fake'
+
+	# Screenshot differs from the recording; text and schema still match
+	step = await player.ainvoke([_screenshot_message('step 1', 'BBBB')], output_format=Step)
+	summary = await player.ainvoke([UserMessage(content='summarize')])
+
+	assert step.completion == Step(goal='goal 1')
+	assert step.usage is not None and step.usage.total_tokens == 11
+	assert summary.completion == 'text 2'
+	assert player.stats == {'recorded': 0, 'replayed': 2, 'matched': 2, 'out_of_order': 0}
+
+
+async def test_unmatched_calls_fall_back_to_recorded_order(tmp_path):
+	path = tmp_path / 'run.jsonl'
+	recorder = ChatCassette(path, llm=ScriptedChat(), mode='record')
+	await recorder.ainvoke([UserMessage(content='first')])
+	await recorder.ainvoke([UserMessage(content='second')])
+
+	player = ChatCassette(path, mode='replay', latency=0)
+	assert (await player.ainvoke([UserMessage(content='second')])).completion == 'text 2'
+	assert (await player.ainvoke([UserMessage(content='something new')])).completion == 'text 1'
+	assert player.stats['out_of_order'] == 1
+
+	with pytest.raises(CassetteMissError):
+		await player.ainvoke([UserMessage(content='one too many')])
+
+
+async def test_strict_replay_raises_on_mismatch(tmp_path):
+	path = tmp_path / 'run.jsonl'
+	await ChatCassette(path, llm=ScriptedChat(), mode='record').ainvoke([UserMessage(content='first')])
+
+	player = ChatCassette(path, mode='replay', strict=True, latency=0)
+	with pytest.raises(CassetteMissError):
+		await player.ainvoke([UserMessage(content='other')])
+
+
+async def test_replay_simulates_latency(tmp_path):
+	path = tmp_path / 'run.jsonl'
+	await ChatCassette(path, llm=ScriptedChat(), mode='record').ainvoke([UserMessage(content='first')])
+
+	player = ChatCassette(path, mode='replay', latency=0.1)
+	start = time.monotonic()
+	await player.ainvoke([UserMessage(content='first')])
+	assert time.monotonic() - start >= 0.1
+
+
+def test_record_mode_requires_live_model(tmp_path):
+	with pytest.raises(ValueError):
+		ChatCassette(tmp_path / 'run.jsonl', mode='record')
+
+
+async def test_images_are_stored_as_digests(tmp_path):
+	path = tmp_path / 'run.jsonl'
+	screenshot = 'iVBORw0KGgo' * 1000
+	await ChatCassette(path, llm=ScriptedChat(), mode='record', match_images=True).ainvoke(
+		[_screenshot_message('step 1', screenshot)], output_format=Step
+	)
+	assert screenshot not in path.read_text()
+
+	# Digests still tell screenshots apart when matching on images
+	player = ChatCassette(path, mode='replay', strict=True, match_images=True, latency=0)
+	with pytest.raises(CassetteMissError):
+		await player.ainvoke([_screenshot_message('step 1', 'BBBB')], output_format=Step)
+	replayed = await player.ainvoke([_screenshot_message('step 1', screenshot)], output_format=Step)
+	assert replayed.completion == Step(goal='goal 1')
@@ -0,0 +1,61 @@
+"""
+Tests for the shared LLM client registry: chat models with the same provider,
+endpoint and credentials must reuse one SDK client and one keep-alive HTTP pool.
+"""
+
+import asyncio
+
+from browser_use.llm.anthropic.chat import ChatAnthropic
+from browser_use.llm.client_pool import aclose_shared_clients, get_shared_http_client
+from browser_use.llm.openai.chat import ChatOpenAI
+
+
+async def test_models_with_same_credentials_share_client():
+	first = ChatOpenAI(model='gpt-4.1-mini', api_key='key-a')
+	second = ChatOpenAI(model='gpt-4.1', api_key='key-a')
+
+	try:
+		assert first.get_client() is second.get_client()
+		assert first.get_client() is first.get_client()
+	finally:
+		await aclose_shared_clients()
+
+
+async def test_different_credentials_get_different_clients_on_one_http_pool():
+	openai_a = ChatOpenAI(model='gpt-4.1-mini', api_key='key-a').get_client()
+	openai_b = ChatOpenAI(model='gpt-4.1-mini', api_key='key-b').get_client()
+	anthropic = ChatAnthropic(model='claude-sonnet-4-0', api_key='key-a').get_client()
+
+	try:
+		assert openai_a is not openai_b
+		http_client = get_shared_http_client()
+		assert openai_a._client is http_client
+		assert openai_b._client is http_client
+		assert anthropic._client is http_client
+	finally:
+		await aclose_shared_clients()
+
+
+async def test_explicit_http_client_is_not_shared():
+	import httpx
+
+	async with httpx.AsyncClient() as http_client:
+		llm = ChatOpenAI(model='gpt-4.1-mini', api_key='key-a', http_client=http_client)
+		assert llm.get_client() is not llm.get_client()
+		assert llm.get_client()._client is http_client
+
+
+def test_clients_are_not_shared_across_event_loops():
+	llm = ChatOpenAI(model='gpt-4.1-mini', api_key='key-a')
+
+	async def get_client():
+		try:
+			return llm.get_client(), get_shared_http_client()
+		finally:
+			await aclose_shared_clients()
+
+	client_a, http_a = asyncio.run(get_client())
+	client_b, http_b = asyncio.run(get_client())
+
+	assert client_a is not client_b
+	assert http_a is not http_b
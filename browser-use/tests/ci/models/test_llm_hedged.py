@@ -0,0 +1,135 @@
+"""
+Tests for hedged requests: the backup fires when the primary is slow or fails,
+the first valid answer wins and the losing request is cancelled.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+
+import pytest
+from pydantic import BaseModel
+
+from browser_use.llm.exceptions import ModelProviderError
+from browser_use.llm.hedged import ChatHedged
+from browser_use.llm.messages import UserMessage
+from browser_use.llm.views import ChatInvokeCompletion
+
+
+class StepOutput(BaseModel):
+	action: list[dict]
+
+
+@dataclass
+class FakeChat:
+	"""Answers after `delay` seconds with `answer`, or raises `error`."""
+
+	model: str
+	delay: float = 0.0
+	answer: str = 'ok'
+	actions: list[dict] = field(default_factory=lambda: [{'click': {'index': 1}}])
+	error: Exception | None = None
+	calls: int = 0
+	cancelled: bool = False
+
+	@property
+	def provider(self) -> str:
+		return self.model
+
+	@property
+	def name(self) -> str:
+		return self.model
+
+	async def ainvoke(self, messages, output_format=None, **kwargs):
+		self.calls += 1
+		try:
+			await asyncio.sleep(self.delay)
+		except asyncio.CancelledError:
+			self.cancelled = True
+			raise
+		if self.error:
+			raise self.error
+		if output_format is None:
+			return ChatInvokeCompletion(completion=self.answer, usage=None)
+		return ChatInvokeCompletion(completion=output_format(action=self.actions), usage=None)
+
+
+MESSAGES = [UserMessage(content='next step?')]
+
+
+async def test_fast_primary_never_calls_backup():
+	primary, backup = FakeChat('primary'), FakeChat('backup')
+	llm = ChatHedged(primary=primary, backup=backup, hedge_after=1.0)
+
+	result = await llm.ainvoke(MESSAGES)
+
+	assert result.completion == 'ok'
+	assert backup.calls == 0
+	assert llm.stats == {'calls': 1, 'hedged': 0, 'backup_wins': 0, 'failovers': 0}
+
+
+async def test_slow_primary_is_hedged_and_cancelled():
+	primary = FakeChat('primary', delay=5, answer='slow')
+	backup = FakeChat('backup', delay=0.01, answer='fast')
+	llm = ChatHedged(primary=primary, backup=backup, hedge_after=0.05)
+
+	result = await asyncio.wait_for(llm.ainvoke(MESSAGES), timeout=2)
+
+	# The loser has finished unwinding by the time the winner is returned
+	assert result.completion == 'fast'
+	assert primary.cancelled
+	assert llm.stats['hedged'] == 1
+	assert llm.stats['backup_wins'] == 1
+
+
+async def test_primary_failure_fails_over_to_backup():
+	primary = FakeChat('primary', error=ModelProviderError(message='down', status_code=503))
+	backup = FakeChat('backup', answer='rescued')
+	llm = ChatHedged(primary=primary, backup=backup, hedge_after=1.0)
+
+	result = await llm.ainvoke(MESSAGES)
+
+	assert result.completion == 'rescued'
+	assert llm.stats['failovers'] == 1
+
+
+async def test_without_failover_the_primary_answer_stands():
+	backup = FakeChat('backup')
+	invalid = ChatHedged(primary=FakeChat('primary', actions=[]), backup=backup, hedge_after=1.0, failover=False)
+	assert (await invalid.ainvoke(MESSAGES, output_format=StepOutput)).completion.action == []
+
+	down = FakeChat('primary', error=ModelProviderError(message='down', status_code=503))
+	with pytest.raises(ModelProviderError, match='down'):
+		await ChatHedged(primary=down, backup=backup, hedge_after=1.0, failover=False).ainvoke(MESSAGES)
+
+	assert backup.calls == 0
+
+
+async def test_invalid_agent_output_does_not_win_the_race():
+	# Backup answers first but with no actions; the primary's valid answer is used
+	primary = FakeChat('primary', delay=0.1)
+	backup = FakeChat('backup', actions=[])
+	llm = ChatHedged(primary=primary, backup=backup, hedge_after=0.01)
+
+	result = await llm.ainvoke(MESSAGES, output_format=StepOutput)
+
+	assert result.completion.action == [{'click': {'index': 1}}]
+	assert llm.stats['backup_wins'] == 0
+
+
+async def test_both_failing_raises_primary_error():
+	primary = FakeChat('primary', error=ModelProviderError(message='primary down', status_code=503))
+	backup = FakeChat('backup', error=ModelProviderError(message='backup down', status_code=503))
+	llm = ChatHedged(primary=primary, backup=backup, hedge_after=1.0)
+
+	with pytest.raises(ModelProviderError, match='primary down'):
+		await llm.ainvoke(MESSAGES)
+
+
+async def test_hedge_delay_follows_primary_latency_percentile():
+	llm = ChatHedged(primary=FakeChat('primary'), backup=FakeChat('backup'), min_samples=10, initial_hedge_after=30)
+	assert llm.current_hedge_delay() == 30
+
+	llm._latencies.extend([1.0] * 9 + [10.0])
+	assert llm.current_hedge_delay() == 10.0
+	llm._latencies.extend([1.0] * 10)
+	assert llm.current_hedge_delay() == 1.0
@@ -0,0 +1,168 @@
+"""
+Tests for the shared rate limiter: token buckets, Retry-After handling and a
+429 cooldown that pauses every wrapper of the same provider/model.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+import httpx
+
+from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
+from browser_use.llm.messages import UserMessage
+from browser_use.llm.rate_limit import (
+	ChatRateLimited,
+	TokenBucket,
+	backoff_delay,
+	estimate_tokens,
+	get_rate_limiter,
+	retry_after_seconds,
+)
+from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
+
+
+@dataclass
+class FakeChat:
+	"""Chat model that fails with the queued errors first, then succeeds."""
+
+	model: str
+	errors: list[Exception] = field(default_factory=list)
+	calls: list[float] = field(default_factory=list)
+	total_tokens: int = 100
+
+	@property
+	def provider(self) -> str:
+		return 'fake'
+
+	@property
+	def name(self) -> str:
+		return self.model
+
+	async def ainvoke(self, messages, output_format=None, **kwargs):
+		self.calls.append(time.monotonic())
+		if self.errors:
+			raise self.errors.pop(0)
+		usage = ChatInvokeUsage(
+			prompt_tokens=self.total_tokens,
+			prompt_cached_tokens=None,
+			prompt_cache_creation_tokens=None,
+			prompt_image_tokens=None,
+			completion_tokens=0,
+			total_tokens=self.total_tokens,
+		)
+		return ChatInvokeCompletion(completion='ok', usage=usage)
+
+
+def _rate_limit_error(retry_after: str) -> ModelRateLimitError:
+	request = httpx.Request('POST', 'https://api.example.com')
+	response = httpx.Response(429, headers={'retry-after': retry_after}, request=request)
+	cause = httpx.HTTPStatusError('rate limited', request=request, response=response)
+	try:
+		raise ModelRateLimitError(message='rate limited', model='m') from cause
+	except ModelRateLimitError as e:
+		return e
+
+
+def test_retry_after_is_read_from_cause_chain():
+	assert retry_after_seconds(_rate_limit_error('2.5')) == 2.5
+	assert retry_after_seconds(ModelProviderError(message='boom')) is None
+
+
+def test_backoff_delay_is_bounded():
+	for attempt in range(10):
+		assert 0 <= backoff_delay(attempt, base_delay=0.5, max_delay=4) <= min(4, 0.5 * 2**attempt)
+
+
+def test_token_bucket_wait_time():
+	bucket = TokenBucket(rate_per_minute=60)  # 1 per second
+	bucket.take(60)
+	assert 0.9 < bucket.wait_time(1) <= 1.0
+	# Larger than capacity only waits for a full bucket
+	assert bucket.wait_time(1000) <= 60
+
+
+def test_estimate_tokens():
+	assert estimate_tokens([UserMessage(content='x' * 400)]) == 100
+
+
+async def test_successful_call_is_passed_through_and_reconciled():
+	inner = FakeChat(model='reconcile', total_tokens=5000)
+	llm = ChatRateLimited(inner, tokens_per_minute=100_000, expected_completion_tokens=0)
+
+	result = await llm.ainvoke([UserMessage(content='x' * 400)])
+
+	assert result.completion == 'ok'
+	assert llm.model == 'reconcile'
+	assert llm.provider == 'fake'
+	# Bucket charged with actual usage, not the 100-token estimate
+	assert 94_000 < llm.limiter.tokens.level < 96_000  # type: ignore[union-attr]
+
+
+async def test_rate_limit_pauses_every_wrapper_of_same_model():
+	inner = FakeChat(model='shared-429', errors=[_rate_limit_error('0.2')])
+	first = ChatRateLimited(inner, base_delay=0.01)
+	second = ChatRateLimited(FakeChat(model='shared-429'))
+	assert first.limiter is second.limiter
+
+	start = time.monotonic()
+	await first.ainvoke([UserMessage(content='hi')])
+	assert time.monotonic() - start >= 0.2
+
+	assert len(inner.calls) == 2
+	assert first.limiter.rate_limit_errors == 1
+	assert first.limiter.retries == 1
+
+
+async def test_request_bucket_spaces_out_calls():
+	inner = FakeChat(model='rpm')
+	llm = ChatRateLimited(inner, requests_per_minute=600)  # 10/s
+	llm.limiter.requests.level = 0  # type: ignore[union-attr]
+
+	await asyncio.gather(*(llm.ainvoke([UserMessage(content='hi')]) for _ in range(3)))
+
+	assert inner.calls[-1] - inner.calls[0] >= 0.15
+	assert llm.limiter.throttled_calls == 3
+	assert llm.limiter.stats()['max_queue_time_ms'] >= 250
+
+
+async def test_non_retryable_errors_are_raised_immediately():
+	inner = FakeChat(model='bad-request', errors=[ModelProviderError(message='bad', status_code=400)])
+	llm = ChatRateLimited(inner)
+
+	try:
+		await llm.ainvoke([UserMessage(content='hi')])
+		raise AssertionError('expected ModelProviderError')
+	except ModelProviderError as e:
+		assert e.status_code == 400
+	assert len(inner.calls) == 1
+	assert get_rate_limiter('fake', 'bad-request').retries == 0
+
+
+def _provider_error(cause: Exception, status_code: int = 502) -> ModelProviderError:
+	try:
+		raise ModelProviderError(message=str(cause), status_code=status_code, model='m') from cause
+	except ModelProviderError as e:
+		return e
+
+
+async def test_server_errors_are_only_retried_when_the_connection_failed():
+	timeout = _provider_error(httpx.ReadTimeout('timed out'))
+	inner = FakeChat(model='transient-502', errors=[timeout])
+	assert await ChatRateLimited(inner, base_delay=0.01).ainvoke([UserMessage(content='hi')])
+	assert len(inner.calls) == 2
+
+	# Invalid output is reported as 502 too, retrying would fail the same way
+	invalid = _provider_error(ValueError('response did not match the schema'))
+	inner = FakeChat(model='invalid-502', errors=[invalid])
+	try:
+		await ChatRateLimited(inner, base_delay=0.01).ainvoke([UserMessage(content='hi')])
+		raise AssertionError('expected ModelProviderError')
+	except ModelProviderError as e:
+		assert e is invalid
+	assert len(inner.calls) == 1
+
+	# Overload is always worth retrying
+	inner = FakeChat(model='overloaded-503', errors=[ModelProviderError(message='overloaded', status_code=503)])
+	assert await ChatRateLimited(inner, base_delay=0.01).ainvoke([UserMessage(content='hi')])
+	assert len(inner.calls) == 2
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark the paint-order occlusion pass on synthetic pages of 1k-50k rectangles.
+
+Each page is a full-width background, a grid of cards with text and buttons inside, and a few
+stacked overlays. Rectangles are replayed in descending paint order exactly like
+PaintOrderRemover.calculate_paint_order (the `calculate_paint_order` phase of the serializer's
+timing_info), once with RectUnionGrid and once with RectUnionPure, and both must agree on which
+rectangles are occluded.
+
+Usage:
+	uv run python tests/scripts/benchmark_paint_order.py
+	uv run python tests/scripts/benchmark_paint_order.py --sizes 1000 50000 --pure-limit 2000
+"""
+
+import argparse
+import random
+import time
+from collections import defaultdict
+
+from browser_use.dom.serializer.paint_order import Rect, RectUnionGrid, RectUnionPure
+
+PAGE_WIDTH = 1920
+
+
+def synthetic_page(rect_count: int, seed: int = 0) -> list[tuple[int, Rect, bool]]:
+	"""(paint order, rect, opaque) triples for a page of roughly `rect_count` painted nodes."""
+	rng = random.Random(seed)
+	items: list[tuple[int, Rect, bool]] = []
+	rows = max(1, rect_count // 40)
+	page_height = rows * 220 + 200
+
+	items.append((0, Rect(0, 0, PAGE_WIDTH, page_height), True))
+	paint_order = 1
+	while len(items) < rect_count:
+		row = rng.randrange(rows)
+		column = rng.randrange(8)
+		x, y = column * 240 + 10, row * 220 + 100
+		# Card, then its content painted on top of it
+		items.append((paint_order, Rect(x, y, x + 220, y + 200), rng.random() < 0.7))
+		for _ in range(rng.randint(2, 6)):
+			cx, cy = x + rng.uniform(5, 150), y + rng.uniform(5, 170)
+			items.append((paint_order + 1, Rect(cx, cy, cx + rng.uniform(10, 65), cy + rng.uniform(8, 25)), rng.random() < 0.3))
+		paint_order += 2
+
+	# Sticky header and a couple of overlays covering parts of the page
+	top = paint_order + 10
+	items.append((top, Rect(0, 0, PAGE_WIDTH, 80), True))
+	for i in range(3):
+		y = rng.uniform(0, page_height - 600)
+		items.append((top + 1 + i, Rect(400, y, 1500, y + 600), True))
+	return items[: rect_count + 4]
+
+
+def occluded(items: list[tuple[int, Rect, bool]], union_cls: type[RectUnionPure]) -> tuple[list[bool], float]:
+	grouped: defaultdict[int, list[int]] = defaultdict(list)
+	for position, (paint_order, _, _) in enumerate(items):
+		grouped[paint_order].append(position)
+
+	result = [False] * len(items)
+	start = time.perf_counter()
+	rect_union = union_cls()
+	for _, positions in sorted(grouped.items(), key=lambda x: -x[0]):
+		rects_to_add = []
+		for position in positions:
+			_, rect, opaque = items[position]
+			if rect_union.contains(rect):
+				result[position] = True
+			if opaque:
+				rects_to_add.append(rect)
+		for rect in rects_to_add:
+			rect_union.add(rect)
+	return result, time.perf_counter() - start
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000, 10000, 25000, 50000])
+	parser.add_argument('--pure-limit', type=int, default=5000, help='largest page also run through RectUnionPure')
+	parser.add_argument('--seed', type=int, default=0)
+	args = parser.parse_args()
+
+	print(f'{"rects":>8} {"occluded":>9} {"grid ms":>10} {"pure ms":>10} {"speedup":>8}')
+	for size in args.sizes:
+		items = synthetic_page(size, args.seed)
+		grid_result, grid_seconds = occluded(items, RectUnionGrid)
+		pure_column, speedup_column = '-', '-'
+		if size <= args.pure_limit:
+			pure_result, pure_seconds = occluded(items, RectUnionPure)
+			assert pure_result == grid_result, f'occlusion mismatch on {size} rects'
+			pure_column = f'{pure_seconds * 1000:.1f}'
+			speedup_column = f'{pure_seconds / grid_seconds:.1f}x'
+		print(f'{len(items):>8} {sum(grid_result):>9} {grid_seconds * 1000:>10.1f} {pure_column:>10} {speedup_column:>8}')
+
+
+if __name__ == '__main__':
+	main()
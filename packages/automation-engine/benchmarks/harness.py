@@ -0,0 +1,376 @@
+"""
+Offline benchmark harness for the automation engine
+Serves static ATS fixtures from a local HTTP server, drives AutomationEngine with a
+scripted LLM and measures where the time goes: browser launch, DOM capture,
+serialization, LLM wait and action execution, plus steps per application and peak RSS.
+"""
+
+import contextlib
+import functools
+import platform
+import statistics
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import psutil
+
+from src.core.automation_engine import AutomationEngine
+from src.core.execution_context import ExecutionMode
+
+from benchmarks.scripted_llm import ScriptedFormLLM
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# First path segment -> fixture site. Hostnames go in the path so the engine's URL
+# detection works against 127.0.0.1 without DNS or HSTS tricks.
+FIXTURE_SITES = {
+    "boards.greenhouse.io": "greenhouse",
+    "linkedin.com": "linkedin",
+    "careers": "generic",
+}
+
+# Metrics compared against the baseline, with the absolute slack below which a change is noise
+COMPARED_METRICS = {
+    "wall_time_ms": 250,
+    "steps": 0,
+    "browser_launch_ms": 250,
+    "dom_capture_ms": 100,
+    "serialization_ms": 50,
+    "llm_wait_ms": 100,
+    "action_execution_ms": 250,
+    "peak_rss_mb": 50,
+}
+
+
+@dataclass
+class Scenario:
+    """One application flow against a fixture site"""
+    name: str
+    path: str
+    title: str
+    company: str
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "greenhouse": Scenario("greenhouse", "/boards.greenhouse.io/acme/jobs/4012345", "Senior Backend Engineer", "Acme Robotics"),
+    "linkedin": Scenario("linkedin", "/linkedin.com/jobs/view/3900000001", "Staff Data Engineer", "Northwind Analytics"),
+    "generic": Scenario("generic", "/careers/globex/product-designer", "Product Designer", "Globex"),
+}
+
+BENCHMARK_PROFILE: Dict[str, Any] = {
+    "first_name": "Alex",
+    "last_name": "Morgan",
+    "email": "alex.morgan@example.com",
+    "phone": "+49 151 23456789",
+    "current_title": "Senior Software Engineer",
+    "years_experience": 8,
+    "current_location": "Berlin",
+    "linkedin_url": "https://www.linkedin.com/in/alex-morgan-example",
+    "portfolio_url": "https://alexmorgan.example.com",
+    "salary_expectation": "85,000 EUR",
+    "work_authorization": "Yes",
+    "require_sponsorship": False,
+    "cover_letter": "I have spent eight years building reliable backend systems and would love to bring that to your team.",
+}
+
+# Fixture field name -> value the scripted LLM enters
+FORM_ANSWERS: Dict[str, str] = {
+    "first_name": BENCHMARK_PROFILE["first_name"],
+    "last_name": BENCHMARK_PROFILE["last_name"],
+    "full_name": f"{BENCHMARK_PROFILE['first_name']} {BENCHMARK_PROFILE['last_name']}",
+    "email": BENCHMARK_PROFILE["email"],
+    "phone": BENCHMARK_PROFILE["phone"],
+    "current_location": BENCHMARK_PROFILE["current_location"],
+    "linkedin_url": BENCHMARK_PROFILE["linkedin_url"],
+    "portfolio_url": BENCHMARK_PROFILE["portfolio_url"],
+    "salary_expectation": BENCHMARK_PROFILE["salary_expectation"],
+    "start_date": "01/03/2026",
+    "years_experience": str(BENCHMARK_PROFILE["years_experience"]),
+    "work_authorization": "Yes",
+    "require_sponsorship": "No",
+    "gender": "Decline to self-identify",
+    "cover_letter": BENCHMARK_PROFILE["cover_letter"],
+    "privacy_consent": "check",
+    "relocation": "check",
+}
+
+
+class _FixtureHandler(SimpleHTTPRequestHandler):
+    """Maps /<site>/.../<file> to fixtures/<site>/<file>, falling back to the site's index.html"""
+
+    def translate_path(self, path: str) -> str:
+        parts = [part for part in urlparse(path).path.split("/") if part]
+        site = FIXTURE_SITES.get(parts[0]) if parts else None
+        if site is None:
+            return str(FIXTURES_DIR / "__not_found__")
+
+        site_dir = FIXTURES_DIR / site
+        candidate = site_dir / parts[-1]
+        return str(candidate if len(parts) > 1 and candidate.is_file() else site_dir / "index.html")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class FixtureServer:
+    """Local HTTP server for the fixture sites, running in a background thread"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._server = ThreadingHTTPServer((host, port), _FixtureHandler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "FixtureServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fixture-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class PhaseRecorder:
+    """
+    Accumulates wall time per phase while installed
+
+    Wraps the browser-use entry points for each phase (BrowserSession.start,
+    DomService.get_serialized_dom_tree, Agent.get_model_output, Agent.multi_act) and
+    splits DOM time into capture and serialization using DomService's own timing info.
+    """
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = defaultdict(float)
+        self.counts: Dict[str, int] = defaultdict(int)
+        self._originals: List[tuple] = []
+
+    def _wrap(self, owner: Any, attr: str, phase: str, on_result=None) -> None:
+        original = getattr(owner, attr)
+
+        @functools.wraps(original)
+        async def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = await original(*args, **kwargs)
+            finally:
+                self.seconds[phase] += time.perf_counter() - start
+                self.counts[phase] += 1
+            if on_result is not None:
+                on_result(result)
+            return result
+
+        setattr(owner, attr, timed)
+        self._originals.append((owner, attr, original))
+
+    def _split_dom_timing(self, result: Any) -> None:
+        timing = result[2]
+        serialize_ms = timing.get("serialize_accessible_elements_total_ms", 0)
+        total_ms = timing.get("get_serialized_dom_tree_total_ms", 0)
+        self.seconds["serialization"] += serialize_ms / 1000
+        self.seconds["dom_capture"] += max(0.0, total_ms - serialize_ms) / 1000
+
+    @contextlib.contextmanager
+    def installed(self):
+        from browser_use import Agent
+        from browser_use.browser.session import BrowserSession
+        from browser_use.dom.service import DomService
+
+        self._wrap(BrowserSession, "start", "browser_launch")
+        self._wrap(DomService, "get_serialized_dom_tree", "dom_total", on_result=self._split_dom_timing)
+        self._wrap(Agent, "get_model_output", "llm_wait")
+        self._wrap(Agent, "multi_act", "action_execution")
+        self._wrap(Agent, "step", "step")
+        try:
+            yield self
+        finally:
+            for owner, attr, original in reversed(self._originals):
+                setattr(owner, attr, original)
+            self._originals.clear()
+
+    def phases_ms(self) -> Dict[str, float]:
+        return {
+            f"{phase}_ms": round(self.seconds.get(phase, 0.0) * 1000, 1)
+            for phase in ("browser_launch", "dom_capture", "serialization", "llm_wait", "action_execution")
+        }
+
+
+class PeakRssSampler:
+    """Samples RSS of this process plus its children (Chrome) in a background thread"""
+
+    def __init__(self, interval: float = 0.1):
+        self.interval = interval
+        self.peak_total = 0
+        self.peak_python = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        process = psutil.Process()
+        python_rss = process.memory_info().rss
+        total = python_rss
+        for child in process.children(recursive=True):
+            with contextlib.suppress(psutil.Error):
+                total += child.memory_info().rss
+        self.peak_python = max(self.peak_python, python_rss)
+        self.peak_total = max(self.peak_total, total)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "PeakRssSampler":
+        self._sample()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self._sample()
+
+
+def _write_resume(directory: Path) -> str:
+    resume = directory / "Alex_Morgan_Resume.pdf"
+    resume.write_bytes(
+        b"%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n"
+        b"2 0 obj<</Type/Pages/Kids[]/Count 0>>endobj\ntrailer<</Root 1 0 R>>\n%%EOF\n"
+    )
+    return str(resume)
+
+
+async def run_scenario(
+    scenario: Scenario,
+    base_url: str,
+    llm_latency: float = 0.0,
+    headless: bool = True,
+    incremental_dom: bool = False,
+) -> Dict[str, Any]:
+    """
+    Run one application against the fixture server and collect metrics
+
+    Args:
+        scenario: Flow to run
+        base_url: Fixture server URL
+        llm_latency: Simulated LLM latency per call (seconds)
+        headless: Run Chrome headless
+        incremental_dom: Keep the DOM tree current from mutation events (BrowserProfile.incremental_dom)
+
+    Returns:
+        Metrics dict (wall time, per-phase ms, steps, LLM calls, peak RSS, success)
+    """
+    apply_url = f"{base_url}{scenario.path}"
+
+    with tempfile.TemporaryDirectory(prefix="jobswipe-bench-") as tmp:
+        resume_path = _write_resume(Path(tmp))
+        llm = ScriptedFormLLM(start_url=apply_url, answers=FORM_ANSWERS, resume_path=resume_path, latency=llm_latency)
+        engine = AutomationEngine(
+            llm=llm,
+            browser_profile_overrides={"headless": headless, "incremental_dom": incremental_dom},
+        )
+
+        job_data = {
+            "job_id": f"bench-{scenario.name}",
+            "title": scenario.title,
+            "company": scenario.company,
+            "apply_url": apply_url,
+        }
+        user_profile = dict(BENCHMARK_PROFILE, resume_local_path=resume_path)
+
+        recorder = PhaseRecorder()
+        with PeakRssSampler() as rss, recorder.installed():
+            start = time.perf_counter()
+            result = await engine.execute(job_data, user_profile, ExecutionMode.SERVER)
+            wall_time = time.perf_counter() - start
+
+    return {
+        "scenario": scenario.name,
+        "success": llm.reached_confirmation,
+        "engine_success": bool(result.get("success")),
+        "error": result.get("error"),
+        "wall_time_ms": round(wall_time * 1000, 1),
+        "steps": recorder.counts.get("step", 0),
+        "llm_calls": llm.calls,
+        **recorder.phases_ms(),
+        "peak_rss_mb": round(rss.peak_total / (1024 * 1024), 1),
+        "peak_python_rss_mb": round(rss.peak_python / (1024 * 1024), 1),
+    }
+
+
+def machine_profile() -> Dict[str, Any]:
+    """Hardware and software the benchmarks ran on, stored with the baseline"""
+    cpu = platform.processor()
+    with contextlib.suppress(OSError):
+        for line in Path("/proc/cpuinfo").read_text().splitlines():
+            if line.startswith("model name"):
+                cpu = line.split(":", 1)[1].strip()
+                break
+    return {
+        "os": platform.platform(),
+        "cpu": cpu or platform.machine(),
+        "cpu_count": psutil.cpu_count(),
+        "memory_gb": round(psutil.virtual_memory().total / (1024 ** 3), 1),
+        "python": platform.python_version(),
+    }
+
+
+def machine_differences(baseline_machine: Dict[str, Any], current_machine: Dict[str, Any]) -> List[str]:
+    """Hardware fields that differ between the baseline's machine and this one"""
+    return [
+        f"{key}: {baseline_machine.get(key)} vs {current_machine.get(key)}"
+        for key in ("cpu", "cpu_count", "memory_gb")
+        if baseline_machine.get(key) != current_machine.get(key)
+    ]
+
+
+def summarize(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Median of every numeric metric across repeated runs of one scenario"""
+    summary: Dict[str, Any] = {
+        "scenario": runs[0]["scenario"],
+        "runs": len(runs),
+        "success_rate": sum(run["success"] for run in runs) / len(runs),
+    }
+    for key, value in runs[0].items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            summary[key] = statistics.median(run[key] for run in runs)
+    return summary
+
+
+def compare_to_baseline(
+    current: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float,
+) -> List[str]:
+    """
+    Find metrics that got worse than the baseline by more than `tolerance` (relative)
+    and the metric's absolute noise floor
+
+    Returns:
+        Human-readable regression descriptions (empty when everything is within bounds)
+    """
+    regressions = []
+    for name, summary in current.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        if summary["success_rate"] < reference.get("success_rate", 1.0):
+            regressions.append(f"{name}: success rate {summary['success_rate']:.0%} < {reference['success_rate']:.0%}")
+        for metric, noise_floor in COMPARED_METRICS.items():
+            if metric not in summary or metric not in reference:
+                continue
+            value, expected = summary[metric], reference[metric]
+            if value > expected * (1 + tolerance) and value - expected > noise_floor:
+                regressions.append(f"{name}: {metric} {value:g} vs baseline {expected:g} (+{(value / max(expected, 1e-9) - 1):.0%})")
+    return regressions
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Offline Benchmark Runner
+Runs the Greenhouse / LinkedIn Easy Apply / generic career-site flows against local
+fixtures with a scripted LLM, prints per-phase timings and fails (exit 1) when a
+metric regresses past the stored baseline
+"""
+
+import sys
+import os
+import json
+import asyncio
+import argparse
+from pathlib import Path
+
+# Keep browser-use's per-step logging out of the report unless asked for
+os.environ.setdefault('BROWSER_USE_LOGGING_LEVEL', 'warning')
+
+# Add automation engine to path
+engine_path = Path(__file__).parent.parent
+sys.path.insert(0, str(engine_path))
+
+from benchmarks.harness import (
+    SCENARIOS, FixtureServer, compare_to_baseline, machine_differences, machine_profile, run_scenario, summarize,
+)
+
+DEFAULT_BASELINE = Path(__file__).parent / 'baseline.json'
+
+REPORT_COLUMNS = [
+    ('wall_time_ms', 'wall ms'),
+    ('steps', 'steps'),
+    ('llm_calls', 'llm calls'),
+    ('browser_launch_ms', 'launch ms'),
+    ('dom_capture_ms', 'dom ms'),
+    ('serialization_ms', 'serialize ms'),
+    ('llm_wait_ms', 'llm ms'),
+    ('action_execution_ms', 'actions ms'),
+    ('peak_rss_mb', 'peak rss mb'),
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="JobSwipe offline automation benchmarks")
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS), help="Scenario to run (repeatable, default: all)")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per scenario; the median is reported (default: 3)")
+    parser.add_argument('--llm-latency', type=float, default=0.0, help="Simulated LLM latency per call in seconds (default: 0)")
+    parser.add_argument('--headful', action='store_true', help="Show the browser window")
+    parser.add_argument('--incremental-dom', action='store_true', help="Maintain the DOM tree from mutation events")
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument('--update-baseline', action='store_true', help="Write this run's results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed relative regression before failing (default: 0.2)")
+    parser.add_argument('--output', type=Path, help="Also write the results as JSON to this file")
+    return parser.parse_args()
+
+
+def print_report(summaries: dict) -> None:
+    header = f"{'scenario':<12}{'ok':>6}" + ''.join(f"{label:>14}" for _, label in REPORT_COLUMNS)
+    print(header)
+    print('-' * len(header))
+    for name, summary in summaries.items():
+        row = f"{name:<12}{summary['success_rate']:>6.0%}"
+        row += ''.join(f"{summary.get(metric, 0):>14g}" for metric, _ in REPORT_COLUMNS)
+        print(row)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    summaries = {}
+    with FixtureServer() as server:
+        for name in args.scenario or list(SCENARIOS):
+            runs = []
+            for attempt in range(args.repeat):
+                print(f"🏃 {name} run {attempt + 1}/{args.repeat}", file=sys.stderr)
+                result = await run_scenario(
+                    SCENARIOS[name], server.base_url, args.llm_latency,
+                    headless=not args.headful, incremental_dom=args.incremental_dom,
+                )
+                if not result['success']:
+                    print(f"⚠️ {name} did not reach the confirmation page: {result.get('error')}", file=sys.stderr)
+                runs.append(result)
+            summaries[name] = summarize(runs)
+    return summaries
+
+
+def main() -> int:
+    args = parse_args()
+    summaries = asyncio.run(run(args))
+
+    print_report(summaries)
+    if args.output:
+        args.output.write_text(json.dumps(summaries, indent=2))
+
+    if args.update_baseline:
+        baseline = {'machine': machine_profile(), 'scenarios': summaries}
+        args.baseline.write_text(json.dumps(baseline, indent=2) + '\n')
+        print(f"\n💾 Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"\nℹ️ No baseline at {args.baseline} - run with --update-baseline to create one")
+        return 0 if all(summary['success_rate'] == 1 for summary in summaries.values()) else 1
+
+    baseline = json.loads(args.baseline.read_text())
+    differences = machine_differences(baseline.get('machine', {}), machine_profile())
+    if differences:
+        print("\n⚠️ Baseline was recorded on a different machine, timings may not be comparable:")
+        for difference in differences:
+            print(f"   - {difference}")
+
+    regressions = compare_to_baseline(summaries, baseline.get('scenarios', {}), args.tolerance)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+        for regression in regressions:
+            print(f"   - {regression}")
+        return 1
+
+    print(f"\n✅ Within {args.tolerance:.0%} of baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
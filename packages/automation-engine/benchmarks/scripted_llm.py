@@ -0,0 +1,150 @@
+"""
+Scripted LLM for offline benchmarks
+Reads the browser state the agent sends and answers like a competent model would:
+fill known fields, upload the resume, click the submit/next button, call done on
+the confirmation page. Deterministic, no network, configurable simulated latency.
+"""
+
+import asyncio
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from browser_use.llm.messages import BaseMessage, UserMessage
+from browser_use.llm.views import ChatInvokeCompletion
+
+# `[123]<input type=text id=first_name name=first_name />` (a leading * marks new elements)
+ELEMENT_RE = re.compile(r'\*?\[(\d+)\]<(\w+)([^\n>]*)')
+ATTRIBUTE_RE = re.compile(r'\b(id|name|type|checked)=(\S+)')
+ADVANCE_RE = re.compile(r'submit|next|review|continue|apply', re.IGNORECASE)
+CONFIRMATION_MARKERS = ('application submitted', 'thank you for applying', 'your application was sent')
+
+
+@dataclass
+class ScriptedFormLLM:
+    """
+    BaseChatModel-compatible model that fills application forms from a fixed answer sheet
+
+    Args:
+        start_url: Page to open when the agent starts on about:blank
+        answers: Field name/id -> value. Inputs get typed, selects get the option text,
+                 checkboxes are clicked when the value is "check"
+        resume_path: File uploaded to file inputs via the upload_resume action
+        latency: Simulated model latency per call in seconds
+    """
+
+    start_url: str
+    answers: Dict[str, str]
+    resume_path: Optional[str] = None
+    latency: float = 0.0
+    model: str = 'scripted-form-filler'
+
+    calls: int = field(default=0, init=False)
+    reached_confirmation: bool = field(default=False, init=False)
+    _handled: Set[str] = field(default_factory=set, init=False)
+    _clicked: Set[str] = field(default_factory=set, init=False)
+    _idle_steps: int = field(default=0, init=False)
+    _navigated: bool = field(default=False, init=False)
+
+    @property
+    def provider(self) -> str:
+        return 'scripted'
+
+    @property
+    def name(self) -> str:
+        return self.model
+
+    @staticmethod
+    def _browser_state(messages: List[BaseMessage]) -> str:
+        """The <browser_state> section of the latest state message (the task text is ignored)"""
+        for message in reversed(messages):
+            if isinstance(message, UserMessage):
+                text = message.text
+                start = text.find('<browser_state>')
+                end = text.find('</browser_state>', start)
+                return text[start:end] if start != -1 and end != -1 else text
+        return ''
+
+    def _plan_actions(self, state: str) -> List[Dict[str, Any]]:
+        lowered = state.lower()
+        if any(marker in lowered for marker in CONFIRMATION_MARKERS):
+            self.reached_confirmation = True
+            return [{'done': {'text': 'SUCCESS: application submitted', 'success': True}}]
+
+        elements = []
+        for index, tag, attribute_text in ELEMENT_RE.findall(state):
+            attributes = dict(ATTRIBUTE_RE.findall(attribute_text))
+            key = attributes.get('name') or attributes.get('id') or ''
+            elements.append((int(index), tag.lower(), attributes, key))
+
+        if not elements and not self._navigated:
+            # Agent started on a blank tab (the task mentions several URLs, so it was not opened directly)
+            self._navigated = True
+            return [{'navigate': {'url': self.start_url, 'new_tab': False}}]
+        if elements:
+            self._navigated = True
+
+        actions: List[Dict[str, Any]] = []
+        for index, tag, attributes, key in elements:
+            handled_key = f'{index}:{key}'
+            if handled_key in self._handled:
+                continue
+            input_type = attributes.get('type', '')
+
+            if input_type == 'file' and self.resume_path:
+                actions.append({'upload_resume': {'index': index, 'file_path': self.resume_path}})
+            elif key not in self.answers:
+                continue
+            elif tag == 'select':
+                actions.append({'select_dropdown': {'index': index, 'text': self.answers[key]}})
+            elif input_type == 'checkbox':
+                if self.answers[key] != 'check' or 'checked' in attributes:
+                    continue
+                actions.append({'click': {'index': index}})
+            elif tag in ('input', 'textarea'):
+                actions.append({'input': {'index': index, 'text': self.answers[key]}})
+            else:
+                continue
+            self._handled.add(handled_key)
+
+        if actions:
+            self._idle_steps = 0
+            return actions
+
+        # Everything on this page is filled - move on
+        for index, tag, attributes, key in elements:
+            advance = attributes.get('type') == 'submit' or ADVANCE_RE.search(attributes.get('id', ''))
+            if advance and tag in ('button', 'a', 'input') and f'{index}' not in self._clicked:
+                self._clicked.add(f'{index}')
+                return [{'click': {'index': index}}]
+
+        self._idle_steps += 1
+        if self._idle_steps >= 3:
+            return [{'done': {'text': 'FAILED: no form progress possible', 'success': False}}]
+        return [{'wait': {'seconds': 1}}]
+
+    async def ainvoke(self, messages: List[BaseMessage], output_format=None, **kwargs: Any) -> ChatInvokeCompletion:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if output_format is None:
+            return ChatInvokeCompletion(completion='ok', usage=None)
+
+        fields = output_format.model_fields
+        if 'action' in fields:
+            actions = self._plan_actions(self._browser_state(messages))
+            completion = output_format.model_validate({
+                'thinking': None,
+                'evaluation_previous_goal': 'Scripted step',
+                'memory': f'Scripted step {self.calls}',
+                'next_goal': 'Continue the application',
+                'action': actions,
+            })
+        elif 'verdict' in fields:
+            # Judge call
+            completion = output_format.model_validate({'verdict': self.reached_confirmation, 'reasoning': 'scripted'})
+        else:
+            raise ValueError(f'ScriptedFormLLM cannot answer {output_format.__name__}')
+
+        return ChatInvokeCompletion(completion=completion, usage=None)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Automation Worker Script
+Long-lived alternative to run_server_automation.py / run_desktop_automation.py:
+imports browser-use, registers automations and creates the LLM client once, then
+serves any number of applications over JSON-RPC (stdin/stdout or a local socket)
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import traceback
+from pathlib import Path
+
+# stdout is the protocol channel - keep browser-use's default logging off it
+os.environ.setdefault('BROWSER_USE_SETUP_LOGGING', 'false')
+
+# Add automation engine to path
+engine_path = Path(__file__).parent.parent
+sys.path.insert(0, str(engine_path))
+
+try:
+    from src.core.worker import AutomationWorker
+    from browser_use.logging_config import setup_logging
+except ImportError as e:
+    print(f"❌ IMPORT ERROR: {str(e)}", file=sys.stderr)
+    traceback.print_exc(file=sys.stderr)
+    sys.exit(1)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="JobSwipe persistent automation worker")
+    parser.add_argument('--socket', dest='socket_path', help="Serve on this Unix socket path instead of stdio")
+    parser.add_argument('--host', default='127.0.0.1', help="TCP host (with --port)")
+    parser.add_argument('--port', type=int, help="Serve on this TCP port instead of stdio")
+    parser.add_argument(
+        '--max-concurrent-jobs', type=int,
+        default=int(os.getenv('WORKER_MAX_CONCURRENT_JOBS', '1')),
+        help="Applications executed at the same time (default: 1)"
+    )
+    parser.add_argument(
+        '--max-jobs', type=int,
+        default=int(os.getenv('WORKER_MAX_JOBS', '0')) or None,
+        help="Exit after this many applications so the supervisor can recycle the worker"
+    )
+    parser.add_argument(
+        '--company-limit', action='append', default=[], metavar='TYPE=N',
+        help="Per company-type concurrency limit, e.g. --company-limit linkedin=2 (repeatable)"
+    )
+    parser.add_argument(
+        '--browser-pool-size', type=int,
+        default=int(os.getenv('WORKER_BROWSER_POOL_SIZE', '0')),
+        help="Keep this many Chrome instances pre-launched and reuse them across jobs (default: 0, launch per job)"
+    )
+    parser.add_argument(
+        '--contexts-per-browser', type=int,
+        default=int(os.getenv('WORKER_CONTEXTS_PER_BROWSER', '1')),
+        help="Jobs sharing one pooled Chrome at the same time, each in its own browser context (default: 1)"
+    )
+    return parser.parse_args()
+
+
+def parse_company_limits(values):
+    """Parse repeated TYPE=N options into a dict (None keeps the scheduler defaults)"""
+    if not values:
+        return None
+
+    from src.core.scheduler import DEFAULT_COMPANY_LIMITS
+    limits = dict(DEFAULT_COMPANY_LIMITS)
+    for value in values:
+        company_type, _, limit = value.partition('=')
+        limits[company_type.strip().lower()] = int(limit)
+    return limits
+
+
+async def main():
+    args = parse_args()
+    setup_logging(stream=sys.stderr)
+
+    worker = AutomationWorker(
+        max_concurrent_jobs=args.max_concurrent_jobs,
+        max_jobs=args.max_jobs,
+        company_limits=parse_company_limits(args.company_limit),
+        browser_pool_size=args.browser_pool_size,
+        contexts_per_browser=args.contexts_per_browser
+    )
+
+    if args.socket_path or args.port:
+        await worker.serve_socket(path=args.socket_path, host=args.host, port=args.port)
+    else:
+        await worker.serve_stdio()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -194,13 +194,17 @@ class BaseJobAutomation(ABC):
         self.logger.info(f"✅ Using LLM from ExecutionContext: {type(self.context.llm).__name__}")
         return self.context.llm
 
-    def _create_browser_session(self) -> BrowserSession:
+    def _create_browser_session(self, pooled_browser=None) -> BrowserSession:
         """
         Create and return a browser session using BrowserProfile from ExecutionContext
 
         UNIFIED VERSION: ExecutionContext already configured BrowserProfile for:
         - SERVER mode: headless=True, with proxy
         - DESKTOP mode: headless=False, with user's browser profile, no proxy
+
+        Args:
+            pooled_browser: Browser leased from context.browser_pool (optional).
+                            The session attaches to it over CDP instead of launching Chrome.
         """
         if self.context.browser_profile is None:
             raise RuntimeError("BrowserProfile not initialized in ExecutionContext! This should never happen.")
@@ -208,6 +212,12 @@ class BaseJobAutomation(ABC):
         self.logger.info(f"Creating browser session for {self.context.mode.value} mode")
         self.logger.info(f"Using BrowserProfile: headless={self.context.browser_profile.headless}, proxy={self.context.browser_profile.proxy is not None}")
 
+        if pooled_browser is not None:
+            from ...core.browser_pool import create_pooled_session
+
+            self.logger.info(f"♻️  Attaching to pooled browser #{pooled_browser.browser_id} ({pooled_browser.jobs_served} jobs served)")
+            return create_pooled_session(pooled_browser, self.context.browser_profile)
+
         # Create BrowserSession with the pre-configured profile from ExecutionContext
         browser_session = BrowserSession(browser_profile=self.context.browser_profile)
 
@@ -292,11 +302,20 @@ class BaseJobAutomation(ABC):
             llm = self._get_llm()
             self.logger.info(f"✅ LLM ready: {llm.__class__.__name__}")
 
-            self.logger.info("🌐 Creating browser session...")
-            browser_session = self._create_browser_session()
-            self.logger.info("✅ Browser session created")
-
+            # Lease a pre-warmed browser when the engine runs with a pool
+            # (the job gets its own browser context, proxy included)
+            browser_pool = self.context.browser_pool
+            pooled_browser = None
+            browser_session = None
             try:
+                if browser_pool is not None:
+                    self.logger.info("🌐 Leasing browser from pool...")
+                    pooled_browser = await browser_pool.acquire()
+
+                self.logger.info("🌐 Creating browser session...")
+                browser_session = self._create_browser_session(pooled_browser)
+                self.logger.info("✅ Browser session created")
+
                 self.logger.info("🔄 Starting browser...")
                 await browser_session.start()
                 self.logger.info("✅ Browser started successfully")
@@ -344,7 +363,13 @@ class BaseJobAutomation(ABC):
                     self.result.screenshots.append(final_screenshot)
 
             finally:
-                await browser_session.stop()
+                try:
+                    if browser_session is not None:
+                        await browser_session.stop()
+                finally:
+                    if pooled_browser is not None:
+                        # The job's context closed with its session; back to the pool, or retired if it crashed / aged out
+                        await browser_pool.release(pooled_browser, healthy=pooled_browser.is_alive())
 
             # Finalize result
             if self.result.status == ApplicationStatus.FAILED:
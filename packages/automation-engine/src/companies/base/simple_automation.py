@@ -85,7 +85,7 @@ class SimpleAutomation:
             profile = BrowserProfile(
                 headless=False,
                 keep_alive=False,
-                wait_between_actions=0.5
+                wait_between_actions=0.0  # Actions wait for the page to settle instead
             )
             
             # Create browser session
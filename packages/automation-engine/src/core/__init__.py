@@ -11,6 +11,15 @@ def __getattr__(name):
     if name == 'AutomationEngine':
         from .automation_engine import AutomationEngine
         return AutomationEngine
+    if name in ('AutomationScheduler', 'JobPriority'):
+        from . import scheduler
+        return getattr(scheduler, name)
+    if name in ('BrowserPool', 'PooledBrowser'):
+        from . import browser_pool
+        return getattr(browser_pool, name)
+    if name == 'AutomationWorker':
+        from .worker import AutomationWorker
+        return AutomationWorker
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
@@ -19,5 +28,8 @@ __all__ = [
     'ProxyConfig',
     'BrowserConfig',
     'AutomationEngine',
+    'AutomationScheduler',
+    'JobPriority',
+    'AutomationWorker',
     'ProxyManager',
 ]
@@ -23,8 +23,27 @@ class AutomationEngine:
     Detects company type from job URL and executes appropriate automation
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        llm: Optional[Any] = None,
+        browser_pool: Optional[Any] = None,
+        browser_profile_overrides: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize automation engine
+
+        Args:
+            llm: Pre-initialized LLM shared by every execution (optional).
+                 When omitted, each ExecutionContext creates its own.
+            browser_pool: Started BrowserPool to lease browsers from (optional).
+                          When omitted, each application launches its own Chrome.
+            browser_profile_overrides: BrowserProfile fields replacing the defaults
+                                       (e.g. {'headless': True}) for every execution
+        """
         self.automations = {}
+        self.llm = llm
+        self.browser_pool = browser_pool
+        self.browser_profile_overrides = browser_profile_overrides or {}
         self._register_automations()
 
     def _register_automations(self):
@@ -133,7 +152,10 @@ class AutomationEngine:
             mode=mode,
             user_profile=user_profile,
             proxy_config=proxy_config,
-            session_id=session_id
+            session_id=session_id,
+            llm=self.llm,
+            browser_pool=self.browser_pool,
+            browser_profile_overrides=self.browser_profile_overrides
         )
 
         context.log_info("=" * 80)
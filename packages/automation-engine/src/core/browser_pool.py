@@ -0,0 +1,376 @@
+"""
+Browser Pool - Pre-warmed Chrome instances shared across job applications
+Pays the Chrome launch cost (subprocess spawn, CDP port wait, extension loading)
+once per pooled browser instead of once per application
+"""
+
+import asyncio
+import logging
+import shutil
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Optional
+
+import psutil
+
+from browser_use import BrowserProfile
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.watchdogs.local_browser_watchdog import LocalBrowserWatchdog
+
+from .execution_context import create_browser_profile
+
+
+@dataclass
+class PooledBrowser:
+    """A launched Chrome process owned by the pool"""
+    browser_id: int
+    cdp_url: str
+    process: Optional[psutil.Process]
+    user_data_dir: str
+    baseline_rss_mb: float = 0.0
+    jobs_served: int = 0
+    active_leases: int = 0
+    retiring: bool = False
+    created_at: float = field(default_factory=time.time)
+
+    def rss_mb(self) -> float:
+        """Resident memory of the browser and all of its child processes"""
+        if not self.process:
+            return 0.0
+        try:
+            processes = [self.process, *self.process.children(recursive=True)]
+        except psutil.Error:
+            return 0.0
+
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+
+    def is_alive(self) -> bool:
+        try:
+            return bool(self.process) and self.process.is_running() and self.process.status() != psutil.STATUS_ZOMBIE
+        except psutil.Error:
+            return False
+
+
+class BrowserPool:
+    """
+    Pool of K pre-launched Chrome instances
+
+    Each job leases a browser and attaches its own BrowserSession over CDP in an
+    isolated browser context (separate cookies, storage, downloads and proxy), so
+    up to `contexts_per_browser` jobs can share one Chrome process. The launching
+    session is detached right after startup so the pool, not a job, owns the
+    process. A browser is retired and replaced once it has served
+    `max_jobs_per_browser` jobs, grown more than `max_rss_growth_mb` or crashed;
+    retirement waits for its other jobs to finish.
+
+    Usage:
+        pool = BrowserPool(size=2)
+        await pool.start()
+        async with pool.session(job_profile) as browser_session:
+            agent = Agent(task=..., llm=llm, browser_session=browser_session)
+            await agent.run()
+        await pool.close()
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        contexts_per_browser: int = 1,
+        launch_profile: Optional[BrowserProfile] = None,
+        max_jobs_per_browser: int = 20,
+        max_rss_growth_mb: float = 1024,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize browser pool
+
+        Args:
+            size: Number of browsers kept launched (K)
+            contexts_per_browser: Jobs allowed to share one browser at the same time
+            launch_profile: Profile used to launch pooled browsers (default: create_browser_profile()).
+                            Launch-level settings (headless, proxy, args) apply to every job using the pool.
+            max_jobs_per_browser: Retire a browser after this many jobs (M)
+            max_rss_growth_mb: Retire a browser whose memory grew by more than this since launch
+            logger: Logger instance (optional)
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if contexts_per_browser < 1:
+            raise ValueError("contexts_per_browser must be at least 1")
+
+        self.size = size
+        self.contexts_per_browser = contexts_per_browser
+        self.launch_profile = launch_profile or create_browser_profile(keep_alive=True)
+        self.max_jobs_per_browser = max_jobs_per_browser
+        self.max_rss_growth_mb = max_rss_growth_mb
+        self.logger = logger or logging.getLogger("jobswipe.automation.browser_pool")
+
+        # One entry per free slot: a browser appears contexts_per_browser times when unused
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._browsers: Dict[int, PooledBrowser] = {}
+        self._replacements: set = set()
+        self._next_id = 0
+        self._closed = False
+
+        self.browsers_launched = 0
+        self.browsers_retired = 0
+        self.jobs_served = 0
+        self.total_acquire_wait_ms = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        """Launch K browsers concurrently"""
+        start_time = time.time()
+        results = await asyncio.gather(
+            *(self._launch() for _ in range(self.size)), return_exceptions=True
+        )
+
+        launched = 0
+        for result in results:
+            if isinstance(result, PooledBrowser):
+                self._add_slots(result)
+                launched += 1
+            else:
+                self.logger.error(f"❌ Failed to launch pooled browser: {result}")
+
+        if not launched:
+            raise RuntimeError("BrowserPool could not launch any browser")
+
+        self.logger.info(
+            f"✅ Browser pool ready: {launched}/{self.size} browsers in {int((time.time() - start_time) * 1000)}ms"
+        )
+
+    async def close(self):
+        """Kill every pooled browser (leased browsers are killed when released)"""
+        self._closed = True
+
+        if self._replacements:
+            await asyncio.gather(*list(self._replacements), return_exceptions=True)
+
+        while not self._idle.empty():
+            self._idle.get_nowait()
+
+        for pooled in list(self._browsers.values()):
+            pooled.retiring = True
+            if not pooled.active_leases:
+                await self._retire(pooled, reason="pool closed")
+
+    def _add_slots(self, pooled: PooledBrowser):
+        for _ in range(self.contexts_per_browser):
+            self._idle.put_nowait(pooled)
+
+    async def _launch(self) -> PooledBrowser:
+        """Launch one Chrome and detach the launching session, keeping the process"""
+        self._next_id += 1
+        browser_id = self._next_id
+
+        # Every pooled browser needs its own profile directory (Chrome locks user_data_dir)
+        user_data_dir = tempfile.mkdtemp(prefix=f'jobswipe-pool-{browser_id}-')
+        profile = self.launch_profile.model_copy(update={
+            'user_data_dir': user_data_dir,
+            'keep_alive': True,
+            'cdp_url': None,
+        })
+
+        launcher = BrowserSession(browser_profile=profile)
+        try:
+            await launcher.start()
+            cdp_url = launcher.cdp_url
+
+            # Take ownership: the launcher must not kill the process when it goes away
+            process = launcher.detach_browser_process()
+        finally:
+            await launcher.event_bus.stop(clear=True, timeout=5)
+            await launcher.reset()
+
+        if not cdp_url:
+            shutil.rmtree(user_data_dir, ignore_errors=True)
+            raise RuntimeError("Pooled browser launched without a CDP URL")
+
+        pooled = PooledBrowser(
+            browser_id=browser_id,
+            cdp_url=cdp_url,
+            process=process,
+            user_data_dir=user_data_dir,
+        )
+        pooled.baseline_rss_mb = pooled.rss_mb()
+
+        self._browsers[browser_id] = pooled
+        self.browsers_launched += 1
+        self.logger.info(
+            f"🌐 Pooled browser #{browser_id} launched (pid={process.pid if process else '?'}, "
+            f"rss={pooled.baseline_rss_mb:.0f}MB)"
+        )
+        return pooled
+
+    async def _retire(self, pooled: PooledBrowser, reason: str):
+        """Kill a pooled browser and remove its profile directory"""
+        self.logger.info(f"♻️  Retiring pooled browser #{pooled.browser_id} after {pooled.jobs_served} jobs ({reason})")
+        self._browsers.pop(pooled.browser_id, None)
+        self.browsers_retired += 1
+
+        if pooled.process:
+            await LocalBrowserWatchdog.terminate_process(pooled.process)
+        shutil.rmtree(pooled.user_data_dir, ignore_errors=True)
+
+    def _schedule_replacement(self):
+        """Launch a replacement browser in the background to keep the pool at size K"""
+        if self._closed:
+            return
+
+        async def replace():
+            try:
+                self._add_slots(await self._launch())
+            except Exception as e:
+                self.logger.error(f"❌ Failed to launch replacement browser: {e}")
+
+        task = asyncio.create_task(replace())
+        self._replacements.add(task)
+        task.add_done_callback(self._replacements.discard)
+
+    # ------------------------------------------------------------------
+    # Leasing
+    # ------------------------------------------------------------------
+
+    async def acquire(self, timeout: Optional[float] = None) -> PooledBrowser:
+        """
+        Lease an idle browser, waiting for one to be released if all are busy
+
+        Args:
+            timeout: Maximum seconds to wait (None = wait forever)
+        """
+        if self._closed:
+            raise RuntimeError("BrowserPool is closed")
+
+        start_time = time.time()
+        while True:
+            pooled = await asyncio.wait_for(self._idle.get(), timeout=timeout)
+            if pooled.retiring:
+                continue  # Stale slot of a browser waiting for its last job to finish
+            if pooled.is_alive():
+                break
+
+            # Crashed while idle - replace it and try the next one
+            pooled.retiring = True
+            if not pooled.active_leases:
+                await self._retire(pooled, reason="process died")
+                self._schedule_replacement()
+
+        pooled.active_leases += 1
+        self.total_acquire_wait_ms += int((time.time() - start_time) * 1000)
+        return pooled
+
+    async def release(self, pooled: PooledBrowser, healthy: bool = True):
+        """
+        Return a leased browser slot, retiring and replacing the browser if it aged out
+
+        The job's browser context (tabs, cookies, storage) is disposed when its
+        BrowserSession disconnects, so nothing needs wiping here.
+
+        Args:
+            pooled: Browser returned by acquire()
+            healthy: False if the job left the browser in a bad state (forces retirement)
+        """
+        pooled.active_leases -= 1
+        pooled.jobs_served += 1
+        self.jobs_served += 1
+
+        if not pooled.retiring:
+            retire_reason = None
+            rss_growth = pooled.rss_mb() - pooled.baseline_rss_mb
+            if self._closed:
+                retire_reason = "pool closed"
+            elif not healthy:
+                retire_reason = "unhealthy"
+            elif not pooled.is_alive():
+                retire_reason = "process died"
+            elif pooled.jobs_served >= self.max_jobs_per_browser:
+                retire_reason = f"max_jobs_per_browser={self.max_jobs_per_browser}"
+            elif rss_growth > self.max_rss_growth_mb:
+                retire_reason = f"memory grew {rss_growth:.0f}MB"
+
+            if retire_reason is None:
+                self._idle.put_nowait(pooled)
+                return
+
+            self.logger.info(f"♻️  Pooled browser #{pooled.browser_id} is retiring ({retire_reason})")
+            pooled.retiring = True
+
+        # Jobs still running in other contexts keep the browser alive until they finish
+        if not pooled.active_leases and pooled.browser_id in self._browsers:
+            await self._retire(pooled, reason="retired")
+            self._schedule_replacement()
+
+    @asynccontextmanager
+    async def lease(self, timeout: Optional[float] = None) -> AsyncIterator[PooledBrowser]:
+        """Lease a browser for the duration of the block"""
+        pooled = await self.acquire(timeout=timeout)
+        healthy = True
+        try:
+            yield pooled
+        except BaseException:
+            healthy = pooled.is_alive()
+            raise
+        finally:
+            await self.release(pooled, healthy=healthy)
+
+    @asynccontextmanager
+    async def session(
+        self,
+        browser_profile: Optional[BrowserProfile] = None,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[BrowserSession]:
+        """
+        Lease a browser and yield a started BrowserSession attached to it
+
+        Args:
+            browser_profile: Job profile (agent-level settings such as wait_between_actions);
+                             launch-level settings come from the pool's launch_profile
+            timeout: Maximum seconds to wait for an idle browser
+        """
+        async with self.lease(timeout=timeout) as pooled:
+            browser_session = create_pooled_session(pooled, browser_profile)
+            await browser_session.start()
+            try:
+                yield browser_session
+            finally:
+                await browser_session.stop()
+
+    def stats(self) -> dict:
+        """Pool counters for monitoring"""
+        return {
+            "size": self.size,
+            "contexts_per_browser": self.contexts_per_browser,
+            "browsers": len(self._browsers),
+            "leased": sum(pooled.active_leases for pooled in self._browsers.values()),
+            "browsers_launched": self.browsers_launched,
+            "browsers_retired": self.browsers_retired,
+            "jobs_served": self.jobs_served,
+            "avg_acquire_wait_ms": int(self.total_acquire_wait_ms / self.jobs_served) if self.jobs_served else 0,
+        }
+
+
+def create_pooled_session(pooled: PooledBrowser, browser_profile: Optional[BrowserProfile] = None) -> BrowserSession:
+    """
+    Create a BrowserSession that attaches to a pooled browser instead of launching one
+
+    The session runs in its own browser context (own cookies, storage, downloads and
+    proxy) that is disposed when it disconnects. keep_alive is forced on so
+    Agent.close() / session.stop() leave the pooled process running.
+    """
+    if browser_profile is None:
+        return BrowserSession(cdp_url=pooled.cdp_url, keep_alive=True, isolated_context=True)
+    return BrowserSession(
+        browser_profile=browser_profile, cdp_url=pooled.cdp_url, keep_alive=True, isolated_context=True
+    )
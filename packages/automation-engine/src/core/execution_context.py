@@ -19,7 +19,150 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / 'browser-use
 # Import browser-use components
 from browser_use import BrowserProfile
 from browser_use.browser.profile import ProxySettings
-from browser_use.llm import ChatGoogle
+from browser_use.llm import ChatAnthropic, ChatGoogle
+from browser_use.llm.cache import ChatCached
+from browser_use.llm.cassette import ChatCassette
+from browser_use.llm.hedged import ChatHedged
+from browser_use.llm.rate_limit import ChatRateLimited
+
+
+def _env_float(name: str) -> Optional[float]:
+    """Read an optional positive number from the environment"""
+    value = os.getenv(name)
+    return float(value) if value else None
+
+
+def create_default_llm(logger: Optional[logging.Logger] = None):
+    """
+    Create the default LLM used by automations (Google Gemini 2.5 Pro)
+
+    Creates a new instance; use get_shared_default_llm() to reuse the process-wide one.
+    Calls go through a ChatRateLimited wrapper, so every automation in the process shares
+    one request/token budget (LLM_REQUESTS_PER_MINUTE / LLM_TOKENS_PER_MINUTE, unset = no
+    limit) and backs off together on 429s instead of each retrying on its own.
+
+    When LLM_BACKUP_MODEL (an Anthropic model, e.g. claude-sonnet-4-0) and ANTHROPIC_API_KEY
+    are set, slow or failing Gemini calls are hedged to that model (ChatHedged). When
+    LLM_CACHE_PATH is set, identical prompts are answered from a SQLite cache (ChatCached).
+
+    LLM_CASSETTE=<file> with LLM_CASSETTE_MODE=record saves every call to a cassette;
+    LLM_CASSETTE_MODE=replay serves a recorded run offline (no API key needed).
+
+    Args:
+        logger: Logger for status messages (optional)
+
+    Returns:
+        Rate-limited ChatGoogle, optionally hedged to an Anthropic backup and cached
+    """
+    cassette_path = os.getenv("LLM_CASSETTE")
+    cassette_mode = os.getenv("LLM_CASSETTE_MODE", "replay")
+    if cassette_path and cassette_mode == "replay":
+        if logger:
+            logger.info(f"📼 Replaying recorded LLM calls from {cassette_path}")
+        return ChatCassette(cassette_path, mode="replay", latency=_env_float("LLM_CASSETTE_LATENCY"))
+
+    google_api_key = os.getenv("GOOGLE_API_KEY")
+
+    if not google_api_key:
+        error_msg = "GOOGLE_API_KEY environment variable not found! Cannot initialize LLM for automation."
+        if logger:
+            logger.error(error_msg)
+        raise ValueError(error_msg)
+
+    try:
+        # Initialize Google Gemini LLM
+        # Retries happen in the shared rate-limit layer, not per client
+        llm = ChatRateLimited(
+            ChatGoogle(model='gemini-2.5-pro', max_retries=1),
+            requests_per_minute=_env_float("LLM_REQUESTS_PER_MINUTE"),
+            tokens_per_minute=_env_float("LLM_TOKENS_PER_MINUTE"),
+        )
+
+        backup_model = os.getenv("LLM_BACKUP_MODEL")
+        if backup_model and os.getenv("ANTHROPIC_API_KEY"):
+            llm = ChatHedged(
+                primary=llm,
+                backup=ChatRateLimited(ChatAnthropic(model=backup_model, max_retries=1)),
+            )
+            if logger:
+                logger.info(f"✅ Hedging slow LLM calls to backup model: {backup_model}")
+
+        cache_path = os.getenv("LLM_CACHE_PATH")
+        if cache_path:
+            llm = ChatCached(llm, cache_path=cache_path)
+            if logger:
+                logger.info(f"✅ LLM response cache enabled: {cache_path}")
+
+        # Outermost, so cache hits are recorded too and the cassette holds every call the agent made
+        if cassette_path:
+            llm = ChatCassette(cassette_path, llm=llm, mode="record")
+            if logger:
+                logger.info(f"📼 Recording LLM calls to {cassette_path}")
+
+        if logger:
+            logger.info("✅ LLM initialized successfully: Google Gemini 2.5 Pro")
+
+        return llm
+
+    except Exception as e:
+        error_msg = f"Failed to initialize LLM: {str(e)}"
+        if logger:
+            logger.error(error_msg, exc_info=True)
+        raise RuntimeError(error_msg) from e
+
+
+_shared_default_llm = None
+
+
+def get_shared_default_llm(logger: Optional[logging.Logger] = None):
+    """
+    Get the process-wide default LLM, creating it on first use
+
+    Every ExecutionContext in the process shares this instance; its SDK client and
+    HTTP connections are pooled by browser_use.llm.client_pool, so LLM steps reuse
+    warm TLS connections instead of reconnecting.
+
+    Args:
+        logger: Logger for status messages (optional)
+
+    Returns:
+        The shared LLM (see create_default_llm)
+    """
+    global _shared_default_llm
+    if _shared_default_llm is None:
+        _shared_default_llm = create_default_llm(logger)
+    return _shared_default_llm
+
+
+def create_browser_profile(
+    proxy: Optional[ProxySettings] = None, keep_alive: bool = False, **overrides: Any
+) -> BrowserProfile:
+    """
+    Create the BrowserProfile used by automations
+
+    Args:
+        proxy: Proxy settings (optional)
+        keep_alive: Keep the browser running after the agent finishes
+                    (pooled browsers outlive individual jobs)
+        **overrides: BrowserProfile fields replacing the defaults below
+                     (e.g. headless=True for benchmarks and CI)
+
+    Returns:
+        BrowserProfile instance
+    """
+    # Always use headful mode (headless=False) as per user requirement
+    settings: Dict[str, Any] = dict(
+        headless=False,  # Always headful mode
+        proxy=proxy,
+        keep_alive=keep_alive,  # Cleanup after job unless the browser is pooled
+        wait_between_actions=0.0,  # Actions wait for the page to settle instead of a fixed delay
+        text_input_mode='insert',  # Whole answers in one CDP call, retyped key by key if the field rejects it
+        disable_security=False,  # Keep security enabled
+        use_vision=True,  # Enable vision for better form understanding
+        max_actions_per_step=4,  # Reasonable action limit per step
+    )
+    settings.update(overrides)
+    return BrowserProfile(**settings)
 
 
 class ExecutionMode(str, Enum):
@@ -88,13 +231,20 @@ class ExecutionContext:
     llm: Optional[Any] = None
     browser_profile: Optional[BrowserProfile] = None
 
+    # Pre-warmed browsers (core.browser_pool.BrowserPool); None launches a browser per job
+    browser_pool: Optional[Any] = None
+
+    # BrowserProfile fields overriding create_browser_profile() defaults
+    browser_profile_overrides: Dict[str, Any] = field(default_factory=dict)
+
     def __post_init__(self):
         """Setup logger, LLM, and BrowserProfile"""
         if self.logger is None:
             self.logger = self._setup_logger()
 
-        # Initialize LLM for AI-powered automation
-        self.llm = self._initialize_llm()
+        # Initialize LLM for AI-powered automation (reuse a warm one if provided)
+        if self.llm is None:
+            self.llm = self._initialize_llm()
 
         # Initialize BrowserProfile with proxy support
         self.browser_profile = self._initialize_browser_profile()
@@ -124,30 +274,9 @@ class ExecutionContext:
     def _initialize_llm(self):
         """
         Initialize LLM for AI-powered automation
-        Uses Google Gemini (ChatGoogle) as recommended
+        Uses Google Gemini (ChatGoogle) as recommended, shared process-wide
         """
-        google_api_key = os.getenv("GOOGLE_API_KEY")
-
-        if not google_api_key:
-            error_msg = "GOOGLE_API_KEY environment variable not found! Cannot initialize LLM for automation."
-            if self.logger:
-                self.logger.error(error_msg)
-            raise ValueError(error_msg)
-
-        try:
-            # Initialize Google Gemini LLM
-            llm = ChatGoogle(model='gemini-2.5-pro')
-
-            if self.logger:
-                self.logger.info("✅ LLM initialized successfully: Google Gemini 2.5 Pro")
-
-            return llm
-
-        except Exception as e:
-            error_msg = f"Failed to initialize LLM: {str(e)}"
-            if self.logger:
-                self.logger.error(error_msg, exc_info=True)
-            raise RuntimeError(error_msg) from e
+        return get_shared_default_llm(self.logger)
 
     def _initialize_browser_profile(self) -> BrowserProfile:
         """
@@ -174,15 +303,7 @@ class ExecutionContext:
 
             # Create BrowserProfile
             # Always use headful mode (headless=False) as per user requirement
-            browser_profile = BrowserProfile(
-                headless=False,  # Always headful mode
-                proxy=proxy_settings,
-                keep_alive=False,  # Always cleanup after job
-                wait_between_actions=0.5,  # Slight delay to avoid rate limits
-                disable_security=False,  # Keep security enabled
-                use_vision=True,  # Enable vision for better form understanding
-                max_actions_per_step=4,  # Reasonable action limit per step
-            )
+            browser_profile = create_browser_profile(proxy=proxy_settings, **self.browser_profile_overrides)
 
             if self.logger:
                 #mode_str = "headless" if is_headless else "headful"
@@ -0,0 +1,368 @@
+"""
+Automation Scheduler - Bounded-concurrency job scheduling on top of AutomationEngine
+Runs many applications in one event loop with per-ATS limits, priority lanes,
+fair scheduling across users and CPU/RAM backpressure
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Deque, Dict, Optional
+
+import psutil
+
+from .execution_context import ExecutionMode, ProxyConfig
+from .automation_engine import AutomationEngine
+
+
+# Conservative defaults - LinkedIn rate limits aggressively, Greenhouse boards are per-company
+DEFAULT_COMPANY_LIMITS: Dict[str, int] = {
+    'linkedin': 2,
+    'greenhouse': 8,
+}
+
+
+class JobPriority(IntEnum):
+    """Priority lane for a scheduled application (lower value runs first)"""
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+@dataclass
+class ScheduledJob:
+    """An application waiting for (or holding) an execution slot"""
+    job_data: Dict[str, Any]
+    user_profile: Dict[str, Any]
+    mode: ExecutionMode
+    company_type: str
+    user_id: str
+    priority: JobPriority = JobPriority.NORMAL
+    proxy_config: Optional[ProxyConfig] = None
+    session_id: Optional[str] = None
+    enqueued_at: float = field(default_factory=time.time)
+    future: Optional[asyncio.Future] = None
+
+
+class AutomationScheduler:
+    """
+    Bounded-concurrency scheduler for AutomationEngine
+
+    Selection order for the next job:
+        1. Highest priority lane with an eligible job
+        2. Within a lane, round-robin across users (one job per user per turn)
+        3. A job is eligible only if its company type is below its concurrency limit;
+           each user's oldest eligible job runs first
+
+    Cancelling the future returned by submit_nowait removes a job that is still queued.
+
+    A new job is started only while there is CPU and RAM headroom; one job is
+    always allowed to run so an overloaded box still makes progress.
+
+    Usage:
+        scheduler = AutomationScheduler(engine, max_concurrent=6)
+        result = await scheduler.submit(job_data, user_profile, ExecutionMode.SERVER, user_id="u1")
+    """
+
+    def __init__(
+        self,
+        engine: AutomationEngine,
+        max_concurrent: int = 4,
+        company_limits: Optional[Dict[str, int]] = None,
+        default_company_limit: Optional[int] = None,
+        max_cpu_percent: float = 85.0,
+        min_available_memory_mb: int = 1024,
+        resource_check_interval: float = 1.0,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize scheduler
+
+        Args:
+            engine: AutomationEngine used to execute applications
+            max_concurrent: Maximum applications running at the same time
+            company_limits: Per company-type concurrency limits (defaults to DEFAULT_COMPANY_LIMITS)
+            default_company_limit: Limit for company types not in company_limits (None = max_concurrent)
+            max_cpu_percent: Do not start new jobs above this system CPU usage
+            min_available_memory_mb: Do not start new jobs below this much available RAM
+            resource_check_interval: Seconds between headroom re-checks while throttled
+            logger: Logger instance (optional)
+        """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+
+        self.engine = engine
+        self.max_concurrent = max_concurrent
+        self.company_limits = dict(DEFAULT_COMPANY_LIMITS if company_limits is None else company_limits)
+        self.default_company_limit = default_company_limit or max_concurrent
+        self.max_cpu_percent = max_cpu_percent
+        self.min_available_memory_mb = min_available_memory_mb
+        self.resource_check_interval = resource_check_interval
+        self.logger = logger or logging.getLogger("jobswipe.automation.scheduler")
+
+        # priority -> user_id -> queue of jobs (OrderedDict order is the round-robin order)
+        self._lanes: Dict[JobPriority, "OrderedDict[str, Deque[ScheduledJob]]"] = {
+            priority: OrderedDict() for priority in JobPriority
+        }
+        self._running_by_company: Dict[str, int] = {}
+        self._running = 0
+        self._tasks: set = set()
+        self._wakeup = asyncio.Event()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self.jobs_submitted = 0
+        self.jobs_completed = 0
+        self.jobs_failed = 0
+        self.throttled_checks = 0
+        self.total_queue_wait_ms = 0
+
+        # Prime psutil's CPU sampling so the first reading is meaningful
+        psutil.cpu_percent(interval=None)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit_nowait(
+        self,
+        job_data: Dict[str, Any],
+        user_profile: Dict[str, Any],
+        mode: ExecutionMode,
+        proxy_config: Optional[ProxyConfig] = None,
+        session_id: Optional[str] = None,
+        priority: JobPriority = JobPriority.NORMAL,
+        user_id: Optional[str] = None
+    ) -> asyncio.Future:
+        """
+        Queue an application and return a future resolving to the engine result dict
+        """
+        if self._closed:
+            raise RuntimeError("Scheduler is stopped")
+
+        job_url = job_data.get('apply_url') or job_data.get('url', '')
+        job = ScheduledJob(
+            job_data=job_data,
+            user_profile=user_profile,
+            mode=mode,
+            company_type=self.engine.detect_company_type(job_url),
+            user_id=str(user_id or user_profile.get('user_id') or user_profile.get('email') or 'anonymous'),
+            priority=JobPriority(priority),
+            proxy_config=proxy_config,
+            session_id=session_id,
+            future=asyncio.get_running_loop().create_future()
+        )
+
+        self._lanes[job.priority].setdefault(job.user_id, deque()).append(job)
+        job.future.add_done_callback(lambda future: self._discard_cancelled(job))
+        self.jobs_submitted += 1
+        self._ensure_dispatcher()
+        self._wakeup.set()
+
+        return job.future
+
+    async def submit(self, *args, **kwargs) -> Dict[str, Any]:
+        """Queue an application and wait for its result (same arguments as submit_nowait)"""
+        return await self.submit_nowait(*args, **kwargs)
+
+    async def stop(self, drain: bool = True):
+        """
+        Stop the scheduler
+
+        Args:
+            drain: Wait for queued and running jobs to finish (otherwise queued jobs are cancelled)
+        """
+        self._closed = True
+
+        if not drain:
+            for users in self._lanes.values():
+                for queue in users.values():
+                    for job in queue:
+                        if not job.future.done():
+                            job.future.cancel()
+                users.clear()
+
+        while drain and (self.pending_count or self._running):
+            self._wakeup.set()
+            await asyncio.sleep(self.resource_check_interval / 4)
+
+        if self._dispatcher:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    @property
+    def pending_count(self) -> int:
+        return sum(len(queue) for users in self._lanes.values() for queue in users.values())
+
+    @property
+    def running_count(self) -> int:
+        return self._running
+
+    def stats(self) -> Dict[str, Any]:
+        """Scheduler counters for monitoring"""
+        finished = self.jobs_completed + self.jobs_failed
+        return {
+            "running": self._running,
+            "pending": self.pending_count,
+            "pending_by_priority": {
+                priority.name.lower(): sum(len(q) for q in users.values())
+                for priority, users in self._lanes.items()
+            },
+            "running_by_company": dict(self._running_by_company),
+            "max_concurrent": self.max_concurrent,
+            "company_limits": dict(self.company_limits),
+            "jobs_submitted": self.jobs_submitted,
+            "jobs_completed": self.jobs_completed,
+            "jobs_failed": self.jobs_failed,
+            "avg_queue_wait_ms": int(self.total_queue_wait_ms / finished) if finished else 0,
+            "throttled_checks": self.throttled_checks,
+        }
+
+    # ------------------------------------------------------------------
+    # Dispatching
+    # ------------------------------------------------------------------
+
+    def _ensure_dispatcher(self):
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch_loop())
+
+    def _company_limit(self, company_type: str) -> int:
+        return self.company_limits.get(company_type, self.default_company_limit)
+
+    def _has_resource_headroom(self) -> bool:
+        """Check CPU / RAM headroom before starting another browser"""
+        if self._running == 0:
+            return True  # Always make progress
+
+        cpu_percent = psutil.cpu_percent(interval=None)
+        available_mb = psutil.virtual_memory().available / (1024 * 1024)
+
+        if cpu_percent > self.max_cpu_percent or available_mb < self.min_available_memory_mb:
+            self.throttled_checks += 1
+            self.logger.debug(
+                f"Backpressure: cpu={cpu_percent:.0f}% available_ram={available_mb:.0f}MB, "
+                f"holding {self.pending_count} pending jobs"
+            )
+            return False
+
+        return True
+
+    def _discard_cancelled(self, job: ScheduledJob):
+        """Drop a queued job whose submitter cancelled its future (running jobs are left alone)"""
+        if not job.future.cancelled():
+            return
+        users = self._lanes[job.priority]
+        queue = users.get(job.user_id)
+        if queue is None or job not in queue:
+            return
+        queue.remove(job)
+        if not queue:
+            del users[job.user_id]
+        self.logger.debug(f"Dropped cancelled {job.company_type} job of user {job.user_id} from the queue")
+
+    def _pop_next_job(self) -> Optional[ScheduledJob]:
+        """Pick the next eligible job (priority lane, then round-robin over users)
+
+        Each user's oldest job whose company type is below its limit is eligible, so a
+        user whose first job waits on a saturated company still gets their other jobs run.
+        """
+        for priority in JobPriority:
+            users = self._lanes[priority]
+            for user_id in list(users.keys()):
+                queue = users[user_id]
+                for index, job in enumerate(queue):
+                    if self._running_by_company.get(job.company_type, 0) < self._company_limit(job.company_type):
+                        break
+                else:
+                    continue
+
+                del queue[index]
+                # Rotate this user to the back of the lane for fairness
+                del users[user_id]
+                if queue:
+                    users[user_id] = queue
+                return job
+
+        return None
+
+    async def _dispatch_loop(self):
+        while True:
+            self._wakeup.clear()
+
+            throttled = False
+            while self._running < self.max_concurrent and self.pending_count:
+                if not self._has_resource_headroom():
+                    throttled = True
+                    break
+
+                job = self._pop_next_job()
+                if job is None:
+                    break  # Everything pending is blocked on company limits
+                self._start(job)
+
+            if self._closed and not self.pending_count:
+                return
+
+            if throttled:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.resource_check_interval)
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await self._wakeup.wait()
+
+    def _start(self, job: ScheduledJob):
+        self._running += 1
+        self._running_by_company[job.company_type] = self._running_by_company.get(job.company_type, 0) + 1
+
+        task = asyncio.create_task(self._run(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, job: ScheduledJob):
+        queue_wait_ms = int((time.time() - job.enqueued_at) * 1000)
+        self.total_queue_wait_ms += queue_wait_ms
+        self.logger.info(
+            f"▶️  Starting {job.company_type} job for user {job.user_id} "
+            f"(priority={job.priority.name}, waited {queue_wait_ms}ms, running={self._running})"
+        )
+
+        try:
+            result = await self.engine.execute(
+                job_data=job.job_data,
+                user_profile=job.user_profile,
+                mode=job.mode,
+                proxy_config=job.proxy_config,
+                session_id=job.session_id
+            )
+            result['queue_wait_ms'] = queue_wait_ms
+
+            if result.get('success'):
+                self.jobs_completed += 1
+            else:
+                self.jobs_failed += 1
+            if not job.future.done():
+                job.future.set_result(result)
+
+        except asyncio.CancelledError:
+            self.jobs_failed += 1
+            job.future.cancel()
+            raise
+
+        except Exception as e:
+            self.jobs_failed += 1
+            if not job.future.done():
+                job.future.set_exception(e)
+
+        finally:
+            self._running -= 1
+            self._running_by_company[job.company_type] -= 1
+            if not self._running_by_company[job.company_type]:
+                del self._running_by_company[job.company_type]
+            self._wakeup.set()
@@ -0,0 +1,496 @@
+"""
+Automation Worker - Long-lived process that serves job applications over JSON-RPC
+Pays the browser-use import, engine registration and LLM client setup once per worker
+instead of once per application
+
+Protocol: JSON-RPC 2.0, one JSON object per line, over stdin/stdout or a local socket.
+
+    --> {"jsonrpc": "2.0", "id": 1, "method": "execute", "params": {"job_data": {...}, "user_profile": {...}}}
+    <-- {"jsonrpc": "2.0", "id": 1, "result": {"success": true, ...}}
+
+Methods:
+    execute              Run one application (params: job_data, user_profile, mode, proxy_config,
+                         session_id, user_id, priority=HIGH|NORMAL|LOW)
+    ping                 Liveness check
+    stats                Worker, scheduler, browser pool and LLM rate-limit counters (jobs, queue, uptime)
+    supported_companies  Registered automation types
+    shutdown             Stop accepting requests and exit once active jobs finish
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, TextIO
+
+from .execution_context import ExecutionMode, ProxyConfig, get_shared_default_llm
+from .automation_engine import AutomationEngine
+from .scheduler import AutomationScheduler, JobPriority
+from .browser_pool import BrowserPool
+
+# browser_use is importable once execution_context has set up sys.path
+from browser_use.llm.rate_limit import rate_limit_stats
+
+
+JSONRPC_VERSION = "2.0"
+
+# Standard JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class JsonRpcError(Exception):
+    """Error raised by an RPC handler, reported to the caller as a JSON-RPC error object"""
+
+    def __init__(self, code: int, message: str, data: Optional[Any] = None):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+    def to_dict(self) -> Dict[str, Any]:
+        error = {"code": self.code, "message": self.message}
+        if self.data is not None:
+            error["data"] = self.data
+        return error
+
+
+class AutomationWorker:
+    """
+    Persistent automation worker
+
+    Keeps one AutomationEngine (and its LLM client) alive and runs many applications
+    per process. Requests are handled concurrently so `ping`/`stats` stay responsive
+    while applications run; `execute` calls go through an AutomationScheduler that
+    bounds concurrency (`max_concurrent_jobs`, per-ATS limits) and applies backpressure.
+
+    Usage:
+        worker = AutomationWorker(max_concurrent_jobs=1)
+        await worker.serve_stdio()
+    """
+
+    def __init__(
+        self,
+        engine: Optional[AutomationEngine] = None,
+        max_concurrent_jobs: int = 1,
+        max_jobs: Optional[int] = None,
+        company_limits: Optional[Dict[str, int]] = None,
+        browser_pool_size: int = 0,
+        contexts_per_browser: int = 1,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize automation worker
+
+        Args:
+            engine: Pre-built AutomationEngine (optional, created in warmup() otherwise)
+            max_concurrent_jobs: Maximum number of applications executed at the same time
+            max_jobs: Recycle the worker after this many applications (optional).
+                      The supervisor is expected to start a fresh worker.
+            company_limits: Per company-type concurrency limits (see AutomationScheduler)
+            browser_pool_size: Pre-launched Chrome instances shared by jobs (0 = launch per job)
+            contexts_per_browser: Jobs sharing one pooled Chrome at the same time (isolated contexts)
+            logger: Logger instance (optional)
+        """
+        if max_concurrent_jobs < 1:
+            raise ValueError("max_concurrent_jobs must be at least 1")
+
+        self.engine = engine
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.max_jobs = max_jobs
+        self.company_limits = company_limits
+        self.browser_pool_size = browser_pool_size
+        self.contexts_per_browser = contexts_per_browser
+        self.browser_pool: Optional[BrowserPool] = None
+        self.scheduler: Optional[AutomationScheduler] = None
+        self.logger = logger or self._setup_logger()
+
+        self.started_at = time.time()
+        self.jobs_started = 0
+        self.jobs_completed = 0
+        self.jobs_failed = 0
+
+        self._shutdown_event = asyncio.Event()
+        self._tasks: set = set()
+
+        self._methods: Dict[str, Callable[[Dict[str, Any]], Awaitable[Any]]] = {
+            'execute': self._rpc_execute,
+            'ping': self._rpc_ping,
+            'stats': self._rpc_stats,
+            'supported_companies': self._rpc_supported_companies,
+            'shutdown': self._rpc_shutdown,
+        }
+
+    def _setup_logger(self) -> logging.Logger:
+        """Setup default logger (always stderr - stdout may be the protocol channel)"""
+        logger = logging.getLogger("jobswipe.automation.worker")
+        logger.setLevel(logging.INFO)
+
+        if not logger.handlers:
+            handler = logging.StreamHandler(sys.stderr)
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+
+        return logger
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def warmup(self):
+        """
+        Pay cold-start costs up front: heavy imports, automation registration, LLM client
+        """
+        start_time = time.time()
+
+        # browser_use lazily imports Agent / agent.views (>1s) - force it now
+        from browser_use import Agent  # noqa: F401
+
+        if self.engine is None:
+            llm = None
+            try:
+                llm = get_shared_default_llm(self.logger)
+            except Exception as e:
+                # Each ExecutionContext will retry and report the error per job
+                self.logger.warning(f"⚠️  LLM warmup failed, contexts will initialize their own: {e}")
+
+            if self.browser_pool_size:
+                self.browser_pool = BrowserPool(
+                    size=self.browser_pool_size,
+                    contexts_per_browser=self.contexts_per_browser,
+                    logger=self.logger
+                )
+
+            self.engine = AutomationEngine(llm=llm, browser_pool=self.browser_pool)
+
+        if self.scheduler is None:
+            self.scheduler = AutomationScheduler(
+                self.engine,
+                max_concurrent=self.max_concurrent_jobs,
+                company_limits=self.company_limits,
+                logger=self.logger
+            )
+
+        warmup_ms = int((time.time() - start_time) * 1000)
+        self.logger.info(f"✅ Worker warm in {warmup_ms}ms (pid={os.getpid()})")
+
+    async def start_browser_pool(self):
+        """Launch pooled browsers (no-op without a pool)"""
+        if self.browser_pool is None:
+            return
+
+        try:
+            await self.browser_pool.start()
+        except Exception as e:
+            # Jobs fall back to launching their own browser
+            self.logger.warning(f"⚠️  Browser pool failed to start, launching per job: {e}")
+            self.browser_pool = None
+            self.engine.browser_pool = None
+
+    @property
+    def is_shutting_down(self) -> bool:
+        return self._shutdown_event.is_set()
+
+    def request_shutdown(self):
+        """Stop accepting new requests; active jobs are allowed to finish"""
+        if not self._shutdown_event.is_set():
+            self.logger.info("🛑 Worker shutdown requested")
+            self._shutdown_event.set()
+
+    @property
+    def active_jobs(self) -> int:
+        return self.scheduler.running_count if self.scheduler else 0
+
+    async def drain(self):
+        """Wait for all in-flight requests to finish"""
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+        if self.scheduler:
+            await self.scheduler.stop(drain=True)
+        if self.browser_pool:
+            await self.browser_pool.close()
+
+        # Close pooled LLM connections while the event loop is still running
+        from browser_use.llm.client_pool import aclose_shared_clients
+        await aclose_shared_clients()
+
+    # ------------------------------------------------------------------
+    # Request handling
+    # ------------------------------------------------------------------
+
+    async def handle_request(self, raw: str) -> Optional[Dict[str, Any]]:
+        """
+        Handle one JSON-RPC request line
+
+        Args:
+            raw: Raw request line
+
+        Returns:
+            Response dict, or None for notifications (requests without an id)
+        """
+        try:
+            request = json.loads(raw)
+        except json.JSONDecodeError as e:
+            return self._error_response(None, JsonRpcError(PARSE_ERROR, f"Parse error: {e}"))
+
+        if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+            return self._error_response(None, JsonRpcError(INVALID_REQUEST, "Invalid request"))
+
+        request_id = request.get('id')
+        is_notification = 'id' not in request
+        method = request['method']
+        params = request.get('params') or {}
+
+        try:
+            handler = self._methods.get(method)
+            if handler is None:
+                raise JsonRpcError(METHOD_NOT_FOUND, f"Method not found: {method}")
+            if not isinstance(params, dict):
+                raise JsonRpcError(INVALID_PARAMS, "params must be an object")
+
+            result = await handler(params)
+            response = {"jsonrpc": JSONRPC_VERSION, "id": request_id, "result": result}
+
+        except JsonRpcError as e:
+            response = self._error_response(request_id, e)
+        except Exception as e:
+            self.logger.error(f"RPC {method} failed: {e}", exc_info=True)
+            response = self._error_response(
+                request_id, JsonRpcError(INTERNAL_ERROR, str(e), {"error_type": type(e).__name__})
+            )
+
+        return None if is_notification else response
+
+    def _error_response(self, request_id: Any, error: JsonRpcError) -> Dict[str, Any]:
+        return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "error": error.to_dict()}
+
+    async def _rpc_execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one application through the shared engine"""
+        if self.is_shutting_down:
+            raise JsonRpcError(INTERNAL_ERROR, "Worker is shutting down")
+
+        job_data = params.get('job_data')
+        user_profile = params.get('user_profile')
+        if not isinstance(job_data, dict) or not isinstance(user_profile, dict):
+            raise JsonRpcError(INVALID_PARAMS, "execute requires job_data and user_profile objects")
+
+        try:
+            mode = ExecutionMode(str(params.get('mode', ExecutionMode.SERVER.value)).upper())
+        except ValueError:
+            raise JsonRpcError(INVALID_PARAMS, f"Invalid mode: {params.get('mode')}")
+
+        try:
+            priority = JobPriority[str(params.get('priority', JobPriority.NORMAL.name)).upper()]
+        except KeyError:
+            raise JsonRpcError(INVALID_PARAMS, f"Invalid priority: {params.get('priority')}")
+
+        proxy_config = None
+        if params.get('proxy_config'):
+            proxy_config = ProxyConfig(**params['proxy_config'])
+
+        if self.scheduler is None:
+            self.warmup()
+
+        self.jobs_started += 1
+        try:
+            result = await self.scheduler.submit(
+                job_data,
+                user_profile,
+                mode,
+                proxy_config=proxy_config,
+                session_id=params.get('session_id'),
+                priority=priority,
+                user_id=params.get('user_id')
+            )
+        except Exception:
+            self.jobs_failed += 1
+            raise
+
+        if result.get('success'):
+            self.jobs_completed += 1
+        else:
+            self.jobs_failed += 1
+
+        if self.max_jobs and (self.jobs_completed + self.jobs_failed) >= self.max_jobs:
+            self.logger.info(f"♻️  Reached max_jobs={self.max_jobs}, recycling worker")
+            self.request_shutdown()
+
+        # Round-trip through JSON so datetimes etc. are serializable
+        return json.loads(json.dumps(result, default=str))
+
+    async def _rpc_ping(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"pong": True, "pid": os.getpid()}
+
+    async def _rpc_stats(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "jobs_started": self.jobs_started,
+            "jobs_completed": self.jobs_completed,
+            "jobs_failed": self.jobs_failed,
+            "active_jobs": self.active_jobs,
+            "max_concurrent_jobs": self.max_concurrent_jobs,
+            "shutting_down": self.is_shutting_down,
+            "scheduler": self.scheduler.stats() if self.scheduler else None,
+            "browser_pool": self.browser_pool.stats() if self.browser_pool else None,
+            "llm_rate_limits": rate_limit_stats(),
+        }
+
+    async def _rpc_supported_companies(self, params: Dict[str, Any]) -> Dict[str, str]:
+        if self.engine is None:
+            self.warmup()
+        return self.engine.get_supported_companies()
+
+    async def _rpc_shutdown(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self.request_shutdown()
+        return {"shutting_down": True, "active_jobs": self.active_jobs}
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Track a request task so drain() can wait for it"""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    # ------------------------------------------------------------------
+    # Transports
+    # ------------------------------------------------------------------
+
+    async def serve_stdio(self, stdin: Optional[TextIO] = None, stdout: Optional[TextIO] = None):
+        """
+        Serve JSON-RPC over stdin/stdout until EOF or shutdown
+
+        stdout is reserved for protocol messages; anything else printed while
+        serving is redirected to stderr.
+        """
+        stdin = stdin or sys.stdin
+        protocol_out = stdout or sys.stdout
+        write_lock = asyncio.Lock()
+
+        async def respond(line: str):
+            response = await self.handle_request(line)
+            if response is not None:
+                async with write_lock:
+                    protocol_out.write(json.dumps(response, default=str) + "\n")
+                    protocol_out.flush()
+
+        with contextlib.redirect_stdout(sys.stderr):
+            if self.engine is None:
+                self.warmup()
+            await self.start_browser_pool()
+
+            lines = self._start_stdin_reader(stdin)
+            self.logger.info("🟢 Worker listening on stdio")
+
+            while not self.is_shutting_down:
+                next_line = asyncio.ensure_future(lines.get())
+                shutdown = asyncio.ensure_future(self._shutdown_event.wait())
+                done, _ = await asyncio.wait({next_line, shutdown}, return_when=asyncio.FIRST_COMPLETED)
+                shutdown.cancel()
+
+                if next_line not in done:
+                    next_line.cancel()
+                    break
+
+                line = next_line.result()
+                if line is None:
+                    break  # EOF - parent closed the pipe
+                if line.strip():
+                    self._spawn(respond(line))
+
+            await self.drain()
+
+        self.logger.info("⚪ Worker stopped")
+
+    def _start_stdin_reader(self, stdin: TextIO) -> asyncio.Queue:
+        """
+        Read stdin on a daemon thread and feed lines into an asyncio queue
+
+        A daemon thread (rather than asyncio.to_thread) keeps a blocked readline()
+        from holding the process open after shutdown. None marks EOF.
+        """
+        loop = asyncio.get_running_loop()
+        lines: asyncio.Queue = asyncio.Queue()
+
+        def read_lines():
+            for line in iter(stdin.readline, ''):
+                loop.call_soon_threadsafe(lines.put_nowait, line)
+            loop.call_soon_threadsafe(lines.put_nowait, None)
+
+        threading.Thread(target=read_lines, name="worker-stdin", daemon=True).start()
+        return lines
+
+    async def serve_socket(
+        self,
+        path: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: Optional[int] = None
+    ):
+        """
+        Serve JSON-RPC over a local Unix socket (path) or TCP (host/port) until shutdown
+
+        Each connection may send any number of requests; responses are written back
+        on the same connection as they complete.
+        """
+        if self.engine is None:
+            self.warmup()
+        await self.start_browser_pool()
+
+        async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            write_lock = asyncio.Lock()
+            pending: set = set()
+
+            async def respond(line: str):
+                response = await self.handle_request(line)
+                if response is not None:
+                    async with write_lock:
+                        writer.write((json.dumps(response, default=str) + "\n").encode())
+                        await writer.drain()
+
+            try:
+                while not self.is_shutting_down:
+                    raw = await reader.readline()
+                    if not raw:
+                        break
+                    line = raw.decode()
+                    if line.strip():
+                        task = self._spawn(respond(line))
+                        pending.add(task)
+                        task.add_done_callback(pending.discard)
+            except ConnectionError:
+                pass
+            finally:
+                if pending:
+                    await asyncio.gather(*list(pending), return_exceptions=True)
+                writer.close()
+
+        if path:
+            if os.path.exists(path):
+                os.unlink(path)
+            server = await asyncio.start_unix_server(handle_connection, path=path)
+            self.logger.info(f"🟢 Worker listening on unix socket {path}")
+        else:
+            if port is None:
+                raise ValueError("serve_socket requires a path or a port")
+            server = await asyncio.start_server(handle_connection, host=host, port=port)
+            self.logger.info(f"🟢 Worker listening on {host}:{port}")
+
+        async with server:
+            await self._shutdown_event.wait()
+            server.close()
+            await self.drain()
+
+        if path and os.path.exists(path):
+            os.unlink(path)
+
+        self.logger.info("⚪ Worker stopped")
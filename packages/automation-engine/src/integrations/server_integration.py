@@ -10,6 +10,7 @@ from pathlib import Path
 from ..core.execution_context import ExecutionContext, ExecutionMode, ProxyConfig
 from ..core.automation_engine import AutomationEngine
 from ..core.proxy_manager import ProxyManager
+from ..core.scheduler import AutomationScheduler, JobPriority
 from ..companies.base.user_profile import UserProfile, JobData
 from ..companies.base.result_handler import ApplicationResult
 
@@ -21,12 +22,18 @@ class ServerAutomationIntegration:
     Usage:
         integration = ServerAutomationIntegration(proxy_manager=proxy_manager)
         result = await integration.execute_automation(user_profile, job_data)
+
+        # Many concurrent applications with per-ATS limits and backpressure
+        integration = ServerAutomationIntegration(proxy_manager=proxy_manager, max_concurrent=6)
+        results = await asyncio.gather(*(integration.execute_automation(u, j) for u, j in jobs))
     """
 
     def __init__(
         self,
         proxy_manager: Optional[ProxyManager] = None,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        max_concurrent: Optional[int] = None,
+        company_limits: Optional[Dict[str, int]] = None
     ):
         """
         Initialize server automation integration
@@ -34,11 +41,23 @@ class ServerAutomationIntegration:
         Args:
             proxy_manager: ProxyManager instance for proxy rotation (optional)
             logger: Logger instance (optional)
+            max_concurrent: Run applications through an AutomationScheduler with this
+                            many concurrent slots (optional, default: run directly)
+            company_limits: Per company-type concurrency limits for the scheduler (optional)
         """
         self.engine = AutomationEngine()
         self.proxy_manager = proxy_manager
         self.logger = logger or self._setup_logger()
 
+        self.scheduler: Optional[AutomationScheduler] = None
+        if max_concurrent:
+            self.scheduler = AutomationScheduler(
+                self.engine,
+                max_concurrent=max_concurrent,
+                company_limits=company_limits,
+                logger=self.logger
+            )
+
         self.logger.info("ServerAutomationIntegration initialized")
         if proxy_manager:
             self.logger.info(f"Proxy rotation enabled with {len(proxy_manager.proxies)} proxies")
@@ -62,7 +81,8 @@ class ServerAutomationIntegration:
         self,
         user_profile_data: Dict[str, Any],
         job_data: Dict[str, Any],
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        priority: JobPriority = JobPriority.NORMAL
     ) -> ApplicationResult:
         """
         Execute automation in SERVER mode with proxy rotation
@@ -71,6 +91,7 @@ class ServerAutomationIntegration:
             user_profile_data: User profile dictionary
             job_data: Job data dictionary
             session_id: Optional session ID for tracking
+            priority: Scheduler priority lane (only used when a scheduler is configured)
 
         Returns:
             ApplicationResult with automation outcome
@@ -91,14 +112,25 @@ class ServerAutomationIntegration:
                 else:
                     self.logger.warning("No proxies available - running without proxy")
 
-            # Execute automation using engine
-            result = await self.engine.execute(
-                job_data=job.to_dict(),
-                user_profile=user_profile.to_dict(),
-                mode=ExecutionMode.SERVER,
-                proxy_config=proxy_config,
-                session_id=session_id
-            )
+            # Execute automation using engine (queued behind the scheduler if configured)
+            if self.scheduler:
+                result = await self.scheduler.submit(
+                    job.to_dict(),
+                    user_profile.to_dict(),
+                    ExecutionMode.SERVER,
+                    proxy_config=proxy_config,
+                    session_id=session_id,
+                    priority=priority,
+                    user_id=user_profile_data.get('user_id')
+                )
+            else:
+                result = await self.engine.execute(
+                    job_data=job.to_dict(),
+                    user_profile=user_profile.to_dict(),
+                    mode=ExecutionMode.SERVER,
+                    proxy_config=proxy_config,
+                    session_id=session_id
+                )
 
             self.logger.info(f"Server automation completed: {result.get('success', False)}")
 
@@ -0,0 +1,6 @@
+"""Make the engine importable as `src` / `benchmarks` (same layout the scripts in the package root use)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,59 @@
+"""
+Unit tests for the benchmark regression gate: medians across runs, tolerance plus
+noise floor per metric, and success rate drops
+"""
+
+from benchmarks.harness import compare_to_baseline, machine_differences, summarize
+
+
+def _run(success=True, **metrics):
+    return {"scenario": "greenhouse", "success": success, "error": None, **metrics}
+
+
+def _summary(success_rate=1.0, **metrics):
+    return {"scenario": "greenhouse", "runs": 3, "success_rate": success_rate, **metrics}
+
+
+def test_summarize_takes_medians_of_numeric_metrics():
+    runs = [
+        _run(wall_time_ms=1000.0, steps=4, engine_success=True),
+        _run(wall_time_ms=5000.0, steps=5, engine_success=True),
+        _run(success=False, wall_time_ms=1200.0, steps=4, engine_success=False),
+    ]
+
+    summary = summarize(runs)
+
+    # Medians shrug off the one slow run; flags and strings are not metrics
+    assert summary == {"scenario": "greenhouse", "runs": 3, "success_rate": 2 / 3, "wall_time_ms": 1200.0, "steps": 4}
+
+
+def test_within_tolerance_or_noise_floor_is_not_a_regression():
+    baseline = {"greenhouse": _summary(wall_time_ms=10000.0, serialization_ms=20.0, steps=4)}
+    current = {
+        # +15% wall time is inside the 20% tolerance, +100% serialization is only 20ms (noise floor 50ms)
+        "greenhouse": _summary(wall_time_ms=11500.0, serialization_ms=40.0, steps=4),
+        # Scenarios without a baseline are not compared
+        "linkedin": _summary(success_rate=0.0, wall_time_ms=99999.0),
+    }
+
+    assert compare_to_baseline(current, baseline, tolerance=0.2) == []
+
+
+def test_regressions_beyond_tolerance_and_noise_floor_are_reported():
+    baseline = {"greenhouse": _summary(wall_time_ms=10000.0, steps=4, llm_wait_ms=100.0)}
+    current = {"greenhouse": _summary(success_rate=2 / 3, wall_time_ms=13000.0, steps=5, llm_wait_ms=50.0)}
+
+    regressions = compare_to_baseline(current, baseline, tolerance=0.2)
+
+    assert regressions == [
+        "greenhouse: success rate 67% < 100%",
+        "greenhouse: wall_time_ms 13000 vs baseline 10000 (+30%)",
+        "greenhouse: steps 5 vs baseline 4 (+25%)",
+    ]
+
+
+def test_machine_differences_compare_hardware_only():
+    baseline = {"os": "Linux-6.8", "cpu": "Xeon @ 2.10GHz", "cpu_count": 4, "memory_gb": 15.6, "python": "3.12.1"}
+
+    assert machine_differences(baseline, dict(baseline, os="Linux-6.9", python="3.12.4")) == []
+    assert machine_differences(baseline, dict(baseline, cpu_count=8)) == ["cpu_count: 4 vs 8"]
@@ -0,0 +1,135 @@
+"""
+Unit tests for AutomationScheduler selection order: priority lanes, round-robin
+across users, per-company limits and cancellation of queued jobs
+"""
+
+import asyncio
+from typing import Dict, List
+
+import pytest
+
+from src.core.execution_context import ExecutionMode
+from src.core.scheduler import AutomationScheduler, JobPriority
+
+
+class FakeEngine:
+    """Records the order jobs start in; each job runs until the test finishes it"""
+
+    def __init__(self):
+        self.started: List[str] = []
+        self._release: Dict[str, asyncio.Event] = {}
+
+    def detect_company_type(self, job_url: str) -> str:
+        return job_url.split('//')[1].split('.')[0]
+
+    async def execute(self, job_data, **kwargs):
+        self.started.append(job_data['name'])
+        await self._event(job_data['name']).wait()
+        return {'success': True}
+
+    def finish(self, name: str):
+        self._event(name).set()
+
+    def _event(self, name: str) -> asyncio.Event:
+        return self._release.setdefault(name, asyncio.Event())
+
+
+def _scheduler(engine: FakeEngine, **kwargs) -> AutomationScheduler:
+    # No CPU/RAM backpressure, only the limits under test
+    return AutomationScheduler(engine, max_cpu_percent=100, min_available_memory_mb=0, **kwargs)  # type: ignore[arg-type]
+
+
+def _submit(scheduler, name, user='u', company='greenhouse', priority=JobPriority.NORMAL) -> asyncio.Future:
+    return scheduler.submit_nowait(
+        {'name': name, 'apply_url': f'https://{company}.example/{name}'},
+        {'user_id': user},
+        ExecutionMode.SERVER,
+        priority=priority,
+    )
+
+
+async def _run_one_at_a_time(scheduler, engine, futures: Dict[str, asyncio.Future]) -> List[str]:
+    """Finish whichever job is running until every job ran, returning the start order"""
+    while len(engine.started) < len(futures):
+        await asyncio.sleep(0.01)
+        name = engine.started[-1]
+        engine.finish(name)
+        await futures[name]
+    await scheduler.stop()
+    return engine.started
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_lanes_run_first():
+    engine = FakeEngine()
+    scheduler = _scheduler(engine, max_concurrent=1)
+    futures = {'blocker': _submit(scheduler, 'blocker')}
+    await asyncio.sleep(0.01)  # Holds the only slot while the rest queues up
+
+    for name, priority in [('low', JobPriority.LOW), ('normal', JobPriority.NORMAL), ('high', JobPriority.HIGH)]:
+        futures[name] = _submit(scheduler, name, priority=priority)
+
+    assert await _run_one_at_a_time(scheduler, engine, futures) == ['blocker', 'high', 'normal', 'low']
+
+
+@pytest.mark.asyncio
+async def test_users_take_turns_within_a_lane():
+    engine = FakeEngine()
+    scheduler = _scheduler(engine, max_concurrent=1)
+    futures = {'blocker': _submit(scheduler, 'blocker', user='x')}
+    await asyncio.sleep(0.01)
+
+    for name in ['a1', 'a2', 'a3']:
+        futures[name] = _submit(scheduler, name, user='a')
+    for name in ['b1', 'b2']:
+        futures[name] = _submit(scheduler, name, user='b')
+
+    assert await _run_one_at_a_time(scheduler, engine, futures) == ['blocker', 'a1', 'b1', 'a2', 'b2', 'a3']
+
+
+@pytest.mark.asyncio
+async def test_company_limit_holds_only_that_companys_jobs():
+    engine = FakeEngine()
+    scheduler = _scheduler(engine, max_concurrent=3, company_limits={'linkedin': 1})
+
+    first = _submit(scheduler, 'linkedin-1', company='linkedin')
+    second = _submit(scheduler, 'linkedin-2', company='linkedin')
+    other = _submit(scheduler, 'greenhouse-1', company='greenhouse')
+    await asyncio.sleep(0.01)
+
+    # The user's next job is blocked on LinkedIn's limit, their Greenhouse job runs anyway
+    assert engine.started == ['linkedin-1', 'greenhouse-1']
+    assert scheduler.stats()['running_by_company'] == {'linkedin': 1, 'greenhouse': 1}
+
+    engine.finish('linkedin-1')
+    await first
+    await asyncio.sleep(0.01)
+    assert engine.started[-1] == 'linkedin-2'
+
+    engine.finish('linkedin-2')
+    engine.finish('greenhouse-1')
+    await asyncio.gather(second, other)
+    await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_jobs_leave_the_queue():
+    engine = FakeEngine()
+    scheduler = _scheduler(engine, max_concurrent=1)
+    running = _submit(scheduler, 'running')
+    await asyncio.sleep(0.01)
+
+    abandoned = _submit(scheduler, 'abandoned')
+    kept = _submit(scheduler, 'kept')
+    abandoned.cancel()
+    await asyncio.sleep(0)
+    assert scheduler.pending_count == 1
+
+    engine.finish('running')
+    await running
+    await asyncio.sleep(0.01)
+    engine.finish('kept')
+    await kept
+    await scheduler.stop()
+
+    assert engine.started == ['running', 'kept']
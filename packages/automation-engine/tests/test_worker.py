@@ -0,0 +1,147 @@
+"""
+Unit tests for AutomationWorker.handle_request: JSON-RPC error codes, notifications,
+routing `execute` through the scheduler and draining on `shutdown`
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from src.core.execution_context import ExecutionMode
+from src.core.scheduler import AutomationScheduler
+from src.core.worker import (
+    INVALID_PARAMS,
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    AutomationWorker,
+)
+
+
+class FakeEngine:
+    """Records the calls the scheduler makes; jobs run until the test releases them"""
+
+    def __init__(self):
+        self.calls: List[Dict[str, Any]] = []
+        self.release = asyncio.Event()
+
+    def detect_company_type(self, job_url: str) -> str:
+        return 'greenhouse'
+
+    async def execute(self, **kwargs):
+        self.calls.append(kwargs)
+        await self.release.wait()
+        return {'success': True, 'job_id': kwargs['job_data']['id']}
+
+
+def _worker(engine: FakeEngine) -> AutomationWorker:
+    worker = AutomationWorker(engine=engine)  # type: ignore[arg-type]
+    # No CPU/RAM backpressure, and no warmup (it would import the whole agent)
+    worker.scheduler = AutomationScheduler(engine, max_cpu_percent=100, min_available_memory_mb=0)  # type: ignore[arg-type]
+    return worker
+
+
+def _request(method: str, request_id: Any = 1, **params) -> str:
+    return json.dumps({'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params})
+
+
+def _execute(request_id: Any = 1, job_id: str = 'job-1', **params) -> str:
+    return _request(
+        'execute',
+        request_id,
+        job_data={'id': job_id, 'apply_url': 'https://boards.greenhouse.io/acme/jobs/1'},
+        user_profile={'user_id': 'u'},
+        **params,
+    )
+
+
+@pytest.mark.asyncio
+async def test_malformed_requests_get_standard_error_codes():
+    worker = _worker(FakeEngine())
+
+    parse_error = await worker.handle_request('{"jsonrpc": "2.0", "id": 1,')
+    assert parse_error['id'] is None
+    assert parse_error['error']['code'] == PARSE_ERROR
+
+    for raw in ['[1, 2]', '{"jsonrpc": "2.0", "id": 2}', '{"jsonrpc": "2.0", "id": 3, "method": 7}']:
+        response = await worker.handle_request(raw)
+        assert response == {'jsonrpc': '2.0', 'id': None, 'error': {'code': INVALID_REQUEST, 'message': 'Invalid request'}}
+
+    bad_params = await worker.handle_request('{"jsonrpc": "2.0", "id": 4, "method": "ping", "params": [1]}')
+    assert bad_params['id'] == 4
+    assert bad_params['error']['code'] == INVALID_PARAMS
+
+    missing_profile = await worker.handle_request(_request('execute', 5, job_data={}))
+    assert missing_profile['error']['code'] == INVALID_PARAMS
+
+
+@pytest.mark.asyncio
+async def test_unknown_method_is_reported():
+    worker = _worker(FakeEngine())
+
+    response = await worker.handle_request(_request('apply', 'abc'))
+
+    assert response == {
+        'jsonrpc': '2.0',
+        'id': 'abc',
+        'error': {'code': METHOD_NOT_FOUND, 'message': 'Method not found: apply'},
+    }
+
+
+@pytest.mark.asyncio
+async def test_notifications_get_no_reply():
+    worker = _worker(FakeEngine())
+
+    assert await worker.handle_request('{"jsonrpc": "2.0", "method": "ping"}') is None
+    # Not even when they fail
+    assert await worker.handle_request('{"jsonrpc": "2.0", "method": "apply"}') is None
+    # A null id is still a request
+    assert (await worker.handle_request(_request('ping', None)))['result']['pong'] is True
+
+
+@pytest.mark.asyncio
+async def test_execute_runs_through_the_scheduler():
+    engine = FakeEngine()
+    worker = _worker(engine)
+    engine.release.set()
+
+    response = await worker.handle_request(_execute(7, mode='desktop', session_id='s-1'))
+
+    assert response['id'] == 7
+    assert response['result']['job_id'] == 'job-1'
+    assert 'queue_wait_ms' in response['result']  # Added by the scheduler
+    assert len(engine.calls) == 1
+    assert engine.calls[0]['mode'] == ExecutionMode.DESKTOP
+    assert engine.calls[0]['session_id'] == 's-1'
+    assert worker.scheduler.stats()['jobs_completed'] == 1
+    assert (worker.jobs_started, worker.jobs_completed) == (1, 1)
+
+    bad_priority = await worker.handle_request(_execute(8, priority='urgent'))
+    assert bad_priority['error']['code'] == INVALID_PARAMS
+    assert len(engine.calls) == 1
+
+    await worker.drain()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_lets_active_jobs_finish():
+    engine = FakeEngine()
+    worker = _worker(engine)
+    running = worker._spawn(worker.handle_request(_execute(1)))
+    await asyncio.sleep(0.01)
+
+    shutdown = await worker.handle_request(_request('shutdown', 2))
+    assert shutdown['result'] == {'shutting_down': True, 'active_jobs': 1}
+
+    # New work is refused while the running job keeps going
+    refused = await worker.handle_request(_execute(3, job_id='job-2'))
+    assert refused['error']['message'] == 'Worker is shutting down'
+
+    engine.release.set()
+    await worker.drain()
+
+    assert running.result()['result']['job_id'] == 'job-1'
+    assert [call['job_data']['id'] for call in engine.calls] == ['job-1']
+    assert worker.active_jobs == 0